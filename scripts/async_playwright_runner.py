@@ -0,0 +1,413 @@
+"""
+Playwright asyncio 실행기
+워커(프로세스)마다 이벤트 루프 하나와 공유 브라우저를 두고, async 테스트 여러 개를 동시에 구동
+
+동시 실행 경로의 제한 (순차 실행 경로는 일반 pytest 흐름과 같음)
+- pytest_runtest_protocol/setup/call/teardown 훅을 호출하지 않고 리포트 생성/기록 훅(makereport, logstart,
+  logreport, logfinish)만 호출하므로, 다른 플러그인의 실행 훅(pytest-rerunfailures, pytest-timeout 등)과
+  테스트별 출력 캡처가 적용되지 않음
+- page fixture가 하는 산출물 기록(네트워크 기록/재생, 실패 trace, 메모리 측정 등)을 거치지 않음 (실패 스크린샷만 저장)
+- pytest 내부 속성에 의존: Function._fixtureinfo, FixtureDef.cached_result, Session._setupstate
+  (pytest 7.4~9.1에서 확인, 속성이 없으면 동시 실행하지 않고 일반 흐름으로 실행)
+"""
+
+import asyncio
+import inspect
+import queue
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+import pytest
+
+# 동시 실행 경로에서 실행기가 직접 제공하는 fixture
+PAGE_FIXTURES = ("page", "driver", "page_playwright_async")
+BROWSER_FIXTURES = ("browser_playwright_async",)
+# setup 훅에서 판정되는 마커 (동시 실행 경로는 setup 훅을 거치지 않으므로 순차 실행)
+SEQUENTIAL_MARKERS = ("skip", "skipif", "xfail")
+
+# 브라우저 이름 -> Playwright 브라우저 타입
+BROWSER_TYPES = {
+    "chromium": "chromium",
+    "firefox": "firefox",
+    "webkit": "webkit",
+    "chrome": "chromium",
+    "edge": "chromium",
+}
+
+
+class AsyncPlaywrightRunner:
+    """
+    워커 단위 asyncio 이벤트 루프 + 공유 브라우저
+
+    - 이벤트 루프는 별도 스레드에서 실행되고, pytest(메인 스레드)는 run()/submit()으로 코루틴을 넘김
+    - 테스트마다 새 BrowserContext/Page를 만들되 브라우저 프로세스는 공유
+    - 동시에 실행되는 테스트 수는 concurrency로 제한
+    """
+
+    def __init__(self, browser_name: str, launch_options: Optional[Dict[str, Any]] = None,
+                 context_options: Optional[Dict[str, Any]] = None, concurrency: int = 4,
+                 test_timeout: float = 0):
+        self.browser_type_name = BROWSER_TYPES.get(browser_name, "chromium")
+        self.launch_options = dict(launch_options or {})
+        self.context_options = dict(context_options or {})
+        self.concurrency = max(1, int(concurrency))
+        self.test_timeout = test_timeout
+        self.playwright = None
+        self.browser = None
+        self._active_pages = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self.stats = {
+            "concurrent_tests": 0,
+            "sequential_tests": 0,
+            "pages_created": 0,
+            "max_active_pages": 0,
+            "batch_ms": 0.0,
+        }
+
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run_loop, name="playwright-async-loop", daemon=True)
+        self._thread.start()
+        try:
+            self.run(self._start())
+        except BaseException:
+            self._stop_loop()
+            raise
+
+    # ------------------------------------------------------------------
+    # 메인 스레드에서 호출
+    # ------------------------------------------------------------------
+
+    def run(self, coro, timeout: Optional[float] = None):
+        """이벤트 루프에서 코루틴을 실행하고 결과를 기다림"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop).result(timeout)
+
+    def submit(self, coro):
+        """이벤트 루프에 코루틴을 넘기고 concurrent.futures.Future 반환"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def close(self) -> None:
+        """브라우저와 이벤트 루프 종료"""
+        try:
+            self.run(self._stop(), timeout=30)
+        except Exception:
+            pass
+        self._stop_loop()
+
+    # ------------------------------------------------------------------
+    # 이벤트 루프에서 실행
+    # ------------------------------------------------------------------
+
+    async def new_page(self) -> Tuple[Any, Any]:
+        """새 BrowserContext와 Page 생성"""
+        context = await self.browser.new_context(**self.context_options)
+        try:
+            page = await context.new_page()
+        except BaseException:
+            await context.close()
+            raise
+        self._active_pages += 1
+        self.stats["pages_created"] += 1
+        self.stats["max_active_pages"] = max(self.stats["max_active_pages"], self._active_pages)
+        return context, page
+
+    async def close_page(self, context) -> None:
+        """new_page()로 만든 BrowserContext 종료"""
+        self._active_pages -= 1
+        await context.close()
+
+    async def run_test(self, item, funcargs: Dict[str, Any]) -> None:
+        """테스트 코루틴 실행 (test_timeout 초과 시 asyncio.TimeoutError)"""
+        kwargs = {name: funcargs[name] for name in item._fixtureinfo.argnames}
+        coro = item.obj(**kwargs)
+        if self.test_timeout and self.test_timeout > 0:
+            await asyncio.wait_for(coro, self.test_timeout)
+        else:
+            await coro
+
+    async def _start(self) -> None:
+        from playwright.async_api import async_playwright
+
+        self._semaphore = asyncio.Semaphore(self.concurrency)
+        self.playwright = await async_playwright().start()
+        try:
+            browser_type = getattr(self.playwright, self.browser_type_name)
+            self.browser = await browser_type.launch(**self.launch_options)
+        except BaseException:
+            await self.playwright.stop()
+            raise
+
+    async def _stop(self) -> None:
+        if self.browser is not None:
+            await self.browser.close()
+        if self.playwright is not None:
+            await self.playwright.stop()
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def _stop_loop(self) -> None:
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(5)
+
+    # ------------------------------------------------------------------
+    # 동시 실행
+    # ------------------------------------------------------------------
+
+    async def _run_item(self, run: "_ItemRun", events: "queue.Queue", stopping: threading.Event, capture) -> None:
+        """
+        테스트 하나를 setup -> call -> (메인 스레드 리포트 대기) -> teardown 순서로 실행
+
+        call 리포트(힐링용 DOM 수집 포함)가 끝날 때까지 페이지를 열어 둠
+        """
+        try:
+            async with self._semaphore:
+                if stopping.is_set():
+                    return
+                run.teardown_ready = asyncio.Event()
+                await self._setup_and_call(run)
+                events.put(("called", run))
+                await run.teardown_ready.wait()
+                await self._teardown(run, capture)
+        except BaseException as e:
+            run.phases.setdefault("teardown", (e, time.time(), time.time(), 0.0))
+        finally:
+            events.put(("finished", run))
+
+    async def _setup_and_call(self, run: "_ItemRun") -> None:
+        item = run.item
+        with _Phase(run, "setup"):
+            run.context, run.page = await self.new_page()
+        item.funcargs = dict(run.values)
+        if run.page is not None:
+            for name in PAGE_FIXTURES:
+                item.funcargs[name] = run.page
+            for name in BROWSER_FIXTURES:
+                item.funcargs[name] = self.browser
+        if run.phases["setup"][0] is not None:
+            return
+        with _Phase(run, "call"):
+            await self.run_test(item, item.funcargs)
+
+    async def _teardown(self, run: "_ItemRun", capture) -> None:
+        with _Phase(run, "teardown"):
+            if run.context is None:
+                return
+            try:
+                rep_call = getattr(run.item, "rep_call", None)
+                if capture is not None and rep_call is not None and rep_call.failed:
+                    try:
+                        screenshot_path = await capture(run.page, run.item.name)
+                        if screenshot_path:
+                            print(f"스크린샷 저장: {screenshot_path}")
+                    except Exception as e:
+                        print(f"스크린샷 캡처 실패: {e}")
+            finally:
+                await self.close_page(run.context)
+
+
+class _ItemRun:
+    """동시 실행 중인 테스트 하나의 상태"""
+
+    def __init__(self, item, values: Dict[str, Any]):
+        self.item = item
+        self.values = values
+        self.context = None
+        self.page = None
+        self.teardown_ready: Optional[asyncio.Event] = None
+        # 단계 -> (예외, 시작 시각, 종료 시각, 소요 시간)
+        self.phases: Dict[str, Tuple[Optional[BaseException], float, float, float]] = {}
+        self.reports: List[Any] = []
+
+
+class _Phase:
+    """단계 실행 시간과 예외 기록 (예외는 삼키고 리포트 생성 시 다시 발생시킴)"""
+
+    def __init__(self, run: _ItemRun, when: str):
+        self.run = run
+        self.when = when
+
+    def __enter__(self):
+        self.start = time.time()
+        self.perf_start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.run.phases[self.when] = (exc, self.start, time.time(), time.perf_counter() - self.perf_start)
+        return exc is not None and not isinstance(exc, (KeyboardInterrupt, SystemExit))
+
+
+def is_async_test(item) -> bool:
+    return isinstance(item, pytest.Function) and inspect.iscoroutinefunction(getattr(item, "obj", None))
+
+
+def static_funcargs(item) -> Optional[Dict[str, Any]]:
+    """
+    동시 실행에 필요한 fixture 값 (페이지/브라우저 제외)
+
+    이미 생성된 session fixture 값과 직접 parametrize 값만 사용할 수 있음
+
+    Returns:
+        {fixture 이름: 값}, 동시 실행할 수 없는 테스트면 None (일반 pytest 흐름으로 순차 실행)
+    """
+    if any(next(item.iter_markers(name=name), None) for name in SEQUENTIAL_MARKERS):
+        return None
+
+    fixtureinfo = getattr(item, "_fixtureinfo", None)
+    if fixtureinfo is None:
+        return None
+
+    values = {}
+    fixturedefs = fixtureinfo.name2fixturedefs
+    params = getattr(getattr(item, "callspec", None), "params", {})
+    direct = _direct_params(item)
+    # 테스트가 직접 요청한 fixture와 autouse fixture만 확인 (page 등의 의존 fixture는 실행기가 대신함)
+    for name in getattr(fixtureinfo, "initialnames", item.fixturenames):
+        if name in PAGE_FIXTURES or name in BROWSER_FIXTURES:
+            continue
+        if name in params and name in direct:
+            values[name] = params[name]
+            continue
+        defs = fixturedefs.get(name)
+        if not defs:
+            return None
+        fixturedef = defs[-1]
+        cached = getattr(fixturedef, "cached_result", None)
+        if fixturedef.scope != "session" or cached is None or cached[2] is not None:
+            return None
+        values[name] = cached[0]
+    return values
+
+
+def _direct_params(item) -> set:
+    """
+    parametrize 마커로 값을 직접 받는 인자 (indirect로 fixture에 넘기는 인자 제외)
+
+    pytest_generate_tests에서 metafunc.parametrize로 추가한 인자는 마커가 없어 포함되지 않음 (순차 실행)
+    """
+    names = set()
+    for marker in item.iter_markers(name="parametrize"):
+        argnames = marker.args[0] if marker.args else marker.kwargs.get("argnames", ())
+        if isinstance(argnames, str):
+            argnames = [name.strip() for name in argnames.split(",") if name.strip()]
+        indirect = marker.args[2] if len(marker.args) > 2 else marker.kwargs.get("indirect", False)
+        for name in argnames:
+            if indirect is True or (isinstance(indirect, (list, tuple)) and name in indirect):
+                continue
+            names.add(name)
+    return names
+
+
+def _make_report(item, when: str, phase: Tuple[Optional[BaseException], float, float, float]):
+    exc, start, stop, duration = phase
+
+    def replay():
+        if exc is not None:
+            raise exc
+
+    call = pytest.CallInfo.from_call(replay, when=when)
+    call.start, call.stop, call.duration = start, stop, duration
+    return item.ihook.pytest_runtest_makereport(item=item, call=call)
+
+
+def run_concurrently(session, runner: AsyncPlaywrightRunner, entries: List[Tuple[Any, Dict[str, Any]]],
+                     capture=None) -> None:
+    """
+    async 테스트를 이벤트 루프에서 동시에 실행하고 리포트는 메인 스레드에서 순서대로 기록
+
+    Args:
+        entries: [(테스트 아이템, static_funcargs 결과), ...]
+        capture: 실패 시 스크린샷을 저장하는 코루틴 함수 (page, 테스트 이름) -> 경로
+    """
+    events: "queue.Queue[Tuple[str, _ItemRun]]" = queue.Queue()
+    stopping = threading.Event()
+    runs = [_ItemRun(item, values) for item, values in entries]
+    start = time.perf_counter()
+    for run in runs:
+        runner.submit(runner._run_item(run, events, stopping, capture))
+
+    pending = len(runs)
+    while pending:
+        kind, run = events.get()
+        item = run.item
+        if kind == "called":
+            # 페이지가 열려 있는 동안 call 리포트 생성 (makereport 훅의 DOM 수집 등)
+            run.reports = [_make_report(item, when, run.phases[when]) for when in ("setup", "call") if when in run.phases]
+            runner.loop.call_soon_threadsafe(run.teardown_ready.set)
+            continue
+
+        pending -= 1
+        if not run.phases:
+            # 중단(-x, --maxfail)으로 시작하지 않은 테스트
+            continue
+        if not run.reports:
+            run.reports = [_make_report(item, when, run.phases[when]) for when in ("setup", "call") if when in run.phases]
+        if "teardown" in run.phases:
+            run.reports.append(_make_report(item, "teardown", run.phases["teardown"]))
+
+        item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+        for report in run.reports:
+            item.ihook.pytest_runtest_logreport(report=report)
+        item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+        runner.stats["concurrent_tests"] += 1
+        if session.shouldfail or session.shouldstop:
+            stopping.set()
+
+    runner.stats["batch_ms"] += (time.perf_counter() - start) * 1000
+
+
+def _run_protocol(session, items: List[Any], last_nextitem) -> None:
+    """일반 pytest 흐름으로 순차 실행 (기본 pytest_runtestloop와 동일한 중단 처리)"""
+    for i, item in enumerate(items):
+        nextitem = items[i + 1] if i + 1 < len(items) else last_nextitem
+        item.config.hook.pytest_runtest_protocol(item=item, nextitem=nextitem)
+        if session.shouldfail:
+            raise session.Failed(session.shouldfail)
+        if session.shouldstop:
+            raise session.Interrupted(session.shouldstop)
+
+
+def run_session(session, get_runner, capture=None) -> bool:
+    """
+    pytest_runtestloop 구현
+
+    1. 동기 테스트를 먼저 순차 실행 (없으면 async 테스트 하나로 session fixture 준비)
+    2. session fixture만 쓰는 async 테스트를 동시에 실행
+    3. 그 밖의 async 테스트는 순차 실행
+
+    Returns:
+        실행했으면 True, async 테스트가 없으면 False (기본 실행 흐름 사용)
+    """
+    candidates = [item for item in session.items if is_async_test(item)]
+    if not candidates or not hasattr(session, "_setupstate"):
+        return False
+    sequential = [item for item in session.items if not is_async_test(item)]
+    if not sequential:
+        sequential = [candidates.pop(0)]
+
+    # 다음 아이템을 async 테스트로 지정해 session fixture가 정리되지 않도록 함
+    _run_protocol(session, sequential, candidates[0] if candidates else None)
+    if not candidates:
+        return True
+
+    runner = get_runner()
+    concurrent, fallback = [], []
+    for item in candidates:
+        values = static_funcargs(item)
+        if values is None:
+            fallback.append(item)
+        else:
+            concurrent.append((item, values))
+
+    run_concurrently(session, runner, concurrent, capture)
+    if session.shouldfail:
+        raise session.Failed(session.shouldfail)
+    if session.shouldstop:
+        raise session.Interrupted(session.shouldstop)
+
+    # 동시 실행 전에 남아 있던 module/class 단계 fixture 정리
+    session._setupstate.teardown_exact(fallback[0] if fallback else None)
+    runner.stats["sequential_tests"] += len(fallback)
+    _run_protocol(session, fallback, None)
+    return True
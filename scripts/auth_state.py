@@ -0,0 +1,406 @@
+"""
+역할(role)별 로그인 상태 재사용
+역할마다 세션(실행)당 한 번만 UI로 로그인하고, 로그인 상태(storage_state: 쿠키 + localStorage)를 파일로 공유
+
+- Playwright: 저장한 storage_state로 새 BrowserContext 생성 (로그인 화면을 거치지 않음)
+- Selenium: 같은 파일의 쿠키/localStorage를 드라이버에 주입
+- xdist 워커 간 공유: 로그인은 잠금 파일을 잡은 워커 하나만 수행하고, 나머지 워커는 기다렸다가 파일을 읽음
+- 만료: 역할 설정의 ttl_minutes 경과, 지정한 세션 쿠키(session_cookies) 만료,
+  테스트가 로그인 페이지에서 실패한 경우(invalidate) 다음 테스트에서 다시 로그인
+
+역할 설정 파일 (--auth-roles, 기본값: 실행 디렉토리의 auth_roles.json):
+{
+  "admin": {
+    "login_url": "/login",
+    "username": "admin@example.com",
+    "password_env": "TEST_ADMIN_PASSWORD",
+    "username_selector": "#email",
+    "password_selector": "#password",
+    "submit_selector": "button[type=submit]",
+    "success_url": "**/dashboard*",
+    "check_url": "/dashboard",
+    "session_cookies": ["sessionid"],
+    "ttl_minutes": 30
+  }
+}
+"""
+
+import os
+import json
+import time
+import fnmatch
+import hashlib
+import tempfile
+import threading
+from typing import Optional, Dict, Any, List, Callable
+from urllib.parse import urljoin, urlsplit
+
+# 로그인 상태 파일 디렉토리 (실행 간 공유)
+STATE_DIR = os.getenv(
+    "TEST_AUTH_STATE_DIR",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "auth-state")
+)
+# 역할 설정에 ttl_minutes가 없을 때의 유효 시간(분)
+DEFAULT_TTL_MINUTES = float(os.getenv("TEST_AUTH_TTL_MINUTES", "30"))
+# 다른 워커의 로그인을 기다리는 최대 시간(초)
+LOCK_TIMEOUT = float(os.getenv("TEST_AUTH_LOCK_TIMEOUT", "120"))
+# 이 시간 동안 갱신되지 않은 잠금 파일은 비정상 종료로 보고 제거 (대기 시간보다 짧아야 대기 중에 회수됨,
+# 잠금을 잡은 워커는 로그인이 오래 걸려도 stale_seconds / 3마다 잠금 파일 수정 시각을 갱신)
+LOCK_STALE_SECONDS = 30
+# 로그인 완료를 기다리는 최대 시간(ms)
+LOGIN_TIMEOUT_MS = 30000
+
+# 역할 이름 -> 사용자 정의 로그인 함수 (login(page 또는 driver, role_config, base_url))
+_custom_logins: Dict[str, Callable] = {}
+
+
+def register_login(role: str, login: Callable) -> None:
+    """
+    폼 입력만으로 로그인할 수 없는 역할(SSO, 2단계 인증 등)의 로그인 함수 등록
+
+    login(page_or_driver, role_config, base_url): Playwright Page 또는 Selenium WebDriver로 로그인을 마침
+    """
+    _custom_logins[role] = login
+
+
+class AuthError(Exception):
+    """역할 설정 오류 또는 로그인 실패"""
+
+
+class FileLock:
+    """
+    잠금 파일 기반 프로세스 간 잠금 (O_EXCL 생성, Windows/Linux/macOS 공통)
+
+    잠금을 잡은 동안 백그라운드 스레드가 잠금 파일 수정 시각을 갱신하므로,
+    stale_seconds보다 오래 갱신되지 않은 잠금 파일만 종료된 프로세스의 것으로 보고 제거
+    """
+
+    def __init__(self, path: str, timeout: float = LOCK_TIMEOUT, stale_seconds: float = LOCK_STALE_SECONDS):
+        self.path = path
+        self.timeout = timeout
+        self.stale_seconds = stale_seconds
+        self.waited_ms = 0.0
+        self._released = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def __enter__(self):
+        start = time.perf_counter()
+        deadline = time.time() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.path.getmtime(self.path) > self.stale_seconds:
+                        os.unlink(self.path)
+                        continue
+                except OSError:
+                    # 그사이 다른 프로세스가 잠금을 해제함
+                    continue
+                if time.time() > deadline:
+                    raise AuthError(f"로그인 잠금 대기 시간 초과: {self.path}")
+                time.sleep(0.1)
+        self.waited_ms = (time.perf_counter() - start) * 1000
+        self._released.clear()
+        self._heartbeat = threading.Thread(target=self._touch, name="auth-lock-heartbeat", daemon=True)
+        self._heartbeat.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._released.set()
+        if self._heartbeat is not None:
+            self._heartbeat.join()
+            self._heartbeat = None
+        try:
+            os.unlink(self.path)
+        except OSError:
+            pass
+
+    def _touch(self) -> None:
+        """잠금을 해제할 때까지 잠금 파일 수정 시각 갱신 (다른 워커가 오래된 잠금으로 보고 제거하지 않도록)"""
+        while not self._released.wait(self.stale_seconds / 3):
+            try:
+                os.utime(self.path)
+            except OSError:
+                pass
+
+
+class AuthStateManager:
+    """
+    역할별 storage_state 관리 (워커당 하나)
+
+    storage_state 형식은 Playwright의 context.storage_state()와 같음
+    ({"cookies": [...], "origins": [{"origin": ..., "localStorage": [{"name", "value"}]}]})
+    """
+
+    def __init__(self, roles: Dict[str, Dict[str, Any]], base_url: str, state_dir: str = STATE_DIR):
+        self.roles = roles
+        self.base_url = base_url
+        self.state_dir = state_dir
+        # 역할 -> {"storage_state", "created", "expires"} (이 워커에서 확인한 상태)
+        self._states: Dict[str, Dict[str, Any]] = {}
+        self.stats = {"logins": 0, "reused": 0, "loaded": 0, "expired": 0, "invalidated": 0, "lock_wait_ms": 0.0}
+
+    @classmethod
+    def from_file(cls, path: str, base_url: str, state_dir: str = STATE_DIR) -> "AuthStateManager":
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                roles = json.load(f)
+        except OSError:
+            roles = {}
+        except ValueError as e:
+            raise AuthError(f"역할 설정 파일 형식 오류: {path} ({e})")
+        return cls(roles, base_url, state_dir)
+
+    def role_config(self, role: str) -> Dict[str, Any]:
+        config = self.roles.get(role)
+        if config is None:
+            raise AuthError(f"역할 설정이 없습니다: {role} (auth_roles.json 또는 --auth-roles 확인)")
+        return config
+
+    def url(self, path: str) -> str:
+        """역할 설정의 상대 경로를 기본 URL 기준 절대 URL로 변환"""
+        return urljoin(self.base_url.rstrip("/") + "/", path.lstrip("/")) if path and "://" not in path else path
+
+    def is_login_page(self, role: str, url: str) -> bool:
+        """현재 URL이 역할의 로그인 페이지인지 확인 (로그인 상태가 만료되어 로그인 화면으로 돌아간 경우)"""
+        login_url = self.role_config(role).get("login_url")
+        if not login_url or not url:
+            return False
+        return urlsplit(url).path.rstrip("/") == urlsplit(self.url(login_url)).path.rstrip("/")
+
+    def state_for(self, role: str, login: Callable[[Dict[str, Any]], Dict[str, Any]],
+                  validate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> Dict[str, Any]:
+        """
+        역할의 storage_state (유효한 상태가 없으면 로그인)
+
+        Args:
+            role: 역할 이름
+            login: 로그인 후 storage_state를 반환하는 함수 (역할 설정을 인자로 받음)
+            validate: 파일에서 읽은 상태가 아직 유효한지 확인하는 함수 (워커당 한 번, check_url이 있는 경우)
+
+        Returns:
+            storage_state
+        """
+        entry = self._states.get(role)
+        if entry is not None and not self._expired(role, entry):
+            self.stats["reused"] += 1
+            return entry["storage_state"]
+
+        entry = self._load(role, validate)
+        if entry is None:
+            path = self._path(role)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with FileLock(path + ".lock") as lock:
+                self.stats["lock_wait_ms"] += lock.waited_ms
+                # 잠금을 기다리는 동안 다른 워커가 로그인했으면 그 상태 사용
+                entry = self._load(role, validate)
+                if entry is None:
+                    entry = self._login(role, login)
+        self._states[role] = entry
+        return entry["storage_state"]
+
+    def invalidate(self, role: str) -> None:
+        """로그인 상태 폐기 (다음 테스트가 다시 로그인)"""
+        self._states.pop(role, None)
+        try:
+            os.unlink(self._path(role))
+        except OSError:
+            pass
+        self.stats["invalidated"] += 1
+
+    def _path(self, role: str) -> str:
+        # 같은 역할이라도 대상 서버(기본 URL)가 다르면 별도 파일
+        suffix = hashlib.sha1(self.base_url.encode("utf-8")).hexdigest()[:8]
+        safe_role = "".join(c if c.isalnum() or c in "-_" else "_" for c in role)
+        return os.path.join(self.state_dir, f"{safe_role}-{suffix}.json")
+
+    def _expired(self, role: str, entry: Dict[str, Any]) -> bool:
+        now = time.time()
+        if now >= entry.get("expires", 0):
+            return True
+        session_cookies = self.role_config(role).get("session_cookies")
+        if session_cookies:
+            for cookie in entry["storage_state"].get("cookies", []):
+                expires = cookie.get("expires", -1)
+                if cookie.get("name") in session_cookies and 0 < expires <= now:
+                    return True
+        return False
+
+    def _load(self, role: str, validate) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._path(role), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or "storage_state" not in entry:
+            return None
+        if self._expired(role, entry):
+            self.stats["expired"] += 1
+            return None
+        if validate is not None and self.role_config(role).get("check_url") and not validate(entry["storage_state"]):
+            self.stats["expired"] += 1
+            return None
+        self.stats["loaded"] += 1
+        return entry
+
+    def _login(self, role: str, login) -> Dict[str, Any]:
+        config = self.role_config(role)
+        storage_state = login(config)
+        now = time.time()
+        entry = {
+            "role": role,
+            "base_url": self.base_url,
+            "created": round(now),
+            "expires": now + float(config.get("ttl_minutes", DEFAULT_TTL_MINUTES)) * 60,
+            "storage_state": storage_state,
+        }
+        path = self._path(role)
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            # 저장 실패 시 이 워커에서만 재사용
+            print(f"[AuthState] 로그인 상태 저장 실패: {e}")
+        self.stats["logins"] += 1
+        return entry
+
+
+def _password(config: Dict[str, Any]) -> str:
+    if config.get("password_env"):
+        password = os.getenv(config["password_env"])
+        if password is None:
+            raise AuthError(f"환경 변수 {config['password_env']}가 설정되지 않았습니다")
+        return password
+    return config.get("password", "")
+
+
+# ============================================================================
+# Playwright
+# ============================================================================
+
+def login_playwright(browser, manager: AuthStateManager, role: str, context_options: Optional[Dict[str, Any]] = None):
+    """새 컨텍스트에서 로그인 후 storage_state 반환 (역할 설정의 폼 입력 또는 등록된 로그인 함수 사용)"""
+    config = manager.role_config(role)
+    context = browser.new_context(**(context_options or {}))
+    try:
+        page = context.new_page()
+        if role in _custom_logins:
+            _custom_logins[role](page, config, manager.base_url)
+        else:
+            page.goto(manager.url(config["login_url"]))
+            page.fill(config["username_selector"], config["username"])
+            page.fill(config["password_selector"], _password(config))
+            page.click(config["submit_selector"])
+            if config.get("success_url"):
+                page.wait_for_url(config["success_url"], timeout=LOGIN_TIMEOUT_MS)
+            elif config.get("success_selector"):
+                page.wait_for_selector(config["success_selector"], timeout=LOGIN_TIMEOUT_MS)
+            else:
+                page.wait_for_load_state("networkidle", timeout=LOGIN_TIMEOUT_MS)
+        if manager.is_login_page(role, page.url):
+            raise AuthError(f"로그인 실패 ({role}): 로그인 페이지에 머물러 있습니다 ({page.url})")
+        return context.storage_state()
+    finally:
+        context.close()
+
+
+def validate_playwright(browser, manager: AuthStateManager, role: str, storage_state: Dict[str, Any],
+                        context_options: Optional[Dict[str, Any]] = None) -> bool:
+    """저장된 상태로 check_url을 열어 로그인 페이지로 돌아가지 않는지 확인"""
+    context = browser.new_context(storage_state=storage_state, **(context_options or {}))
+    try:
+        page = context.new_page()
+        page.goto(manager.url(manager.role_config(role)["check_url"]))
+        return not manager.is_login_page(role, page.url)
+    except Exception:
+        return False
+    finally:
+        context.close()
+
+
+# ============================================================================
+# Selenium
+# ============================================================================
+
+def login_selenium(driver, manager: AuthStateManager, role: str) -> Dict[str, Any]:
+    """테스트 드라이버로 로그인 후 storage_state 형식으로 반환 (드라이버는 로그인된 상태로 남음)"""
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+
+    config = manager.role_config(role)
+    if role in _custom_logins:
+        _custom_logins[role](driver, config, manager.base_url)
+    else:
+        login_url = manager.url(config["login_url"])
+        driver.get(login_url)
+        wait = WebDriverWait(driver, LOGIN_TIMEOUT_MS / 1000)
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, config["username_selector"]))).send_keys(config["username"])
+        driver.find_element(By.CSS_SELECTOR, config["password_selector"]).send_keys(_password(config))
+        driver.find_element(By.CSS_SELECTOR, config["submit_selector"]).click()
+        if config.get("success_url"):
+            wait.until(lambda d: fnmatch.fnmatch(d.current_url, config["success_url"]))
+        elif config.get("success_selector"):
+            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, config["success_selector"])))
+        else:
+            wait.until(lambda d: not manager.is_login_page(role, d.current_url))
+    if manager.is_login_page(role, driver.current_url):
+        raise AuthError(f"로그인 실패 ({role}): 로그인 페이지에 머물러 있습니다 ({driver.current_url})")
+
+    cookies = []
+    for cookie in driver.get_cookies():
+        converted = {key: cookie[key] for key in ("name", "value", "domain", "path", "httpOnly", "secure") if key in cookie}
+        converted["expires"] = cookie.get("expiry", -1)
+        if cookie.get("sameSite"):
+            converted["sameSite"] = cookie["sameSite"]
+        cookies.append(converted)
+    origin = driver.execute_script("return window.location.origin")
+    local_storage = driver.execute_script(
+        "var items = []; for (var i = 0; i < localStorage.length; i++) {"
+        " var k = localStorage.key(i); items.push({name: k, value: localStorage.getItem(k)}); } return items;"
+    )
+    return {"cookies": cookies, "origins": [{"origin": origin, "localStorage": local_storage or []}]}
+
+
+def apply_selenium(driver, storage_state: Dict[str, Any]) -> None:
+    """
+    storage_state를 드라이버에 주입 (쿠키는 해당 도메인 페이지를 연 상태에서만 추가할 수 있으므로 origin별로 이동)
+
+    주입 후 드라이버는 마지막 origin의 페이지에 머무름
+    """
+    origins: Dict[str, List[Dict[str, Any]]] = {}
+    for item in storage_state.get("origins", []):
+        origins[item["origin"]] = item.get("localStorage", [])
+    cookies_by_origin: Dict[str, List[Dict[str, Any]]] = {}
+    for cookie in storage_state.get("cookies", []):
+        domain = cookie.get("domain", "").lstrip(".")
+        scheme = "https" if cookie.get("secure") else "http"
+        # localStorage origin과 같은 호스트면 그 origin에서 추가 (쿠키 도메인이 상위 도메인이어도 하위 호스트에서 설정 가능)
+        origin = next((o for o in origins if urlsplit(o).hostname and urlsplit(o).hostname.endswith(domain)),
+                      f"{scheme}://{domain}")
+        cookies_by_origin.setdefault(origin, []).append(cookie)
+
+    for origin in list(dict.fromkeys(list(cookies_by_origin) + list(origins))):
+        driver.get(origin + "/")
+        for cookie in cookies_by_origin.get(origin, []):
+            converted = {key: cookie[key] for key in ("name", "value", "path", "httpOnly", "secure") if key in cookie}
+            converted["domain"] = cookie.get("domain")
+            if cookie.get("expires", -1) > 0:
+                converted["expiry"] = int(cookie["expires"])
+            if cookie.get("sameSite") in ("Strict", "Lax", "None"):
+                converted["sameSite"] = cookie["sameSite"]
+            try:
+                driver.add_cookie(converted)
+            except Exception as e:
+                print(f"[AuthState] 쿠키 주입 실패: {cookie.get('name')} ({e})")
+        if origins.get(origin):
+            driver.execute_script(
+                "arguments[0].forEach(function (item) { localStorage.setItem(item.name, item.value); });",
+                origins[origin],
+            )
@@ -0,0 +1,81 @@
+"""
+실패 분류기 벤치마크
+실제 Playwright/Selenium traceback 모음(corpus/)으로 classify_failure의 정확도와 처리 시간을 측정
+(.txt는 traceback 문자열, .json은 TestReport._to_json() 결과로 구조화된 longrepr 그대로 분류)
+
+사용법:
+    python benchmarks/bench_failure_classifier.py
+    python benchmarks/bench_failure_classifier.py --repeat 5000 --budget-us 200
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import pytest
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+sys.path.insert(0, SCRIPTS_DIR)
+
+from test_utils import classify_failure  # noqa: E402
+
+# 비교하는 결과 항목 (error_message는 분석 텍스트라 제외)
+FIELDS = ("framework", "locator", "locator_failure", "line_number", "page_url")
+
+
+def load_corpus():
+    with open(os.path.join(CORPUS_DIR, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    samples = []
+    for entry in manifest:
+        with open(os.path.join(CORPUS_DIR, entry["file"]), "r", encoding="utf-8") as f:
+            if entry["file"].endswith(".json"):
+                samples.append((entry, pytest.TestReport._from_json(json.load(f)).longrepr))
+            else:
+                samples.append((entry, f.read()))
+    return samples
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="실패 분류기 벤치마크")
+    parser.add_argument("--repeat", type=int, default=2000, help="샘플당 반복 횟수")
+    parser.add_argument("--budget-us", type=float, default=None,
+                        help="샘플당 평균 처리 시간 상한 (µs, 초과 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    failures = 0
+    over_budget = 0
+    total_us = 0.0
+    samples = load_corpus()
+
+    print(f"{'sample':<42} {'avg µs':>10}  result")
+    for entry, text in samples:
+        result = classify_failure(text, entry.get("source_file"))
+        mismatches = [
+            f"{field}={result[field]!r} (기대값 {entry['expected'][field]!r})"
+            for field in FIELDS if result[field] != entry["expected"][field]
+        ]
+
+        start = time.perf_counter()
+        for _ in range(args.repeat):
+            classify_failure(text, entry.get("source_file"))
+        avg_us = (time.perf_counter() - start) / args.repeat * 1e6
+        total_us += avg_us
+
+        status = "OK" if not mismatches else "MISMATCH " + ", ".join(mismatches)
+        if args.budget_us is not None and avg_us > args.budget_us:
+            over_budget += 1
+            status += " (예산 초과)"
+        failures += bool(mismatches)
+        print(f"{entry['file']:<42} {avg_us:>10.1f}  {status}")
+
+    print(f"\n샘플 {len(samples)}개, 평균 {total_us / max(1, len(samples)):.1f} µs, "
+          f"불일치 {failures}개, 예산 초과 {over_budget}개")
+    return 1 if failures or over_budget else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
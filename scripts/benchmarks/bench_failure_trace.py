@@ -0,0 +1,97 @@
+"""
+실패 trace 오버헤드 벤치마크
+생성된 테스트와 비슷한 동작(페이지 이동, 입력, 클릭, 텍스트 확인)을 반복하며 통과한 테스트 하나에 추가되는 시간을 측정
+(trace 없음 / snapshots 모드로 기록 후 버림 / screenshots 모드로 기록 후 버림 / 실패 시 저장)
+
+사용법:
+    python benchmarks/bench_failure_trace.py
+    python benchmarks/bench_failure_trace.py --tests 50 --browser firefox --budget-pct 15
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from failure_trace import FailureTracer  # noqa: E402
+
+# 입력 폼 + 결과 목록이 있는 페이지 (외부 네트워크 없이 실행)
+PAGE = """data:text/html,<html><body>
+<form id="f"><input id="name" name="name"><input id="email" type="email"><button id="submit" type="button"
+onclick="const li=document.createElement('li');li.textContent=document.getElementById('name').value;
+document.getElementById('list').appendChild(li)">저장</button></form>
+<ul id="list">""" + "".join(f"<li class='row'>항목 {i}</li>" for i in range(200)) + "</ul></body></html>"
+
+
+def _run_test(page, index: int) -> None:
+    page.goto(PAGE)
+    page.fill("#name", f"user {index}")
+    page.fill("#email", f"user{index}@example.com")
+    page.click("#submit")
+    page.locator("#list li").last.wait_for()
+    assert page.locator("#list li").last.text_content() == f"user {index}"
+
+
+def _measure(browser, tests: int, tracer, failed: bool = False):
+    """테스트마다 새 컨텍스트 (page_playwright 기본 동작), 테스트 하나의 시간 목록(ms)"""
+    durations = []
+    for index in range(tests):
+        start = time.perf_counter()
+        context = browser.new_context()
+        page = context.new_page()
+        trace_start = tracer.begin(context, f"bench {index}") if tracer is not None else None
+        _run_test(page, index)
+        if tracer is not None:
+            tracer.end(context, f"bench_{index}", failed, trace_start)
+        page.close()
+        context.close()
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="실패 trace 오버헤드 벤치마크")
+    parser.add_argument("--tests", type=int, default=30, help="모드별 테스트 수")
+    parser.add_argument("--browser", default="chromium", choices=["chromium", "firefox", "webkit"])
+    parser.add_argument("--budget-pct", type=float, default=None,
+                        help="snapshots 모드의 통과한 테스트 오버헤드 상한 (%%, 초과 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    from playwright.sync_api import sync_playwright
+
+    with sync_playwright() as playwright, tempfile.TemporaryDirectory() as trace_dir:
+        browser = getattr(playwright, args.browser).launch()
+        # 브라우저 준비 시간 제외
+        _measure(browser, 3, None)
+        cases = [("trace 없음", None, False)]
+        cases.append(("snapshots, 통과(버림)", FailureTracer(trace_dir, screenshots=False, max_traces=0), False))
+        cases.append(("screenshots, 통과(버림)", FailureTracer(trace_dir, screenshots=True, max_traces=0), False))
+        cases.append(("snapshots, 실패(저장)", FailureTracer(trace_dir, screenshots=False, max_traces=0), True))
+        results = []
+        for label, tracer, failed in cases:
+            durations = _measure(browser, args.tests, tracer, failed)
+            size = tracer.stats["bytes_saved"] / max(1, tracer.stats["saved"]) / 1024 if tracer is not None else 0
+            results.append((label, statistics.median(durations), size))
+        browser.close()
+
+    baseline = results[0][1]
+    print(f"{args.browser}, 모드별 테스트 {args.tests}개 (중앙값)\n")
+    print(f"{'case':<28} {'ms/test':>9} {'overhead':>9}  trace")
+    for label, median, size in results:
+        overhead = (median - baseline) / baseline * 100
+        print(f"{label:<28} {median:>9.1f} {overhead:>8.1f}%  {f'{size:.0f} KB' if size else ''}")
+
+    snapshots_pct = (results[1][1] - baseline) / baseline * 100
+    if args.budget_pct is not None and snapshots_pct > args.budget_pct:
+        print(f"\n통과한 테스트 오버헤드 {snapshots_pct:.1f}%가 상한 {args.budget_pct}%를 초과")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
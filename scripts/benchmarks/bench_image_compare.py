@@ -0,0 +1,121 @@
+"""
+이미지 비교 벤치마크
+큰 전체 페이지 캡처 크기의 합성 이미지로 디코딩/띠 해시/픽셀 비교 시간을 측정
+(바이트 동일, 띠 해시 동일, 일부 영역 변경, 전체 변경, 기준 이미지 캐시 적중/미적중)
+
+사용법:
+    python benchmarks/bench_image_compare.py
+    python benchmarks/bench_image_compare.py --width 1920 --height 20000 --repeat 5 --budget-ms 300
+"""
+
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import numpy as np  # noqa: E402
+from PIL import Image  # noqa: E402
+
+import image_compare  # noqa: E402
+
+
+def _page(width: int, height: int, seed: int = 0) -> np.ndarray:
+    """웹 페이지와 비슷한 이미지 (흰 배경, 색 블록, 글자 모양의 잡음 줄)"""
+    rng = np.random.default_rng(seed)
+    pixels = np.full((height, width, 3), 255, dtype=np.uint8)
+    for top in range(0, height, 180):
+        color = rng.integers(0, 256, size=3, dtype=np.uint8)
+        pixels[top + 20:top + 60, 40:width - 40] = color
+        lines = pixels[top + 80:top + 160, 40:width - 40]
+        lines[rng.random(lines.shape[:2]) < 0.15] = (30, 30, 30)
+    return pixels
+
+
+def _png(pixels: np.ndarray) -> bytes:
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def _time_ms(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="이미지 비교 벤치마크")
+    parser.add_argument("--width", type=int, default=1280, help="이미지 너비 (px)")
+    parser.add_argument("--height", type=int, default=12000, help="이미지 높이 (px, 전체 페이지 캡처)")
+    parser.add_argument("--repeat", type=int, default=3, help="케이스별 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--budget-ms", type=float, default=None,
+                        help="일부 영역 변경 비교 시간 상한 (ms, 초과 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    baseline_pixels = _page(args.width, args.height)
+    baseline_png = _png(baseline_pixels)
+    # 같은 픽셀을 다른 압축 수준으로 인코딩 (바이트는 다르고 띠 해시는 같음)
+    buffer = io.BytesIO()
+    Image.fromarray(baseline_pixels).save(buffer, "PNG", compress_level=6)
+    reencoded_png = buffer.getvalue()
+    local = baseline_pixels.copy()
+    local[args.height // 2:args.height // 2 + 100, 100:400] = (255, 0, 0)
+    local_png = _png(local)
+    full_png = _png(_page(args.width, args.height, seed=1))
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        baseline_path = os.path.join(work_dir, "baseline.png")
+        with open(baseline_path, "wb") as f:
+            f.write(baseline_png)
+        comparator = image_compare.ImageComparator(os.path.join(work_dir, "diff"))
+        cold = _time_ms(lambda: image_compare.ImageComparator(work_dir).load_baseline(baseline_path), args.repeat)
+        expected = comparator.load_baseline(baseline_path)
+        warm = _time_ms(lambda: comparator.load_baseline(baseline_path), args.repeat)
+        decode_ms = _time_ms(lambda: image_compare.decode(local_png), args.repeat)
+        local_decoded = image_compare.DecodedImage.from_bytes(local_png)
+
+        cases = [
+            ("baseline load (cold)", cold, ""),
+            ("baseline load (cached)", warm, ""),
+            ("decode actual", decode_ms, ""),
+        ]
+        for label, actual, method in (
+            ("exact bytes", baseline_png, "perceptual"),
+            ("same pixels (tiles)", reencoded_png, "perceptual"),
+            ("local change", local_png, "perceptual"),
+            ("local change", local_png, "pixel"),
+            ("full change", full_png, "perceptual"),
+            ("full change", full_png, "pixel"),
+        ):
+            result = comparator.compare(actual, expected, method=method)
+            elapsed = _time_ms(lambda: comparator.compare(actual, expected, method=method), args.repeat)
+            cases.append((f"{label} [{method}]", elapsed,
+                          f"{result.reason}, tiles {result.tiles_diffed}/{result.tiles_total}, {result.diff_count}px"))
+        compare_only = _time_ms(lambda: comparator.compare(local_decoded, expected), args.repeat)
+        cases.append(("local change (decoded)", compare_only, "디코딩 제외"))
+        failure = _time_ms(lambda: comparator.check(local_png, baseline_path, "bench"), 1)
+        cases.append(("failure with diff image", failure, "actual/diff 저장 포함"))
+
+    megapixels = args.width * args.height / 1e6
+    print(f"{args.width}x{args.height} ({megapixels:.1f} MP, PNG {len(baseline_png) / 1024 / 1024:.1f} MB)\n")
+    print(f"{'case':<36} {'ms':>9}  note")
+    for label, elapsed, note in cases:
+        print(f"{label:<36} {elapsed:>9.1f}  {note}")
+
+    local_ms = next(elapsed for label, elapsed, _ in cases if label == "local change [perceptual]")
+    if args.budget_ms is not None and local_ms > args.budget_ms:
+        print(f"\n예산 초과 ({args.budget_ms} ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+레거시 스크립트 일괄 실행 벤치마크
+JSON 결과를 출력하는 레거시 스크립트를 스크립트마다 새 프로세스로 실행(PythonService.executeScript 방식)한 경우와
+script_batch_runner.py의 워커 풀로 실행한 경우의 전체 시간 비교
+
+사용법:
+    python benchmarks/bench_script_batch.py
+    python benchmarks/bench_script_batch.py --scripts 300 --workers 8 --import selenium.webdriver
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+from script_batch_runner import BatchRunner  # noqa: E402
+
+# example_test.py와 같은 형식의 결과를 출력하는 스크립트 (대기 없음)
+SCRIPT_TEMPLATE = """import json
+import sys
+{imports}
+
+def run_test():
+    return {{
+        "test_name": "레거시 테스트 {index}",
+        "status": "PASSED",
+        "details": {{"total_steps": 5, "passed_steps": 5, "failed_steps": 0}},
+        "steps": [{{"step": step, "status": "PASSED"}} for step in range(1, 6)],
+    }}
+
+if __name__ == "__main__":
+    print(json.dumps(run_test(), ensure_ascii=False))
+    sys.exit(0)
+"""
+
+
+def _run_subprocess(paths, workers: int) -> float:
+    """스크립트마다 새 인터프리터 (동시 실행 수는 workers와 같게)"""
+    def run(path):
+        result = subprocess.run([sys.executable, path], cwd=os.path.dirname(path), capture_output=True)
+        json.loads(result.stdout)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(run, paths))
+    return (time.perf_counter() - start) * 1000
+
+
+def _run_batch(paths, workers: int, preload) -> float:
+    results = []
+    runner = BatchRunner(workers=workers, timeout=60, preload=preload, emit=results.append)
+    start = time.perf_counter()
+    summary = runner.run([{"script": path} for path in paths])
+    elapsed = (time.perf_counter() - start) * 1000
+    if summary["passed"] != len(paths):
+        failed = [event for event in results if event.get("status") not in (None, "passed")]
+        raise RuntimeError(f"일괄 실행 실패: {failed[:3]}")
+    return elapsed
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="레거시 스크립트 일괄 실행 벤치마크")
+    parser.add_argument("--scripts", type=int, default=100, help="실행할 스크립트 수")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 2, help="동시 실행 수")
+    parser.add_argument("--import", dest="imports", action="append", default=[],
+                        help="스크립트마다 import할 모듈 (예: selenium.webdriver, 워커에서는 미리 import)")
+    args = parser.parse_args()
+
+    imports = "\n".join(f"import {name}" for name in args.imports)
+    with tempfile.TemporaryDirectory() as directory:
+        paths = []
+        for index in range(args.scripts):
+            path = os.path.join(directory, f"legacy_{index}.py")
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(SCRIPT_TEMPLATE.format(imports=imports, index=index))
+            paths.append(path)
+
+        subprocess_ms = _run_subprocess(paths, args.workers)
+        batch_ms = _run_batch(paths, args.workers, args.imports)
+
+    print(f"스크립트 {args.scripts}개, 동시 실행 {args.workers}\n")
+    print(f"{'case':<24} {'total ms':>10} {'scripts/s':>10}")
+    for label, elapsed in (("스크립트마다 새 프로세스", subprocess_ms), ("워커 풀 (runpy)", batch_ms)):
+        print(f"{label:<24} {elapsed:>10.1f} {args.scripts / elapsed * 1000:>10.1f}")
+    print(f"\n{subprocess_ms / batch_ms:.1f}배")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""
+pytest 시작 시간 벤치마크
+`pytest --collect-only` 실행 시간을 새 프로세스로 여러 번 측정해 기준값(startup_baseline.json)과 비교
+(PC 성능 차이를 줄이기 위해 각 항목은 같은 실행의 인터프리터 시작 시간 대비 배수로 비교)
+
+측정 항목:
+- interpreter: 빈 Python 인터프리터 시작
+- import_pytest: `import pytest`까지
+- collect_only: `pytest --collect-only -q -p no:cacheprovider <대상>` 전체 (플러그인/conftest import + 수집)
+
+사용법:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --repeat 15 --max-regression 0.2   # 허용치 초과 시 종료 코드 1
+    python benchmarks/bench_startup.py --update-baseline
+    python benchmarks/bench_startup.py --pytest-arg=-pxdist   # pytest 인자 추가
+    python benchmarks/bench_startup.py --profile      # 항목별 시간 (-p startup_profiler)
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "startup_baseline.json")
+
+# 기준값 비교 대상 (interpreter는 비교 기준)
+TRACKED = ("import_pytest", "collect_only")
+
+
+def _pytest_command(target: str, extra=()):
+    return [sys.executable, "-m", "pytest", "--collect-only", "-q", "-p", "no:cacheprovider", *extra, target]
+
+
+def _measure(command, repeat: int):
+    """명령을 repeat번 실행해 실행 시간(ms) 목록 반환 (첫 실행은 디스크 캐시 준비용으로 버림)"""
+    times = []
+    for index in range(repeat + 1):
+        start = time.perf_counter()
+        result = subprocess.run(command, cwd=SCRIPTS_DIR, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        elapsed = (time.perf_counter() - start) * 1000
+        if result.returncode not in (0, 5):
+            # 5: 수집된 테스트 없음
+            raise RuntimeError(f"실행 실패 ({result.returncode}): {' '.join(command)}\n"
+                               f"{result.stderr.decode(errors='replace')[-2000:]}")
+        if index > 0:
+            times.append(elapsed)
+    return times
+
+
+def _environment():
+    import pytest
+    return {
+        "python": platform.python_version(),
+        "pytest": pytest.__version__,
+        "platform": platform.platform(terse=True),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="pytest 시작 시간 벤치마크")
+    parser.add_argument("target", nargs="?", default="test_example.py", help="수집 대상 (scripts 기준 경로)")
+    parser.add_argument("--repeat", type=int, default=10, help="항목별 반복 횟수")
+    parser.add_argument("--max-regression", type=float, default=None,
+                        help="기준값 대비 허용 증가율 (지정하면 초과 시 종료 코드 1, 기본: 결과만 출력)")
+    parser.add_argument("--update-baseline", action="store_true", help="측정값을 기준값으로 저장")
+    parser.add_argument("--pytest-arg", action="append", default=[],
+                        help="pytest에 추가로 전달할 인자 (여러 번 지정 가능)")
+    parser.add_argument("--profile", action="store_true",
+                        help="-p startup_profiler로 한 번 실행해 플러그인/훅/fixture별 시간 출력")
+    args = parser.parse_args()
+
+    if args.profile:
+        command = _pytest_command(args.target, ("-p", "startup_profiler", *args.pytest_arg))
+        return subprocess.call(command, cwd=SCRIPTS_DIR)
+
+    # PYTHONDONTWRITEBYTECODE가 설정되어 있어도 .pyc가 있는 상태로 측정
+    subprocess.run([sys.executable, "-m", "compileall", "-q", SCRIPTS_DIR], stdout=subprocess.DEVNULL)
+
+    commands = {
+        "interpreter": [sys.executable, "-c", "pass"],
+        "import_pytest": [sys.executable, "-c", "import pytest"],
+        "collect_only": _pytest_command(args.target, args.pytest_arg),
+    }
+    results = {}
+    print(f"{'item':<16} {'min ms':>9} {'median ms':>10}")
+    for name, command in commands.items():
+        times = _measure(command, args.repeat)
+        results[name] = {"min_ms": round(min(times), 1), "median_ms": round(statistics.median(times), 1)}
+        print(f"{name:<16} {results[name]['min_ms']:>9.1f} {results[name]['median_ms']:>10.1f}")
+
+    environment = _environment()
+    if args.update_baseline:
+        with open(BASELINE_FILE, "w", encoding="utf-8") as f:
+            json.dump({"target": args.target, "pytest_args": args.pytest_arg, "repeat": args.repeat,
+                       "environment": environment, "results": results}, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"\n기준값 저장: {BASELINE_FILE}")
+        return 0
+
+    if not os.path.exists(BASELINE_FILE):
+        print("\n기준값이 없습니다 (--update-baseline으로 생성)")
+        return 0
+    with open(BASELINE_FILE, "r", encoding="utf-8") as f:
+        baseline = json.load(f)
+    if (baseline.get("environment") != environment or baseline.get("target") != args.target
+            or baseline.get("pytest_args", []) != args.pytest_arg):
+        print(f"\n주의: 기준값과 측정 조건이 다릅니다 (기준값: {baseline.get('environment')}, "
+              f"대상 {baseline.get('target')}, pytest 인자 {baseline.get('pytest_args', [])})")
+
+    regressions = 0
+    base_interpreter = baseline["results"]["interpreter"]["min_ms"]
+    interpreter = results["interpreter"]["min_ms"]
+    print(f"\n인터프리터 시작 시간 대비 배수 (기준값 {base_interpreter:.1f} ms, 현재 {interpreter:.1f} ms)")
+    print(f"{'item':<16} {'baseline':>9} {'current':>9} {'change':>8}")
+    for name in TRACKED:
+        base = baseline["results"].get(name)
+        if not base:
+            continue
+        # 다른 프로세스의 영향을 덜 받는 최솟값으로 비교
+        base_ratio = base["min_ms"] / base_interpreter
+        ratio = results[name]["min_ms"] / interpreter
+        change = ratio / base_ratio - 1
+        status = ""
+        if args.max_regression is not None and change > args.max_regression:
+            regressions += 1
+            status = " (허용치 초과)"
+        print(f"{name:<16} {base_ratio:>8.1f}x {ratio:>8.1f}x {change:>+8.1%}{status}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
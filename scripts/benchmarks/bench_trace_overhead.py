@@ -0,0 +1,72 @@
+"""
+실행 구간 기록기 오버헤드 벤치마크
+trace_recorder로 감싼 드라이버 호출 한 번에 추가되는 시간을 측정 (기록 중 / 기록하지 않을 때)
+
+사용법:
+    python benchmarks/bench_trace_overhead.py
+    python benchmarks/bench_trace_overhead.py --calls 200000 --budget-us 10
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+SCRIPTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SCRIPTS_DIR)
+
+import trace_recorder  # noqa: E402
+
+
+class FakeWebDriver:
+    """WebDriver.execute와 같은 형태의 빈 호출 (드라이버 통신 시간 없이 기록 비용만 측정)"""
+
+    def execute(self, driver_command, params=None):
+        return {"value": None}
+
+
+def _per_call_us(driver, calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        driver.execute("findElement", {"using": "css selector", "value": "#login"})
+    return (time.perf_counter() - start) / calls * 1e6
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="실행 구간 기록기 오버헤드 벤치마크")
+    parser.add_argument("--calls", type=int, default=100000, help="측정할 호출 수")
+    parser.add_argument("--budget-us", type=float, default=None,
+                        help="기록 중 호출당 추가 시간 상한 (µs, 초과 시 종료 코드 1)")
+    args = parser.parse_args()
+
+    driver = FakeWebDriver()
+    baseline = _per_call_us(driver, args.calls)
+
+    FakeWebDriver.execute = trace_recorder._wrap_selenium_execute(FakeWebDriver.execute)
+    idle = _per_call_us(driver, args.calls)
+
+    with tempfile.TemporaryDirectory() as trace_dir:
+        recorder = trace_recorder.TraceRecorder(os.path.join(trace_dir, "trace-bench.json"))
+        trace_recorder._active = recorder
+        try:
+            recording = _per_call_us(driver, args.calls)
+        finally:
+            trace_recorder._active = None
+            recorder.close()
+        size = os.path.getsize(recorder.path)
+
+    overhead = recording - baseline
+    print(f"{'case':<24} {'µs/call':>9}")
+    print(f"{'direct':<24} {baseline:>9.2f}")
+    print(f"{'wrapped (idle)':<24} {idle:>9.2f}")
+    print(f"{'wrapped (recording)':<24} {recording:>9.2f}")
+    print(f"\n호출당 추가 시간 {overhead:.2f} µs, 이벤트당 파일 크기 {size / args.calls:.0f} bytes")
+    if args.budget_us is not None and overhead > args.budget_us:
+        print(f"예산 초과 ({args.budget_us} µs)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+"""
+브라우저 매트릭스 실행 (--browser-matrix, conftest.py에서 사용)
+세션 하나에서 여러 브라우저를 실행: 브라우저를 쓰는 테스트마다 브라우저별 항목을 만들고
+(session 범위 간접 파라미터 matrix_browser, node ID 예: test_login[firefox]) 결과를 브라우저별로 합쳐 보고
+
+- 브라우저 실행: 워커마다 브라우저별로 한 번 (pytest가 같은 브라우저 항목을 묶어 실행하고,
+  병렬 실행 시 duration_scheduler가 워커마다 같은 브라우저의 작업 단위를 이어서 배정)
+- 리포트: 테스트 리포트 user_properties의 ("browser", 이름), 실행 통계 browser_matrix.<브라우저>,
+  JSON 리포트의 browser_matrix 항목 (브라우저별 결과 + 브라우저마다 결과가 다른 테스트)
+"""
+
+import re
+import pytest
+from typing import Optional, Dict, Any, List, Iterable, Callable
+
+# 매트릭스에 지정할 수 있는 브라우저 (chrome/edge는 Playwright에서 chromium + 채널)
+SUPPORTED_BROWSERS = ("chromium", "firefox", "webkit", "chrome", "edge")
+
+# 리포트 user_properties 항목 이름
+BROWSER_PROPERTY = "browser"
+
+# 브라우저별 항목으로 나눌 테스트 (이 fixture 중 하나를 쓰는 테스트)
+BROWSER_FIXTURES = frozenset((
+    "page", "driver", "page_playwright", "browser_playwright", "browser_type", "playwright_context_pools",
+    "driver_selenium", "selenium_driver_options", "selenium_driver_pool",
+))
+
+_PARAMS_RE = re.compile(r"\[([^\]]*)\]$")
+
+
+def parse_browsers(matrix: str, browser_option: Any = None) -> List[str]:
+    """
+    매트릭스 브라우저 목록
+
+    matrix: --browser-matrix 값 (쉼표 구분)
+    browser_option: --browser 값 (pytest-playwright는 목록, 두 개 이상 지정한 경우에만 매트릭스로 사용)
+    """
+    if matrix:
+        names = [name.strip().lower() for name in matrix.split(",") if name.strip()]
+    elif isinstance(browser_option, (list, tuple)) and len(browser_option) > 1:
+        names = [str(name).lower() for name in browser_option]
+    else:
+        return []
+    unknown = [name for name in names if name not in SUPPORTED_BROWSERS]
+    if unknown:
+        raise ValueError(f"지원하지 않는 브라우저: {', '.join(unknown)} (지원: {', '.join(SUPPORTED_BROWSERS)})")
+    # 순서 유지, 중복 제거
+    return list(dict.fromkeys(names))
+
+
+def browser_of(nodeid: str, browsers: Iterable[str]) -> Optional[str]:
+    """node ID의 파라미터 id에서 매트릭스 브라우저 찾기 (예: test_a[firefox-2] -> firefox)"""
+    match = _PARAMS_RE.search(nodeid)
+    if not match:
+        return None
+    browsers = set(browsers)
+    for part in match.group(1).split("-"):
+        if part in browsers:
+            return part
+    return None
+
+
+def base_nodeid(nodeid: str, browser: str) -> str:
+    """브라우저 파라미터를 뺀 node ID (브라우저별 결과 비교용)"""
+    match = _PARAMS_RE.search(nodeid)
+    if not match:
+        return nodeid
+    parts = match.group(1).split("-")
+    if browser in parts:
+        parts.remove(browser)
+    prefix = nodeid[:match.start()]
+    return f"{prefix}[{'-'.join(parts)}]" if parts else prefix
+
+
+class MatrixReport:
+    """
+    브라우저별 결과 집계 플러그인 (xdist 컨트롤러에서만 등록, 워커 리포트도 컨트롤러로 전달됨)
+
+    테스트 하나의 결과: call 단계 결과, setup/teardown 실패는 error, setup 단계 skip은 skipped
+    """
+
+    def __init__(self, browsers: List[str], publish_stats: Optional[Callable] = None):
+        self.browsers = browsers
+        self.publish_stats = publish_stats
+        self.summary: Dict[str, Dict[str, Any]] = {
+            browser: {"passed": 0, "failed": 0, "skipped": 0, "error": 0, "duration_s": 0.0}
+            for browser in browsers
+        }
+        # 브라우저를 뺀 node ID -> {브라우저: 결과}
+        self.results: Dict[str, Dict[str, str]] = {}
+
+    @staticmethod
+    def _browser(report) -> Optional[str]:
+        for name, value in getattr(report, "user_properties", ()):
+            if name == BROWSER_PROPERTY:
+                return value
+        return None
+
+    def _set(self, report, browser: str, outcome: str) -> None:
+        tests = self.results.setdefault(base_nodeid(report.nodeid, browser), {})
+        # 같은 테스트의 teardown 오류는 call 결과를 덮어씀 (통과 후 teardown 실패 등)
+        previous = tests.get(browser)
+        if previous is not None:
+            self.summary[browser][previous] -= 1
+        tests[browser] = outcome
+        self.summary[browser][outcome] += 1
+
+    def pytest_runtest_logreport(self, report):
+        browser = self._browser(report)
+        if browser not in self.summary:
+            return
+        if report.when == "call":
+            self._set(report, browser, report.outcome)
+            self.summary[browser]["duration_s"] = round(self.summary[browser]["duration_s"] + report.duration, 3)
+        elif report.when == "setup" and not report.passed:
+            self._set(report, browser, "skipped" if report.skipped else "error")
+        elif report.when == "teardown" and report.failed:
+            self._set(report, browser, "error")
+
+    def divergent(self) -> Dict[str, Dict[str, str]]:
+        """브라우저마다 결과가 다른 테스트 (skip 제외)"""
+        return {
+            nodeid: outcomes for nodeid, outcomes in sorted(self.results.items())
+            if len({outcome for outcome in outcomes.values() if outcome != "skipped"}) > 1
+        }
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        # JSON 리포트(pytest-json-report의 sessionfinish)보다 먼저 실행 통계에 등록
+        if self.publish_stats is None:
+            return
+        for browser, summary in self.summary.items():
+            if any(summary[outcome] for outcome in ("passed", "failed", "skipped", "error")):
+                self.publish_stats(f"browser_matrix.{browser}", summary)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_json_modifyreport(self, json_report):
+        json_report["browser_matrix"] = {
+            "browsers": self.browsers,
+            "summary": self.summary,
+            "divergent": self.divergent(),
+        }
+
+    def pytest_terminal_summary(self, terminalreporter):
+        divergent = self.divergent()
+        if not divergent:
+            return
+        terminalreporter.write_sep("-", "브라우저마다 결과가 다른 테스트")
+        for nodeid, outcomes in divergent.items():
+            values = ", ".join(f"{browser}={outcomes.get(browser, '-')}" for browser in self.browsers)
+            terminalreporter.write_line(f"{nodeid}: {values}")
@@ -8,12 +8,15 @@ import sys
 import os
 import time
 import json
+import inspect
+from contextlib import nullcontext
 from pathlib import Path
 from typing import Optional, Dict, Any
 
-# 프로젝트 루트를 Python 경로에 추가
+# 프로젝트 루트를 Python 경로에 추가 (상주 실행기에서 conftest를 다시 import해도 중복 추가하지 않음)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 
 def pytest_addoption(parser):
@@ -31,8 +34,8 @@ def pytest_addoption(parser):
             "--driver",
             action="store",
             default=os.getenv("TEST_DRIVER", "playwright"),
-            choices=["playwright", "selenium"],
-            help="사용할 웹드라이버 (playwright, selenium)"
+            choices=["playwright", "playwright-async", "selenium"],
+            help="사용할 웹드라이버 (playwright, playwright-async, selenium)"
         )
     except ValueError:
         # 이미 등록된 경우 무시 (중복 등록 방지)
@@ -53,11 +56,257 @@ def pytest_addoption(parser):
     except ValueError:
         # 이미 등록된 경우 무시 (중복 등록 방지)
         pass
+    
+    # --context-pool 옵션 등록 (BrowserContext 재사용)
+    try:
+        parser.addoption(
+            "--context-pool",
+            action="store",
+            default=os.getenv("TEST_CONTEXT_POOL", "false"),
+            choices=["true", "false"],
+            help="Playwright BrowserContext 풀 사용 여부 (true, false)"
+        )
+        parser.addoption(
+            "--context-pool-size",
+            action="store",
+            type=int,
+            default=int(os.getenv("TEST_CONTEXT_POOL_SIZE", "2")),
+            help="워커당 유휴 BrowserContext 최대 개수 (데스크톱/모바일 각각)"
+        )
+        parser.addoption(
+            "--context-pool-max-uses",
+            action="store",
+            type=int,
+            default=int(os.getenv("TEST_CONTEXT_POOL_MAX_USES", "50")),
+            help="BrowserContext 하나를 재사용할 최대 테스트 수"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --async-concurrency 옵션 등록 (playwright-async 모드 동시 실행 수)
+    try:
+        parser.addoption(
+            "--async-concurrency",
+            action="store",
+            type=int,
+            default=int(os.getenv("TEST_ASYNC_CONCURRENCY", "4")),
+            help="playwright-async 모드에서 워커당 동시에 실행할 async 테스트 수"
+        )
+        parser.addoption(
+            "--async-test-timeout",
+            action="store",
+            type=float,
+            default=float(os.getenv("TEST_ASYNC_TEST_TIMEOUT", "0")),
+            help="playwright-async 모드의 async 테스트 하나당 제한 시간(초, 0이면 제한 없음)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --ndjson-report 옵션 등록 (테스트 단계별 결과 스트리밍)
+    try:
+        parser.addoption(
+            "--ndjson-report",
+            action="store",
+            default=os.getenv("TEST_NDJSON_REPORT", ""),
+            help="테스트 단계가 끝날 때마다 NDJSON 이벤트를 기록할 파일 경로 ('fd:N'이면 해당 파일 디스크립터)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --trace-events 옵션 등록 (실행 구간 trace-event 기록)
+    try:
+        parser.addoption(
+            "--trace-events",
+            action="store",
+            default=os.getenv("TEST_TRACE_EVENTS", ""),
+            help="fixture/단계/페이지 이동/드라이버 호출 시간을 Chrome trace-event JSON으로 기록할 디렉토리"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --history-schedule 옵션 등록 (실행 시간 기록 기반 xdist 배정)
+    try:
+        parser.addoption(
+            "--history-schedule",
+            action="store",
+            default=os.getenv("TEST_HISTORY_SCHEDULE", "true"),
+            choices=["true", "false"],
+            help="병렬 실행(-n) 시 이전 실행 시간 기록으로 오래 걸리는 테스트부터 워커에 배정 (true, false)"
+        )
+        parser.addoption(
+            "--duration-history",
+            action="store",
+            default=os.getenv("TEST_DURATION_HISTORY", ""),
+            help="테스트 실행 시간 기록 파일 경로 (기본값: ~/.testarchitect/duration-history.json)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --incremental 옵션 등록 (변경된 테스트만 실행)
+    try:
+        parser.addoption(
+            "--incremental",
+            action="store",
+            default=os.getenv("TEST_INCREMENTAL", "false"),
+            choices=["true", "false"],
+            help="코드 지문이 바뀌었거나 지난 실행에서 통과하지 못한 테스트만 실행하고 나머지는 캐시된 통과로 보고 (true, false)"
+        )
+        parser.addoption(
+            "--incremental-state",
+            action="store",
+            default=os.getenv("TEST_INCREMENTAL_STATE", ""),
+            help="선택 실행 기록 파일 경로 (기본값: ~/.testarchitect/incremental-state.json)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --network-cache 옵션 등록 (Playwright 네트워크 기록/재생)
+    try:
+        parser.addoption(
+            "--network-cache",
+            action="store",
+            default=os.getenv("TEST_NETWORK_CACHE", "live"),
+            choices=["live", "record", "replay", "auto"],
+            help="Playwright 요청 기록/재생 모드 (live, record, replay, auto: 기록이 있으면 재생, 없으면 기록). network 마커가 우선"
+        )
+        parser.addoption(
+            "--network-cache-dir",
+            action="store",
+            default=os.getenv("TEST_NETWORK_CACHE_DIR", ""),
+            help="네트워크 기록 저장소 디렉토리 (기본값: ~/.testarchitect/network-cache)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --block-resources 옵션 등록 (이미지/폰트/미디어/외부 분석 스크립트 차단)
+    try:
+        parser.addoption(
+            "--block-resources",
+            action="store",
+            default=os.getenv("TEST_BLOCK_RESOURCES", "off"),
+            choices=["off", "media", "trackers", "fast"],
+            help="리소스 차단 프로필 (off, media: 이미지/폰트/미디어, trackers: 외부 분석/광고, fast: 둘 다). block_resources 마커가 우선"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --auth-role 옵션 등록 (역할별 로그인 상태 재사용)
+    try:
+        parser.addoption(
+            "--auth-role",
+            action="store",
+            default=os.getenv("TEST_AUTH_ROLE", ""),
+            help="모든 테스트에 적용할 로그인 역할 (auth 마커가 우선, 비어 있으면 로그인 상태를 주입하지 않음)"
+        )
+        parser.addoption(
+            "--auth-roles",
+            action="store",
+            default=os.getenv("TEST_AUTH_ROLES", ""),
+            help="역할별 로그인 설정 파일 경로 (기본값: rootdir의 auth_roles.json)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --browser-matrix 옵션 등록 (세션 하나에서 여러 브라우저 실행)
+    try:
+        parser.addoption(
+            "--browser-matrix",
+            action="store",
+            default=os.getenv("TEST_BROWSER_MATRIX", ""),
+            help="쉼표로 구분한 브라우저 목록 (예: chromium,firefox,webkit). 브라우저를 쓰는 테스트를 브라우저별로 실행하고 결과를 브라우저별로 합침 "
+                 "(비어 있어도 --browser를 두 개 이상 지정하면 사용)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --failure-trace 옵션 등록 (실패한 테스트만 Playwright trace 저장)
+    try:
+        parser.addoption(
+            "--failure-trace",
+            action="store",
+            default=os.getenv("TEST_FAILURE_TRACE", "off"),
+            choices=["off", "snapshots", "screenshots"],
+            help="테스트마다 Playwright trace를 기록하고 실패한 테스트만 trace.zip으로 저장 (off, snapshots: DOM 스냅샷, screenshots: 스냅샷 + 스크린샷)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --memory-telemetry 옵션 등록 (테스트별 메모리 측정, 브라우저 재실행 기준)
+    try:
+        parser.addoption(
+            "--memory-telemetry",
+            action="store",
+            default=os.getenv("TEST_MEMORY_TELEMETRY", "false"),
+            choices=["true", "false"],
+            help="테스트별 브라우저/Python 메모리 측정 및 증가량 상위 테스트 보고 (true, false)"
+        )
+        parser.addoption(
+            "--browser-recycle-mb",
+            action="store",
+            type=float,
+            default=float(os.getenv("TEST_BROWSER_RECYCLE_MB", "0")),
+            help="브라우저 프로세스 트리 RSS(MB)가 이 값을 넘으면 테스트 사이에 Playwright 브라우저 재실행 (0이면 사용 안 함)"
+        )
+        parser.addoption(
+            "--browser-recycle-tests",
+            action="store",
+            type=int,
+            default=int(os.getenv("TEST_BROWSER_RECYCLE_TESTS", "0")),
+            help="Playwright 브라우저 하나로 실행할 최대 테스트 수 (0이면 제한 없음)"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+    
+    # --selenium-pool 옵션 등록 (WebDriver 세션 재사용)
+    try:
+        parser.addoption(
+            "--selenium-pool",
+            action="store",
+            default=os.getenv("TEST_SELENIUM_POOL", "false"),
+            choices=["true", "false"],
+            help="Selenium WebDriver 세션 풀 사용 여부 (true, false)"
+        )
+        parser.addoption(
+            "--selenium-pool-max-uses",
+            action="store",
+            type=int,
+            default=int(os.getenv("TEST_SELENIUM_POOL_MAX_USES", "20")),
+            help="WebDriver 세션 하나를 재사용할 최대 테스트 수"
+        )
+    except ValueError:
+        # 이미 등록된 경우 무시 (중복 등록 방지)
+        pass
+
+
+@pytest.fixture(scope="session")
+def matrix_browser(request):
+    """브라우저 매트릭스 실행 시 이 항목의 브라우저 (pytest_generate_tests에서 session 범위로 파라미터화, 아니면 None)"""
+    return getattr(request, "param", None)
 
 
 @pytest.fixture(scope="session")
-def test_config(pytestconfig):
-    """테스트 설정 fixture"""
+def test_config(pytestconfig, matrix_browser):
+    """테스트 설정 fixture (매트릭스 실행 시 브라우저별로 따로 생성되어 브라우저 fixture도 브라우저별로 생성됨)"""
+    config = _build_test_config(pytestconfig)
+    if matrix_browser:
+        config["browser"] = matrix_browser
+    return config
+
+
+def _build_test_config(pytestconfig) -> Dict[str, Any]:
+    """명령줄 옵션/환경 변수로 테스트 설정 생성"""
     # pytest-base-url 플러그인의 base_url 옵션 사용
     try:
         base_url = pytestconfig.getoption("base_url")
@@ -90,18 +339,97 @@ def test_config(pytestconfig):
         "browser": browser,
         "headless": headless,
         "driver": pytestconfig.getoption("--driver"),
-        "mobile": pytestconfig.getoption("--mobile") == "true"
+        "mobile": pytestconfig.getoption("--mobile") == "true",
+        "context_pool": pytestconfig.getoption("--context-pool") == "true",
+        "context_pool_size": pytestconfig.getoption("--context-pool-size"),
+        "context_pool_max_uses": pytestconfig.getoption("--context-pool-max-uses"),
+        "selenium_pool": pytestconfig.getoption("--selenium-pool") == "true",
+        "selenium_pool_max_uses": pytestconfig.getoption("--selenium-pool-max-uses"),
+        "async_concurrency": pytestconfig.getoption("--async-concurrency"),
+        "async_test_timeout": pytestconfig.getoption("--async-test-timeout"),
+        "network_cache": pytestconfig.getoption("--network-cache"),
+        "network_cache_dir": pytestconfig.getoption("--network-cache-dir"),
+        "block_resources": pytestconfig.getoption("--block-resources"),
+        "auth_role": pytestconfig.getoption("--auth-role"),
+        "failure_trace": pytestconfig.getoption("--failure-trace", default="off"),
+        "browser_matrix": _matrix_browsers(pytestconfig)
     }
 
 
+def _matrix_browsers(config) -> list:
+    """브라우저 매트릭스 목록 (--browser-matrix 또는 두 개 이상의 --browser, 매트릭스 실행이 아니면 빈 목록)"""
+    from browser_matrix import parse_browsers
+    try:
+        browser_option = config.getoption("--browser")
+    except (ValueError, AttributeError):
+        browser_option = None
+    try:
+        return parse_browsers(config.getoption("--browser-matrix", default=""), browser_option)
+    except ValueError as e:
+        raise pytest.UsageError(f"--browser-matrix: {e}")
+
+
+def pytest_generate_tests(metafunc):
+    """브라우저 매트릭스: 브라우저를 쓰는 테스트를 브라우저별 항목으로 나눔 (예: test_login[firefox])"""
+    config = metafunc.config
+    # playwright-async 모드는 워커당 브라우저 하나를 공유하므로 매트릭스를 적용하지 않음
+    if "matrix_browser" not in metafunc.fixturenames or _is_async_mode(config):
+        return
+    from browser_matrix import BROWSER_FIXTURES
+    browsers = _matrix_browsers(config)
+    if browsers and BROWSER_FIXTURES.intersection(metafunc.fixturenames):
+        # session 범위: 같은 브라우저 항목끼리 묶여 실행되어 브라우저를 워커마다 브라우저별로 한 번만 실행
+        metafunc.parametrize("matrix_browser", browsers, indirect=True, scope="session", ids=browsers)
+
+
+def pytest_itemcollected(item):
+    """매트릭스 항목의 브라우저를 리포트에 기록 (xdist 워커 리포트와 JSON/NDJSON 리포트에 전달됨)"""
+    callspec = getattr(item, "callspec", None)
+    if callspec is not None and callspec.params.get("matrix_browser"):
+        from browser_matrix import BROWSER_PROPERTY
+        item.user_properties.append((BROWSER_PROPERTY, callspec.params["matrix_browser"]))
+
+
+def _record_artifact(node, kind: str, path: str) -> None:
+    """테스트 산출물 경로를 리포트에 기록 (user_properties로 xdist/JSON/NDJSON 리포트에 전달됨)"""
+    node.user_properties.append((f"artifact:{kind}", path))
+
+
+def _record_setup_group(node, test_config, url: str) -> None:
+    """테스트가 사용한 브라우저/호스트 기록 (병렬 실행 시 같은 설정을 쓰는 테스트를 같은 워커에 배정하는 데 사용)"""
+    from urllib.parse import urlparse
+    host = urlparse(url).netloc if url else ""
+    if host:
+        node.user_properties.append(("setup_group", f"{test_config['browser']}|{host}"))
+
+
+def _test_failed(item) -> bool:
+    """setup 또는 call 단계에서 테스트가 실패했는지 확인"""
+    for when in ("setup", "call"):
+        rep = getattr(item, f"rep_{when}", None)
+        if rep is not None and rep.failed:
+            return True
+    return False
+
+
 # ============================================================================
 # Playwright Fixtures
 # ============================================================================
 
+def _resident_browsers():
+    """상주 실행기(pytest_daemon.py)에서 실행 중이면 실행 간에 유지되는 브라우저 저장소 반환"""
+    daemon = sys.modules.get("pytest_daemon")
+    return getattr(daemon, "resident_browsers", None)
+
+
 @pytest.fixture(scope="session")
 def playwright_instance():
-    """Playwright 인스턴스 생성"""
+    """Playwright 인스턴스 생성 (상주 실행기에서는 실행 간에 재사용하므로 종료하지 않음)"""
     try:
+        resident = _resident_browsers()
+        if resident is not None:
+            yield resident.playwright()
+            return
         from playwright.sync_api import sync_playwright
         with sync_playwright() as p:
             yield p
@@ -144,9 +472,179 @@ def browser_playwright(browser_type, test_config):
     if test_config["browser"] in ["chrome", "edge"]:
         launch_options["channel"] = test_config["browser"]
     
-    browser = browser_type.launch(**launch_options)
+    resident = _resident_browsers()
+    if resident is not None:
+        # 상주 실행기: 브라우저는 유지하고 남은 컨텍스트는 실행기가 정리
+        launch = lambda: resident.browser(browser_type, launch_options)
+    else:
+        launch = lambda: browser_type.launch(**launch_options)
+    
+    if _memory_telemetry is not None and _memory_telemetry.recycles:
+        # 메모리/테스트 수 기준을 넘으면 테스트 사이에 다시 실행 (page_playwright 정리 단계)
+        from memory_telemetry import RecyclableBrowser
+        browser = RecyclableBrowser(launch, lambda old: old.close())
+    else:
+        browser = launch()
     yield browser
-    browser.close()
+    if resident is None:
+        browser.close()
+
+
+# 모바일 디바이스 에뮬레이션 프로필 (iPhone 12 Pro)
+MOBILE_DEVICE = {
+    'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1',
+    'viewport': {'width': 390, 'height': 844},
+    'device_scale_factor': 3,
+    'is_mobile': True,
+    'has_touch': True
+}
+
+
+@pytest.fixture(scope="session")
+def playwright_context_pools(browser_playwright, test_config):
+    """워커 단위 BrowserContext 풀 (데스크톱/모바일 프로필별로 분리)"""
+    from context_pool import ContextPool
+    
+    pools = {}
+    
+    def get_pool(profile):
+        if profile not in pools:
+            pool = ContextPool(
+                browser_playwright,
+                context_options=MOBILE_DEVICE if profile == "mobile" else None,
+                max_size=test_config["context_pool_size"],
+                max_uses=test_config["context_pool_max_uses"],
+                name=profile
+            )
+            pool.prewarm()
+            pools[profile] = pool
+        return pools[profile]
+    
+    def close_pools():
+        for profile, pool in pools.items():
+            pool.close()
+            _publish_stats(f"context_pool.{profile}", pool.summary())
+        pools.clear()
+    
+    # 브라우저를 다시 실행하면 이전 브라우저의 컨텍스트는 버리고 새 브라우저로 풀을 다시 만듦
+    if _is_recyclable(browser_playwright):
+        browser_playwright.on_recycle(close_pools)
+    
+    yield get_pool
+    
+    close_pools()
+
+
+def _attach_network_cache(context, request, test_config):
+    """네트워크 기록/재생 라우터 연결 (live 모드면 None)"""
+    marker = request.node.get_closest_marker("network")
+    if test_config["network_cache"] == "live" and marker is None:
+        return None
+    from network_cache import NetworkCache, NetworkStore, resolve_mode, CACHE_DIR
+    mode, rules = resolve_mode(test_config["network_cache"], marker)
+    if mode == "live":
+        return None
+    cache = NetworkCache(NetworkStore(test_config["network_cache_dir"] or CACHE_DIR), rules, mode)
+    cache.attach(context)
+    return cache
+
+
+def _detach_network_cache(cache, request) -> None:
+    """라우팅 해제 후 통계 등록 (재생 모드에서 기록에 없던 요청 출력)"""
+    if cache is None:
+        return
+    cache.detach()
+    _publish_stats(f"network_cache.{cache.mode}", cache.stats)
+    if cache.missed:
+        print(f"[NetworkCache] 기록에 없는 요청 {len(cache.missed)}개 차단 ({request.node.name}):")
+        for missed in cache.missed:
+            print(f"  {missed}")
+
+
+@pytest.fixture(scope="session")
+def auth_state_manager(pytestconfig, test_config):
+    """역할별 로그인 상태 관리 (워커당 하나, 상태 파일은 워커/실행 간 공유)"""
+    from auth_state import AuthStateManager
+    roles_path = pytestconfig.getoption("--auth-roles", default="") or str(pytestconfig.rootpath / "auth_roles.json")
+    manager = AuthStateManager.from_file(roles_path, test_config["base_url"])
+    
+    yield manager
+    
+    _publish_stats("auth_state", manager.stats)
+
+
+def _auth_role(request, test_config) -> Optional[str]:
+    """테스트에 적용할 로그인 역할 (auth 마커가 --auth-role보다 우선, auth(None)이면 로그인하지 않음)"""
+    marker = request.node.get_closest_marker("auth")
+    if marker is not None:
+        return marker.args[0] if marker.args else None
+    return test_config["auth_role"] or None
+
+
+def _new_authenticated_context(browser, request, role: str, context_options: Dict[str, Any]):
+    """역할의 로그인 상태가 담긴 BrowserContext 생성 (유효한 상태가 없으면 먼저 로그인)"""
+    from auth_state import login_playwright, validate_playwright
+    manager = request.getfixturevalue("auth_state_manager")
+    storage_state = manager.state_for(
+        role,
+        lambda config: login_playwright(browser, manager, role, context_options),
+        validate=lambda state: validate_playwright(browser, manager, role, state, context_options)
+    )
+    return browser.new_context(storage_state=storage_state, **context_options)
+
+
+def _authenticate_selenium(driver, request, role: str) -> None:
+    """역할의 로그인 상태를 드라이버에 주입 (유효한 상태가 없으면 이 드라이버로 로그인)"""
+    from auth_state import login_selenium, apply_selenium
+    manager = request.getfixturevalue("auth_state_manager")
+    logged_in = []
+    
+    def login(config):
+        logged_in.append(True)
+        return login_selenium(driver, manager, role)
+    
+    storage_state = manager.state_for(role, login)
+    if not logged_in:
+        apply_selenium(driver, storage_state)
+
+
+def _expire_auth_if_needed(request, role: Optional[str], url: str) -> None:
+    """로그인 페이지에서 실패한 테스트: 로그인 상태가 만료된 것으로 보고 폐기 (다음 테스트가 다시 로그인)"""
+    if not role or not _test_failed(request.node):
+        return
+    manager = request.getfixturevalue("auth_state_manager")
+    if manager.is_login_page(role, url):
+        manager.invalidate(role)
+        print(f"[AuthState] 로그인 상태 만료로 폐기: {role}")
+
+
+def _attach_resource_blocker(target, request, test_config, selenium: bool = False):
+    """리소스 차단 시작 (차단 프로필이 없으면 None)"""
+    marker = request.node.get_closest_marker("block_resources")
+    if test_config["block_resources"] == "off" and marker is None:
+        return None
+    from resource_blocking import resolve_profile, PlaywrightBlocker, SeleniumBlocker
+    profile = resolve_profile(test_config["block_resources"], marker)
+    if not profile.enabled:
+        return None
+    if selenium:
+        blocker = SeleniumBlocker(profile)
+        if not blocker.attach(target):
+            # CDP를 지원하지 않는 브라우저(Firefox): 세션 단위 설정만 적용
+            return None
+        return blocker
+    blocker = PlaywrightBlocker(profile)
+    blocker.attach(target)
+    return blocker
+
+
+def _detach_resource_blocker(blocker, request) -> None:
+    """리소스 차단 해제 후 테스트별 차단 결과 기록"""
+    if blocker is None:
+        return
+    blocker.detach()
+    blocker.record(request.node)
+    _publish_stats(f"resource_blocking.{blocker.profile.name}", blocker.stats)
 
 
 @pytest.fixture(scope="function")
@@ -157,49 +655,220 @@ def page_playwright(browser_playwright, request, test_config):
     
     # 모바일 모드 확인
     is_mobile = test_config.get("mobile", False)
+    auth_role = _auth_role(request, test_config)
     
-    if is_mobile:
-        # 모바일 디바이스 에뮬레이션 (iPhone 12 Pro)
-        mobile_device = {
-            'user_agent': 'Mozilla/5.0 (iPhone; CPU iPhone OS 14_4 like Mac OS X) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/14.0.3 Mobile/15E148 Safari/604.1',
-            'viewport': {'width': 390, 'height': 844},
-            'device_scale_factor': 3,
-            'is_mobile': True,
-            'has_touch': True
-        }
-        context = browser_playwright.new_context(**mobile_device)
+    pool = None
+    if auth_role:
+        # 로그인 상태가 담긴 새 컨텍스트 (풀의 컨텍스트는 반납 시 쿠키/스토리지를 지우므로 사용하지 않음)
+        context = _new_authenticated_context(browser_playwright, request, auth_role, MOBILE_DEVICE if is_mobile else {})
+        page = context.new_page()
+    elif test_config.get("context_pool"):
+        # 풀 모드: 미리 생성된 컨텍스트 재사용
+        get_pool = request.getfixturevalue("playwright_context_pools")
+        pool = get_pool("mobile" if is_mobile else "desktop")
+        context, page = pool.acquire()
     else:
-        context = browser_playwright.new_context()
+        if is_mobile:
+            context = browser_playwright.new_context(**MOBILE_DEVICE)
+        else:
+            context = browser_playwright.new_context()
+        page = context.new_page()
+    
+    # 테스트 단위 trace 기록 (--failure-trace, 실패한 테스트만 저장)
+    failure_tracer = _get_failure_tracer(test_config["failure_trace"]) if test_config["failure_trace"] != "off" else None
+    trace_start = failure_tracer.begin(context, request.node.nodeid) if failure_tracer is not None else None
     
-    page = context.new_page()
+    # 네트워크 기록/재생 (--network-cache 또는 network 마커)
+    network_cache = _attach_network_cache(context, request, test_config)
+    # 리소스 차단 (나중에 등록한 라우터가 먼저 처리: 차단하지 않은 요청은 네트워크 기록/재생으로 넘어감)
+    resource_blocker = _attach_resource_blocker(context, request, test_config)
+    
+    yield page
+    
+    # 실패 시 스크린샷 자동 캡처 (인코딩/저장은 백그라운드 스레드에서 처리)
+    if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
+        try:
+            with _trace_span("failure_screenshot", "screenshot"):
+                screenshot_path = _get_screenshot_pipeline().capture_playwright(page, request.node.name)
+            if screenshot_path:
+                _record_artifact(request.node, "screenshot", screenshot_path)
+                print(f"스크린샷 저장: {screenshot_path}")
+        except Exception as e:
+            print(f"스크린샷 캡처 실패: {e}")
+    
+    _record_setup_group(request.node, test_config, page.url)
+    _expire_auth_if_needed(request, auth_role, page.url)
+    _detach_resource_blocker(resource_blocker, request)
+    _detach_network_cache(network_cache, request)
+    
+    # 실패한 테스트만 trace.zip 저장 (통과한 테스트의 trace는 파일을 쓰지 않고 버림)
+    if failure_tracer is not None:
+        trace_path, overhead_ms = failure_tracer.end(context, request.node.name, _test_failed(request.node), trace_start)
+        if trace_path:
+            _record_artifact(request.node, "trace", trace_path)
+            print(f"trace 저장: {trace_path}")
+        elif overhead_ms:
+            request.node.user_properties.append(("trace_overhead_ms", round(overhead_ms, 1)))
+    
+    # 페이지를 닫기 전 JS 힙 지표 (--memory-telemetry, Chromium 계열만)
+    if _memory_telemetry is not None:
+        from memory_telemetry import js_metrics_playwright
+        _memory_telemetry.record_js(request.node.nodeid, test_config["browser"], lambda: js_metrics_playwright(page))
+    
+    if pool is not None:
+        # 실패한 테스트의 컨텍스트는 재사용하지 않음
+        pool.release(context, page, failed=_test_failed(request.node))
+    else:
+        page.close()
+        context.close()
+    
+    _recycle_browser_if_needed(browser_playwright, request)
+
+
+def _is_recyclable(browser) -> bool:
+    memory_telemetry = sys.modules.get("memory_telemetry")
+    return memory_telemetry is not None and isinstance(browser, memory_telemetry.RecyclableBrowser)
+
+
+def _recycle_browser_if_needed(browser, request) -> None:
+    """메모리/테스트 수 기준을 넘은 브라우저를 다음 테스트 전에 다시 실행 (재실행 이유는 리포트에 기록)"""
+    if _memory_telemetry is None or not _is_recyclable(browser):
+        return
+    reason = _memory_telemetry.recycle_reason(browser)
+    if reason is None:
+        return
+    from memory_telemetry import RECYCLE_PROPERTY
+    with _trace_span("browser_recycle", "browser"):
+        browser.recycle()
+    _memory_telemetry.recycled(reason)
+    request.node.user_properties.append((RECYCLE_PROPERTY, reason))
+    print(f"[MemoryTelemetry] 브라우저 재실행 ({reason}): {request.node.name} 이후")
+
+
+# ============================================================================
+# Playwright Async Fixtures (--driver playwright-async)
+# ============================================================================
+
+@pytest.fixture(scope="session")
+def browser_playwright_async(pytestconfig):
+    """워커 이벤트 루프에서 실행되는 공유 브라우저 (playwright.async_api)"""
+    try:
+        return _get_async_runner(pytestconfig).browser
+    except ImportError:
+        pytest.skip("Playwright가 설치되지 않았습니다. 'pip install playwright' 실행 후 'playwright install' 실행하세요.")
+
+
+@pytest.fixture(scope="function")
+def page_playwright_async(browser_playwright_async, pytestconfig, request, test_config):
+    """async 테스트용 Playwright 페이지 (스크린샷 자동 캡처 포함)"""
+    runner = _get_async_runner(pytestconfig)
+    context, page = runner.run(runner.new_page())
     
     yield page
     
     # 실패 시 스크린샷 자동 캡처
     if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
-        screenshot_dir = os.getenv('PYTEST_SCREENSHOT_DIR', '.pytest-reports/screenshots')
-        os.makedirs(screenshot_dir, exist_ok=True)
-        
-        test_name = request.node.name.replace('::', '_').replace('/', '_')
-        timestamp = int(time.time() * 1000)
-        screenshot_path = os.path.join(screenshot_dir, f'{test_name}_{timestamp}.png')
-        
         try:
-            page.screenshot(path=screenshot_path, full_page=True)
-            print(f"스크린샷 저장: {screenshot_path}")
+            with _trace_span("failure_screenshot", "screenshot"):
+                screenshot_path = runner.run(
+                    _get_screenshot_pipeline().capture_playwright_async(page, request.node.name)
+                )
+            if screenshot_path:
+                _record_artifact(request.node, "screenshot", screenshot_path)
+                print(f"스크린샷 저장: {screenshot_path}")
         except Exception as e:
             print(f"스크린샷 캡처 실패: {e}")
     
-    page.close()
-    context.close()
+    _record_setup_group(request.node, test_config, page.url)
+    runner.run(runner.close_page(context))
+
+
+# 워커 단위 asyncio 실행기 (playwright-async 모드에서 처음 필요할 때 생성)
+_async_runner = None
+
+# 테스트별 메모리 측정 (--memory-telemetry 또는 브라우저 재실행 기준을 지정한 경우 pytest_configure에서 생성)
+_memory_telemetry = None
+
+
+def _get_async_runner(config):
+    """asyncio 실행기 가져오기 (없으면 브라우저를 띄워 생성)"""
+    global _async_runner
+    if _async_runner is None:
+        from async_playwright_runner import AsyncPlaywrightRunner
+        
+        settings = _build_test_config(config)
+        launch_options = {"headless": settings["headless"]}
+        # Chrome/Edge는 chromium을 사용하되 채널 지정
+        if settings["browser"] in ["chrome", "edge"]:
+            launch_options["channel"] = settings["browser"]
+        _async_runner = AsyncPlaywrightRunner(
+            settings["browser"],
+            launch_options=launch_options,
+            context_options=MOBILE_DEVICE if settings["mobile"] else None,
+            concurrency=settings["async_concurrency"],
+            test_timeout=settings["async_test_timeout"]
+        )
+    return _async_runner
+
+
+def _resolve_async(value, timeout: float = 10):
+    """async API 결과(코루틴)면 워커 이벤트 루프에서 실행해 값으로 변환"""
+    if _async_runner is not None and inspect.isawaitable(value):
+        return _async_runner.run(value, timeout)
+    return value
+
+
+def _is_async_mode(config) -> bool:
+    return config.getoption("--driver") == "playwright-async"
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """playwright-async 모드: async 테스트를 워커 이벤트 루프에서 실행 (순차 실행 경로)"""
+    if not _is_async_mode(pyfuncitem.config) or not inspect.iscoroutinefunction(pyfuncitem.obj):
+        return None
+    runner = _get_async_runner(pyfuncitem.config)
+    runner.run(runner.run_test(pyfuncitem, pyfuncitem.funcargs))
+    return True
+
+
+def pytest_runtestloop(session):
+    """playwright-async 모드: session fixture만 쓰는 async 테스트를 워커 하나에서 동시에 실행"""
+    config = session.config
+    # xdist 워커는 컨트롤러가 테스트를 하나씩 보내므로 기본 실행 흐름 사용 (async 테스트는 순차 실행)
+    if not _is_async_mode(config) or config.option.collectonly or hasattr(config, "workerinput"):
+        return None
+    if session.testsfailed and not config.option.continue_on_collection_errors:
+        return None
+    
+    from async_playwright_runner import run_session
+    
+    def capture(page, test_name):
+        return _get_screenshot_pipeline().capture_playwright_async(page, test_name)
+    
+    return run_session(session, lambda: _get_async_runner(config), capture) or None
 
 
 # ============================================================================
 # Selenium Fixtures
 # ============================================================================
 
+def _selenium_block_settings(request, test_config):
+    """
+    Selenium 세션 단위 리소스 차단 설정: (세션 차단 프로필 또는 None, 성능 로그 필요 여부)
+
+    마커로 테스트마다 다른 프로필을 쓰는 경우 세션 단위 설정(이미지 차단)은 적용하지 않고 CDP 차단만 사용
+    """
+    uses_marker = any(item.get_closest_marker("block_resources") for item in request.session.items)
+    if test_config["block_resources"] == "off" and not uses_marker:
+        return None, False
+    from resource_blocking import resolve_profile
+    profile = resolve_profile(test_config["block_resources"])
+    return (profile if profile.enabled and not uses_marker else None), True
+
+
 @pytest.fixture(scope="session")
-def selenium_driver_options(test_config):
+def selenium_driver_options(test_config, request):
     """Selenium WebDriver 옵션 생성"""
     try:
         from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -211,87 +880,125 @@ def selenium_driver_options(test_config):
     browser_name = test_config["browser"]
     headless = test_config["headless"]
     
-    if browser_name in ["chromium", "chrome"]:
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        return options, "Chrome"
-    elif browser_name == "firefox":
+    # 매트릭스 실행: Selenium에는 WebKit 드라이버가 없으므로 Chrome으로 대체하지 않고 건너뜀
+    if browser_name == "webkit" and test_config["browser_matrix"]:
+        pytest.skip("Selenium은 webkit을 지원하지 않습니다 (브라우저 매트릭스에서 건너뜀)")
+    
+    if browser_name == "firefox":
         options = FirefoxOptions()
         if headless:
             options.add_argument("--headless")
+        # 리소스 차단: Firefox는 CDP가 없으므로 이미지 로드 차단 설정만 적용
+        block_profile, _ = _selenium_block_settings(request, test_config)
+        if block_profile is not None and "image" in block_profile.resource_types:
+            options.set_preference("permissions.default.image", 2)
         return options, "Firefox"
-    elif browser_name == "edge":
-        options = EdgeOptions()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        return options, "Edge"
+    
+    if browser_name == "edge":
+        options, driver_name = EdgeOptions(), "Edge"
     else:
-        # 기본값: Chrome
-        options = ChromeOptions()
-        if headless:
-            options.add_argument("--headless")
-        options.add_argument("--no-sandbox")
-        options.add_argument("--disable-dev-shm-usage")
-        return options, "Chrome"
+        # chromium, chrome, 기본값: Chrome
+        options, driver_name = ChromeOptions(), "Chrome"
+    if headless:
+        options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    
+    # 리소스 차단: 이미지 로드 차단 설정 + 차단 수 집계용 성능 로그 (테스트별 차단은 CDP로 적용)
+    block_profile, needs_log = _selenium_block_settings(request, test_config)
+    if block_profile is not None and block_profile.chrome_prefs():
+        options.add_experimental_option("prefs", block_profile.chrome_prefs())
+    if needs_log:
+        options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    return options, driver_name
+
+
+@pytest.fixture(scope="session")
+def selenium_driver_pool(selenium_driver_options, test_config):
+    """워커 단위 WebDriver 세션 풀"""
+    from selenium_pool import SeleniumDriverPool
+    
+    options, browser_name = selenium_driver_options
+    pool = SeleniumDriverPool(
+        options,
+        browser_name,
+        max_uses=test_config["selenium_pool_max_uses"]
+    )
+    
+    yield pool
+    
+    pool.close()
+    _publish_stats(f"selenium_pool.{browser_name}", pool.summary())
 
 
 @pytest.fixture(scope="function")
-def driver_selenium(selenium_driver_options, test_config):
+def driver_selenium(selenium_driver_options, test_config, request):
     """Selenium WebDriver 생성"""
-    from selenium import webdriver
-    from selenium.webdriver.chrome.service import Service as ChromeService
-    from selenium.webdriver.firefox.service import Service as FirefoxService
-    from selenium.webdriver.edge.service import Service as EdgeService
-    
-    # webdriver-manager가 없으면 경고하고 기본 경로 사용 시도
-    try:
-        from webdriver_manager.chrome import ChromeDriverManager
-        from webdriver_manager.firefox import GeckoDriverManager
-        from webdriver_manager.microsoft import EdgeChromiumDriverManager
-        use_webdriver_manager = True
-    except ImportError:
-        use_webdriver_manager = False
-        import warnings
-        warnings.warn("webdriver-manager가 설치되지 않았습니다. WebDriver 경로를 수동으로 설정해야 할 수 있습니다.")
+    from selenium_pool import create_driver
     
     options, browser_name = selenium_driver_options
     
+    pool = None
     try:
-        if browser_name == "Chrome":
-            if use_webdriver_manager:
-                service = ChromeService(ChromeDriverManager().install())
-            else:
-                service = ChromeService()
-            driver = webdriver.Chrome(service=service, options=options)
-        elif browser_name == "Firefox":
-            if use_webdriver_manager:
-                service = FirefoxService(GeckoDriverManager().install())
-            else:
-                service = FirefoxService()
-            driver = webdriver.Firefox(service=service, options=options)
-        elif browser_name == "Edge":
-            if use_webdriver_manager:
-                service = EdgeService(EdgeChromiumDriverManager().install())
-            else:
-                service = EdgeService()
-            driver = webdriver.Edge(service=service, options=options)
+        if test_config.get("selenium_pool"):
+            # 풀 모드: 살아있는 세션 재사용
+            pool = request.getfixturevalue("selenium_driver_pool")
+            driver = pool.acquire()
         else:
-            # 기본값: Chrome
-            if use_webdriver_manager:
-                service = ChromeService(ChromeDriverManager().install())
-            else:
-                service = ChromeService()
-            driver = webdriver.Chrome(service=service, options=options)
-        
-        yield driver
-        driver.quit()
+            # 드라이버 바이너리 경로는 세션당 한 번만 해석 (디스크 캐시 사용)
+            driver = create_driver(options, browser_name)
     except Exception as e:
         pytest.skip(f"Selenium WebDriver 생성 실패: {str(e)}")
+    
+    # 역할별 로그인 상태 주입 (--auth-role 또는 auth 마커)
+    auth_role = _auth_role(request, test_config)
+    if auth_role:
+        try:
+            _authenticate_selenium(driver, request, auth_role)
+        except Exception:
+            # 로그인 실패: 드라이버 정리 후 setup 오류로 보고
+            if pool is not None:
+                pool.release(driver, failed=True)
+            else:
+                driver.quit()
+            raise
+    
+    # 리소스 차단 (--block-resources 또는 block_resources 마커)
+    resource_blocker = _attach_resource_blocker(driver, request, test_config, selenium=True)
+    
+    yield driver
+    
+    # 실패 시 스크린샷 자동 캡처
+    if hasattr(request.node, 'rep_call') and request.node.rep_call.failed:
+        try:
+            with _trace_span("failure_screenshot", "screenshot"):
+                screenshot_path = _get_screenshot_pipeline().capture_selenium(driver, request.node.name)
+            if screenshot_path:
+                _record_artifact(request.node, "screenshot", screenshot_path)
+                print(f"스크린샷 저장: {screenshot_path}")
+        except Exception as e:
+            print(f"스크린샷 캡처 실패: {e}")
+    
+    try:
+        _record_setup_group(request.node, test_config, driver.current_url)
+        _expire_auth_if_needed(request, auth_role, driver.current_url)
+    except Exception:
+        # 세션이 끊긴 경우 등: 기록만 생략
+        pass
+    
+    _detach_resource_blocker(resource_blocker, request)
+    
+    # 드라이버를 닫기 전 JS 힙 지표 (--memory-telemetry, Chrome/Edge만)
+    if _memory_telemetry is not None:
+        from memory_telemetry import js_metrics_selenium
+        _memory_telemetry.record_js(request.node.nodeid, browser_name, lambda: js_metrics_selenium(driver))
+    
+    if pool is not None:
+        # 실패한 테스트의 세션은 재사용하지 않음
+        pool.release(driver, failed=_test_failed(request.node))
+        return
+    
+    driver.quit()
 
 
 # ============================================================================
@@ -304,6 +1011,11 @@ def page(test_config, request):
     # test_config["driver"]에 따라 필요한 fixture만 동적으로 가져오기
     if test_config["driver"] == "playwright":
         return request.getfixturevalue("page_playwright")
+    elif test_config["driver"] == "playwright-async":
+        # async 테스트는 async API 페이지, 동기 테스트(생성된 스크립트 등)는 기존 페이지 사용
+        if inspect.iscoroutinefunction(request.function):
+            return request.getfixturevalue("page_playwright_async")
+        return request.getfixturevalue("page_playwright")
     else:
         return request.getfixturevalue("driver_selenium")
 
@@ -314,6 +1026,10 @@ def driver(test_config, request):
     # test_config["driver"]에 따라 필요한 fixture만 동적으로 가져오기
     if test_config["driver"] == "playwright":
         return request.getfixturevalue("page_playwright")
+    elif test_config["driver"] == "playwright-async":
+        if inspect.iscoroutinefunction(request.function):
+            return request.getfixturevalue("page_playwright_async")
+        return request.getfixturevalue("page_playwright")
     else:
         return request.getfixturevalue("driver_selenium")
 
@@ -322,46 +1038,343 @@ def driver(test_config, request):
 # Visual Snapshot Testing
 # ============================================================================
 
-# snapshots 폴더 경로
+# snapshots 폴더 경로 (폴더는 시각적 스냅샷 플러그인이 설치된 경우에만 pytest_configure에서 생성)
 SNAPSHOTS_DIR = project_root / "snapshots"
-SNAPSHOTS_DIR.mkdir(exist_ok=True)
+
+# 커스텀 마커 (pytest.ini 없이 실행되는 임시 디렉토리에서도 --strict-markers를 통과하도록 등록)
+CUSTOM_MARKERS = (
+    "slow: 느린 테스트 (실행 시간이 오래 걸림)",
+    "integration: 통합 테스트",
+    "unit: 단위 테스트",
+    "playwright: Playwright를 사용하는 테스트",
+    "selenium: Selenium을 사용하는 테스트",
+    "smoke: 스모크 테스트",
+    "regression: 회귀 테스트",
+    "auth(role): 역할별 로그인 상태(storage_state) 재사용 (None이면 로그인하지 않음)",
+    "block_resources(profile, types=None, patterns=None): 리소스 차단 프로필 (off, media, trackers, fast)",
+    "network(mode, include=None, exclude=None, ignore_params=None, match_body=True): Playwright 네트워크 기록/재생 모드 (live, record, replay, auto)",
+)
 
 
 def pytest_configure(config):
-    """pytest 설정 초기화 - snapshots 폴더 설정"""
-    # snapshots 폴더 생성
-    SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+    """pytest 설정 초기화 - 리포터 등록, snapshots 폴더 설정, 마커 등록"""
+    # NDJSON 스트리밍 리포터 등록 (xdist 워커의 리포트도 컨트롤러로 전달되므로 컨트롤러에서만 기록)
+    ndjson_target = config.getoption("--ndjson-report", default="")
+    if ndjson_target and not hasattr(config, "workerinput"):
+        from ndjson_reporter import NdjsonReporter
+        config.pluginmanager.register(
+            NdjsonReporter(config, ndjson_target, stats_provider=lambda: _session_stats),
+            "testarchitect_ndjson_reporter"
+        )
+    
+    # 실행 구간 기록기 등록 (xdist 워커는 각자 파일을 쓰고 컨트롤러는 집계만 합침)
+    trace_dir = config.getoption("--trace-events", default="")
+    if trace_dir:
+        from trace_recorder import TracePlugin
+        config.pluginmanager.register(
+            TracePlugin(config, trace_dir, publish_stats=_publish_stats),
+            "testarchitect_trace_recorder"
+        )
+    
+    # 테스트 실행 시간 기록 (기록 기반 배정을 쓰는 병렬 실행에서만, xdist 워커의 리포트도 컨트롤러로 전달되므로 컨트롤러에서만 기록)
+    if _history_schedule_enabled(config) and not hasattr(config, "workerinput"):
+        from duration_history import DurationRecorder
+        config.pluginmanager.register(
+            DurationRecorder(_get_duration_history(config), publish_stats=_publish_stats),
+            "testarchitect_duration_recorder"
+        )
+    
+    # 브라우저 매트릭스 결과 집계 (xdist 워커의 리포트도 컨트롤러로 전달되므로 컨트롤러에서만 집계)
+    matrix_browsers = _matrix_browsers(config)
+    if matrix_browsers and not hasattr(config, "workerinput"):
+        from browser_matrix import MatrixReport
+        config.pluginmanager.register(
+            MatrixReport(matrix_browsers, publish_stats=_publish_stats),
+            "testarchitect_browser_matrix"
+        )
+    
+    # 테스트별 메모리 측정 (워커는 각자 측정, 증가량 상위 테스트는 컨트롤러에서 집계)
+    global _memory_telemetry
+    _memory_telemetry = None
+    recycle = (config.getoption("--browser-recycle-mb", default=0) > 0
+               or config.getoption("--browser-recycle-tests", default=0) > 0)
+    if recycle and config.getoption("--driver", default="playwright") != "playwright":
+        # 재실행은 page_playwright의 세션 브라우저만 지원 (비동기 브라우저는 워커 이벤트 루프가 소유)
+        raise pytest.UsageError(
+            "--browser-recycle-mb/--browser-recycle-tests는 --driver=playwright에서만 사용할 수 있습니다 "
+            "(Selenium은 --selenium-pool-max-uses로 세션 재사용 횟수를 제한하세요)"
+        )
+    if config.getoption("--memory-telemetry", default="false") == "true" or recycle:
+        from memory_telemetry import MemoryTelemetry, MemoryReport
+        _memory_telemetry = MemoryTelemetry(
+            max_browser_mb=config.getoption("--browser-recycle-mb"),
+            max_tests=config.getoption("--browser-recycle-tests"),
+            tracemalloc_top=int(os.getenv("TEST_MEMORY_TRACEMALLOC", "0")),
+            publish_stats=_publish_stats
+        )
+        config.pluginmanager.register(_memory_telemetry, "testarchitect_memory_telemetry")
+        if not hasattr(config, "workerinput"):
+            config.pluginmanager.register(
+                MemoryReport(int(os.getenv("TEST_MEMORY_TOP", "10")), local=_memory_telemetry),
+                "testarchitect_memory_report"
+            )
+    
+    # 변경 감지 기반 선택 실행 (워커는 수집 목록에서 캐시된 테스트 제외, 컨트롤러는 보고/기록)
+    if config.getoption("--incremental", default="false") == "true":
+        from incremental_selection import IncrementalSelection, IncrementalState, STATE_FILE
+        test_config = _build_test_config(config)
+        context_keys = ("driver", "browser", "base_url", "headless", "mobile", "network_cache", "block_resources",
+                        "auth_role", "browser_matrix")
+        context = json.dumps({key: test_config[key] for key in context_keys}, sort_keys=True)
+        config.pluginmanager.register(
+            IncrementalSelection(
+                config,
+                IncrementalState(config.getoption("--incremental-state", default="") or STATE_FILE),
+                context=context,
+                publish_stats=_publish_stats
+            ),
+            "testarchitect_incremental"
+        )
     
     # pytest-playwright-visual-snapshot 플러그인 설정
     # snapshots 경로를 pytest.ini나 환경 변수로 설정 가능
-    if not config.getini("playwright_visual_snapshots_path"):
-        config.option.playwright_visual_snapshots_path = str(SNAPSHOTS_DIR)
+    try:
+        snapshots_path = config.getini("playwright_visual_snapshots_path")
+    except ValueError:
+        # 플러그인이 설치되지 않음 (ini 항목 미등록): 폴더를 만들 필요 없음
+        pass
+    else:
+        SNAPSHOTS_DIR.mkdir(parents=True, exist_ok=True)
+        if not snapshots_path:
+            config.option.playwright_visual_snapshots_path = str(SNAPSHOTS_DIR)
     
-    # 커스텀 마커 등록
-    config.addinivalue_line(
-        "markers", "slow: 느린 테스트 (실행 시간이 오래 걸림)"
-    )
-    config.addinivalue_line(
-        "markers", "integration: 통합 테스트"
-    )
-    config.addinivalue_line(
-        "markers", "unit: 단위 테스트"
-    )
-    config.addinivalue_line(
-        "markers", "playwright: Playwright를 사용하는 테스트"
-    )
-    config.addinivalue_line(
-        "markers", "selenium: Selenium을 사용하는 테스트"
-    )
-    config.addinivalue_line(
-        "markers", "smoke: 스모크 테스트"
-    )
-    config.addinivalue_line(
-        "markers", "regression: 회귀 테스트"
-    )
+    # 커스텀 마커 등록 (pytest.ini에 이미 선언된 마커는 건너뜀)
+    declared = {line.split(":", 1)[0].strip() for line in config.getini("markers")}
+    for marker in CUSTOM_MARKERS:
+        if marker.split(":", 1)[0] not in declared:
+            config.addinivalue_line("markers", marker)
 
 # pytest-playwright-visual-snapshot 패키지가 설치되어 있으면
 # 자동으로 assert_snapshot fixture를 제공하므로 여기서 정의하지 않음
+# (compare_snapshot은 같은 경로 구조를 쓰는 내장 비교기로 Selenium에서도 사용 가능)
+
+
+@pytest.fixture(scope="function")
+def compare_snapshot(request, pytestconfig):
+    """
+    기준 이미지와 비교 (Playwright/Selenium 공통, numpy/Pillow 필요)
+    기준 이미지 경로: snapshots/{테스트 파일}/{테스트 함수}/{name}
+
+    compare_snapshot(page.locator("#chart").screenshot(), name="chart.png",
+                     mask=[page.locator(".clock").bounding_box()])
+    compare_snapshot(driver.get_screenshot_as_png(), name="home.png", threshold=0.2, max_diff_ratio=0.001)
+    """
+    from image_compare import get_comparator
+    comparator = get_comparator()
+    snapshots_dir = Path(getattr(pytestconfig.option, "playwright_visual_snapshots_path", None) or SNAPSHOTS_DIR)
+    update = (pytestconfig.getoption("--update-snapshots", default=False) is True
+              or os.getenv("TEST_UPDATE_SNAPSHOTS", "false").lower() == "true")
+    
+    def _compare(image: bytes, name: str, **options):
+        node = request.node
+        baseline_path = snapshots_dir / node.path.stem / node.name / name
+        with _trace_span("compare_snapshot", "screenshot"):
+            result = comparator.check(image, str(baseline_path), f"{node.name}-{name}", update=update, **options)
+        if result.actual_path:
+            _record_artifact(node, "snapshot_actual", result.actual_path)
+        if result.diff_path:
+            _record_artifact(node, "snapshot_diff", result.diff_path)
+        if not result.matched:
+            raise AssertionError(result.message())
+        return result
+    
+    return _compare
+
+
+# ============================================================================
+# 실행 통계 (컨텍스트 풀 등의 카운터를 세션 종료 시 요약)
+# ============================================================================
+
+STATS_KEY = "testarchitect_stats"
+
+# 이름별 통계 (예: "context_pool.desktop" -> {"hits": 10, ...})
+_session_stats: Dict[str, Dict[str, Any]] = {}
+
+
+def _publish_stats(name: str, stats: Dict[str, Any]) -> None:
+    """세션 통계 등록 (같은 이름으로 여러 번 등록하면 숫자 값은 합산)"""
+    _merge_stats(_session_stats, {name: stats})
+
+
+def _merge_stats(store: Dict[str, Dict[str, Any]], incoming: Dict[str, Dict[str, Any]]) -> None:
+    """통계 병합 (xdist 워커별 통계를 컨트롤러에서 합칠 때도 사용)"""
+    for name, stats in incoming.items():
+        target = store.setdefault(name, {})
+        for key, value in stats.items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool) and key in target:
+                # max_*는 최댓값, 나머지 숫자는 합산
+                target[key] = max(target[key], value) if key.startswith("max_") else target[key] + value
+            else:
+                target[key] = value
+        # 비율은 합산하지 않고 hit/miss로 다시 계산
+        if "hits" in target and "misses" in target and "hit_rate" in target:
+            total = target["hits"] + target["misses"]
+            target["hit_rate"] = round(target["hits"] / total, 3) if total else 0.0
+
+
+def pytest_sessionfinish(session, exitstatus):
+    """xdist 워커의 통계를 컨트롤러로 전달"""
+    # Selenium 드라이버 경로 해석 통계 (selenium_pool을 사용한 경우에만)
+    selenium_pool = sys.modules.get("selenium_pool")
+    if selenium_pool is not None:
+        _publish_stats("selenium_driver_resolution", selenium_pool.resolution_stats)
+    
+    # 이미지 비교 통계 (compare_snapshot/assert_image_matches를 사용한 경우에만)
+    image_compare = sys.modules.get("image_compare")
+    if image_compare is not None:
+        _publish_stats("image_compare", image_compare.get_comparator().stats())
+    
+    # 힐링용 요소 메타데이터 수집 통계 (locator 실패가 있었던 경우에만)
+    element_metadata = sys.modules.get("element_metadata")
+    if element_metadata is not None and element_metadata.stats["captures"] + element_metadata.stats["failed"]:
+        _publish_stats("healing_metadata", element_metadata.stats)
+    
+    # locator 자가 치유 통계 및 요소 기록 저장 (heal_locator/heal_find_element를 사용한 경우에만)
+    self_healing = sys.modules.get("self_healing")
+    if self_healing is not None:
+        healer = self_healing.get_healer()
+        healer.store.save()
+        _publish_stats("self_healing", healer.stats)
+    
+    # 남은 힐링 요청을 제한 시간 내에 전송
+    if _healing_dispatcher is not None:
+        flush_timeout = float(os.getenv('HEALING_FLUSH_TIMEOUT', '10'))
+        _healing_dispatcher.flush(flush_timeout)
+        _publish_stats("healing_dispatcher", _healing_dispatcher.stats())
+    
+    # asyncio 실행기 종료 (브라우저 포함)
+    global _async_runner
+    if _async_runner is not None:
+        _async_runner.close()
+        _publish_stats("playwright_async", _async_runner.stats)
+        _async_runner = None
+    
+    # 실패 trace 통계 (--failure-trace를 사용한 경우에만, 상주 실행기에서는 실행마다 새로 생성)
+    global _failure_tracer
+    if _failure_tracer is not None:
+        _publish_stats("failure_trace", _failure_tracer.stats)
+        _failure_tracer = None
+    
+    # 남은 실패 스크린샷 저장
+    if _screenshot_pipeline is not None:
+        _screenshot_pipeline.flush(float(os.getenv('PYTEST_SCREENSHOT_FLUSH_TIMEOUT', '30')))
+        _publish_stats("screenshots", _screenshot_pipeline.stats())
+    
+    if _session_stats and hasattr(session.config, "workeroutput"):
+        session.config.workeroutput[STATS_KEY] = _session_stats
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """xdist 워커 종료 시 워커 통계 병합"""
+    stats = getattr(node, "workeroutput", {}).get(STATS_KEY)
+    if stats:
+        _merge_stats(_session_stats, stats)
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_json_modifyreport(json_report):
+    """pytest-json-report 리포트에 실행 통계 추가"""
+    if _session_stats:
+        json_report[STATS_KEY] = _session_stats
+
+
+def pytest_terminal_summary(terminalreporter, exitstatus, config):
+    """실행 통계 출력"""
+    if not _session_stats:
+        return
+    terminalreporter.write_sep("-", "TestArchitect 실행 통계")
+    for name, stats in sorted(_session_stats.items()):
+        values = ", ".join(
+            f"{key}={round(value, 2) if isinstance(value, float) else value}"
+            for key, value in stats.items()
+        )
+        terminalreporter.write_line(f"{name}: {values}")
+
+
+# 테스트 실행 시간 기록 (컨트롤러에서 처음 필요할 때 읽음)
+_duration_history = None
+
+
+def _get_duration_history(config):
+    """실행 시간 기록 가져오기 (없으면 파일에서 읽음)"""
+    global _duration_history
+    if _duration_history is None:
+        from duration_history import DurationHistory, HISTORY_FILE
+        _duration_history = DurationHistory(config.getoption("--duration-history", default="") or HISTORY_FILE)
+    return _duration_history
+
+
+def _history_schedule_enabled(config) -> bool:
+    """실행 시간 기록 기반 배정 사용 여부 (병렬 실행(--dist load, -n의 기본값)이고 --history-schedule=true)"""
+    return (config.getoption("--history-schedule", default="true") == "true"
+            and config.getoption("dist", default="no") == "load")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_make_scheduler(config, log):
+    """병렬 실행(--dist load, -n의 기본값) 시 실행 시간 기록 기반 스케줄러 사용"""
+    if not _history_schedule_enabled(config):
+        return None
+    from duration_scheduler import DurationScheduling
+    return DurationScheduling(config, log, history=_get_duration_history(config), publish_stats=_publish_stats,
+                              browsers=_matrix_browsers(config))
+
+
+def _trace_span(name: str, cat: str):
+    """실행 구간 기록 (--trace-events를 지정하지 않았으면 아무것도 하지 않음)"""
+    trace_recorder = sys.modules.get("trace_recorder")
+    if trace_recorder is None:
+        return nullcontext()
+    return trace_recorder.span(name, cat)
+
+
+# 실패 스크린샷 파이프라인 (첫 실패 시 생성)
+_screenshot_pipeline = None
+
+# 실패 trace 기록기 (--failure-trace를 지정한 경우 첫 테스트에서 생성)
+_failure_tracer = None
+
+
+def _get_failure_tracer(mode: str):
+    """실패 trace 기록기 가져오기 (없으면 생성)"""
+    global _failure_tracer
+    if _failure_tracer is None:
+        from failure_trace import create_from_env
+        _failure_tracer = create_from_env(mode)
+    return _failure_tracer
+
+
+def _get_screenshot_pipeline():
+    """스크린샷 파이프라인 가져오기 (없으면 생성)"""
+    global _screenshot_pipeline
+    if _screenshot_pipeline is None:
+        from screenshot_pipeline import create_from_env
+        _screenshot_pipeline = create_from_env()
+    return _screenshot_pipeline
+
+
+# 힐링 요청 백그라운드 전송기 (첫 실패 시 생성)
+_healing_dispatcher = None
+
+
+def _get_healing_dispatcher():
+    """힐링 전송기 가져오기 (없으면 생성)"""
+    global _healing_dispatcher
+    if _healing_dispatcher is None:
+        from healing_dispatcher import create_from_env
+        _healing_dispatcher = create_from_env()
+    return _healing_dispatcher
 
 
 def _trigger_healing_if_needed(failure_info: Dict[str, Any], item) -> None:
@@ -373,10 +1386,15 @@ def _trigger_healing_if_needed(failure_info: Dict[str, Any], item) -> None:
             return
         
         # 페이지 URL 및 현재 DOM 추출 시도 (fixture에서)
+        # 기본은 실패한 locator 주변 후보 요소의 메타데이터만 수집, 전체 DOM은 HEALING_FULL_DOM=true일 때만
         page_url = failure_info.get('page_url')
+        full_dom = os.getenv('HEALING_FULL_DOM', 'false').lower() == 'true'
+        failed_locator = failure_info.get('failed_locator') or ''
         current_dom = None
         
         try:
+            import element_metadata
+            limit = int(os.getenv('HEALING_METADATA_LIMIT', str(element_metadata.DEFAULT_LIMIT)))
             if 'page' in item.fixturenames:
                 page = item.funcargs.get('page')
                 if page:
@@ -384,14 +1402,21 @@ def _trigger_healing_if_needed(failure_info: Dict[str, Any], item) -> None:
                     if hasattr(page, 'url'):
                         page_url = page.url
                         try:
-                            current_dom = page.content()
+                            # playwright-async 모드의 페이지는 코루틴을 반환
+                            if full_dom:
+                                current_dom = _resolve_async(page.content())
+                            else:
+                                current_dom = element_metadata.collect_playwright(
+                                    page, failed_locator, limit, resolve=_resolve_async
+                                )
                         except Exception:
                             pass
                     # Selenium
                     elif hasattr(page, 'current_url'):
                         page_url = page.current_url
                         try:
-                            current_dom = page.page_source
+                            current_dom = page.page_source if full_dom else \
+                                element_metadata.collect_selenium(page, failed_locator, limit)
                         except Exception:
                             pass
             elif 'driver' in item.fixturenames:
@@ -400,22 +1425,18 @@ def _trigger_healing_if_needed(failure_info: Dict[str, Any], item) -> None:
                 if driver:
                     try:
                         page_url = driver.current_url
-                        current_dom = driver.page_source
+                        current_dom = driver.page_source if full_dom else \
+                            element_metadata.collect_selenium(driver, failed_locator, limit)
                     except Exception:
                         pass
         except Exception:
             pass
         
-        # 서버 API 호출 (HTTP 요청)
-        import urllib.request
-        import urllib.parse
-        
-        api_url = os.getenv('HEALING_API_URL', 'http://localhost:3001/api/locator-healing/trigger')
-        
         # 실패 정보 업데이트
         failure_info['page_url'] = page_url
         if current_dom:
             failure_info['current_dom'] = current_dom
+            failure_info['current_dom_type'] = 'html' if full_dom else 'metadata'
         
         payload = {
             'failure_info': failure_info,
@@ -424,23 +1445,8 @@ def _trigger_healing_if_needed(failure_info: Dict[str, Any], item) -> None:
             'timestamp': time.time()
         }
         
-        data = json.dumps(payload).encode('utf-8')
-        req = urllib.request.Request(
-            api_url,
-            data=data,
-            headers={'Content-Type': 'application/json'},
-            method='POST'
-        )
-        
-        try:
-            # 비동기로 전송 (블로킹하지 않음)
-            urllib.request.urlopen(req, timeout=5)
-        except Exception as e:
-            # 서버 연결 실패는 무시 (테스트 실행을 방해하지 않음)
-            # 디버그 모드에서는 로그 출력
-            if os.getenv('DEBUG_HEALING', 'false').lower() == 'true':
-                print(f"[Healing] 힐링 트리거 실패: {e}")
-            pass
+        # 백그라운드 전송기 큐에 추가 (테스트 스레드는 네트워크를 기다리지 않음)
+        _get_healing_dispatcher().submit(payload)
     except Exception as e:
         # 힐링 트리거 실패는 무시
         if os.getenv('DEBUG_HEALING', 'false').lower() == 'true':
@@ -455,6 +1461,12 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     setattr(item, f"rep_{rep.when}", rep)
     
+    # 이 테스트에서 치유한 locator (heal_locator/heal_find_element를 사용한 경우에만)
+    self_healing = sys.modules.get("self_healing")
+    if self_healing is not None and rep.when == "call":
+        for healed in self_healing.get_healer().take_pending():
+            rep.user_properties.append(("healed_locator", json.dumps(healed, ensure_ascii=False)))
+    
     # 테스트 실패 시 locator 실패 감지
     if rep.when == "call" and rep.failed:
         try:
@@ -464,7 +1476,8 @@ def pytest_runtest_makereport(item, call):
                 # 실패 정보를 리포트에 저장
                 rep.locator_failure = failure_info
                 # 서버로 전송 (자동 힐링 트리거)
-                _trigger_healing_if_needed(failure_info, item)
+                with _trace_span("healing_trigger", "healing"):
+                    _trigger_healing_if_needed(failure_info, item)
         except Exception as e:
             # locator 추출 실패는 무시 (테스트 실패 원인과 무관할 수 있음)
             pass
@@ -0,0 +1,251 @@
+"""
+Playwright BrowserContext 풀
+테스트마다 new_context()/new_page()를 호출하는 대신 미리 생성한 컨텍스트를 재사용
+"""
+
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+
+class ContextPool:
+    """
+    워커(프로세스) 단위 BrowserContext 풀
+
+    - 유휴 컨텍스트가 있으면 상태를 초기화한 뒤 재사용 (hit)
+    - 없으면 새로 생성 (miss)
+    - max_uses 초과, 테스트 실패, 초기화 실패 시 컨텍스트를 폐기
+    - 스토리지 초기화: 컨텍스트의 모든 페이지(팝업 포함)와 프레임이 방문한 origin을 기록해
+      Chromium은 CDP로 origin별 전체 스토리지 정리, 그 밖의 브라우저는 origin 하나만 방문한 경우에만
+      페이지에서 localStorage/sessionStorage/IndexedDB/Cache Storage/Service Worker를 정리하고 재사용
+    - 유휴 컨텍스트는 max_size 개까지만 보관
+
+    Playwright sync API는 스레드 안전하지 않으므로 하나의 스레드에서만 사용해야 함
+    """
+
+    def __init__(self, browser, context_options: Optional[Dict[str, Any]] = None,
+                 max_size: int = 2, max_uses: int = 50, name: str = "desktop"):
+        self.browser = browser
+        self.context_options = dict(context_options or {})
+        self.max_size = max(1, int(max_size))
+        self.max_uses = max(1, int(max_uses))
+        self.name = name
+        # 유휴 슬롯: (context, page, 사용 횟수)
+        self._idle: List[Tuple[Any, Any, int]] = []
+        # 사용 중인 컨텍스트의 사용 횟수 / 방문한 origin
+        self._uses: Dict[int, int] = {}
+        self._origins: Dict[int, set] = {}
+        self._tracked_contexts: set = set()
+        self._is_chromium = getattr(getattr(browser, "browser_type", None), "name", "") == "chromium"
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "created": 0,
+            "discarded": 0,
+            "discarded_max_uses": 0,
+            "discarded_failed": 0,
+            "discarded_reset_error": 0,
+            "acquire_hit_ms": 0.0,
+            "acquire_miss_ms": 0.0,
+            "reset_ms": 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # 공개 API
+    # ------------------------------------------------------------------
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """유휴 컨텍스트를 미리 생성 (세션 시작 시 호출)"""
+        target = self.max_size if count is None else min(int(count), self.max_size)
+        while len(self._idle) < target:
+            context, page = self._create()
+            self._idle.append((context, page, 0))
+
+    def acquire(self) -> Tuple[Any, Any]:
+        """컨텍스트와 페이지 대여 (유휴 슬롯 우선)"""
+        start = time.perf_counter()
+        if self._idle:
+            context, page, uses = self._idle.pop()
+            self.stats["hits"] += 1
+            elapsed_key = "acquire_hit_ms"
+        else:
+            context, page = self._create()
+            uses = 0
+            self.stats["misses"] += 1
+            elapsed_key = "acquire_miss_ms"
+
+        self._uses[id(context)] = uses + 1
+        self._origins[id(context)] = set()
+        self._track_origins(context)
+        self.stats[elapsed_key] += (time.perf_counter() - start) * 1000
+        return context, page
+
+    def release(self, context, page, failed: bool = False) -> None:
+        """
+        컨텍스트 반납
+
+        Args:
+            context: acquire()로 받은 BrowserContext
+            page: acquire()로 받은 Page
+            failed: 테스트 실패 여부 (실패한 컨텍스트는 재사용하지 않음)
+        """
+        uses = self._uses.pop(id(context), self.max_uses)
+        origins = self._origins.pop(id(context), set())
+
+        if failed:
+            self._discard(context, "discarded_failed")
+            return
+        if uses >= self.max_uses:
+            self._discard(context, "discarded_max_uses")
+            return
+        if len(self._idle) >= self.max_size:
+            self._discard(context, None)
+            return
+
+        start = time.perf_counter()
+        try:
+            page = self._reset(context, page, origins)
+        except Exception:
+            page = None
+        self.stats["reset_ms"] += (time.perf_counter() - start) * 1000
+
+        if page is None:
+            self._discard(context, "discarded_reset_error")
+            return
+        self._idle.append((context, page, uses))
+
+    def close(self) -> None:
+        """유휴 컨텍스트 모두 정리"""
+        while self._idle:
+            context, _, _ = self._idle.pop()
+            try:
+                context.close()
+            except Exception:
+                pass
+
+    def summary(self) -> Dict[str, Any]:
+        """hit/miss 비율을 포함한 통계 반환"""
+        stats = dict(self.stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        return stats
+
+    # ------------------------------------------------------------------
+    # 내부 구현
+    # ------------------------------------------------------------------
+
+    def _create(self) -> Tuple[Any, Any]:
+        context = self.browser.new_context(**self.context_options)
+        page = context.new_page()
+        self.stats["created"] += 1
+        return context, page
+
+    def _discard(self, context, reason: Optional[str]) -> None:
+        self._tracked_contexts.discard(id(context))
+        self.stats["discarded"] += 1
+        if reason:
+            self.stats[reason] += 1
+        try:
+            context.close()
+        except Exception:
+            pass
+
+    def _track_origins(self, context) -> None:
+        """컨텍스트의 모든 페이지(나중에 열린 팝업 포함)의 프레임이 방문한 origin 기록 (스토리지 초기화 대상)"""
+        if id(context) in self._tracked_contexts:
+            return
+
+        def on_navigated(frame):
+            origin = _origin_of(frame.url)
+            current = self._origins.get(id(context))
+            if origin and current is not None:
+                current.add(origin)
+
+        def track(page):
+            page.on("framenavigated", on_navigated)
+
+        for page in context.pages:
+            track(page)
+        context.on("page", track)
+        self._tracked_contexts.add(id(context))
+
+    def _reset(self, context, page, origins: set):
+        """
+        다음 테스트를 위해 컨텍스트 상태 초기화
+
+        Returns:
+            재사용할 Page (초기화할 수 없으면 None)
+        """
+        if page.is_closed():
+            return None
+
+        # 테스트가 연 추가 페이지(팝업 등) 정리 (닫기 전에 현재 origin도 정리 대상에 추가)
+        for extra in list(context.pages):
+            if extra is not page:
+                for frame in extra.frames:
+                    origin = _origin_of(frame.url)
+                    if origin:
+                        origins.add(origin)
+                extra.close()
+
+        if self._is_chromium:
+            if origins:
+                # 현재 탭의 sessionStorage는 CDP로 지워지지 않으므로 페이지에서 정리
+                page.evaluate("() => { try { localStorage.clear(); sessionStorage.clear(); } catch (e) {} }")
+                # 방문한 모든 origin의 스토리지(IndexedDB, Cache Storage, Service Worker 포함)를 CDP로 정리
+                session = context.new_cdp_session(page)
+                try:
+                    for origin in origins:
+                        session.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+                finally:
+                    session.detach()
+        elif origins:
+            # CDP가 없는 브라우저: 페이지가 머문 origin 하나만 페이지 안에서 정리 가능 (그 밖에는 폐기)
+            if len(origins) > 1 or _origin_of(page.url) not in origins:
+                return None
+            if not page.evaluate(_CLEAR_ORIGIN_STORAGE_JS):
+                return None
+
+        context.clear_cookies()
+        context.clear_permissions()
+        context.set_extra_http_headers({})
+        context.set_offline(False)
+
+        # 라우트 해제 (unroute_all은 Playwright 1.41+, 그 이전 버전은 라우트를 보장할 수 없어 폐기)
+        if not hasattr(context, "unroute_all"):
+            return None
+        context.unroute_all(behavior="ignoreErrors")
+        page.unroute_all(behavior="ignoreErrors")
+
+        page.goto("about:blank")
+        return page
+
+
+# 현재 origin의 스토리지 전체 정리 (IndexedDB 목록을 얻을 수 없으면 false: 정리를 보장할 수 없음)
+_CLEAR_ORIGIN_STORAGE_JS = """async () => {
+    try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}
+    if (typeof indexedDB !== 'undefined') {
+        if (typeof indexedDB.databases !== 'function') return false;
+        for (const db of await indexedDB.databases()) {
+            await new Promise((resolve) => {
+                const request = indexedDB.deleteDatabase(db.name);
+                request.onsuccess = request.onerror = request.onblocked = resolve;
+            });
+        }
+    }
+    if (typeof caches !== 'undefined') {
+        for (const key of await caches.keys()) await caches.delete(key);
+    }
+    if (navigator.serviceWorker) {
+        for (const registration of await navigator.serviceWorker.getRegistrations()) await registration.unregister();
+    }
+    return true;
+}"""
+
+
+def _origin_of(url: str) -> Optional[str]:
+    """URL에서 origin(scheme://host:port) 추출"""
+    if not url or not url.startswith(("http://", "https://")):
+        return None
+    scheme_end = url.index("://") + 3
+    path_start = url.find("/", scheme_end)
+    return url if path_start == -1 else url[:path_start]
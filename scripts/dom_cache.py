@@ -0,0 +1,87 @@
+"""
+힐링용 DOM 콘텐츠 주소 캐시
+DOM을 SHA256으로 식별하고, 이미 서버로 전송한 DOM은 해시만 보내도록 디스크에 기록 (xdist 워커 간 공유)
+"""
+
+import gzip
+import hashlib
+import os
+import tempfile
+import time
+from typing import Optional
+
+
+def dom_hash(dom: str) -> str:
+    """DOM SHA256 해시 (서버 domSnapshotScheduler.generateHash와 동일한 방식)"""
+    return hashlib.sha256(dom.encode("utf-8")).hexdigest()
+
+
+class DomCache:
+    """
+    전송한 DOM을 gzip으로 보관하는 디스크 캐시
+
+    - 파일명: <sha256>.html.gz
+    - 여러 프로세스가 동시에 기록해도 안전하도록 임시 파일 + os.replace 사용
+    - ttl 초가 지난 항목은 전송하지 않은 것으로 간주
+    - 서버가 해시를 모른다고 응답하면(서버 재시작, 서버 캐시에서 교체됨) forget()으로 지우고 DOM 전체를 다시 전송
+    """
+
+    def __init__(self, cache_dir: str, ttl: float = 3600):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        os.makedirs(cache_dir, exist_ok=True)
+        self.prune()
+
+    def _path(self, content_hash: str) -> str:
+        return os.path.join(self.cache_dir, f"{content_hash}.html.gz")
+
+    def was_sent(self, content_hash: str) -> bool:
+        """유효 기간 내에 전송한 DOM인지 확인"""
+        try:
+            return time.time() - os.path.getmtime(self._path(content_hash)) <= self.ttl
+        except OSError:
+            return False
+
+    def mark_sent(self, content_hash: str, dom: str) -> None:
+        """서버 전송 완료 기록 (DOM은 gzip으로 보관)"""
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(gzip.compress(dom.encode("utf-8"), compresslevel=6))
+            os.replace(tmp_path, self._path(content_hash))
+        except OSError:
+            # 캐시 기록 실패는 무시 (다음 실패 시 DOM을 다시 전송)
+            pass
+
+    def forget(self, content_hash: str) -> None:
+        """전송 기록 삭제 (서버가 해시로 DOM을 찾지 못한 경우)"""
+        try:
+            os.remove(self._path(content_hash))
+        except OSError:
+            pass
+
+    def load(self, content_hash: str) -> Optional[str]:
+        """보관된 DOM 읽기"""
+        try:
+            with open(self._path(content_hash), "rb") as f:
+                return gzip.decompress(f.read()).decode("utf-8")
+        except (OSError, EOFError):
+            return None
+
+    def prune(self) -> int:
+        """유효 기간이 지난 항목 삭제"""
+        removed = 0
+        now = time.time()
+        try:
+            names = os.listdir(self.cache_dir)
+        except OSError:
+            return 0
+        for name in names:
+            path = os.path.join(self.cache_dir, name)
+            try:
+                if now - os.path.getmtime(path) > self.ttl:
+                    os.remove(path)
+                    removed += 1
+            except OSError:
+                pass
+        return removed
@@ -0,0 +1,154 @@
+"""
+테스트 실행 시간 기록
+테스트 node ID별 실행 시간(지수 이동 평균), 마지막 결과, 설정 그룹(브라우저|호스트)을 pytest 캐시와 별도 파일에 저장
+(앱은 -p no:cacheprovider로 실행하므로 pytest 캐시는 실행 간에 남지 않음)
+
+- 기록: xdist 컨트롤러(또는 단일 프로세스)가 실행 종료 시 한 번 갱신
+- 사용: duration_scheduler.py가 오래 걸리는 테스트부터 워커에 배정
+"""
+
+import os
+import json
+import time
+import tempfile
+from typing import Optional, Dict, Any, Iterable
+
+import pytest
+
+from incremental_selection import is_cached_report
+
+# 기록 파일 (실행 간 공유)
+HISTORY_FILE = os.getenv(
+    "TEST_DURATION_HISTORY",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "duration-history.json")
+)
+# 이 기간(일) 동안 실행되지 않은 테스트는 기록에서 제거
+HISTORY_TTL_DAYS = float(os.getenv("TEST_DURATION_HISTORY_TTL", "30"))
+# 새 실행 시간 반영 비율 (지수 이동 평균)
+EMA_ALPHA = 0.3
+
+# 리포트 user_properties 중 설정 그룹 항목 이름 (fixture가 기록)
+SETUP_GROUP_PROPERTY = "setup_group"
+
+
+class DurationHistory:
+    """
+    node ID -> {"duration": 초, "runs": 횟수, "outcome": 마지막 결과, "group": 설정 그룹, "seen": 마지막 실행 시각}
+    """
+
+    def __init__(self, path: str = HISTORY_FILE):
+        self.path = path
+        self.tests: Dict[str, Dict[str, Any]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("tests", {}) if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def duration(self, nodeid: str) -> Optional[float]:
+        entry = self.tests.get(nodeid)
+        return entry["duration"] if entry else None
+
+    def group(self, nodeid: str) -> Optional[str]:
+        entry = self.tests.get(nodeid)
+        return entry.get("group") if entry else None
+
+    def outcome(self, nodeid: str) -> Optional[str]:
+        entry = self.tests.get(nodeid)
+        return entry.get("outcome") if entry else None
+
+    def save(self, results: Dict[str, Dict[str, Any]]) -> int:
+        """
+        이번 실행 결과 반영 후 저장 (원자적 교체)
+
+        Args:
+            results: node ID -> {"duration": 초, "outcome": 결과, "group": 설정 그룹(없으면 None)}
+
+        Returns:
+            갱신한 테스트 수
+        """
+        if not results:
+            return 0
+        now = time.time()
+        # 다른 실행이 그사이 기록한 내용을 덮어쓰지 않도록 저장 직전에 다시 읽어 병합
+        tests = self._read()
+        for nodeid, result in results.items():
+            entry = tests.get(nodeid)
+            if entry is None:
+                entry = tests[nodeid] = {"duration": result["duration"], "runs": 0}
+            else:
+                entry["duration"] = entry["duration"] * (1 - EMA_ALPHA) + result["duration"] * EMA_ALPHA
+            entry["duration"] = round(entry["duration"], 4)
+            entry["runs"] = entry.get("runs", 0) + 1
+            entry["outcome"] = result["outcome"]
+            entry["seen"] = round(now)
+            if result.get("group"):
+                entry["group"] = result["group"]
+        expired = now - HISTORY_TTL_DAYS * 86400
+        tests = {nodeid: entry for nodeid, entry in tests.items() if entry.get("seen", now) >= expired}
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "tests": tests}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # 기록 실패는 무시 (다음 실행은 이전 기록으로 배정)
+            print(f"[DurationHistory] 실행 시간 기록 저장 실패: {e}")
+            return 0
+        self.tests = tests
+        return len(results)
+
+
+class DurationRecorder:
+    """
+    실행 시간 수집 플러그인 (xdist 컨트롤러 또는 단일 프로세스에서만 등록)
+
+    - setup/call/teardown 리포트의 duration을 합산
+    - 건너뛴 테스트(skip/xfail)와 선택 실행의 캐시된 통과는 실행 시간이 의미 없으므로 기록하지 않음
+    """
+
+    def __init__(self, history: DurationHistory, publish_stats=None):
+        self.history = history
+        self.publish_stats = publish_stats
+        self._results: Dict[str, Dict[str, Any]] = {}
+
+    def pytest_runtest_logreport(self, report):
+        if is_cached_report(report):
+            return
+        result = self._results.setdefault(report.nodeid, {"duration": 0.0, "outcome": "passed", "group": None})
+        result["duration"] += report.duration
+        if report.failed:
+            result["outcome"] = "failed"
+        elif report.skipped:
+            result["outcome"] = "skipped"
+        if report.when == "teardown":
+            for name, value in report.user_properties:
+                if name == SETUP_GROUP_PROPERTY:
+                    result["group"] = value
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        results = {nodeid: result for nodeid, result in self._results.items() if result["outcome"] != "skipped"}
+        updated = self.history.save(results)
+        if updated and self.publish_stats is not None:
+            self.publish_stats("duration_history", {"updated": updated, "entries": len(self.history.tests)})
+
+
+def estimate(history: DurationHistory, nodeids: Iterable[str]) -> Dict[str, float]:
+    """
+    테스트별 예상 실행 시간 (기록이 없는 테스트는 기록된 테스트의 중앙값, 기록이 전혀 없으면 1초)
+    """
+    nodeids = list(nodeids)
+    known = sorted(d for d in (history.duration(nodeid) for nodeid in nodeids) if d is not None)
+    default = known[len(known) // 2] if known else 1.0
+    estimates = {}
+    for nodeid in nodeids:
+        duration = history.duration(nodeid)
+        estimates[nodeid] = duration if duration is not None else default
+    return estimates
@@ -0,0 +1,182 @@
+"""
+실행 시간 기록 기반 xdist 스케줄러 (--dist load 대체, conftest.py의 pytest_xdist_make_scheduler에서 생성)
+
+- 작업 단위: 같은 설정 그룹(브라우저|호스트, 기록이 없으면 테스트 파일)에 속한 테스트 묶음
+  (같은 워커에서 연속 실행되어 세션 브라우저/로그인 상태 등 준비 비용을 공유)
+- 한 단위의 예상 시간이 워커당 평균 부하의 절반을 넘으면 여러 단위로 나눔 (묶음 유지보다 부하 균형 우선)
+- 예상 시간이 긴 단위부터 대기열에 넣고, 일이 떨어진 워커가 다음 단위를 가져감 (longest-first)
+- 단위 안에서도 오래 걸리는 테스트부터 실행
+- 브라우저 매트릭스(--browser-matrix): 단위를 브라우저별로 나누고, 워커에는 실행 중인 브라우저의 단위를 이어서 배정
+  (처음에는 맡은 워커가 적은 브라우저부터 배정해 모든 브라우저가 동시에 실행됨)
+"""
+
+from collections import OrderedDict, Counter
+from typing import Optional, Dict, List, Tuple, Callable
+
+from xdist.scheduler import LoadScopeScheduling
+
+from duration_history import DurationHistory, estimate
+from browser_matrix import browser_of
+
+
+def plan_units(nodeids: List[str], estimates: Dict[str, float], groups: Dict[str, Optional[str]],
+               workers: int) -> List[Tuple[str, List[str], float]]:
+    """
+    작업 단위 구성
+
+    Args:
+        nodeids: 수집된 테스트
+        estimates: node ID -> 예상 실행 시간(초)
+        groups: node ID -> 설정 그룹 (None이면 테스트 파일로 묶음)
+        workers: 워커 수
+
+    Returns:
+        [(단위 이름, 테스트 목록(오래 걸리는 순), 예상 시간)] (예상 시간이 긴 순)
+    """
+    grouped: Dict[str, List[str]] = OrderedDict()
+    for nodeid in nodeids:
+        key = groups.get(nodeid) or nodeid.split("::", 1)[0]
+        grouped.setdefault(key, []).append(nodeid)
+
+    # 단위 하나가 넘지 않아야 하는 예상 시간 (워커당 평균 부하의 절반: 마지막에 남는 단위가 작아 끝나는 시간이 고르게 됨)
+    limit = sum(estimates[nodeid] for nodeid in nodeids) / (2 * max(1, workers))
+
+    units: List[Tuple[str, List[str], float]] = []
+    for key, members in grouped.items():
+        members.sort(key=lambda nodeid: -estimates[nodeid])
+        chunk: List[str] = []
+        total = 0.0
+        for nodeid in members:
+            if chunk and total + estimates[nodeid] > limit:
+                units.append((f"{key}#{len(units)}", chunk, total))
+                chunk, total = [], 0.0
+            chunk.append(nodeid)
+            total += estimates[nodeid]
+        units.append((f"{key}#{len(units)}", chunk, total))
+
+    units.sort(key=lambda unit: -unit[2])
+    return units
+
+
+class DurationScheduling(LoadScopeScheduling):
+    """
+    LoadScopeScheduling의 작업 단위를 실행 시간 기록 기반으로 구성
+
+    배정/재배정/워커 비정상 종료 처리는 LoadScopeScheduling을 그대로 사용하고,
+    단위 구성(_split_scope)과 대기열 순서만 바꿈
+    """
+
+    def __init__(self, config, log=None, history: Optional[DurationHistory] = None,
+                 publish_stats: Optional[Callable] = None, browsers: Optional[List[str]] = None):
+        super().__init__(config, log)
+        self.history = history if history is not None else DurationHistory()
+        self.publish_stats = publish_stats
+        self.browsers = browsers or []
+        # 작업 단위 이름 -> 매트릭스 브라우저, 워커 -> 마지막으로 배정한 브라우저
+        self._unit_browser: Dict[str, str] = {}
+        self._node_browser: Dict[object, str] = {}
+        # node ID -> 작업 단위 이름
+        self._unit_of: Dict[str, str] = {}
+        # 워커 -> {node ID: 수집 인덱스}
+        self._indexes: Dict[object, Dict[str, int]] = {}
+
+    def _split_scope(self, nodeid: str) -> str:
+        return self._unit_of.get(nodeid) or super()._split_scope(nodeid)
+
+    def _next_unit(self, node) -> str:
+        """
+        워커에 배정할 다음 단위 (매트릭스가 아니면 대기열 맨 앞)
+
+        워커가 실행 중인 브라우저의 단위 우선 (브라우저 재실행 방지), 없으면 맡은 워커가 가장 적은 브라우저의 단위
+        """
+        if not self._unit_browser:
+            return next(iter(self.workqueue))
+        current = self._node_browser.get(node)
+        if current is not None:
+            for scope in self.workqueue:
+                if self._unit_browser.get(scope) == current:
+                    return scope
+        holders = Counter(self._node_browser.values())
+        return min(self.workqueue, key=lambda scope: holders[self._unit_browser.get(scope)])
+
+    def _assign_work_unit(self, node) -> None:
+        """작업 단위 하나를 워커에 배정 (수집 인덱스는 list.index 대신 미리 만든 사전으로 조회)"""
+        assert self.workqueue
+        scope = self._next_unit(node)
+        work_unit = self.workqueue.pop(scope)
+        self.assigned_work.setdefault(node, {})[scope] = work_unit
+        
+        browser = self._unit_browser.get(scope)
+        if browser is not None:
+            if self._node_browser.get(node) not in (None, browser) and self.publish_stats is not None:
+                self.publish_stats("duration_schedule", {"browser_switches": 1})
+            self._node_browser[node] = browser
+
+        index = self._indexes.get(node)
+        if index is None:
+            index = self._indexes[node] = {
+                nodeid: position for position, nodeid in enumerate(self.registered_collections[node])
+            }
+        node.send_runtest_some([index[nodeid] for nodeid, completed in work_unit.items() if not completed])
+
+    def schedule(self) -> None:
+        assert self.collection_is_completed
+
+        # 첫 배정 이후: 새로 추가된 워커 등에 남은 단위 배정
+        if self.collection is not None:
+            for node in self.nodes:
+                self._reschedule(node)
+            return
+
+        if not self._check_nodes_have_same_collection():
+            self.log("**Different tests collected, aborting run**")
+            return
+
+        self.collection = list(next(iter(self.registered_collections.values())))
+        if not self.collection:
+            return
+
+        estimates = estimate(self.history, self.collection)
+        groups = {nodeid: self.history.group(nodeid) for nodeid in self.collection}
+        matrix = {nodeid: browser_of(nodeid, self.browsers) for nodeid in self.collection} if self.browsers else {}
+        for nodeid, browser in matrix.items():
+            # 매트릭스 항목: 브라우저별로 묶음 (기록된 그룹은 이미 "브라우저|호스트", 기록이 없으면 "브라우저|테스트 파일")
+            if browser is not None and groups[nodeid] is None:
+                groups[nodeid] = f"{browser}|{nodeid.split('::', 1)[0]}"
+        units = plan_units(self.collection, estimates, groups, len(self.nodes))
+        for name, members, _total in units:
+            self.workqueue[name] = {nodeid: False for nodeid in members}
+            for nodeid in members:
+                self._unit_of[nodeid] = name
+            if matrix.get(members[0]) is not None:
+                self._unit_browser[name] = matrix[members[0]]
+
+        if self.publish_stats is not None:
+            total = sum(estimates.values())
+            self.publish_stats("duration_schedule", {
+                "tests": len(self.collection),
+                "with_history": sum(1 for nodeid in self.collection if self.history.duration(nodeid) is not None),
+                "units": len(units),
+                "workers": len(self.nodes),
+                "estimated_s": round(total, 1),
+                "max_unit_s": round(units[0][2], 1),
+            })
+
+        # 단위보다 워커가 많으면 남는 워커 종료
+        extra_nodes = len(self.nodes) - len(self.workqueue)
+        if extra_nodes > 0:
+            self.log(f"Shutting down {extra_nodes} nodes")
+            for _ in range(extra_nodes):
+                unused_node, _assigned = self.assigned_work.popitem()
+                self.log(f"Shutting down unused node {unused_node}")
+                unused_node.shutdown()
+
+        # 워커마다 가장 긴 단위부터 하나씩 배정한 뒤, 일이 적은 워커에 추가 배정
+        for node in self.nodes:
+            self._assign_work_unit(node)
+        for node in self.nodes:
+            self._reschedule(node)
+
+        if not self.workqueue:
+            for node in self.nodes:
+                node.shutdown()
@@ -0,0 +1,234 @@
+"""
+힐링용 요소 메타데이터 수집
+실패한 테스트의 리포트 훅에서 전체 DOM(page.content(), driver.page_source) 대신
+실패한 locator와 관련된 후보 요소만 브라우저 안에서 한 번의 page.evaluate/execute_script로 수집
+
+- 형식: 서버 findElementInSnapshot의 메타데이터 형식
+  {"dataType": "metadata", "url", "elements": [{"tag", "id", "classes", "text", "attrs", "dataAttrs"}], "total"}
+- 후보: locator의 id/class/속성 값/텍스트 토큰과 일치하는 요소, locator 앞부분이 가리키는 영역 안의 상호작용 요소
+  (점수 순으로 최대 limit개)
+- 전체 DOM은 HEALING_FULL_DOM=true로 명시한 경우에만 전송 (conftest)
+"""
+
+import re
+import json
+import time
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+# 수집할 최대 요소 수
+DEFAULT_LIMIT = 200
+
+# 요소 텍스트 최대 길이
+MAX_TEXT = 80
+
+# 수집 통계 (conftest에서 세션 종료 시 출력)
+stats: Dict[str, Any] = {
+    "captures": 0,
+    "elements": 0,
+    "bytes": 0,
+    "capture_ms": 0.0,
+    "max_capture_ms": 0.0,
+    "failed": 0,
+}
+
+# 요소 하나를 메타데이터로 변환하는 함수 (수집/기록 스크립트 공통)
+_DESCRIBE_JS = r"""
+  const ATTRS = ['name', 'type', 'role', 'aria-label', 'placeholder', 'title', 'href', 'for', 'value'];
+  const isUnique = (selector) => {
+    try { return document.querySelectorAll(selector).length === 1; } catch (e) { return false; }
+  };
+  // 요소를 하나만 가리키는 CSS selector (id, data-testid/name/aria-label, nth-of-type 경로 순)
+  const cssFor = (el) => {
+    const tag = el.tagName.toLowerCase();
+    if (el.id && isUnique('#' + CSS.escape(el.id))) return '#' + CSS.escape(el.id);
+    for (const attr of ['data-testid', 'name', 'aria-label']) {
+      const value = el.getAttribute(attr);
+      const selector = `${tag}[${attr}=${JSON.stringify(value)}]`;
+      if (value && isUnique(selector)) return selector;
+    }
+    const path = [];
+    for (let node = el; node && node.nodeType === 1 && node !== document.documentElement; node = node.parentElement) {
+      if (node !== el && node.id && isUnique('#' + CSS.escape(node.id))) {
+        path.unshift('#' + CSS.escape(node.id));
+        break;
+      }
+      let index = 1;
+      for (let sibling = node.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+        if (sibling.tagName === node.tagName) index++;
+      }
+      path.unshift(`${node.tagName.toLowerCase()}:nth-of-type(${index})`);
+    }
+    return path.join(' > ');
+  };
+  const describe = (el, maxText, selectors) => {
+    const entry = { tag: el.tagName.toLowerCase() };
+    if (el.id) entry.id = el.id;
+    const classes = typeof el.className === 'string' ? el.className.split(/\s+/).filter(Boolean) : [];
+    if (classes.length) entry.classes = classes;
+    const text = (el.textContent || '').replace(/\s+/g, ' ').trim().slice(0, maxText);
+    if (text) entry.text = text;
+    const attrs = {};
+    const dataAttrs = {};
+    for (const attr of el.attributes) {
+      if (attr.name.startsWith('data-')) dataAttrs[attr.name] = attr.value.slice(0, maxText);
+      else if (ATTRS.includes(attr.name) && !(attr.name === 'value' && el.type === 'password')) {
+        attrs[attr.name] = attr.value.slice(0, maxText);
+      }
+    }
+    if (Object.keys(attrs).length) entry.attrs = attrs;
+    if (Object.keys(dataAttrs).length) entry.dataAttrs = dataAttrs;
+    if (selectors) entry.css = cssFor(el);
+    return entry;
+  };
+"""
+
+# 브라우저에서 실행할 수집 함수 (Playwright evaluate의 함수 식, Selenium은 즉시 호출로 감쌈)
+COLLECT_SCRIPT = "(args) => {" + _DESCRIBE_JS + r"""
+  const INTERACTIVE = 'a,button,input,select,textarea,label,option,summary,[role],[onclick],[tabindex],[data-testid],[contenteditable="true"]';
+  const tokens = args.tokens;
+  const scored = new Map();
+  const add = (el, points) => {
+    if (el && el.nodeType === 1) scored.set(el, (scored.get(el) || 0) + points);
+  };
+  const query = (selector) => {
+    try { return document.querySelectorAll(selector); } catch (e) { return []; }
+  };
+
+  // 1. locator 토큰과 속성 값이 일치하는 요소
+  for (const [token, weight] of tokens) {
+    const quoted = JSON.stringify(token);
+    for (const attr of ['id', 'class', 'name', 'data-testid', 'aria-label', 'placeholder']) {
+      for (const el of query(`[${attr}*=${quoted} i]`)) add(el, weight);
+    }
+  }
+
+  // 2. locator 텍스트 토큰을 포함하는 텍스트 노드의 부모 요소
+  const texts = tokens.filter(([token, weight]) => weight >= 10).map(([token]) => token);
+  if (texts.length && document.body) {
+    const walker = document.createTreeWalker(document.body, NodeFilter.SHOW_TEXT);
+    for (let node = walker.nextNode(); node; node = walker.nextNode()) {
+      const value = node.nodeValue.toLowerCase();
+      for (const text of texts) {
+        if (value.includes(text)) add(node.parentElement, text === value.trim() ? 10 : 5);
+      }
+    }
+  }
+
+  // 3. locator 앞부분이 가리키는 영역 (가장 긴 앞부분부터) 안의 상호작용 요소
+  let scope = null;
+  for (const selector of args.scopes) {
+    const found = query(selector);
+    if (found.length) { scope = found[0]; break; }
+  }
+  const root = scope || document;
+  for (const el of root.querySelectorAll(INTERACTIVE)) add(el, scope ? 2 : 1);
+
+  const ranked = [...scored.entries()].sort((a, b) => b[1] - a[1]).slice(0, args.limit);
+  const elements = ranked.map(([el, score]) => Object.assign(describe(el, args.maxText, args.selectors), { score }));
+  return { dataType: 'metadata', url: location.href, elements, total: scored.size };
+}
+"""
+
+# 요소 하나의 메타데이터 (Playwright locator.evaluate의 함수 식, Selenium은 즉시 호출로 감쌈)
+DESCRIBE_SCRIPT = "(el) => {" + _DESCRIBE_JS + f"  return describe(el, {MAX_TEXT}, true);\n}}\n"
+
+# locator에서 토큰 추출
+_QUOTED_RE = re.compile(r"""["']([^"']{2,})["']""")
+_ID_CLASS_RE = re.compile(r"[#.]([A-Za-z_][\w-]+)")
+_WORD_SPLIT_RE = re.compile(r"[-_\s]+|(?<=[a-z])(?=[A-Z])")
+# CSS 조합자 (locator 앞부분 영역 계산용)
+_COMBINATOR_RE = re.compile(r"\s*[>+~]\s*|\s+")
+
+
+def locator_hints(failed_locator: str, max_tokens: int = 12,
+                  extra_values: Iterable[str] = ()) -> Tuple[List[Tuple[str, int]], List[str]]:
+    """
+    실패한 locator -> (토큰과 가중치 목록, 영역 selector 목록)
+
+    - 따옴표 안의 값/텍스트, #id, .class, 단어 하나로 된 locator(Selenium By.ID 등)는 가중치 10
+    - 그 값을 -, _, 대소문자 경계로 나눈 3자 이상 단어는 가중치 3 (submit-btn -> submit-button 같은 변경 대응)
+    - CSS locator는 조합자 기준 앞부분을 긴 것부터 영역 후보로 사용
+    - extra_values: 함께 찾을 값 (이전에 기록한 요소의 id, 텍스트 등)
+    """
+    locator = (failed_locator or "").strip()
+    for prefix in ("text=", "css=", "xpath=", "id="):
+        if locator.startswith(prefix):
+            locator = locator[len(prefix):].strip()
+    values = _QUOTED_RE.findall(locator) + _ID_CLASS_RE.findall(locator)
+    if re.fullmatch(r"[\w-]{2,}", locator) or (locator and not values and not locator.startswith(("/", "("))):
+        values.append(locator)
+    values.extend(value for value in extra_values if value)
+
+    weights: Dict[str, int] = {}
+    for value in values:
+        value = value.strip()
+        if len(value) >= 2:
+            weights[value.lower()] = 10
+        for part in _WORD_SPLIT_RE.split(value):
+            part = part.lower()
+            if len(part) >= 3 and part not in weights:
+                weights[part] = 3
+    tokens = sorted(weights.items(), key=lambda item: -item[1])[:max_tokens]
+
+    scopes: List[str] = []
+    is_css = (not locator.startswith(("/", "(")) and any(ch in locator for ch in "#.[>")
+              and not any(ch in locator for ch in "\"'"))
+    if is_css:
+        parts = [part for part in _COMBINATOR_RE.split(locator) if part]
+        scopes = [" ".join(parts[:count]) for count in range(len(parts) - 1, 0, -1)]
+    return tokens, scopes
+
+
+def arguments(failed_locator: str, limit: int = DEFAULT_LIMIT, extra_values: Iterable[str] = (),
+              selectors: bool = False) -> Dict[str, Any]:
+    """COLLECT_SCRIPT 인자 (selectors=True이면 요소마다 하나만 가리키는 CSS selector 포함)"""
+    tokens, scopes = locator_hints(failed_locator, extra_values=extra_values)
+    return {"tokens": [list(token) for token in tokens], "scopes": scopes, "limit": limit,
+            "maxText": MAX_TEXT, "selectors": selectors}
+
+
+def evaluate(target, script: str, argument: Any, resolve=None) -> Any:
+    """Playwright 페이지/locator 또는 Selenium 드라이버에서 함수 식 스크립트 실행"""
+    if hasattr(target, "execute_script"):
+        return target.execute_script(f"return ({script})(arguments[0]);", argument)
+    result = target.evaluate(script, argument)
+    return resolve(result) if resolve is not None else result
+
+
+def _record(metadata: Optional[Dict[str, Any]], start: float) -> Optional[str]:
+    elapsed = (time.perf_counter() - start) * 1000
+    stats["capture_ms"] = round(stats["capture_ms"] + elapsed, 1)
+    stats["max_capture_ms"] = max(stats["max_capture_ms"], round(elapsed, 1))
+    if not isinstance(metadata, dict) or not isinstance(metadata.get("elements"), list):
+        stats["failed"] += 1
+        return None
+    # 해시로 중복 전송을 판단하므로 키 순서를 고정
+    payload = json.dumps(metadata, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    stats["captures"] += 1
+    stats["elements"] += len(metadata["elements"])
+    stats["bytes"] += len(payload.encode("utf-8"))
+    return payload
+
+
+def collect_playwright(page, failed_locator: str, limit: int = DEFAULT_LIMIT, resolve=None) -> Optional[str]:
+    """
+    Playwright 페이지에서 메타데이터 수집 (JSON 문자열, 실패 시 None)
+
+    resolve: async API 페이지인 경우 코루틴을 실행할 함수 (conftest._resolve_async)
+    """
+    start = time.perf_counter()
+    try:
+        metadata = evaluate(page, COLLECT_SCRIPT, arguments(failed_locator, limit), resolve)
+    except Exception:
+        metadata = None
+    return _record(metadata, start)
+
+
+def collect_selenium(driver, failed_locator: str, limit: int = DEFAULT_LIMIT) -> Optional[str]:
+    """Selenium 드라이버에서 메타데이터 수집 (JSON 문자열, 실패 시 None)"""
+    start = time.perf_counter()
+    try:
+        metadata = evaluate(driver, COLLECT_SCRIPT, arguments(failed_locator, limit))
+    except Exception:
+        metadata = None
+    return _record(metadata, start)
@@ -0,0 +1,133 @@
+"""
+실패한 테스트만 Playwright trace 저장 (--failure-trace, conftest.py의 page_playwright에서 사용)
+
+- 컨텍스트마다 가벼운 trace(DOM 스냅샷, 선택적으로 스크린샷, 소스 제외)를 켜 두고 테스트 단위 chunk로 기록
+  (컨텍스트 풀로 재사용되는 컨텍스트는 tracing.start 한 번 후 테스트마다 start_chunk)
+- 통과한 테스트: stop_chunk()로 파일을 쓰지 않고 버림
+- 실패한 테스트: stop_chunk(path=...)로 trace.zip 저장 (npx playwright show-trace 또는 trace.playwright.dev로 열기)
+- 저장 개수 상한: 이 워커가 이번 실행에서 저장한 trace가 max_traces개를 넘으면 오래된 것부터 삭제
+  (이전 실행이나 다른 워커가 저장한 파일은 건드리지 않음)
+- 통과한 테스트의 trace 오버헤드(시작/버리기 시간)는 테스트별로 리포트에, 합계는 실행 통계에 기록
+"""
+
+import os
+import time
+import weakref
+from collections import deque
+from typing import Optional, Tuple
+
+TRACE_EXTENSION = ".zip"
+
+
+class FailureTracer:
+    """
+    실패 시에만 저장하는 Playwright trace 기록기 (워커당 하나)
+
+    Args:
+        trace_dir: trace.zip 저장 디렉토리
+        screenshots: 동작마다 스크린샷 포함 여부 (파일과 오버헤드가 커짐)
+        max_traces: 이번 실행에서 남길 최대 trace 수 (워커별, 0이면 제한 없음)
+    """
+
+    def __init__(self, trace_dir: str, screenshots: bool = False, max_traces: int = 20):
+        self.trace_dir = trace_dir
+        self.screenshots = screenshots
+        self.max_traces = max_traces
+        # tracing.start를 호출한 컨텍스트 (풀에서 재사용되면 start_chunk만 호출)
+        self._started = weakref.WeakSet()
+        # 이번 실행에서 저장한 trace 경로 (저장 순서, 상한 적용 대상)
+        self._saved = deque()
+        self.stats = {
+            "tests": 0,
+            "saved": 0,
+            "discarded": 0,
+            "evicted": 0,
+            "failed": 0,
+            "bytes_saved": 0,
+            "start_ms": 0.0,
+            "save_ms": 0.0,
+            "passed_overhead_ms": 0.0,
+            "max_passed_overhead_ms": 0.0,
+        }
+
+    def begin(self, context, title: str) -> Optional[float]:
+        """테스트 시작 시 trace chunk 시작 (시작에 걸린 시간 ms, 실패 시 None)"""
+        start = time.perf_counter()
+        try:
+            if context in self._started:
+                context.tracing.start_chunk(title=title)
+            else:
+                context.tracing.start(title=title, snapshots=True, screenshots=self.screenshots, sources=False)
+                self._started.add(context)
+        except Exception as e:
+            # 이미 다른 곳에서 tracing을 켠 컨텍스트 등: 이 테스트는 기록하지 않음
+            self.stats["failed"] += 1
+            print(f"[FailureTrace] trace 시작 실패: {e}")
+            return None
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats["tests"] += 1
+        self.stats["start_ms"] = round(self.stats["start_ms"] + elapsed, 1)
+        return elapsed
+
+    def end(self, context, test_name: str, failed: bool, start_ms: Optional[float]) -> Tuple[Optional[str], float]:
+        """
+        테스트 종료 시 trace chunk 종료
+
+        Returns:
+            (저장한 trace 경로 또는 None, 통과한 테스트의 오버헤드 ms)
+        """
+        if start_ms is None:
+            return None, 0.0
+        start = time.perf_counter()
+        if not failed:
+            try:
+                context.tracing.stop_chunk()
+            except Exception:
+                # 컨텍스트가 이미 닫힌 경우 등
+                self._started.discard(context)
+            overhead = start_ms + (time.perf_counter() - start) * 1000
+            self.stats["discarded"] += 1
+            self.stats["passed_overhead_ms"] = round(self.stats["passed_overhead_ms"] + overhead, 1)
+            self.stats["max_passed_overhead_ms"] = max(self.stats["max_passed_overhead_ms"], round(overhead, 1))
+            return None, overhead
+
+        safe_name = test_name.replace("::", "_").replace("/", "_").replace("\\", "_")
+        path = os.path.join(self.trace_dir, f"{safe_name}_{int(time.time() * 1000)}{TRACE_EXTENSION}")
+        try:
+            os.makedirs(self.trace_dir, exist_ok=True)
+            context.tracing.stop_chunk(path=path)
+        except Exception as e:
+            self._started.discard(context)
+            self.stats["failed"] += 1
+            print(f"[FailureTrace] trace 저장 실패: {e}")
+            return None, 0.0
+        self.stats["saved"] += 1
+        self.stats["save_ms"] = round(self.stats["save_ms"] + (time.perf_counter() - start) * 1000, 1)
+        try:
+            self.stats["bytes_saved"] += os.path.getsize(path)
+        except OSError:
+            pass
+        self._saved.append(path)
+        self._enforce_limit()
+        return path, 0.0
+
+    def _enforce_limit(self) -> None:
+        """이번 실행에서 저장한 trace가 max_traces개를 넘으면 오래된 것부터 삭제"""
+        if self.max_traces <= 0:
+            return
+        while len(self._saved) > self.max_traces:
+            path = self._saved.popleft()
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self.stats["evicted"] += 1
+
+
+def create_from_env(mode: str) -> FailureTracer:
+    """환경 변수 설정으로 생성 (mode: snapshots 또는 screenshots)"""
+    return FailureTracer(
+        trace_dir=os.getenv("PYTEST_TRACE_DIR", ".pytest-reports/traces"),
+        screenshots=mode == "screenshots",
+        max_traces=int(os.getenv("PYTEST_TRACE_MAX", "20")),
+    )
@@ -0,0 +1,355 @@
+"""
+힐링 트리거 백그라운드 전송기
+테스트 스레드는 큐에 넣기만 하고, 네트워크 전송은 별도 스레드에서 배치/재시도 처리
+"""
+
+import gzip
+import json
+import os
+import queue
+import threading
+import time
+import http.client
+from urllib.parse import urlparse
+from typing import Optional, Dict, Any, List, Tuple
+
+from dom_cache import DomCache, dom_hash
+
+
+class HealingHTTPError(RuntimeError):
+    """서버가 2xx가 아닌 상태로 응답 (4xx는 같은 요청을 다시 보내도 실패하므로 재시도하지 않음)"""
+
+    def __init__(self, status: int, body: bytes = b""):
+        detail = body[:200].decode("utf-8", errors="replace").strip()
+        super().__init__(f"HTTP {status}" + (f": {detail}" if detail else ""))
+        self.status = status
+        self.retryable = status >= 500 or status == 429
+
+
+class HealingDispatcher:
+    """
+    힐링 요청 비동기 전송기
+
+    - 제한된 크기의 큐 (가득 차면 요청을 버리고 dropped 카운트 증가)
+    - 여러 실패를 하나의 POST로 묶어 전송 ({"batch": [...]})
+    - keep-alive 연결 재사용, 실패 시 지수 백오프 재시도
+    - 같은 locator/페이지/DOM에 대한 중복 요청은 하나로 병합 (전송에 성공한 요청만 기록)
+    - 2xx가 아닌 응답은 실패로 처리 (5xx/429만 재시도), 최종 실패는 debug 설정과 관계없이 출력
+    - 이미 전송한 DOM은 해시(current_dom_hash)만 전송, 본문은 gzip 압축
+      (서버가 해시를 찾지 못했다고 응답하면(unknown_dom_hashes) DOM 전체와 함께 다시 전송)
+    - flush(deadline)으로 세션 종료 시 남은 요청을 제한 시간 내 전송
+    """
+
+    def __init__(self, api_url: str, max_queue: int = 100, batch_size: int = 10,
+                 batch_wait: float = 0.2, max_retries: int = 3, backoff: float = 0.5,
+                 timeout: float = 5.0, debug: bool = False,
+                 dom_cache: Optional[DomCache] = None, compress: bool = True):
+        parsed = urlparse(api_url)
+        self.api_url = api_url
+        self._scheme = parsed.scheme or "http"
+        self._host = parsed.hostname or "localhost"
+        self._port = parsed.port
+        self._path = parsed.path or "/"
+        if parsed.query:
+            self._path += f"?{parsed.query}"
+
+        self.batch_size = max(1, batch_size)
+        self.batch_wait = batch_wait
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = timeout
+        self.debug = debug
+        self.dom_cache = dom_cache
+        self.compress = compress
+        # 전송에 성공한 힐링 요청 키 (locator, 타입, URL, DOM 해시)
+        self._seen_requests = set()
+
+        self._queue: "queue.Queue[Dict[str, Any]]" = queue.Queue(maxsize=max_queue)
+        self._conn: Optional[http.client.HTTPConnection] = None
+        self._stop = threading.Event()
+        # flush 제한 시각 (이 시각 이후에는 재시도하지 않음)
+        self._deadline: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stats = {
+            "submitted": 0,
+            "sent": 0,
+            "batches": 0,
+            "retries": 0,
+            "dropped": 0,
+            "failed": 0,
+            "merged": 0,
+            "dom_hash_only": 0,
+            "dom_resent": 0,
+            "dom_resend_failed": 0,
+            "bytes_raw": 0,
+            "bytes_sent": 0,
+            "max_queue_depth": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name="healing-dispatcher", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # 테스트 스레드에서 호출 (블로킹 없음)
+    # ------------------------------------------------------------------
+
+    def submit(self, payload: Dict[str, Any]) -> bool:
+        """힐링 요청을 큐에 추가 (큐가 가득 차면 버리고 False 반환)"""
+        try:
+            self._queue.put_nowait(payload)
+        except queue.Full:
+            self._bump("dropped")
+            self._log("큐가 가득 차서 힐링 요청을 버렸습니다")
+            return False
+        with self._lock:
+            self._stats["submitted"] += 1
+            self._stats["max_queue_depth"] = max(self._stats["max_queue_depth"], self._queue.qsize())
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """전송 통계 (현재 큐 깊이 포함)"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def flush(self, timeout: float) -> bool:
+        """
+        남은 요청을 제한 시간 내에 전송하고 전송 스레드 종료
+
+        Returns:
+            제한 시간 내에 모두 처리했는지 여부 (남은 요청은 dropped로 집계)
+        """
+        self._deadline = time.monotonic() + timeout
+        self._stop.set()
+        self._thread.join(timeout)
+        finished = not self._thread.is_alive()
+        if finished:
+            self._close_connection()
+        else:
+            leftover = self._drain()
+            self._bump("dropped", len(leftover))
+        return finished
+
+    # ------------------------------------------------------------------
+    # 전송 스레드
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+
+            batch = [first]
+            gather_until = time.monotonic() + (0 if self._stop.is_set() else self.batch_wait)
+            while len(batch) < self.batch_size:
+                remaining = gather_until - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            self._send_with_retry(batch)
+
+    def _prepare(self, batch: List[Dict[str, Any]]) -> Tuple[List[Dict[str, Any]], Dict[str, str], set]:
+        """
+        중복 요청 병합 및 DOM 해시 치환
+
+        Returns:
+            (전송할 요청 목록, 이번에 본문째 전송하는 DOM {해시: DOM}, 요청 키)
+        """
+        prepared = []
+        pending_doms: Dict[str, str] = {}
+        keys = set()
+        for payload in batch:
+            info = payload.get("failure_info") or {}
+            dom = info.get("current_dom")
+            content_hash = dom_hash(dom) if dom else info.get("current_dom_hash")
+
+            key = (info.get("failed_locator"), info.get("locator_type"), info.get("page_url"), content_hash)
+            if key in self._seen_requests or key in keys:
+                self._bump("merged")
+                continue
+            keys.add(key)
+
+            if dom:
+                info = dict(info, current_dom_hash=content_hash)
+                already_sent = content_hash in pending_doms or (
+                    self.dom_cache is not None and self.dom_cache.was_sent(content_hash)
+                )
+                if already_sent:
+                    # 서버가 해시로 DOM을 찾을 수 있으므로 본문 생략
+                    del info["current_dom"]
+                    self._bump("dom_hash_only")
+                else:
+                    pending_doms[content_hash] = dom
+                payload = dict(payload, failure_info=info)
+            prepared.append(payload)
+        return prepared, pending_doms, keys
+
+    def _send_with_retry(self, batch: List[Dict[str, Any]]) -> None:
+        prepared, pending_doms, keys = self._prepare(batch)
+        if not prepared:
+            return
+
+        response = self._deliver(prepared)
+        if response is None:
+            self._bump("failed", len(prepared))
+            return
+        self._bump("sent", len(prepared))
+        # 전송에 성공한 요청만 이후 중복으로 병합 (실패한 요청은 같은 실패가 다시 나면 재전송)
+        self._seen_requests.update(keys)
+        if self.dom_cache is not None:
+            for content_hash, dom in pending_doms.items():
+                self.dom_cache.mark_sent(content_hash, dom)
+
+        unknown = set(response.get("unknown_dom_hashes") or ()) if isinstance(response, dict) else set()
+        if unknown:
+            self._resend_full_dom(prepared, unknown)
+
+    def _resend_full_dom(self, prepared: List[Dict[str, Any]], unknown: set) -> None:
+        """
+        서버가 찾지 못한 DOM 해시(서버 재시작, 서버 캐시에서 교체됨)의 요청을 DOM 전체와 함께 다시 전송
+        (전송 기록도 지워서 이후 같은 DOM은 본문째 전송)
+        """
+        resend = []
+        for payload in prepared:
+            info = payload.get("failure_info") or {}
+            content_hash = info.get("current_dom_hash")
+            if content_hash not in unknown or info.get("current_dom"):
+                continue
+            dom = self.dom_cache.load(content_hash) if self.dom_cache is not None else None
+            if dom is None:
+                continue
+            resend.append(dict(payload, failure_info=dict(info, current_dom=dom)))
+        if self.dom_cache is not None:
+            for content_hash in unknown:
+                self.dom_cache.forget(content_hash)
+        self._log(f"서버가 모르는 DOM 해시 {len(unknown)}개, 요청 {len(resend)}건을 DOM과 함께 다시 전송")
+        if not resend:
+            return
+
+        if self._deliver(resend) is None:
+            self._bump("dom_resend_failed", len(resend))
+            return
+        self._bump("dom_resent", len(resend))
+        if self.dom_cache is not None:
+            for payload in resend:
+                info = payload["failure_info"]
+                self.dom_cache.mark_sent(info["current_dom_hash"], info["current_dom"])
+
+    def _deliver(self, payloads: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        요청 목록을 한 번의 POST로 전송 (실패 시 재시도)
+
+        Returns:
+            응답 본문 (JSON이 아니면 빈 dict), 전송 실패 시 None
+        """
+        # 요청이 하나면 기존 단건 형식 그대로 전송 (구버전 서버 호환)
+        body = payloads[0] if len(payloads) == 1 else {"batch": payloads}
+        data = json.dumps(body).encode("utf-8")
+        raw_size = len(data)
+        if self.compress:
+            data = gzip.compress(data, compresslevel=6)
+
+        error: Optional[Exception] = None
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self._post(data)
+                with self._lock:
+                    self._stats["batches"] += 1
+                    self._stats["bytes_raw"] += raw_size
+                    self._stats["bytes_sent"] += len(data)
+                return response
+            except Exception as e:
+                error = e
+                self._close_connection()
+                self._log(f"힐링 트리거 실패 (시도 {attempt + 1}): {e}")
+                if isinstance(e, HealingHTTPError) and not e.retryable:
+                    break
+                delay = self.backoff * (2 ** attempt)
+                if attempt == self.max_retries or self._past_deadline(delay):
+                    break
+                self._bump("retries")
+                time.sleep(delay)
+
+        print(f"[Healing] 힐링 요청 {len(payloads)}건 전송 실패: {error}")
+        return None
+
+    def _post(self, data: bytes) -> Dict[str, Any]:
+        if self._conn is None:
+            conn_cls = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            self._conn = conn_cls(self._host, self._port, timeout=self.timeout)
+        headers = {
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+        }
+        if self.compress:
+            headers["Content-Encoding"] = "gzip"
+        self._conn.request("POST", self._path, body=data, headers=headers)
+        response = self._conn.getresponse()
+        # 연결을 재사용하려면 응답 본문을 끝까지 읽어야 함
+        body = response.read()
+        if not 200 <= response.status < 300:
+            raise HealingHTTPError(response.status, body)
+        try:
+            return json.loads(body) if body else {}
+        except ValueError:
+            return {}
+
+    # ------------------------------------------------------------------
+    # 내부 유틸리티
+    # ------------------------------------------------------------------
+
+    def _past_deadline(self, delay: float) -> bool:
+        return self._deadline is not None and time.monotonic() + delay > self._deadline
+
+    def _drain(self) -> List[Dict[str, Any]]:
+        items = []
+        while True:
+            try:
+                items.append(self._queue.get_nowait())
+            except queue.Empty:
+                return items
+
+    def _close_connection(self) -> None:
+        if self._conn is not None:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+            self._conn = None
+
+    def _bump(self, key: str, amount: int = 1) -> None:
+        with self._lock:
+            self._stats[key] += amount
+
+    def _log(self, message: str) -> None:
+        if self.debug:
+            print(f"[Healing] {message}")
+
+
+def create_from_env() -> HealingDispatcher:
+    """환경 변수 설정으로 전송기 생성"""
+    dom_cache = None
+    cache_dir = os.getenv(
+        'HEALING_DOM_CACHE_DIR',
+        os.path.join(os.path.expanduser("~"), ".testarchitect", "healing-dom-cache")
+    )
+    try:
+        dom_cache = DomCache(cache_dir, ttl=float(os.getenv('HEALING_DOM_CACHE_TTL', '3600')))
+    except OSError:
+        # 캐시 디렉토리를 만들 수 없으면 항상 DOM 전체 전송
+        pass
+
+    return HealingDispatcher(
+        api_url=os.getenv('HEALING_API_URL', 'http://localhost:3001/api/locator-healing/trigger'),
+        max_queue=int(os.getenv('HEALING_QUEUE_SIZE', '100')),
+        batch_size=int(os.getenv('HEALING_BATCH_SIZE', '10')),
+        max_retries=int(os.getenv('HEALING_MAX_RETRIES', '3')),
+        debug=os.getenv('DEBUG_HEALING', 'false').lower() == 'true',
+        dom_cache=dom_cache,
+        compress=os.getenv('HEALING_GZIP', 'true').lower() == 'true'
+    )
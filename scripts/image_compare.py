@@ -0,0 +1,444 @@
+"""
+시각적 검증용 이미지 비교 (NumPy 벡터 연산, Playwright/Selenium 공통)
+
+- 빠른 종료: 인코딩된 바이트가 기준 이미지 파일과 같으면 디코딩 없이 일치,
+  디코딩 후에는 가로 띠(tile) 단위 해시를 비교해 달라진 띠만 픽셀 비교
+- 픽셀 비교 방식: perceptual(YIQ 색 거리, pixelmatch와 같은 기준) 또는 pixel(채널별 최대 차이)
+- 마스크 영역(x, y, width, height)은 비교에서 제외 (광고, 시계 등 매번 바뀌는 부분)
+- 기준 이미지의 디코딩 결과와 띠 해시는 메모리에 캐시 (파일이 바뀌면 다시 읽음)
+- 차이 이미지(-actual.png, -diff.png)는 비교가 실패한 경우에만 저장
+- 디코딩/인코딩에 Pillow 필요 ('pip install numpy pillow')
+"""
+
+import io
+import os
+import re
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple, Iterable, Union
+
+import numpy as np
+
+METHODS = ("perceptual", "pixel")
+
+# 띠 해시 단위 (행 수, 띠 하나는 메모리에서 연속이므로 복사 없이 해시)
+TILE_ROWS = 64
+# 픽셀 비교를 한 번에 처리할 최대 행 수 (큰 전체 페이지 캡처의 임시 배열 크기 제한)
+CHUNK_ROWS = 512
+
+# YIQ 변환 계수 (pixelmatch와 같은 값) 와 최대 색 거리
+_YIQ = np.array([
+    [0.29889531, 0.58662247, 0.11448223],
+    [0.59597799, -0.27417610, -0.32180189],
+    [0.21147017, -0.52261711, 0.31114694],
+], dtype=np.float32).T
+_YIQ_WEIGHTS = np.array([0.5053, 0.299, 0.1957], dtype=np.float32)
+_MAX_YIQ_DELTA = 35215.0
+
+Region = Union[Tuple[float, float, float, float], Dict[str, float]]
+
+
+def _load_pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("이미지 비교에 Pillow가 필요합니다. 'pip install pillow' 실행하세요.") from None
+    return Image
+
+
+def decode(data: bytes) -> np.ndarray:
+    """PNG/JPEG 바이트 -> (높이, 너비, 3) uint8 RGB 배열 (투명 영역은 흰 배경에 합성)"""
+    Image = _load_pillow()
+    with Image.open(io.BytesIO(data)) as image:
+        if image.mode in ("RGBA", "LA", "P") or "transparency" in image.info:
+            rgba = image.convert("RGBA")
+            background = Image.new("RGBA", rgba.size, (255, 255, 255, 255))
+            image_rgb = Image.alpha_composite(background, rgba).convert("RGB")
+        else:
+            image_rgb = image.convert("RGB")
+    return np.ascontiguousarray(np.asarray(image_rgb, dtype=np.uint8))
+
+
+def encode_png(pixels: np.ndarray) -> bytes:
+    """RGB 배열 -> PNG 바이트 (실패 시 차이 이미지 저장용, 압축보다 속도 우선)"""
+    Image = _load_pillow()
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, "PNG", compress_level=1)
+    return buffer.getvalue()
+
+
+def tile_hashes(pixels: np.ndarray, tile_rows: int = TILE_ROWS) -> List[bytes]:
+    """가로 띠별 해시 (C 연속 배열의 행 슬라이스는 복사 없이 버퍼로 전달됨)"""
+    pixels = np.ascontiguousarray(pixels)
+    return [
+        hashlib.blake2b(pixels[start:start + tile_rows], digest_size=16).digest()
+        for start in range(0, pixels.shape[0], tile_rows)
+    ]
+
+
+def mask_array(shape: Tuple[int, int], regions: Iterable[Region]) -> Optional[np.ndarray]:
+    """
+    비교할 픽셀 True, 제외할 픽셀 False인 배열 (제외 영역이 없으면 None)
+
+    영역은 (x, y, width, height) 또는 Playwright bounding_box() 형식의 딕셔너리
+    """
+    height, width = shape
+    mask = None
+    for region in regions or ():
+        if region is None:
+            continue
+        if isinstance(region, dict):
+            x, y, w, h = region["x"], region["y"], region["width"], region["height"]
+        else:
+            x, y, w, h = region
+        x0, y0 = max(0, int(x)), max(0, int(y))
+        x1, y1 = min(width, int(np.ceil(x + w))), min(height, int(np.ceil(y + h)))
+        if x1 <= x0 or y1 <= y0:
+            continue
+        if mask is None:
+            mask = np.ones(shape, dtype=bool)
+        mask[y0:y1, x0:x1] = False
+    return mask
+
+
+def diff_pixels(actual: np.ndarray, expected: np.ndarray, threshold: float, method: str) -> np.ndarray:
+    """두 이미지 영역(같은 크기)에서 허용치를 넘는 픽셀 True"""
+    if method == "pixel":
+        # uint8 그대로 |a - b| 계산 (int16 변환 없이), 채널 축 max 대신 채널별 maximum
+        delta = np.maximum(actual, expected) - np.minimum(actual, expected)
+        delta = np.maximum(np.maximum(delta[..., 0], delta[..., 1]), delta[..., 2])
+        return delta > threshold * 255
+    difference = actual.astype(np.float32) - expected.astype(np.float32)
+    yiq = difference @ _YIQ
+    delta = (yiq * yiq) @ _YIQ_WEIGHTS
+    return delta > _MAX_YIQ_DELTA * threshold * threshold
+
+
+def render_diff(expected: np.ndarray, diff_mask: np.ndarray, mask: Optional[np.ndarray] = None) -> np.ndarray:
+    """흐리게 만든 기준 이미지 위에 다른 픽셀은 빨강, 제외 영역은 회색으로 표시"""
+    luma = (expected[..., 0].astype(np.uint16) * 77
+            + expected[..., 1].astype(np.uint16) * 150
+            + expected[..., 2].astype(np.uint16) * 29) >> 8
+    faded = (230 + luma // 10).astype(np.uint8)
+    output = np.repeat(faded[..., None], 3, axis=2)
+    if mask is not None:
+        output[~mask] = (200, 200, 200)
+    output[diff_mask] = (255, 0, 0)
+    return output
+
+
+class DecodedImage:
+    """디코딩한 이미지와 빠른 비교용 해시"""
+
+    __slots__ = ("pixels", "digest", "tiles")
+
+    def __init__(self, pixels: np.ndarray, digest: str, tiles: Optional[List[bytes]] = None):
+        self.pixels = pixels
+        self.digest = digest
+        self.tiles = tiles if tiles is not None else tile_hashes(pixels)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "DecodedImage":
+        return cls(decode(data), hashlib.sha256(data).hexdigest())
+
+    @property
+    def nbytes(self) -> int:
+        return self.pixels.nbytes
+
+
+class CompareResult:
+    """비교 결과"""
+
+    def __init__(self, matched: bool, reason: str, diff_count: int = 0, compared: int = 0,
+                 tiles_total: int = 0, tiles_diffed: int = 0, diff_mask: Optional[np.ndarray] = None,
+                 mask: Optional[np.ndarray] = None):
+        self.matched = matched
+        # exact(바이트 동일), tiles(모든 띠 해시 동일), pixels(허용치 이내), diff, size, missing
+        self.reason = reason
+        self.diff_count = diff_count
+        self.compared = compared
+        self.tiles_total = tiles_total
+        self.tiles_diffed = tiles_diffed
+        self.diff_mask = diff_mask
+        # 비교한 픽셀 True (제외 영역이 없으면 None)
+        self.mask = mask
+        self.baseline_path: Optional[str] = None
+        self.actual_path: Optional[str] = None
+        self.diff_path: Optional[str] = None
+
+    @property
+    def diff_ratio(self) -> float:
+        return self.diff_count / self.compared if self.compared else 0.0
+
+    def message(self) -> str:
+        if self.reason == "missing":
+            return f"기준 이미지가 없어 현재 이미지를 기준으로 저장했습니다: {self.baseline_path}"
+        if self.reason == "size":
+            return f"이미지 크기가 기준 이미지와 다릅니다: {self.baseline_path} (현재 이미지: {self.actual_path})"
+        lines = [f"이미지가 기준 이미지와 다릅니다: {self.diff_count}px ({self.diff_ratio:.4%}), "
+                 f"달라진 띠 {self.tiles_diffed}/{self.tiles_total}",
+                 f"  기준: {self.baseline_path}"]
+        if self.actual_path:
+            lines.append(f"  현재: {self.actual_path}")
+        if self.diff_path:
+            lines.append(f"  차이: {self.diff_path}")
+        return "\n".join(lines)
+
+
+class ImageComparator:
+    """
+    기준 이미지 캐시와 비교/차이 이미지 저장
+
+    Args:
+        diff_dir: 실패 시 현재 이미지/차이 이미지를 저장할 디렉토리
+        threshold: 픽셀별 허용치 (0~1, perceptual은 YIQ 색 거리 비율, pixel은 채널 차이 비율)
+        method: "perceptual" 또는 "pixel"
+        cache_bytes: 메모리에 둘 기준 이미지 최대 크기 (디코딩된 바이트 기준, 넘으면 오래 안 쓴 것부터 제거)
+    """
+
+    def __init__(self, diff_dir: str, threshold: float = 0.1, method: str = "perceptual",
+                 cache_bytes: int = 512 * 1024 * 1024):
+        if method not in METHODS:
+            raise ValueError(f"지원하지 않는 이미지 비교 방식: {method} ({', '.join(METHODS)})")
+        self.diff_dir = diff_dir
+        self.threshold = float(threshold)
+        self.method = method
+        self.cache_bytes = int(cache_bytes)
+        # 경로 -> ((수정 시각, 크기), DecodedImage)
+        self._cache: "OrderedDict[str, Tuple[Tuple[int, int], DecodedImage]]" = OrderedDict()
+        self._cached_bytes = 0
+        self._lock = threading.Lock()
+        self._stats = {
+            "comparisons": 0,
+            "passed": 0,
+            "failed": 0,
+            "exact_matches": 0,
+            "tile_matches": 0,
+            "tiles_total": 0,
+            "tiles_diffed": 0,
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "baselines_created": 0,
+            "diff_images": 0,
+            "decode_ms": 0.0,
+            "compare_ms": 0.0,
+            "max_compare_ms": 0.0,
+        }
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        stats["decode_ms"] = round(stats["decode_ms"], 1)
+        stats["compare_ms"] = round(stats["compare_ms"], 1)
+        stats["max_compare_ms"] = round(stats["max_compare_ms"], 1)
+        return stats
+
+    def load_baseline(self, path: str) -> DecodedImage:
+        """기준 이미지 (캐시에 없거나 파일이 바뀌었으면 디코딩)"""
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == version:
+                self._cache.move_to_end(path)
+                self._stats["hits"] += 1
+                return cached[1]
+        start = time.perf_counter()
+        with open(path, "rb") as f:
+            image = DecodedImage.from_bytes(f.read())
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            self._stats["misses"] += 1
+            self._stats["decode_ms"] += elapsed
+            self._store(path, version, image)
+        return image
+
+    def _store(self, path: str, version: Tuple[int, int], image: DecodedImage) -> None:
+        previous = self._cache.pop(path, None)
+        if previous is not None:
+            self._cached_bytes -= previous[1].nbytes
+        if image.nbytes > self.cache_bytes:
+            return
+        self._cache[path] = (version, image)
+        self._cached_bytes += image.nbytes
+        while self._cached_bytes > self.cache_bytes:
+            _, (_, evicted) = self._cache.popitem(last=False)
+            self._cached_bytes -= evicted.nbytes
+
+    def compare(self, actual: Union[bytes, DecodedImage], expected: DecodedImage,
+                threshold: Optional[float] = None, method: Optional[str] = None,
+                max_diff_pixels: int = 0, max_diff_ratio: float = 0.0,
+                mask: Iterable[Region] = ()) -> CompareResult:
+        """
+        현재 이미지와 기준 이미지 비교 (파일 저장 없음)
+
+        max_diff_pixels/max_diff_ratio: 허용치를 넘는 픽셀이 이 수(비율) 이하이면 일치로 판단
+        """
+        threshold = self.threshold if threshold is None else float(threshold)
+        method = method or self.method
+        if method not in METHODS:
+            raise ValueError(f"지원하지 않는 이미지 비교 방식: {method} ({', '.join(METHODS)})")
+
+        if isinstance(actual, (bytes, bytearray)):
+            if hashlib.sha256(actual).hexdigest() == expected.digest:
+                return CompareResult(True, "exact")
+            start = time.perf_counter()
+            actual = DecodedImage.from_bytes(bytes(actual))
+            with self._lock:
+                self._stats["decode_ms"] += (time.perf_counter() - start) * 1000
+        elif actual.digest == expected.digest:
+            return CompareResult(True, "exact")
+
+        if actual.pixels.shape != expected.pixels.shape:
+            return CompareResult(False, "size")
+
+        height, width = expected.pixels.shape[:2]
+        changed = [index for index, (a, b) in enumerate(zip(actual.tiles, expected.tiles)) if a != b]
+        tiles_total = len(expected.tiles)
+        if not changed:
+            return CompareResult(True, "tiles", tiles_total=tiles_total)
+
+        include = mask_array((height, width), mask)
+        diff_mask = np.zeros((height, width), dtype=bool)
+        for start, stop in _row_ranges(changed, TILE_ROWS, height):
+            diff_mask[start:stop] = diff_pixels(actual.pixels[start:stop], expected.pixels[start:stop],
+                                                threshold, method)
+        if include is not None:
+            diff_mask &= include
+        compared = int(include.sum()) if include is not None else height * width
+        diff_count = int(np.count_nonzero(diff_mask))
+        allowed = max(int(max_diff_pixels), int(max_diff_ratio * compared))
+        matched = diff_count <= allowed
+        return CompareResult(matched, "pixels" if matched else "diff", diff_count, compared,
+                             tiles_total, len(changed), diff_mask, include)
+
+    def check(self, actual: bytes, baseline_path: str, name: str, update: bool = False,
+              **options) -> CompareResult:
+        """
+        기준 이미지 파일과 비교하고 실패 시 현재 이미지/차이 이미지를 저장
+
+        - 기준 이미지가 없으면 현재 이미지를 기준으로 저장하고 실패 처리 (update=True이면 통과)
+        - update=True이면 다를 때 기준 이미지를 현재 이미지로 교체하고 통과
+        """
+        start = time.perf_counter()
+        if not os.path.exists(baseline_path):
+            _write_atomic(baseline_path, actual)
+            result = CompareResult(update, "missing")
+            result.baseline_path = baseline_path
+            with self._lock:
+                self._stats["baselines_created"] += 1
+            self._record(result, start)
+            return result
+
+        expected = self.load_baseline(baseline_path)
+        result = self.compare(actual, expected, **options)
+        result.baseline_path = baseline_path
+        if not result.matched:
+            if update:
+                _write_atomic(baseline_path, actual)
+                result.matched = True
+            else:
+                self._write_failure(actual, expected, baseline_path, name, result)
+        self._record(result, start)
+        return result
+
+    def _write_failure(self, actual: bytes, expected: DecodedImage, baseline_path: str, name: str,
+                       result: CompareResult) -> None:
+        base = os.path.join(self.diff_dir, _safe_name(os.path.splitext(name)[0]))
+        result.actual_path = f"{base}-actual{os.path.splitext(baseline_path)[1] or '.png'}"
+        _write_atomic(result.actual_path, actual)
+        if result.diff_mask is not None:
+            result.diff_path = f"{base}-diff.png"
+            _write_atomic(result.diff_path, encode_png(render_diff(expected.pixels, result.diff_mask, result.mask)))
+            with self._lock:
+                self._stats["diff_images"] += 1
+
+    def _record(self, result: CompareResult, start: float) -> None:
+        elapsed = (time.perf_counter() - start) * 1000
+        with self._lock:
+            stats = self._stats
+            stats["comparisons"] += 1
+            stats["passed" if result.matched else "failed"] += 1
+            if result.reason == "exact":
+                stats["exact_matches"] += 1
+            elif result.reason == "tiles":
+                stats["tile_matches"] += 1
+            stats["tiles_total"] += result.tiles_total
+            stats["tiles_diffed"] += result.tiles_diffed
+            stats["compare_ms"] += elapsed
+            stats["max_compare_ms"] = max(stats["max_compare_ms"], elapsed)
+
+
+def _row_ranges(tiles: List[int], tile_rows: int, height: int) -> List[Tuple[int, int]]:
+    """달라진 띠 번호 -> 이어지는 행 범위 (CHUNK_ROWS 단위로 나눔)"""
+    ranges: List[Tuple[int, int]] = []
+    for index in tiles:
+        start, stop = index * tile_rows, min(height, (index + 1) * tile_rows)
+        if ranges and ranges[-1][1] == start and stop - ranges[-1][0] <= CHUNK_ROWS:
+            ranges[-1] = (ranges[-1][0], stop)
+        else:
+            ranges.append((start, stop))
+    return ranges
+
+
+def _safe_name(name: str) -> str:
+    return re.sub(r"[^\w.-]+", "_", name).strip("_") or "snapshot"
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def create_from_env() -> ImageComparator:
+    """환경 변수 설정으로 비교기 생성"""
+    return ImageComparator(
+        diff_dir=os.getenv("TEST_IMAGE_DIFF_DIR", ".pytest-reports/image-diff"),
+        threshold=float(os.getenv("TEST_IMAGE_THRESHOLD", "0.1")),
+        method=os.getenv("TEST_IMAGE_METHOD", "perceptual").lower(),
+        cache_bytes=int(float(os.getenv("TEST_IMAGE_CACHE_MB", "512")) * 1024 * 1024),
+    )
+
+
+_default_comparator: Optional[ImageComparator] = None
+
+
+def get_comparator() -> ImageComparator:
+    """프로세스 공용 비교기 (기준 이미지 캐시를 테스트 간에 공유)"""
+    global _default_comparator
+    if _default_comparator is None:
+        _default_comparator = create_from_env()
+    return _default_comparator
+
+
+def assert_image_matches(actual: bytes, baseline_path: str, name: Optional[str] = None,
+                         update: Optional[bool] = None, **options) -> CompareResult:
+    """
+    기준 이미지와 다르면 AssertionError (pytest fixture 없이 실행하는 스크립트용)
+
+    assert_image_matches(element.screenshot_as_png, "snapshots/login.png", mask=[(0, 0, 200, 40)])
+    """
+    if update is None:
+        update = os.getenv("TEST_UPDATE_SNAPSHOTS", "false").lower() == "true"
+    result = get_comparator().check(actual, baseline_path, name or os.path.basename(baseline_path),
+                                    update=update, **options)
+    if not result.matched:
+        raise AssertionError(result.message())
+    return result
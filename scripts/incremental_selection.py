@@ -0,0 +1,408 @@
+"""
+변경 감지 기반 선택 실행 (--incremental true)
+테스트마다 코드 지문(fingerprint)을 만들어, 지문이 바뀌었거나 지난 실행에서 통과하지 못한 테스트만 실행하고
+나머지는 "캐시된 통과"로 보고
+
+- 지문: 테스트 함수(클래스 메서드) 자체의 AST + 같은 파일의 테스트 외 코드(import, 헬퍼, fixture 등)
+  + 파일이 import하는 로컬 모듈(test_utils.py, page_objects 등, 재귀) + 상위 디렉토리의 conftest.py와 그 모듈
+  + 실행 설정(드라이버, 브라우저, 기본 URL 등)
+- 힐링으로 로케이터가 바뀐 테스트(codeModifier.replaceLocatorInCode)는 해당 함수의 AST가 바뀌므로 그 테스트만 다시 실행
+  (Page Object가 바뀌면 그 Page Object를 import하는 테스트가 다시 실행)
+- 기록: xdist 컨트롤러(또는 단일 프로세스)가 실행 종료 시 한 번 갱신
+- 캐시된 통과는 setup/call/teardown 모두 passed인 리포트로 보고 (user_properties에 ("incremental", "cached"))
+"""
+
+import os
+import re
+import ast
+import json
+import time
+import fnmatch
+import hashlib
+import tempfile
+from pathlib import Path
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+import pytest
+
+# 선택 실행 기록 파일 (실행 간 공유)
+STATE_FILE = os.getenv(
+    "TEST_INCREMENTAL_STATE",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "incremental-state.json")
+)
+# 이 기간(일) 동안 실행되지 않은 테스트는 기록에서 제거
+STATE_TTL_DAYS = float(os.getenv("TEST_INCREMENTAL_STATE_TTL", "30"))
+
+# 캐시된 통과 리포트의 user_properties 항목 이름
+CACHED_PROPERTY = "incremental"
+# xdist 워커가 캐시된 테스트 목록을 컨트롤러로 전달할 때 사용하는 workeroutput 키
+CACHED_KEY = "testarchitect_incremental_cached"
+
+# node ID 끝의 매개변수 부분 (test_login[chromium] -> test_login)
+_PARAMS_RE = re.compile(r"\[.*\]$")
+
+
+def _sha1(*parts: str) -> str:
+    digest = hashlib.sha1()
+    for part in parts:
+        digest.update(part.encode("utf-8", "surrogatepass"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def _matches(name: str, patterns: Iterable[str]) -> bool:
+    """pytest의 python_functions/python_classes 규칙 (접두사 또는 glob 패턴)"""
+    return any(name.startswith(pattern) or fnmatch.fnmatch(name, pattern) for pattern in patterns)
+
+
+def is_cached_report(report) -> bool:
+    """캐시된 통과로 보고된 리포트인지 확인 (실행 시간 기록 등에서 제외할 때 사용)"""
+    return (CACHED_PROPERTY, "cached") in getattr(report, "user_properties", ())
+
+
+class Fingerprinter:
+    """
+    테스트 node ID -> 지문
+
+    파일 내용/AST 분석 결과는 파일별로 한 번만 계산
+    """
+
+    def __init__(self, rootdir, context: str = "",
+                 function_patterns: Iterable[str] = ("test",), class_patterns: Iterable[str] = ("Test",)):
+        self.rootdir = Path(rootdir).resolve()
+        self.context = context
+        self.function_patterns = tuple(function_patterns)
+        self.class_patterns = tuple(class_patterns)
+        # 파일 경로 -> 내용 해시 (읽을 수 없으면 None)
+        self._contents: Dict[Path, Optional[str]] = {}
+        # 파일 경로 -> 파일이 import하는 로컬 모듈 파일
+        self._imports: Dict[Path, List[Path]] = {}
+        # 파일 경로 -> (테스트 이름 -> AST 해시, 테스트 외 코드 해시) (구문 오류면 None)
+        self._modules: Dict[Path, Optional[Tuple[Dict[str, str], str]]] = {}
+        # 파일 경로 -> 의존 파일(자신, import한 로컬 모듈, conftest.py) 전체의 해시
+        self._dependencies: Dict[Path, Optional[str]] = {}
+        self._trees: Dict[Path, Optional[ast.Module]] = {}
+
+    def fingerprint(self, nodeid: str) -> Optional[str]:
+        """
+        테스트 지문 (파일을 읽거나 분석할 수 없으면 None: 항상 실행)
+        """
+        parts = nodeid.split("::")
+        path = (self.rootdir / parts[0]).resolve()
+        dependencies = self._dependency_hash(path)
+        module = self._module(path)
+        if dependencies is None or module is None:
+            return None
+
+        tests, base = module
+        name = _PARAMS_RE.sub("", "::".join(parts[1:]))
+        if name in tests:
+            return _sha1(self.context, dependencies, base, tests[name])
+        # 함수를 찾지 못한 경우(동적으로 생성된 테스트 등) 파일 전체 기준
+        return _sha1(self.context, dependencies, self._content(path) or "")
+
+    def _content(self, path: Path) -> Optional[str]:
+        if path not in self._contents:
+            try:
+                self._contents[path] = hashlib.sha1(path.read_bytes()).hexdigest()
+            except OSError:
+                self._contents[path] = None
+        return self._contents[path]
+
+    def _tree(self, path: Path) -> Optional[ast.Module]:
+        if path not in self._trees:
+            try:
+                self._trees[path] = ast.parse(path.read_bytes(), filename=str(path))
+            except (OSError, SyntaxError, ValueError):
+                self._trees[path] = None
+        return self._trees[path]
+
+    def _module(self, path: Path) -> Optional[Tuple[Dict[str, str], str]]:
+        """테스트 파일을 테스트 함수별 AST와 나머지 코드로 나눔"""
+        if path in self._modules:
+            return self._modules[path]
+        tree = self._tree(path)
+        if tree is None:
+            self._modules[path] = None
+            return None
+
+        tests: Dict[str, str] = {}
+        rest: List[str] = []
+        for node in tree.body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and _matches(node.name, self.function_patterns):
+                tests[node.name] = _sha1(ast.dump(node))
+            elif isinstance(node, ast.ClassDef) and _matches(node.name, self.class_patterns):
+                # 클래스의 테스트 외 코드(setup 메서드, 클래스 속성 등)는 클래스의 모든 테스트 지문에 포함
+                methods = []
+                class_rest = [ast.dump(decorator) for decorator in node.decorator_list]
+                class_rest.extend(ast.dump(base) for base in node.bases)
+                for child in node.body:
+                    if isinstance(child, (ast.FunctionDef, ast.AsyncFunctionDef)) and _matches(child.name, self.function_patterns):
+                        methods.append(child)
+                    else:
+                        class_rest.append(ast.dump(child))
+                class_base = _sha1(*class_rest)
+                for method in methods:
+                    tests[f"{node.name}::{method.name}"] = _sha1(class_base, ast.dump(method))
+            else:
+                rest.append(ast.dump(node))
+        self._modules[path] = (tests, _sha1(*rest))
+        return self._modules[path]
+
+    def _local_imports(self, path: Path) -> List[Path]:
+        """파일이 import하는 모듈 중 rootdir 안에 있는 파일 (함수 안의 지연 import 포함)"""
+        if path in self._imports:
+            return self._imports[path]
+        found: List[Path] = []
+        tree = self._tree(path) if path.suffix == ".py" else None
+        if tree is not None:
+            search_dirs = [path.parent, self.rootdir]
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    for alias in node.names:
+                        found.extend(self._resolve(search_dirs, alias.name.split(".")))
+                elif isinstance(node, ast.ImportFrom):
+                    module = node.module.split(".") if node.module else []
+                    dirs = search_dirs
+                    if node.level:
+                        # 상대 import: 현재 파일 기준 패키지
+                        base = path.parent
+                        for _ in range(node.level - 1):
+                            base = base.parent
+                        dirs = [base]
+                    found.extend(self._resolve(dirs, module))
+                    for alias in node.names:
+                        # from page_objects import login_page 형태 (모듈 import)
+                        found.extend(self._resolve(dirs, module + [alias.name], packages=False))
+        self._imports[path] = found
+        return found
+
+    def _resolve(self, search_dirs: List[Path], names: List[str], packages: bool = True) -> List[Path]:
+        """모듈 이름 -> rootdir 안의 파일 (상위 패키지의 __init__.py 포함)"""
+        if not names:
+            return []
+        for directory in search_dirs:
+            candidates = [directory.joinpath(*names).with_suffix(".py"), directory.joinpath(*names, "__init__.py")]
+            for candidate in candidates:
+                if candidate.is_file() and self.rootdir in candidate.resolve().parents:
+                    resolved = [candidate.resolve()]
+                    if packages:
+                        for depth in range(1, len(names)):
+                            init = directory.joinpath(*names[:depth], "__init__.py")
+                            if init.is_file():
+                                resolved.append(init.resolve())
+                    return resolved
+        return []
+
+    def _conftests(self, path: Path) -> List[Path]:
+        """테스트 파일 디렉토리부터 rootdir까지의 conftest.py"""
+        found = []
+        directory = path.parent
+        while True:
+            conftest = directory / "conftest.py"
+            if conftest.is_file():
+                found.append(conftest)
+            if directory == self.rootdir or directory.parent == directory:
+                break
+            directory = directory.parent
+        return found
+
+    def _dependency_hash(self, path: Path) -> Optional[str]:
+        """테스트 파일이 의존하는 로컬 파일 전체의 해시 (테스트 파일 자신은 AST 단위로 따로 비교)"""
+        if path in self._dependencies:
+            return self._dependencies[path]
+        if self._content(path) is None:
+            self._dependencies[path] = None
+            return None
+
+        seen = {path}
+        pending = self._local_imports(path) + self._conftests(path)
+        while pending:
+            dependency = pending.pop()
+            if dependency in seen:
+                continue
+            seen.add(dependency)
+            pending.extend(self._local_imports(dependency))
+        seen.discard(path)
+
+        entries = []
+        for dependency in sorted(seen):
+            try:
+                name = dependency.relative_to(self.rootdir).as_posix()
+            except ValueError:
+                name = dependency.as_posix()
+            entries.append(f"{name}={self._content(dependency)}")
+        self._dependencies[path] = _sha1(*entries)
+        return self._dependencies[path]
+
+
+class IncrementalState:
+    """
+    node ID -> {"fingerprint": 지문, "outcome": 마지막 결과, "seen": 마지막 실행(또는 캐시 통과) 시각}
+    """
+
+    def __init__(self, path: str = STATE_FILE):
+        self.path = path
+        self.tests: Dict[str, Dict[str, Any]] = self._read()
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            return data.get("tests", {}) if isinstance(data, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def is_cached(self, nodeid: str, fingerprint: str) -> bool:
+        """지난 실행에서 같은 지문으로 통과했는지 확인"""
+        entry = self.tests.get(nodeid)
+        return bool(entry) and entry.get("fingerprint") == fingerprint and entry.get("outcome") == "passed"
+
+    def save(self, results: Dict[str, Dict[str, Any]], cached: Iterable[str] = ()) -> int:
+        """
+        이번 실행 결과 반영 후 저장 (원자적 교체)
+
+        Args:
+            results: node ID -> {"fingerprint": 지문, "outcome": 결과}
+            cached: 캐시된 통과로 보고한 node ID (기록 유지 시각만 갱신)
+
+        Returns:
+            갱신한 테스트 수
+        """
+        cached = list(cached)
+        if not results and not cached:
+            return 0
+        now = round(time.time())
+        # 다른 실행이 그사이 기록한 내용을 덮어쓰지 않도록 저장 직전에 다시 읽어 병합
+        tests = self._read()
+        for nodeid, result in results.items():
+            tests[nodeid] = {"fingerprint": result["fingerprint"], "outcome": result["outcome"], "seen": now}
+        for nodeid in cached:
+            if nodeid in tests:
+                tests[nodeid]["seen"] = now
+        expired = now - STATE_TTL_DAYS * 86400
+        tests = {nodeid: entry for nodeid, entry in tests.items() if entry.get("seen", now) >= expired}
+
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": 1, "tests": tests}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            # 기록 실패는 무시 (다음 실행은 이전 기록 기준으로 선택)
+            print(f"[IncrementalSelection] 선택 실행 기록 저장 실패: {e}")
+            return 0
+        self.tests = tests
+        return len(results)
+
+
+class IncrementalSelection:
+    """
+    선택 실행 플러그인 (xdist 워커와 컨트롤러 모두 등록)
+
+    - 워커(또는 단일 프로세스): 수집 후 캐시된 테스트를 실행 목록에서 제외
+      (모든 워커가 같은 기록을 읽으므로 수집 결과가 워커 간에 같음)
+    - 컨트롤러(또는 단일 프로세스): 캐시된 통과 리포트 보고, 실행 결과와 지문 기록
+    """
+
+    def __init__(self, config, state: IncrementalState, context: str = "", publish_stats=None):
+        self.config = config
+        self.state = state
+        self.publish_stats = publish_stats
+        self.is_controller = not hasattr(config, "workerinput")
+        self.fingerprinter = Fingerprinter(
+            config.rootpath, context,
+            function_patterns=config.getini("python_functions"),
+            class_patterns=config.getini("python_classes"),
+        )
+        # 캐시된 테스트 [(node ID, location)]
+        self._cached: List[Tuple[str, Tuple[str, Optional[int], str]]] = []
+        self._reported = False
+        self._session = None
+        # node ID -> 이번 실행 결과
+        self._outcomes: Dict[str, str] = {}
+
+    def pytest_sessionstart(self, session):
+        self._session = session
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, session, config, items):
+        # -k/-m 등으로 선택이 끝난 뒤 적용, --collect-only는 전체 목록을 보여줌
+        if config.option.collectonly:
+            return
+        selected = []
+        for item in items:
+            fingerprint = self.fingerprinter.fingerprint(item.nodeid)
+            if fingerprint is not None and self.state.is_cached(item.nodeid, fingerprint):
+                self._cached.append((item.nodeid, item.location))
+            else:
+                selected.append(item)
+        items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        # 단일 프로세스: 실행 전에 캐시된 통과를 먼저 보고 (xdist 컨트롤러는 워커 종료 시 보고)
+        if self.is_controller and not self.config.pluginmanager.has_plugin("dsession"):
+            self._report_cached(self._cached)
+        return None
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        cached = getattr(node, "workeroutput", {}).get(CACHED_KEY)
+        if cached is not None:
+            self._report_cached([(nodeid, tuple(location)) for nodeid, location in cached])
+
+    def _report_cached(self, cached) -> None:
+        """캐시된 테스트를 통과 리포트로 보고 (모든 워커가 같은 목록을 보내므로 한 번만)"""
+        if self._reported:
+            return
+        self._reported = True
+        self._cached = list(cached)
+        # 진행률(%)이 캐시된 테스트까지 포함한 전체 기준이 되도록 수집 수에 더함
+        if self._session is not None:
+            self._session.testscollected += len(self._cached)
+        hook = self.config.hook
+        for nodeid, location in self._cached:
+            hook.pytest_runtest_logstart(nodeid=nodeid, location=location)
+            for when in ("setup", "call", "teardown"):
+                hook.pytest_runtest_logreport(report=pytest.TestReport(
+                    nodeid, location, {}, "passed", None, when,
+                    user_properties=[(CACHED_PROPERTY, "cached")],
+                ))
+            hook.pytest_runtest_logfinish(nodeid=nodeid, location=location)
+
+    def pytest_report_teststatus(self, report, config):
+        # 통과 수에 포함하되 -v 출력에서 실제 실행과 구분
+        if report.when == "call" and is_cached_report(report):
+            return "passed", "c", ("CACHED", {"green": True})
+        return None
+
+    def pytest_runtest_logreport(self, report):
+        if not self.is_controller or is_cached_report(report):
+            return
+        if report.failed:
+            self._outcomes[report.nodeid] = "failed"
+        elif report.skipped and self._outcomes.get(report.nodeid) != "failed":
+            self._outcomes[report.nodeid] = "skipped"
+        else:
+            self._outcomes.setdefault(report.nodeid, "passed")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        if not self.is_controller:
+            self.config.workeroutput[CACHED_KEY] = [[nodeid, list(location)] for nodeid, location in self._cached]
+            return
+        results = {}
+        for nodeid, outcome in self._outcomes.items():
+            fingerprint = self.fingerprinter.fingerprint(nodeid)
+            if fingerprint is not None:
+                results[nodeid] = {"fingerprint": fingerprint, "outcome": outcome}
+        self.state.save(results, [nodeid for nodeid, _location in self._cached])
+        if self.publish_stats is not None:
+            self.publish_stats("incremental", {
+                "executed": len(self._outcomes),
+                "cached": len(self._cached),
+                "entries": len(self.state.tests),
+            })
@@ -0,0 +1,394 @@
+"""
+브라우저/프로세스 메모리 측정과 브라우저 재실행 정책 (--memory-telemetry, conftest.py에서 사용)
+
+테스트마다 setup 직전과 teardown 직후에 측정해 증가량을 그 테스트에 귀속:
+- 브라우저 프로세스 트리 RSS: 테스트 프로세스의 하위 프로세스 중 브라우저 프로세스와 그 하위 프로세스
+  (Playwright 드라이버(node), chromedriver/geckodriver 등 드라이버와 그 밖의 하위 프로세스는 제외)
+- Python RSS, tracemalloc 추적 메모리 (TEST_MEMORY_TRACEMALLOC > 0인 경우)
+- JS 힙/DOM 노드/이벤트 리스너: 페이지를 닫기 전 CDP Performance.getMetrics (Chromium 계열만)
+
+세션 브라우저(browser_playwright)는 브라우저 RSS 또는 테스트 수가 기준을 넘으면 테스트 사이에 다시 실행 (RecyclableBrowser).
+측정값은 teardown 리포트 user_properties("memory")로 컨트롤러에 전달되어 증가량 상위 테스트를 리포트에 기록 (MemoryReport).
+
+psutil이 없으면 Linux의 /proc로 Python RSS만 측정 (브라우저 RSS와 RSS 기준 재실행은 사용 안 함)
+"""
+
+import os
+import json
+import time
+import heapq
+import warnings
+import tracemalloc
+import pytest
+from typing import Optional, Dict, Any, List, Tuple, Callable
+
+MB = 1024 * 1024
+
+# 리포트 user_properties 항목 이름
+SAMPLE_PROPERTY = "memory"
+RECYCLE_PROPERTY = "browser_recycled"
+
+# xdist 워커 -> 컨트롤러로 tracemalloc 상위 할당 위치 전달 키
+WORKEROUTPUT_KEY = "testarchitect_memory_allocations"
+
+# 브라우저 프로세스 이름 (소문자 부분 일치, 이름에 "driver"가 들어간 chromedriver 등은 제외)
+BROWSER_PROCESS_NAMES = ("chrome", "chromium", "headless_shell", "msedge", "firefox", "webkit", "minibrowser")
+
+# CDP Performance.getMetrics 중 기록할 항목 (이름 -> 결과 키, 바이트 단위 여부)
+_JS_METRICS = {
+    "JSHeapUsedSize": ("js_heap_used_mb", True),
+    "JSHeapTotalSize": ("js_heap_total_mb", True),
+    "Nodes": ("dom_nodes", False),
+    "JSEventListeners": ("js_listeners", False),
+    "Documents": ("documents", False),
+}
+
+
+def _psutil():
+    try:
+        import psutil
+        return psutil
+    except ImportError:
+        return None
+
+
+def _proc_rss(pid: str = "self") -> Optional[int]:
+    """psutil이 없을 때 Linux /proc에서 RSS(바이트) 읽기"""
+    try:
+        with open(f"/proc/{pid}/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+def _is_browser_process(process) -> bool:
+    name = process.name().lower()
+    return "driver" not in name and any(part in name for part in BROWSER_PROCESS_NAMES)
+
+
+def process_memory() -> Tuple[Optional[int], Optional[int], int]:
+    """(Python RSS, 브라우저 프로세스 트리 RSS 합계, 브라우저 프로세스 수), 측정할 수 없는 값은 None"""
+    psutil = _psutil()
+    if psutil is None:
+        return _proc_rss(), None, 0
+    current = psutil.Process()
+    browser_rss = 0
+    counted = set()
+    for child in current.children(recursive=True):
+        try:
+            if child.pid in counted or not _is_browser_process(child):
+                continue
+            # 브라우저 프로세스와 그 하위 프로세스 (렌더러, GPU, 네트워크 프로세스 등)
+            tree = [child] + child.children(recursive=True)
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            # 측정 중에 종료된 프로세스 등
+            continue
+        for process in tree:
+            if process.pid in counted:
+                continue
+            try:
+                browser_rss += process.memory_info().rss
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            counted.add(process.pid)
+    return current.memory_info().rss, browser_rss, len(counted)
+
+
+def _parse_js_metrics(metrics: List[Dict[str, Any]]) -> Dict[str, Any]:
+    result = {}
+    for metric in metrics or ():
+        entry = _JS_METRICS.get(metric.get("name"))
+        if entry is not None:
+            key, in_bytes = entry
+            result[key] = round(metric["value"] / MB, 2) if in_bytes else int(metric["value"])
+    return result
+
+
+def js_metrics_playwright(page) -> Optional[Dict[str, Any]]:
+    """Playwright 페이지의 JS 힙 지표 (Chromium 계열이 아니면 None)"""
+    session = page.context.new_cdp_session(page)
+    try:
+        session.send("Performance.enable")
+        return _parse_js_metrics(session.send("Performance.getMetrics").get("metrics"))
+    finally:
+        session.detach()
+
+
+def js_metrics_selenium(driver) -> Optional[Dict[str, Any]]:
+    """Selenium 드라이버의 JS 힙 지표 (Chrome/Edge만, 그 외 None)"""
+    if not hasattr(driver, "execute_cdp_cmd"):
+        return None
+    driver.execute_cdp_cmd("Performance.enable", {})
+    return _parse_js_metrics(driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics"))
+
+
+def _mb(value: Optional[int]) -> Optional[float]:
+    return round(value / MB, 1) if value is not None else None
+
+
+class RecyclableBrowser:
+    """
+    다시 실행할 수 있는 세션 브라우저 (Playwright Browser 대리 객체)
+
+    recycle() 시 등록된 콜백(컨텍스트 풀 정리 등)을 먼저 호출한 뒤 브라우저를 닫고 새로 실행
+    """
+
+    def __init__(self, launch: Callable[[], Any], close: Callable[[Any], None]):
+        self._launch = launch
+        self._close = close
+        self._browser = launch()
+        self._listeners: List[Callable[[], None]] = []
+        # 현재 브라우저로 실행한 테스트 수
+        self.tests = 0
+        self.launches = 1
+
+    def on_recycle(self, callback: Callable[[], None]) -> None:
+        self._listeners.append(callback)
+
+    def recycle(self) -> None:
+        for callback in self._listeners:
+            callback()
+        try:
+            self._close(self._browser)
+        except Exception as e:
+            # 이미 끊긴(크래시한) 브라우저 등
+            print(f"[MemoryTelemetry] 브라우저 종료 실패: {e}")
+        self._browser = self._launch()
+        self.tests = 0
+        self.launches += 1
+
+    def __getattr__(self, name: str):
+        return getattr(self._browser, name)
+
+
+class MemoryTelemetry:
+    """
+    테스트별 메모리 측정 플러그인 (모든 프로세스에서 등록, xdist 워커는 각자 측정)
+
+    Args:
+        max_browser_mb: 브라우저 프로세스 트리 RSS가 이 값(MB)을 넘으면 다음 테스트 전에 브라우저 재실행 (0이면 사용 안 함)
+        max_tests: 브라우저 하나로 실행할 최대 테스트 수 (0이면 제한 없음)
+        tracemalloc_top: 세션 종료 시 보고할 Python 할당 증가 상위 위치 수 (0이면 tracemalloc 사용 안 함)
+        publish_stats: conftest._publish_stats
+    """
+
+    def __init__(self, max_browser_mb: float = 0, max_tests: int = 0, tracemalloc_top: int = 0,
+                 publish_stats: Optional[Callable] = None):
+        self.max_browser_mb = max_browser_mb
+        self.max_tests = max_tests
+        self.tracemalloc_top = tracemalloc_top
+        self.publish_stats = publish_stats
+        self.has_psutil = _psutil() is not None
+        if not self.has_psutil:
+            warnings.warn("psutil이 설치되지 않아 브라우저 프로세스 메모리는 측정하지 않습니다. 'pip install psutil' 실행하세요.")
+        # nodeid -> setup 직전 측정값
+        self._before: Dict[str, Tuple[Optional[int], Optional[int], int]] = {}
+        # nodeid -> 페이지를 닫기 전 JS 힙 지표
+        self._js: Dict[str, Dict[str, Any]] = {}
+        # JS 힙 지표를 읽을 수 없는 브라우저 (firefox, webkit 등)
+        self._js_unsupported = set()
+        self._baseline = None
+        self.allocations: List[Dict[str, Any]] = []
+        self.stats = {
+            "tests": 0,
+            "recycles_rss": 0,
+            "recycles_tests": 0,
+            "max_browser_rss_mb": 0.0,
+            "max_python_rss_mb": 0.0,
+            "max_js_heap_mb": 0.0,
+            "max_dom_nodes": 0,
+            "sample_ms": 0.0,
+            "max_sample_ms": 0.0,
+        }
+
+    @property
+    def recycles(self) -> bool:
+        """브라우저 재실행 정책 사용 여부"""
+        return self.max_tests > 0 or (self.max_browser_mb > 0 and self.has_psutil)
+
+    def _sample(self) -> Tuple[Optional[int], Optional[int], int]:
+        start = time.perf_counter()
+        sample = process_memory()
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats["sample_ms"] = round(self.stats["sample_ms"] + elapsed, 1)
+        self.stats["max_sample_ms"] = max(self.stats["max_sample_ms"], round(elapsed, 1))
+        return sample
+
+    # ------------------------------------------------------------------
+    # 브라우저 fixture에서 호출
+    # ------------------------------------------------------------------
+
+    def record_js(self, nodeid: str, browser: str, read: Callable[[], Optional[Dict[str, Any]]]) -> None:
+        """페이지를 닫기 전 JS 힙 지표 기록 (지원하지 않는 브라우저는 한 번 실패 후 건너뜀)"""
+        if browser in self._js_unsupported:
+            return
+        try:
+            metrics = read()
+        except Exception:
+            metrics = None
+        if not metrics:
+            self._js_unsupported.add(browser)
+            return
+        self._js[nodeid] = metrics
+
+    def recycle_reason(self, browser: RecyclableBrowser) -> Optional[str]:
+        """브라우저를 다시 실행해야 하면 이유("tests", "rss"), 아니면 None (테스트 하나가 끝날 때마다 호출)"""
+        browser.tests += 1
+        if self.max_tests > 0 and browser.tests >= self.max_tests:
+            return "tests"
+        if self.max_browser_mb > 0 and self.has_psutil:
+            _python_rss, browser_rss, _count = self._sample()
+            if browser_rss is not None and browser_rss / MB > self.max_browser_mb:
+                return "rss"
+        return None
+
+    def recycled(self, reason: str) -> None:
+        self.stats[f"recycles_{reason}"] += 1
+
+    # ------------------------------------------------------------------
+    # pytest 훅
+    # ------------------------------------------------------------------
+
+    def pytest_sessionstart(self, session):
+        config = session.config
+        # 병렬 실행의 컨트롤러는 테스트를 실행하지 않으므로 추적하지 않음
+        runs_tests = hasattr(config, "workerinput") or getattr(config.option, "dist", "no") == "no"
+        if self.tracemalloc_top > 0 and runs_tests:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._baseline = tracemalloc.take_snapshot()
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        sample = self._sample()
+        traced = tracemalloc.get_traced_memory()[0] if self._baseline is not None else None
+        self._before[item.nodeid] = sample + (traced,)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        yield
+        # fixture 정리(페이지/컨텍스트 종료, 브라우저 재실행) 후 측정: 테스트가 남긴 메모리
+        before = self._before.pop(item.nodeid, None)
+        if before is None:
+            return
+        python_rss, browser_rss, count = self._sample()
+        record: Dict[str, Any] = {"python_rss_mb": _mb(python_rss), "browser_processes": count}
+        if python_rss is not None and before[0] is not None:
+            record["python_rss_delta_mb"] = _mb(python_rss - before[0])
+        if browser_rss is not None:
+            record["browser_rss_mb"] = _mb(browser_rss)
+            if before[1] is not None:
+                record["browser_rss_delta_mb"] = _mb(browser_rss - before[1])
+        if before[3] is not None:
+            record["traced_delta_mb"] = _mb(tracemalloc.get_traced_memory()[0] - before[3])
+        record.update(self._js.pop(item.nodeid, {}))
+        if any(name == RECYCLE_PROPERTY for name, _value in item.user_properties):
+            # 브라우저를 다시 실행한 테스트: 브라우저 증가량은 의미 없음
+            record.pop("browser_rss_delta_mb", None)
+
+        self.stats["tests"] += 1
+        for key, stat in (("browser_rss_mb", "max_browser_rss_mb"), ("python_rss_mb", "max_python_rss_mb"),
+                          ("js_heap_used_mb", "max_js_heap_mb"), ("dom_nodes", "max_dom_nodes")):
+            if record.get(key) is not None:
+                self.stats[stat] = max(self.stats[stat], record[key])
+        item.user_properties.append((SAMPLE_PROPERTY, json.dumps(record, separators=(",", ":"))))
+
+    def top_allocations(self) -> List[Dict[str, Any]]:
+        """세션 시작 대비 증가량이 큰 Python 할당 위치"""
+        if self._baseline is None:
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap*>"),
+        ))
+        allocations = []
+        for stat in snapshot.compare_to(self._baseline, "lineno")[:self.tracemalloc_top]:
+            frame = stat.traceback[0]
+            allocations.append({"location": f"{frame.filename}:{frame.lineno}",
+                                "size_diff_kb": round(stat.size_diff / 1024, 1), "count_diff": stat.count_diff})
+        return allocations
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session):
+        # conftest가 실행 통계를 워커 출력에 담기 전에 등록
+        self.allocations = self.top_allocations()
+        if self.publish_stats is not None:
+            self.publish_stats("memory", self.stats)
+        if hasattr(session.config, "workeroutput") and self.allocations:
+            session.config.workeroutput[WORKEROUTPUT_KEY] = self.allocations
+
+
+class MemoryReport:
+    """
+    메모리 증가량 상위 테스트 집계 플러그인 (xdist 컨트롤러에서만 등록, 워커 리포트도 컨트롤러로 전달됨)
+
+    local: 같은 프로세스의 MemoryTelemetry (xdist 없이 실행한 경우 tracemalloc 결과를 직접 읽음)
+    """
+
+    def __init__(self, top: int = 10, local: Optional[MemoryTelemetry] = None):
+        self.top = top
+        self.local = local
+        self._browser: List[Tuple[float, str, Dict[str, Any]]] = []
+        self._python: List[Tuple[float, str, Dict[str, Any]]] = []
+        self.recycled: List[Dict[str, str]] = []
+        self.allocations: List[Dict[str, Any]] = []
+
+    def _push(self, heap: list, value: Optional[float], nodeid: str, record: Dict[str, Any]) -> None:
+        if value is None or value <= 0:
+            return
+        entry = (value, nodeid, record)
+        if len(heap) < self.top:
+            heapq.heappush(heap, entry)
+        elif value > heap[0][0]:
+            heapq.heapreplace(heap, entry)
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, value in getattr(report, "user_properties", ()):
+            if name == SAMPLE_PROPERTY:
+                record = json.loads(value)
+                self._push(self._browser, record.get("browser_rss_delta_mb"), report.nodeid, record)
+                self._push(self._python, record.get("python_rss_delta_mb"), report.nodeid, record)
+            elif name == RECYCLE_PROPERTY:
+                self.recycled.append({"nodeid": report.nodeid, "reason": value})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        self.allocations.extend(getattr(node, "workeroutput", {}).get(WORKEROUTPUT_KEY, ()))
+
+    def _top(self, heap: list) -> List[Dict[str, Any]]:
+        return [dict(record, nodeid=nodeid) for _value, nodeid, record in sorted(heap, reverse=True)]
+
+    def summary(self) -> Dict[str, Any]:
+        # 워커별 결과를 위치별로 합산
+        merged: Dict[str, Dict[str, Any]] = {}
+        for allocation in self.allocations + (self.local.allocations if self.local is not None else []):
+            entry = merged.setdefault(allocation["location"], dict(allocation, size_diff_kb=0.0, count_diff=0))
+            entry["size_diff_kb"] = round(entry["size_diff_kb"] + allocation["size_diff_kb"], 1)
+            entry["count_diff"] += allocation["count_diff"]
+        allocations = list(merged.values())
+        return {
+            "top_browser_growth": self._top(self._browser),
+            "top_python_growth": self._top(self._python),
+            "browser_recycles": self.recycled,
+            "top_allocations": sorted(allocations, key=lambda item: -item["size_diff_kb"])[:self.top],
+        }
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_json_modifyreport(self, json_report):
+        json_report["memory_telemetry"] = self.summary()
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.summary()
+        if not (summary["top_browser_growth"] or summary["top_python_growth"] or summary["top_allocations"]):
+            return
+        terminalreporter.write_sep("-", "메모리 증가 상위 테스트")
+        for title, key, field in (("브라우저", "top_browser_growth", "browser_rss_delta_mb"),
+                                  ("Python", "top_python_growth", "python_rss_delta_mb")):
+            for record in summary[key]:
+                terminalreporter.write_line(f"{title} +{record[field]}MB: {record['nodeid']}")
+        for allocation in summary["top_allocations"]:
+            terminalreporter.write_line(f"Python 할당 +{allocation['size_diff_kb']}KB: {allocation['location']}")
+        if summary["browser_recycles"]:
+            terminalreporter.write_line(f"브라우저 재실행: {len(summary['browser_recycles'])}회")
@@ -0,0 +1,185 @@
+"""
+NDJSON 스트리밍 리포터
+테스트 단계(setup/call/teardown)가 끝날 때마다 한 줄짜리 JSON 이벤트를 파일(또는 파이프)에 기록
+(실행이 끝날 때까지 기다리지 않고 tail로 진행 상황과 결과를 읽을 수 있음)
+
+이벤트 종류:
+    {"event": "session_start", "ts": ..., "pid": ...}
+    {"event": "collected", "count": 12}
+    {"event": "phase", "nodeid": ..., "when": "call", "outcome": "failed",
+     "duration": 0.52, "longrepr": "...", "locator_failure": {...}, "artifacts": {...}}
+    {"event": "test", "nodeid": ..., "outcome": "failed", "duration": 0.61,
+     "call": {"outcome": "failed", "longrepr": "..."}, ...}                 (teardown 후 테스트 단위 결과)
+    {"event": "collect_error", "nodeid": ..., "longrepr": "..."}
+    {"event": "session_finish", "exitstatus": 1, "duration": 12.3, "summary": {...}, "stats": {...}}
+"""
+
+import json
+import os
+import time
+import pytest
+from typing import Optional, Dict, Any, Callable
+
+# 이벤트 하나에 담는 traceback 최대 길이 (예외 정보가 있는 뒤쪽을 남김)
+MAX_LONGREPR_CHARS = 8 * 1024
+
+# 리포트 user_properties 중 산출물 경로 항목의 접두사 (예: ("artifact:screenshot", "/path/a.png"))
+ARTIFACT_PREFIX = "artifact:"
+
+# locator_failure 중 이벤트에 싣지 않는 항목 (힐링 요청용 전체 DOM 등)
+_LOCATOR_FAILURE_EXCLUDE = ("current_dom",)
+
+
+def _open_stream(target: str):
+    """파일 경로 또는 'fd:N'(상위 프로세스가 넘겨준 파이프)을 줄 단위 버퍼링으로 열기"""
+    if target.startswith("fd:"):
+        return os.fdopen(int(target[3:]), "w", encoding="utf-8", buffering=1, closefd=False)
+    directory = os.path.dirname(os.path.abspath(target))
+    os.makedirs(directory, exist_ok=True)
+    return open(target, "w", encoding="utf-8", buffering=1)
+
+
+class NdjsonReporter:
+    """
+    NDJSON 스트리밍 리포터 플러그인 (xdist 컨트롤러에서만 등록)
+
+    - 단계별 이벤트는 pytest_runtest_logreport 시점에 바로 기록 (메모리에 누적하지 않음)
+    - 테스트 단위 결과는 teardown 리포트를 받은 뒤 "test" 이벤트로 기록
+      (진행 중인 테스트의 상태만 보관)
+    """
+
+    def __init__(self, config, target: str, stats_provider: Optional[Callable[[], Dict[str, Any]]] = None):
+        self.config = config
+        self.target = target
+        self.stats_provider = stats_provider
+        self._stream = None
+        self._start = time.time()
+        # nodeid -> {"outcome": ..., "duration": ...} (teardown 전까지)
+        self._running: Dict[str, Dict[str, Any]] = {}
+        self._summary: Dict[str, int] = {}
+        self._collect_errors = 0
+
+    def _emit(self, event: Dict[str, Any]) -> None:
+        if self._stream is None:
+            return
+        try:
+            self._stream.write(json.dumps(event, ensure_ascii=False, default=str, separators=(",", ":")) + "\n")
+        except (OSError, ValueError):
+            # 읽는 쪽이 파이프를 닫은 경우 등: 리포트만 중단하고 테스트는 계속
+            self._stream = None
+
+    # ------------------------------------------------------------------
+    # pytest 훅
+    # ------------------------------------------------------------------
+
+    def pytest_sessionstart(self, session):
+        self._stream = _open_stream(self.target)
+        self._emit({"event": "session_start", "ts": round(self._start, 3), "pid": os.getpid()})
+
+    def pytest_collection_finish(self, session):
+        self._emit({"event": "collected", "count": len(session.items)})
+
+    def pytest_collectreport(self, report):
+        if report.failed:
+            self._collect_errors += 1
+            self._emit({
+                "event": "collect_error",
+                "nodeid": report.nodeid,
+                "longrepr": report.longreprtext[-MAX_LONGREPR_CHARS:],
+            })
+
+    def pytest_runtest_logreport(self, report):
+        status = self.config.hook.pytest_report_teststatus(report=report, config=self.config)[0]
+        event: Dict[str, Any] = {
+            "event": "phase",
+            "nodeid": report.nodeid,
+            "when": report.when,
+            "outcome": report.outcome,
+            "duration": round(report.duration, 4),
+            "ts": round(time.time(), 3),
+        }
+        if status and status != report.outcome:
+            # pytest가 분류한 결과 (xfailed, xpassed, error, rerun 등)
+            event["status"] = status
+        # xdist 컨트롤러에서는 리포트에 워커 노드가 붙어 있음
+        gateway = getattr(getattr(report, "node", None), "gateway", None)
+        if gateway is not None:
+            event["worker"] = gateway.id
+        if report.failed or status in ("xfailed", "xpassed"):
+            longrepr = report.longreprtext
+            if longrepr:
+                event["longrepr"] = longrepr[-MAX_LONGREPR_CHARS:]
+        locator_failure = getattr(report, "locator_failure", None)
+        if locator_failure:
+            event["locator_failure"] = {
+                key: value for key, value in locator_failure.items()
+                if key not in _LOCATOR_FAILURE_EXCLUDE
+            }
+        artifacts = {
+            name[len(ARTIFACT_PREFIX):]: value
+            for name, value in report.user_properties
+            if isinstance(name, str) and name.startswith(ARTIFACT_PREFIX)
+        }
+        if artifacts:
+            event["artifacts"] = artifacts
+        self._emit(event)
+        self._track(report, status, event)
+
+    def _track(self, report, status: str, event: Dict[str, Any]) -> None:
+        """단계 결과를 테스트 단위 결과로 합치고 teardown이 끝나면 "test" 이벤트 기록"""
+        if status == "rerun":
+            # pytest-rerunfailures: 이번 시도는 버리고 다음 시도 결과를 사용
+            self._running.pop(report.nodeid, None)
+            self._emit({"event": "test", "nodeid": report.nodeid, "outcome": "rerun",
+                        "duration": event["duration"]})
+            return
+
+        state = self._running.setdefault(report.nodeid, {"outcome": "passed", "duration": 0.0})
+        state["duration"] += report.duration
+        if report.failed and report.when != "call":
+            state["outcome"] = "error"
+        elif state["outcome"] != "error":
+            if report.when == "call":
+                state["outcome"] = status or report.outcome
+            elif report.skipped:
+                state["outcome"] = status or "skipped"
+        if "longrepr" in event:
+            # 실패한 단계의 traceback은 테스트 단위 결과에도 포함 (pytest-json-report와 같은 구조)
+            state[report.when] = {"outcome": report.outcome, "longrepr": event["longrepr"]}
+        for key in ("locator_failure", "artifacts"):
+            if key in event:
+                state.setdefault(key, {}).update(event[key])
+
+        if report.when == "teardown":
+            state = self._running.pop(report.nodeid)
+            self._summary[state["outcome"]] = self._summary.get(state["outcome"], 0) + 1
+            state["duration"] = round(state["duration"], 4)
+            self._emit({"event": "test", "nodeid": report.nodeid, **state})
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        # conftest.py의 pytest_sessionfinish(통계 등록)가 끝난 뒤 실행
+        summary = dict(self._summary)
+        summary["total"] = sum(self._summary.values())
+        summary["collected"] = getattr(session, "testscollected", 0)
+        if self._collect_errors:
+            summary["collect_errors"] = self._collect_errors
+        event = {
+            "event": "session_finish",
+            "exitstatus": int(exitstatus),
+            "duration": round(time.time() - self._start, 3),
+            "summary": summary,
+        }
+        if self.stats_provider is not None:
+            stats = self.stats_provider()
+            if stats:
+                event["stats"] = stats
+        self._emit(event)
+
+    def pytest_unconfigure(self, config):
+        if self._stream is not None:
+            try:
+                self._stream.close()
+            except OSError:
+                pass
+            self._stream = None
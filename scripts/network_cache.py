@@ -0,0 +1,264 @@
+"""
+Playwright 네트워크 기록/재생 캐시 (context.route 기반)
+첫 실행에서 응답을 로컬 저장소에 기록하고, 이후 실행에서는 실제 서버 대신 기록된 응답으로 처리
+
+- 모드: live(캐시 사용 안 함), record(항상 실제 서버에서 받아 기록), replay(기록된 응답만 사용, 없으면 요청 차단),
+  auto(기록이 있으면 재생, 없으면 받아서 기록)
+- 저장소: 응답 본문은 SHA-256으로 주소를 매겨 한 번만 저장 (blobs/), 요청 키별 응답 정보는 entries/에 저장
+  (같은 정적 파일을 여러 테스트/페이지가 받아도 본문은 하나, xdist 워커가 동시에 기록해도 파일 단위로 원자적 교체)
+- 요청 키: 메서드 + 정규화한 URL(쿼리 파라미터 정렬, 캐시 무효화용 파라미터 제외) + 요청 본문 해시
+"""
+
+import os
+import json
+import time
+import fnmatch
+import hashlib
+import tempfile
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+MODES = ("live", "record", "replay", "auto")
+
+# 기록 저장소 (실행 간 공유)
+CACHE_DIR = os.getenv(
+    "TEST_NETWORK_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "network-cache")
+)
+
+
+def _env_list(name: str, default: str = "") -> List[str]:
+    return [value.strip() for value in os.getenv(name, default).split(",") if value.strip()]
+
+
+# 기록/재생할 URL 패턴 (glob, 비어 있으면 모든 http(s) 요청)
+DEFAULT_INCLUDE = _env_list("TEST_NETWORK_CACHE_INCLUDE")
+# 항상 실제 서버로 보낼 URL 패턴 (glob)
+DEFAULT_EXCLUDE = _env_list("TEST_NETWORK_CACHE_EXCLUDE")
+# 요청 키에서 제외할 쿼리 파라미터 (캐시 무효화용 타임스탬프 등)
+DEFAULT_IGNORE_PARAMS = _env_list("TEST_NETWORK_CACHE_IGNORE_PARAMS", "_,t,ts,timestamp,cb,cachebust,nocache")
+
+# 재생 시 버리는 응답 헤더 (route.fetch()는 압축을 푼 본문을 주므로 길이/인코딩 헤더가 맞지 않음)
+_DROPPED_HEADERS = {"content-encoding", "content-length", "transfer-encoding", "connection", "keep-alive"}
+
+
+class MatchRules:
+    """
+    기록/재생 대상 판단과 요청 키 생성
+
+    Args:
+        include: 대상 URL glob 패턴 (비어 있으면 모든 http(s) 요청)
+        exclude: 제외할 URL glob 패턴 (include보다 우선)
+        ignore_params: 요청 키에서 제외할 쿼리 파라미터 이름
+        match_body: POST 등 요청 본문을 키에 포함할지 여부
+    """
+
+    def __init__(self, include: Iterable[str] = (), exclude: Iterable[str] = (),
+                 ignore_params: Iterable[str] = (), match_body: bool = True):
+        self.include = tuple(include)
+        self.exclude = tuple(exclude)
+        self.ignore_params = frozenset(ignore_params)
+        self.match_body = match_body
+
+    def applies(self, url: str) -> bool:
+        if not url.startswith(("http://", "https://")):
+            return False
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.exclude):
+            return False
+        return not self.include or any(fnmatch.fnmatch(url, pattern) for pattern in self.include)
+
+    def normalize_url(self, url: str) -> str:
+        """쿼리 파라미터 정렬/제외, fragment 제거"""
+        parts = urlsplit(url)
+        query = sorted((key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+                       if key not in self.ignore_params)
+        return urlunsplit((parts.scheme, parts.netloc.lower(), parts.path or "/", urlencode(query), ""))
+
+    def key(self, method: str, url: str, body: Optional[bytes] = None) -> str:
+        digest = hashlib.sha256()
+        digest.update(method.upper().encode())
+        digest.update(b" ")
+        digest.update(self.normalize_url(url).encode("utf-8"))
+        if self.match_body and body:
+            digest.update(b"\0")
+            digest.update(hashlib.sha256(body).digest())
+        return digest.hexdigest()
+
+
+class NetworkStore:
+    """
+    내용 주소 방식 응답 저장소
+
+    - blobs/<sha256 앞 2자리>/<sha256>: 응답 본문
+    - entries/<키 앞 2자리>/<키>.json: {"method", "url", "status", "headers", "body": 본문 sha256, "recorded"}
+    """
+
+    def __init__(self, root: str = CACHE_DIR):
+        self.root = root
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.root, "entries", key[:2], f"{key}.json")
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.root, "blobs", digest[:2], digest)
+
+    def get(self, key: str) -> Optional[Tuple[Dict[str, Any], bytes]]:
+        """기록된 응답 (응답 정보, 본문) 또는 None"""
+        try:
+            with open(self._entry_path(key), "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            with open(self._blob_path(entry["body"]), "rb") as f:
+                body = f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+        return entry, body
+
+    def put(self, key: str, method: str, url: str, status: int, headers: Dict[str, str], body: bytes) -> bool:
+        """응답 기록 (같은 본문은 한 번만 저장), 성공 여부 반환"""
+        digest = hashlib.sha256(body).hexdigest()
+        try:
+            blob_path = self._blob_path(digest)
+            if not os.path.exists(blob_path):
+                self._write(blob_path, body)
+            entry = {
+                "method": method,
+                "url": url,
+                "status": status,
+                "headers": headers,
+                "body": digest,
+                "recorded": round(time.time()),
+            }
+            self._write(self._entry_path(key), json.dumps(entry, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            # 기록 실패는 무시 (응답은 이미 실제 서버에서 받았으므로 테스트는 계속 진행)
+            print(f"[NetworkCache] 응답 기록 실패: {url} ({e})")
+            return False
+        return True
+
+    @staticmethod
+    def _write(path: str, data: bytes) -> None:
+        """원자적 교체 (xdist 워커가 같은 파일을 동시에 써도 깨진 파일을 읽지 않음)"""
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+
+class NetworkCache:
+    """
+    테스트 하나의 BrowserContext에 붙는 기록/재생 라우터
+
+    Playwright sync API는 스레드 안전하지 않으므로 해당 컨텍스트를 만든 스레드에서만 사용해야 함
+    """
+
+    # 재생 실패 요청 URL을 보관할 최대 개수 (테스트 종료 시 출력)
+    MAX_MISSED_URLS = 20
+
+    def __init__(self, store: NetworkStore, rules: MatchRules, mode: str = "auto"):
+        if mode not in MODES:
+            raise ValueError(f"지원하지 않는 네트워크 캐시 모드: {mode} ({', '.join(MODES)})")
+        self.store = store
+        self.rules = rules
+        self.mode = mode
+        self.missed: List[str] = []
+        self._context = None
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+            "recorded": 0,
+            "passthrough": 0,
+            "errors": 0,
+            "bytes_served": 0,
+        }
+
+    def attach(self, context) -> None:
+        """컨텍스트의 모든 요청을 라우팅 (live 모드는 아무것도 하지 않음)"""
+        if self.mode == "live":
+            return
+        self._context = context
+        context.route("**/*", self._handle)
+
+    def detach(self) -> None:
+        """라우팅 해제 (컨텍스트 풀에 반납하기 전에 호출)"""
+        if self._context is None:
+            return
+        try:
+            self._context.unroute("**/*", self._handle)
+        except Exception:
+            # 이미 닫힌 컨텍스트
+            pass
+        self._context = None
+        total = self.stats["hits"] + self.stats["misses"]
+        self.stats["hit_rate"] = round(self.stats["hits"] / total, 3) if total else 0.0
+
+    def _handle(self, route) -> None:
+        request = route.request
+        url = request.url
+        if not self.rules.applies(url):
+            self.stats["passthrough"] += 1
+            route.continue_()
+            return
+
+        key = self.rules.key(request.method, url, request.post_data_buffer)
+        if self.mode in ("replay", "auto"):
+            cached = self.store.get(key)
+            if cached is not None:
+                entry, body = cached
+                self.stats["hits"] += 1
+                self.stats["bytes_served"] += len(body)
+                route.fulfill(status=entry["status"], headers=entry["headers"], body=body)
+                return
+            self.stats["misses"] += 1
+            if self.mode == "replay":
+                # 기록에 없는 요청은 실제 서버로 보내지 않음 (재생 결과가 외부 상태에 영향받지 않도록)
+                if len(self.missed) < self.MAX_MISSED_URLS:
+                    self.missed.append(f"{request.method} {url}")
+                route.abort("internetdisconnected")
+                return
+
+        try:
+            # 리다이렉트는 따라가지 않고 3xx 응답 자체를 기록 (브라우저가 Location으로 다시 요청)
+            response = route.fetch(max_redirects=0)
+            body = response.body()
+        except Exception as e:
+            self.stats["errors"] += 1
+            print(f"[NetworkCache] 요청 실패: {url} ({e})")
+            route.abort()
+            return
+
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _DROPPED_HEADERS}
+        if self.store.put(key, request.method, url, response.status, headers, body):
+            self.stats["recorded"] += 1
+        route.fulfill(status=response.status, headers=headers, body=body)
+
+
+def resolve_mode(default_mode: str, marker) -> Tuple[str, MatchRules]:
+    """
+    테스트에 적용할 모드와 규칙 (network 마커가 있으면 명령줄/환경 변수 설정보다 우선)
+
+    @pytest.mark.network("replay", exclude=["*/api/session*"], ignore_params=["nonce"])
+    """
+    mode = default_mode
+    options: Dict[str, Any] = {}
+    if marker is not None:
+        if marker.args:
+            mode = marker.args[0]
+        options = dict(marker.kwargs)
+        mode = options.pop("mode", mode)
+    rules = MatchRules(
+        include=options.get("include", DEFAULT_INCLUDE),
+        exclude=list(DEFAULT_EXCLUDE) + list(options.get("exclude", ())),
+        ignore_params=list(DEFAULT_IGNORE_PARAMS) + list(options.get("ignore_params", ())),
+        match_body=options.get("match_body", True),
+    )
+    return mode, rules
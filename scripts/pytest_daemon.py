@@ -0,0 +1,299 @@
+"""
+상주 pytest 실행기
+pytest/플러그인/Playwright/Selenium import와 Playwright 브라우저를 프로세스에 유지한 채
+표준 입력으로 실행 요청을 받아 pytest.main()을 반복 호출
+
+프로토콜 (한 줄에 JSON 하나, UTF-8):
+    시작:  {"event": "ready", "pid": 1234}
+    요청:  {"id": 1, "cmd": "run", "args": [...], "cwd": "...", "env": {...}}
+           {"id": 2, "cmd": "ping"}
+           {"id": 3, "cmd": "shutdown"}
+    응답:  {"id": 1, "ok": true, "exit_code": 1, "stdout": "...", "stderr": "...",
+            "duration_ms": 812.4, "runs": 3, "recycle": false}
+
+- pytest 출력은 실행마다 임시 파일로 리다이렉트해 응답에 담고, 프로토콜은 원래 stdout을 복제한 fd로만 씀
+- 실행이 끝나면 작업 디렉토리에서 import한 모듈(conftest, 테스트, 헬퍼)을 제거하고
+  환경 변수/sys.path/작업 디렉토리를 복원
+- --max-runs 번 실행하거나 pytest 내부 예외가 발생하면 응답 후 종료 (호출 측에서 재시작)
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+# 실행 간에 유지하는 Playwright 브라우저 (conftest.py가 sys.modules["pytest_daemon"]으로 조회)
+resident_browsers = None
+
+
+class ResidentBrowsers:
+    """
+    실행 간에 유지하는 Playwright 브라우저 저장소
+
+    - (브라우저 타입, 실행 옵션)별로 브라우저 하나를 유지
+    - 연결이 끊긴(크래시한) 브라우저는 다음 요청 시 다시 실행
+    - 실행이 끝날 때마다 남은 BrowserContext를 모두 닫음
+    """
+
+    def __init__(self):
+        self._playwright = None
+        self._browsers: Dict[Tuple[str, str], Any] = {}
+        self.stats = {
+            "launched": 0,
+            "reused": 0,
+            "relaunched": 0,
+        }
+
+    def playwright(self):
+        """sync_playwright 인스턴스 (처음 요청 시 시작)"""
+        if self._playwright is None:
+            from playwright.sync_api import sync_playwright
+            self._playwright = sync_playwright().start()
+        return self._playwright
+
+    def browser(self, browser_type, launch_options: Dict[str, Any]):
+        """유지 중인 브라우저 반환 (없거나 끊겼으면 실행)"""
+        key = (browser_type.name, json.dumps(launch_options, sort_keys=True))
+        browser = self._browsers.get(key)
+        if browser is not None and browser.is_connected():
+            self.stats["reused"] += 1
+            return browser
+        if browser is not None:
+            self.stats["relaunched"] += 1
+        browser = browser_type.launch(**launch_options)
+        self.stats["launched"] += 1
+        self._browsers[key] = browser
+        return browser
+
+    def reset(self) -> None:
+        """실행 사이 정리: 테스트가 남긴 컨텍스트 종료, 끊긴 브라우저 제거"""
+        for key, browser in list(self._browsers.items()):
+            if not browser.is_connected():
+                del self._browsers[key]
+                continue
+            for context in list(browser.contexts):
+                try:
+                    context.close()
+                except Exception:
+                    pass
+
+    def close(self) -> None:
+        for browser in self._browsers.values():
+            try:
+                browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        if self._playwright is not None:
+            try:
+                self._playwright.stop()
+            except Exception:
+                pass
+            self._playwright = None
+
+
+def _preload() -> None:
+    """무거운 모듈을 미리 import (설치되지 않은 패키지는 건너뜀)"""
+    import pytest  # noqa: F401
+    for module_name in ("playwright.sync_api", "playwright.async_api", "selenium.webdriver"):
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+
+
+def _is_under(path: Optional[str], directory: str) -> bool:
+    if not path:
+        return False
+    try:
+        return os.path.commonpath([os.path.realpath(path), directory]) == directory
+    except ValueError:
+        # 다른 드라이브 (Windows)
+        return False
+
+
+def _purge_modules(before: set, run_dir: str) -> int:
+    """이번 실행에서 작업 디렉토리로부터 import한 모듈 제거 (다음 실행에서 수정된 파일을 다시 읽도록)"""
+    run_dir = os.path.realpath(run_dir)
+    this_file = os.path.realpath(__file__)
+    removed = 0
+    for name in list(sys.modules):
+        if name in before:
+            continue
+        module = sys.modules.get(name)
+        module_file = getattr(module, "__file__", None)
+        if name == "conftest" or (_is_under(module_file, run_dir) and os.path.realpath(module_file) != this_file):
+            del sys.modules[name]
+            removed += 1
+    return removed
+
+
+class _RedirectedOutput:
+    """fd 1/2를 임시 파일로 리다이렉트 (pytest의 fd 단위 출력 캡처와 하위 프로세스 출력 포함)"""
+
+    def __enter__(self):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        self._files = [tempfile.TemporaryFile(), tempfile.TemporaryFile()]
+        self._saved = [os.dup(1), os.dup(2)]
+        os.dup2(self._files[0].fileno(), 1)
+        os.dup2(self._files[1].fileno(), 2)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        sys.stdout.flush()
+        sys.stderr.flush()
+        os.dup2(self._saved[0], 1)
+        os.dup2(self._saved[1], 2)
+        for fd in self._saved:
+            os.close(fd)
+        self.stdout, self.stderr = (self._read(f) for f in self._files)
+        return False
+
+    @staticmethod
+    def _read(f) -> str:
+        f.seek(0)
+        data = f.read().decode("utf-8", errors="replace")
+        f.close()
+        return data
+
+
+class PytestDaemon:
+    """pytest.main()을 반복 실행하는 상주 실행기"""
+
+    def __init__(self, proto, max_runs: int = 50):
+        self.proto = proto
+        self.max_runs = max(1, max_runs)
+        self.runs = 0
+
+    def send(self, message: Dict[str, Any]) -> None:
+        self.proto.write(json.dumps(message, ensure_ascii=False) + "\n")
+        self.proto.flush()
+
+    def serve(self, stream) -> int:
+        self.send({"event": "ready", "pid": os.getpid()})
+        for raw in stream:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError:
+                self.send({"ok": False, "error": f"잘못된 요청: {line[:200]}"})
+                continue
+
+            cmd = request.get("cmd")
+            request_id = request.get("id")
+            if cmd == "ping":
+                self.send({"id": request_id, "ok": True, "runs": self.runs})
+            elif cmd == "shutdown":
+                self.send({"id": request_id, "ok": True})
+                return 0
+            elif cmd == "run":
+                response, healthy = self.run(request)
+                response["id"] = request_id
+                response["recycle"] = not healthy or self.runs >= self.max_runs
+                self.send(response)
+                if response["recycle"]:
+                    return 0 if healthy else 1
+            else:
+                self.send({"id": request_id, "ok": False, "error": f"알 수 없는 명령: {cmd}"})
+        return 0
+
+    def run(self, request: Dict[str, Any]) -> Tuple[Dict[str, Any], bool]:
+        """
+        pytest 한 번 실행
+
+        Returns:
+            (응답, 프로세스를 계속 사용해도 되는지 여부)
+        """
+        import pytest
+
+        args: List[str] = [str(arg) for arg in request.get("args", [])]
+        run_dir = os.path.abspath(request.get("cwd") or os.getcwd())
+
+        saved_cwd = os.getcwd()
+        saved_env = dict(os.environ)
+        saved_path = list(sys.path)
+        saved_argv = list(sys.argv)
+        modules_before = set(sys.modules)
+
+        start = time.perf_counter()
+        healthy = True
+        error = None
+        exit_code = None
+        output = _RedirectedOutput()
+        try:
+            os.environ.update({str(k): str(v) for k, v in (request.get("env") or {}).items()})
+            os.chdir(run_dir)
+            sys.argv = ["pytest"] + args
+            with output:
+                exit_code = int(pytest.main(args))
+        except BaseException as e:
+            # pytest 내부 오류는 프로세스 상태를 보장할 수 없으므로 재시작 요청
+            healthy = False
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            os.chdir(saved_cwd)
+            os.environ.clear()
+            os.environ.update(saved_env)
+            sys.path[:] = saved_path
+            sys.argv = saved_argv
+            purged = _purge_modules(modules_before, run_dir)
+            if resident_browsers is not None:
+                try:
+                    resident_browsers.reset()
+                except Exception:
+                    healthy = False
+            gc.collect()
+            self.runs += 1
+
+        response = {
+            "ok": error is None,
+            "exit_code": exit_code,
+            "stdout": getattr(output, "stdout", ""),
+            "stderr": getattr(output, "stderr", ""),
+            "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+            "runs": self.runs,
+            "purged_modules": purged,
+        }
+        if resident_browsers is not None:
+            response["browsers"] = dict(resident_browsers.stats)
+        if error:
+            response["error"] = error
+        return response, healthy
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="상주 pytest 실행기")
+    parser.add_argument("--max-runs", type=int, default=int(os.getenv("PYTEST_DAEMON_MAX_RUNS", "50")),
+                        help="이 횟수만큼 실행한 뒤 종료 (메모리 누수 방지, 호출 측에서 재시작)")
+    parser.add_argument("--no-resident-browser", action="store_true",
+                        help="Playwright 브라우저를 실행 간에 유지하지 않음")
+    options = parser.parse_args()
+
+    global resident_browsers
+    # conftest.py에서 import 없이 조회할 수 있도록 등록 (__main__으로 실행되므로)
+    sys.modules["pytest_daemon"] = sys.modules[__name__]
+    if not options.no_resident_browser:
+        resident_browsers = ResidentBrowsers()
+
+    # 프로토콜 전용 fd 확보 후, 실행 사이의 print가 프로토콜을 깨뜨리지 않도록 stdout을 stderr로 보냄
+    proto = os.fdopen(os.dup(1), "w", encoding="utf-8")
+    os.dup2(2, 1)
+
+    _preload()
+    daemon = PytestDaemon(proto, max_runs=options.max_runs)
+    try:
+        return daemon.serve(sys.stdin.buffer)
+    finally:
+        if resident_browsers is not None:
+            resident_browsers.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,247 @@
+"""
+리소스 차단 (빠른 실행 모드)
+기능 테스트에 필요 없는 이미지/폰트/미디어와 외부 분석/광고 스크립트 요청을 차단
+
+- Playwright: context.route로 리소스 타입/URL 패턴에 맞는 요청을 abort
+- Selenium(Chrome/Edge): CDP Network.setBlockedURLs(테스트 단위) + Chrome 이미지 차단 설정(세션 단위, selenium_driver_options)
+  Firefox: 이미지 차단 설정(permissions.default.image)만 적용
+- 테스트별 차단 요청 수와 절약한 바이트(리소스 타입별 추정치)를 리포트 user_properties와 실행 통계로 보고
+  (차단된 요청은 응답을 받지 않으므로 실제 크기를 알 수 없음)
+"""
+
+import os
+import json
+import fnmatch
+from typing import Optional, Dict, Any, List, Iterable, FrozenSet, Tuple
+
+# 외부 분석/광고/세션 기록 도메인
+TRACKER_PATTERNS = (
+    "*google-analytics.com/*",
+    "*googletagmanager.com/*",
+    "*doubleclick.net/*",
+    "*googlesyndication.com/*",
+    "*googleadservices.com/*",
+    "*adservice.google.*",
+    "*connect.facebook.net/*",
+    "*analytics.tiktok.com/*",
+    "*hotjar.com/*",
+    "*clarity.ms/*",
+    "*cdn.segment.com/*",
+    "*api.segment.io/*",
+    "*mixpanel.com/*",
+    "*amplitude.com/*",
+    "*nr-data.net/*",
+    "*js-agent.newrelic.com/*",
+    "*criteo.com/*",
+    "*taboola.com/*",
+    "*outbrain.com/*",
+)
+
+# 리소스 타입별 URL 확장자 (Selenium은 타입 대신 URL 패턴으로만 차단 가능)
+TYPE_EXTENSIONS = {
+    "image": ("png", "jpg", "jpeg", "gif", "webp", "avif", "svg", "ico", "bmp"),
+    "font": ("woff", "woff2", "ttf", "otf", "eot"),
+    "media": ("mp4", "webm", "ogg", "ogv", "mp3", "wav", "m4a", "m3u8", "mpd"),
+}
+
+# 차단 프로필: 이름 -> (리소스 타입, URL 패턴)
+PROFILES: Dict[str, Tuple[Tuple[str, ...], Tuple[str, ...]]] = {
+    "off": ((), ()),
+    "media": (("image", "font", "media"), ()),
+    "trackers": ((), TRACKER_PATTERNS),
+    "fast": (("image", "font", "media"), TRACKER_PATTERNS),
+}
+
+# 리소스 타입별 추정 크기(바이트, 절약한 바이트 계산용)
+ESTIMATED_BYTES = {
+    "image": 40_000,
+    "font": 30_000,
+    "media": 500_000,
+    "script": 25_000,
+    "stylesheet": 10_000,
+    "document": 20_000,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+# CDP(Network.loadingFailed) 리소스 타입 -> Playwright 리소스 타입 이름
+_CDP_TYPES = {"Image": "image", "Font": "font", "Media": "media", "Script": "script",
+              "Stylesheet": "stylesheet", "Document": "document", "XHR": "xhr", "Fetch": "fetch"}
+
+
+def _env_list(name: str) -> List[str]:
+    return [value.strip() for value in os.getenv(name, "").split(",") if value.strip()]
+
+
+class BlockProfile:
+    """
+    차단 규칙 (리소스 타입 + URL glob 패턴)
+    """
+
+    def __init__(self, name: str, resource_types: Iterable[str] = (), url_patterns: Iterable[str] = ()):
+        self.name = name
+        self.resource_types: FrozenSet[str] = frozenset(resource_types)
+        self.url_patterns = tuple(url_patterns)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.resource_types or self.url_patterns)
+
+    def match(self, resource_type: str, url: str) -> Optional[str]:
+        """차단 이유(리소스 타입 또는 "url") 또는 None"""
+        if resource_type in self.resource_types:
+            return resource_type
+        if any(fnmatch.fnmatch(url, pattern) for pattern in self.url_patterns):
+            return "url"
+        return None
+
+    def selenium_patterns(self) -> List[str]:
+        """CDP Network.setBlockedURLs 패턴 (리소스 타입은 확장자 패턴으로 변환, 쿼리 문자열이 붙어도 일치)"""
+        patterns = list(self.url_patterns)
+        for resource_type in sorted(self.resource_types):
+            patterns.extend(f"*.{extension}*" for extension in TYPE_EXTENSIONS.get(resource_type, ()))
+        return patterns
+
+    def chrome_prefs(self) -> Dict[str, Any]:
+        """Chrome/Edge 세션 설정 (이미지 로드 차단)"""
+        if "image" in self.resource_types:
+            return {"profile.managed_default_content_settings.images": 2}
+        return {}
+
+
+def resolve_profile(default_name: str, marker=None) -> BlockProfile:
+    """
+    테스트에 적용할 차단 프로필 (block_resources 마커가 있으면 명령줄/환경 변수 설정보다 우선)
+
+    @pytest.mark.block_resources("fast", types=["stylesheet"], patterns=["*/chat-widget/*"])
+    @pytest.mark.block_resources("off")
+    """
+    name = default_name
+    options: Dict[str, Any] = {}
+    if marker is not None:
+        if marker.args:
+            name = marker.args[0]
+        options = dict(marker.kwargs)
+    if name not in PROFILES:
+        raise ValueError(f"지원하지 않는 리소스 차단 프로필: {name} ({', '.join(PROFILES)})")
+    resource_types, url_patterns = PROFILES[name]
+    if name == "off":
+        return BlockProfile(name)
+    return BlockProfile(
+        name,
+        list(resource_types) + _env_list("TEST_BLOCK_RESOURCE_TYPES") + list(options.get("types", ())),
+        list(url_patterns) + _env_list("TEST_BLOCK_URL_PATTERNS") + list(options.get("patterns", ())),
+    )
+
+
+class _BlockCounter:
+    """차단 요청 수/추정 바이트 집계"""
+
+    def __init__(self, profile: BlockProfile):
+        self.profile = profile
+        self.stats: Dict[str, Any] = {"tests": 1, "requests_blocked": 0, "estimated_bytes_saved": 0}
+
+    def count(self, resource_type: str, reason: str) -> None:
+        self.stats["requests_blocked"] += 1
+        self.stats["estimated_bytes_saved"] += ESTIMATED_BYTES.get(resource_type, DEFAULT_ESTIMATED_BYTES)
+        key = f"blocked_{reason}"
+        self.stats[key] = self.stats.get(key, 0) + 1
+
+    def record(self, node) -> None:
+        """테스트 리포트에 차단 결과 기록 (user_properties로 xdist/JSON/NDJSON 리포트에 전달됨)"""
+        node.user_properties.append(("resources_blocked", self.stats["requests_blocked"]))
+        node.user_properties.append(("resource_estimated_bytes_saved", self.stats["estimated_bytes_saved"]))
+
+
+class PlaywrightBlocker(_BlockCounter):
+    """
+    BrowserContext 라우팅으로 요청 차단
+
+    차단하지 않는 요청은 route.fallback()으로 먼저 등록된 라우터(네트워크 기록/재생 등)에 넘김
+    """
+
+    def __init__(self, profile: BlockProfile):
+        super().__init__(profile)
+        self._context = None
+
+    def attach(self, context) -> None:
+        self._context = context
+        context.route("**/*", self._handle)
+
+    def detach(self) -> None:
+        if self._context is None:
+            return
+        try:
+            self._context.unroute("**/*", self._handle)
+        except Exception:
+            # 이미 닫힌 컨텍스트
+            pass
+        self._context = None
+
+    def _handle(self, route) -> None:
+        request = route.request
+        reason = self.profile.match(request.resource_type, request.url)
+        # 메인 프레임 페이지 이동은 차단하지 않음 (테스트가 직접 연 페이지)
+        if reason is not None and not (request.is_navigation_request() and request.frame.parent_frame is None):
+            self.count(request.resource_type, reason)
+            route.abort("blockedbyclient")
+            return
+        route.fallback()
+
+
+class SeleniumBlocker(_BlockCounter):
+    """
+    CDP Network.setBlockedURLs로 요청 차단 (Chrome/Edge)
+
+    차단 수는 성능 로그(goog:loggingPrefs performance)의 Network.loadingFailed(blockedReason)로 집계
+    (selenium_driver_options에서 성능 로그를 켠 경우에만)
+    """
+
+    def __init__(self, profile: BlockProfile):
+        super().__init__(profile)
+        self._driver = None
+
+    def attach(self, driver) -> bool:
+        """차단 시작 (CDP를 지원하지 않는 드라이버면 False)"""
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return False
+        # 세션 풀에서 재사용한 드라이버의 이전 테스트 로그는 버림
+        self._read_performance_log(driver)
+        try:
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.profile.selenium_patterns()})
+        except Exception as e:
+            # 원격 드라이버 등 CDP 명령을 처리하지 못하는 경우: 차단 없이 진행
+            print(f"[ResourceBlocking] CDP 요청 차단 설정 실패: {e}")
+            return False
+        self._driver = driver
+        return True
+
+    def detach(self) -> None:
+        """차단 수 집계 후 차단 해제 (세션 풀에 반납된 드라이버가 다음 테스트에 영향을 주지 않도록)"""
+        driver, self._driver = self._driver, None
+        if driver is None:
+            return
+        for entry in self._read_performance_log(driver):
+            try:
+                message = json.loads(entry["message"])["message"]
+            except (KeyError, TypeError, ValueError):
+                continue
+            if message.get("method") != "Network.loadingFailed":
+                continue
+            params = message.get("params", {})
+            if params.get("blockedReason"):
+                resource_type = _CDP_TYPES.get(params.get("type"), "other")
+                self.count(resource_type, resource_type if resource_type in self.profile.resource_types else "url")
+        try:
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        except Exception:
+            # 세션이 끊긴 경우: 풀에서 폐기됨
+            pass
+
+    @staticmethod
+    def _read_performance_log(driver) -> List[Dict[str, Any]]:
+        try:
+            return driver.get_log("performance")
+        except Exception:
+            # 성능 로그를 켜지 않은 세션
+            return []
@@ -0,0 +1,249 @@
+"""
+실패 스크린샷 파이프라인
+테스트 스레드는 브라우저에서 바이트만 받아 큐에 넣고, 인코딩/저장/용량 정리는 별도 스레드에서 처리
+"""
+
+import hashlib
+import io
+import os
+import queue
+import threading
+import time
+from typing import Optional, Dict, Any, List, Tuple
+
+# 지원 형식과 파일 확장자
+FORMAT_EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+SCREENSHOT_EXTENSIONS = tuple(FORMAT_EXTENSIONS.values())
+
+
+def _pillow_available() -> bool:
+    try:
+        import PIL.Image  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+
+class ScreenshotPipeline:
+    """
+    실패 스크린샷 비동기 저장기
+
+    - capture_*()/add(): 브라우저에서 받은 이미지 바이트만 큐에 추가 (재인코딩/디스크 쓰기 없음)
+    - 같은 내용의 캡처는 해시로 중복 제거 (이미 저장한 파일 경로 반환)
+    - jpeg/webp 재인코딩은 전송 스레드에서 Pillow로 수행
+      (Pillow가 없으면 jpeg는 브라우저에서 바로 jpeg로 캡처, webp는 png로 저장)
+    - 디렉토리 전체 용량이 budget_bytes를 넘으면 오래된 파일부터 삭제
+    """
+
+    def __init__(self, screenshot_dir: str, image_format: str = "png", quality: int = 80,
+                 budget_bytes: int = 500 * 1024 * 1024, full_page: bool = True,
+                 max_queue: int = 20):
+        if image_format not in FORMAT_EXTENSIONS:
+            raise ValueError(f"지원하지 않는 스크린샷 형식: {image_format} (사용 가능: {', '.join(FORMAT_EXTENSIONS)})")
+        self.screenshot_dir = screenshot_dir
+        self.quality = max(1, min(100, int(quality)))
+        self.budget_bytes = int(budget_bytes)
+        self.full_page = full_page
+
+        self.image_format = image_format
+        self._has_pillow = _pillow_available()
+        if image_format == "webp" and not self._has_pillow:
+            import warnings
+            warnings.warn("Pillow가 설치되지 않아 webp 대신 브라우저가 준 형식으로 저장합니다. 'pip install pillow' 실행하세요.")
+
+        os.makedirs(screenshot_dir, exist_ok=True)
+        # 내용 해시 -> 저장 경로
+        self._saved: Dict[str, str] = {}
+        self._queue: "queue.Queue[Optional[Tuple[bytes, str, str, str]]]" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._stats = {
+            "captured": 0,
+            "written": 0,
+            "deduplicated": 0,
+            "dropped": 0,
+            "failed": 0,
+            "evicted": 0,
+            "bytes_captured": 0,
+            "bytes_written": 0,
+            "bytes_evicted": 0,
+            "capture_ms": 0.0,
+            "encode_ms": 0.0,
+            "max_capture_ms": 0.0,
+            "max_encode_ms": 0.0,
+        }
+        self._thread = threading.Thread(target=self._run, name="screenshot-pipeline", daemon=True)
+        self._thread.start()
+
+    # ------------------------------------------------------------------
+    # 테스트 스레드에서 호출
+    # ------------------------------------------------------------------
+
+    def capture_playwright(self, page, test_name: str) -> Optional[str]:
+        """Playwright 페이지 캡처"""
+        source_format, options = self._playwright_options()
+        start = time.perf_counter()
+        data = page.screenshot(**options)
+        return self.add(data, source_format, test_name, (time.perf_counter() - start) * 1000)
+
+    async def capture_playwright_async(self, page, test_name: str) -> Optional[str]:
+        """Playwright async API 페이지 캡처 (playwright-async 모드)"""
+        source_format, options = self._playwright_options()
+        start = time.perf_counter()
+        data = await page.screenshot(**options)
+        return self.add(data, source_format, test_name, (time.perf_counter() - start) * 1000)
+
+    def capture_selenium(self, driver, test_name: str) -> Optional[str]:
+        """Selenium WebDriver 캡처 (뷰포트만 캡처됨)"""
+        start = time.perf_counter()
+        data = driver.get_screenshot_as_png()
+        return self.add(data, "png", test_name, (time.perf_counter() - start) * 1000)
+
+    def _playwright_options(self) -> Tuple[str, Dict[str, Any]]:
+        # jpeg는 브라우저가 바로 인코딩할 수 있으므로 재인코딩 생략
+        source_format = "jpeg" if self.image_format == "jpeg" else "png"
+        options = {"full_page": self.full_page, "type": source_format}
+        if source_format == "jpeg":
+            options["quality"] = self.quality
+        return source_format, options
+
+    def add(self, data: bytes, source_format: str, test_name: str, capture_ms: float = 0.0) -> Optional[str]:
+        """
+        캡처한 이미지 바이트를 저장 큐에 추가 (여러 스레드에서 호출 가능)
+
+        Returns:
+            저장될(또는 이미 저장된) 파일 경로, 큐가 가득 차면 None
+        """
+        content_hash = hashlib.sha256(data).hexdigest()
+
+        with self._lock:
+            self._stats["captured"] += 1
+            self._stats["bytes_captured"] += len(data)
+            self._stats["capture_ms"] += capture_ms
+            self._stats["max_capture_ms"] = max(self._stats["max_capture_ms"], capture_ms)
+            existing = self._saved.get(content_hash)
+            if existing is not None:
+                self._stats["deduplicated"] += 1
+                return existing
+
+            # Pillow가 없으면 브라우저가 준 형식 그대로 저장
+            output_format = self.image_format if self._has_pillow else source_format
+            safe_name = test_name.replace("::", "_").replace("/", "_").replace("\\", "_")
+            path = os.path.join(
+                self.screenshot_dir,
+                f"{safe_name}_{int(time.time() * 1000)}{FORMAT_EXTENSIONS[output_format]}"
+            )
+            self._saved[content_hash] = path
+
+        try:
+            self._queue.put_nowait((data, source_format, output_format, path))
+        except queue.Full:
+            with self._lock:
+                self._stats["dropped"] += 1
+                del self._saved[content_hash]
+            return None
+        return path
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+        stats["queue_depth"] = self._queue.qsize()
+        return stats
+
+    def flush(self, timeout: float) -> bool:
+        """남은 캡처를 제한 시간 내에 저장하고 스레드 종료"""
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            return False
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    # ------------------------------------------------------------------
+    # 저장 스레드
+    # ------------------------------------------------------------------
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            data, source_format, output_format, path = item
+            try:
+                start = time.perf_counter()
+                encoded = self._encode(data, source_format, output_format)
+                elapsed = (time.perf_counter() - start) * 1000
+                tmp_path = f"{path}.tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(encoded)
+                os.replace(tmp_path, path)
+                with self._lock:
+                    self._stats["written"] += 1
+                    self._stats["bytes_written"] += len(encoded)
+                    self._stats["encode_ms"] += elapsed
+                    self._stats["max_encode_ms"] = max(self._stats["max_encode_ms"], elapsed)
+                self._enforce_budget()
+            except Exception as e:
+                with self._lock:
+                    self._stats["failed"] += 1
+                print(f"스크린샷 저장 실패: {e}")
+
+    def _encode(self, data: bytes, source_format: str, output_format: str) -> bytes:
+        if source_format == output_format:
+            return data
+        from PIL import Image
+
+        with Image.open(io.BytesIO(data)) as image:
+            output = io.BytesIO()
+            if output_format == "jpeg":
+                image.convert("RGB").save(output, "JPEG", quality=self.quality, optimize=True)
+            else:
+                image.save(output, "WEBP", quality=self.quality, method=4)
+            return output.getvalue()
+
+    def _enforce_budget(self) -> None:
+        """디렉토리 용량이 예산을 넘으면 오래된 스크린샷부터 삭제 (다른 워커가 저장한 파일 포함)"""
+        if self.budget_bytes <= 0:
+            return
+        files: List[Tuple[float, int, str]] = []
+        total = 0
+        with os.scandir(self.screenshot_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(SCREENSHOT_EXTENSIONS) or not entry.is_file():
+                    continue
+                stat = entry.stat()
+                files.append((stat.st_mtime, stat.st_size, entry.path))
+                total += stat.st_size
+        if total <= self.budget_bytes:
+            return
+
+        files.sort()
+        evicted = set()
+        for _, size, path in files:
+            if total <= self.budget_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            evicted.add(path)
+            with self._lock:
+                self._stats["evicted"] += 1
+                self._stats["bytes_evicted"] += size
+
+        if evicted:
+            with self._lock:
+                # 삭제된 파일은 다시 캡처되면 새로 저장
+                for content_hash in [h for h, p in self._saved.items() if p in evicted]:
+                    del self._saved[content_hash]
+
+
+def create_from_env() -> ScreenshotPipeline:
+    """환경 변수 설정으로 파이프라인 생성"""
+    return ScreenshotPipeline(
+        screenshot_dir=os.getenv('PYTEST_SCREENSHOT_DIR', '.pytest-reports/screenshots'),
+        image_format=os.getenv('PYTEST_SCREENSHOT_FORMAT', 'png').lower(),
+        quality=int(os.getenv('PYTEST_SCREENSHOT_QUALITY', '80')),
+        budget_bytes=int(float(os.getenv('PYTEST_SCREENSHOT_BUDGET_MB', '500')) * 1024 * 1024),
+        full_page=os.getenv('PYTEST_SCREENSHOT_FULL_PAGE', 'true').lower() == 'true'
+    )
@@ -0,0 +1,381 @@
+"""
+레거시 스크립트 일괄 실행기
+JSON 결과를 stdout으로 출력하는 레거시 스크립트(예: example_test.py)를 스크립트마다 인터프리터를 새로 띄우지 않고
+미리 시작해 둔 워커 프로세스에서 runpy로 실행 (PythonService.executeBatch에서 사용)
+
+- 워커마다 한 번에 스크립트 하나: __main__으로 실행하고 stdout/stderr를 fd 단위로 스크립트별 캡처
+- 스크립트마다 시간 제한: 초과하면 워커를 종료하고 새 워커로 교체 (다른 스크립트는 계속 실행,
+  시간 초과/워커 비정상 종료 시 그 스크립트의 출력은 남지 않음)
+- 작업을 기다리던 워커가 종료되어 있으면 새 워커로 교체하고 그 작업을 다시 배정
+- 실행이 끝나면 스크립트 디렉토리에서 import한 모듈을 제거하고 환경 변수/sys.path/작업 디렉토리/argv를 복원
+  (pytest_daemon.py와 같은 방식)
+- 결과는 끝나는 순서대로 한 줄에 JSON 하나씩 stdout으로 출력
+
+출력 (한 줄에 JSON 하나, UTF-8):
+    {"event": "start", "scripts": 3, "workers": 2}
+    {"event": "result", "index": 0, "script": "example_test.py", "status": "passed", "exit_code": 0,
+     "data": {...}, "stdout": "...", "stderr": "", "duration_ms": 1003.2, "worker": 1234}
+    {"event": "summary", "scripts": 3, "passed": 2, "failed": 0, "timeout": 1, "crashed": 0, ...}
+
+status: passed(종료 코드 0), failed(0이 아닌 종료 코드 또는 예외), timeout(시간 초과), crashed(워커 비정상 종료)
+data: stdout 전체를 JSON으로 파싱한 값 (JSON이 아니면 {"output": stdout, "note": ...}, PythonService와 같은 형식)
+
+사용법:
+    python script_batch_runner.py example_test.py other_test.py --workers 4 --timeout 60
+    python script_batch_runner.py --jobs jobs.jsonl      # 한 줄에 {"script": ..., "args": [...], "timeout": 초}
+    python script_batch_runner.py --jobs - < jobs.jsonl  # 표준 입력으로 작업 목록 전달
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import runpy
+import sys
+import time
+import traceback
+from collections import deque
+from multiprocessing.connection import wait
+from typing import Optional, Dict, Any, List, Callable
+
+from pytest_daemon import _RedirectedOutput, _purge_modules
+
+# 워커 시작 시 미리 import할 모듈 (설치되지 않은 패키지는 건너뜀)
+DEFAULT_PRELOAD = ("playwright.sync_api", "selenium.webdriver")
+
+NOT_JSON_NOTE = "JSON 형식이 아닌 일반 출력입니다."
+
+# 작업을 보내지 못한(대기 중에 종료된) 워커를 교체하며 다시 배정할 최대 횟수 (넘으면 crashed로 보고)
+MAX_ASSIGN_ATTEMPTS = 3
+
+
+def parse_result(stdout: str) -> Dict[str, Any]:
+    """스크립트 stdout 파싱 (PythonService._parseResult와 같은 규칙)"""
+    if not stdout or not stdout.strip():
+        return {"output": ""}
+    try:
+        return json.loads(stdout)
+    except ValueError:
+        return {"output": stdout, "note": NOT_JSON_NOTE}
+
+
+def _preload(modules) -> None:
+    for module_name in modules:
+        try:
+            __import__(module_name)
+        except ImportError:
+            pass
+
+
+def _exit_code(exit_value) -> int:
+    """SystemExit 값을 종료 코드로 변환 (sys.exit("메시지")는 메시지를 stderr에 쓰고 1)"""
+    if exit_value is None:
+        return 0
+    if isinstance(exit_value, int):
+        return exit_value
+    print(exit_value, file=sys.stderr)
+    return 1
+
+
+def run_script(job: Dict[str, Any]) -> Dict[str, Any]:
+    """현재 프로세스에서 스크립트 하나 실행 (워커에서 호출)"""
+    script = os.path.abspath(job["script"])
+    script_dir = os.path.dirname(script)
+    run_dir = os.path.abspath(job.get("cwd") or script_dir)
+
+    saved_cwd = os.getcwd()
+    saved_env = dict(os.environ)
+    saved_path = list(sys.path)
+    saved_argv = list(sys.argv)
+    modules_before = set(sys.modules)
+
+    start = time.perf_counter()
+    exit_code = None
+    error = None
+    output = _RedirectedOutput()
+    try:
+        os.environ.update({str(k): str(v) for k, v in (job.get("env") or {}).items()})
+        os.chdir(run_dir)
+        # python script.py로 실행한 것과 같은 sys.argv/sys.path[0]
+        sys.argv = [script] + [str(arg) for arg in job.get("args", [])]
+        sys.path.insert(0, script_dir)
+        with output:
+            try:
+                runpy.run_path(script, run_name="__main__")
+                exit_code = 0
+            except SystemExit as e:
+                exit_code = _exit_code(e.code)
+            except BaseException as e:
+                # 실행기/runpy 프레임은 빼고 스크립트부터 출력
+                tb = e.__traceback__
+                while tb is not None and tb.tb_frame.f_code.co_filename != script:
+                    tb = tb.tb_next
+                traceback.print_exception(type(e), e, tb or e.__traceback__)
+                exit_code = 1
+                error = f"{type(e).__name__}: {e}"
+    finally:
+        os.chdir(saved_cwd)
+        os.environ.clear()
+        os.environ.update(saved_env)
+        sys.path[:] = saved_path
+        sys.argv = saved_argv
+        _purge_modules(modules_before, script_dir)
+
+    response = {
+        "exit_code": exit_code,
+        "stdout": getattr(output, "stdout", ""),
+        "stderr": getattr(output, "stderr", ""),
+        "duration_ms": round((time.perf_counter() - start) * 1000, 1),
+    }
+    if error:
+        response["error"] = error
+    return response
+
+
+def _worker_main(conn, preload, max_runs: int) -> None:
+    """워커 프로세스: 작업을 받아 실행하고 결과를 보냄 (None을 받거나 max_runs번 실행하면 종료)"""
+    # 부모가 sys.stdout/sys.stderr를 바꿔 둔 경우(pytest 출력 캡처 등)에도 fd 1/2로 출력해 스크립트별로 캡처되도록 함
+    sys.stdout, sys.stderr = sys.__stdout__, sys.__stderr__
+    # 스크립트 밖의 print가 부모 프로세스의 결과 출력에 섞이지 않도록 stdout을 stderr로 보냄
+    sys.stdout.flush()
+    os.dup2(2, 1)
+    _preload(preload)
+    runs = 0
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        response = run_script(job)
+        runs += 1
+        response["recycle"] = runs >= max_runs
+        conn.send(response)
+        if response["recycle"]:
+            return
+
+
+class _Worker:
+    """실행 중인 워커 프로세스와 배정된 작업"""
+
+    def __init__(self, context, preload, max_runs: int):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=_worker_main, args=(child_conn, tuple(preload), max_runs), daemon=True)
+        self.process.start()
+        # 워커가 종료되면 recv가 EOFError를 내도록 부모 쪽 끝은 닫음
+        child_conn.close()
+        self.job: Optional[Dict[str, Any]] = None
+        self.deadline: Optional[float] = None
+
+    def assign(self, job: Dict[str, Any], timeout: float) -> bool:
+        """작업 전송 (대기 중에 종료된 워커라 보내지 못하면 False)"""
+        if not self.process.is_alive():
+            return False
+        try:
+            self.conn.send({key: job[key] for key in ("script", "args", "cwd", "env") if key in job})
+        except (OSError, ValueError):
+            # BrokenPipeError 등: 확인 직후 워커가 종료된 경우
+            return False
+        self.job = job
+        self.deadline = time.monotonic() + timeout if timeout > 0 else None
+        return True
+
+    def stop(self, kill: bool = False) -> None:
+        if kill:
+            self.process.kill()
+        else:
+            try:
+                self.conn.send(None)
+            except (OSError, ValueError):
+                pass
+        self.process.join(timeout=5)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class BatchRunner:
+    """
+    레거시 스크립트 일괄 실행기
+
+    Args:
+        workers: 워커 프로세스 수
+        timeout: 스크립트 하나의 기본 시간 제한(초, 0이면 제한 없음)
+        max_runs: 워커 하나가 실행할 최대 스크립트 수 (도달하면 새 워커로 교체, 메모리 누수 방지)
+        preload: 워커 시작 시 미리 import할 모듈
+        emit: 이벤트(dict)를 받는 함수
+    """
+
+    def __init__(self, workers: int = 4, timeout: float = 300, max_runs: int = 100,
+                 preload=DEFAULT_PRELOAD, emit: Optional[Callable[[Dict[str, Any]], None]] = None):
+        self.workers = max(1, workers)
+        self.timeout = timeout
+        self.max_runs = max(1, max_runs)
+        self.preload = preload
+        self.emit = emit or (lambda event: None)
+        self._context = multiprocessing.get_context()
+        self.stats: Dict[str, Any] = {}
+
+    def _start_worker(self) -> _Worker:
+        self.stats["workers_started"] += 1
+        return _Worker(self._context, self.preload, self.max_runs)
+
+    def _finish(self, worker: _Worker, response: Dict[str, Any], status: Optional[str] = None) -> None:
+        job = worker.job
+        if status is None:
+            status = "passed" if response.get("exit_code") == 0 else "failed"
+        result = {
+            "event": "result",
+            "index": job["index"],
+            "script": job["script"],
+            "status": status,
+            "exit_code": response.get("exit_code"),
+            "data": parse_result(response.get("stdout", "")) if status in ("passed", "failed") else None,
+            "stdout": response.get("stdout", ""),
+            "stderr": response.get("stderr", ""),
+            "duration_ms": response.get("duration_ms"),
+            "worker": worker.process.pid,
+        }
+        if response.get("error"):
+            result["error"] = response["error"]
+        self.stats["scripts"] += 1
+        self.stats[status] += 1
+        if result["duration_ms"] is not None:
+            self.stats["script_ms"] = round(self.stats["script_ms"] + result["duration_ms"], 1)
+        worker.job = None
+        worker.deadline = None
+        self.emit(result)
+
+    def run(self, jobs: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """작업 목록 실행 (결과는 끝나는 순서대로 emit), 실행 통계 반환"""
+        start = time.perf_counter()
+        self.stats = {
+            "scripts": 0,
+            "passed": 0,
+            "failed": 0,
+            "timeout": 0,
+            "crashed": 0,
+            "workers_started": 0,
+            "script_ms": 0.0,
+        }
+        pending = deque(dict(job, index=index) for index, job in enumerate(jobs))
+        worker_count = min(self.workers, len(pending))
+        self.emit({"event": "start", "scripts": len(pending), "workers": worker_count})
+        pool: List[_Worker] = []
+        try:
+            while pending or any(worker.job is not None for worker in pool):
+                # 빈 워커에 작업 배정 (종료된 워커 자리는 새로 시작)
+                while len(pool) < worker_count and pending:
+                    pool.append(self._start_worker())
+                replaced = False
+                for worker in list(pool):
+                    if worker.job is None and pending:
+                        job = pending.popleft()
+                        if worker.assign(job, float(job.get("timeout", self.timeout))):
+                            continue
+                        # 대기 중에 종료된 워커(OOM 등): 작업을 되돌리고 새 워커로 교체
+                        job["assign_attempts"] = job.get("assign_attempts", 0) + 1
+                        if job["assign_attempts"] >= MAX_ASSIGN_ATTEMPTS:
+                            worker.job = job
+                            self._finish(worker, {
+                                "exit_code": worker.process.exitcode,
+                                "error": f"워커 프로세스가 작업을 받기 전에 종료되었습니다 ({job['assign_attempts']}회)",
+                            }, "crashed")
+                        else:
+                            pending.appendleft(job)
+                        pool.remove(worker)
+                        worker.stop(kill=True)
+                        replaced = True
+                if replaced:
+                    continue
+
+                busy = [worker for worker in pool if worker.job is not None]
+                deadlines = [worker.deadline for worker in busy if worker.deadline is not None]
+                wait_timeout = max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+                wait([worker.conn for worker in busy] + [worker.process.sentinel for worker in busy], wait_timeout)
+
+                for worker in busy:
+                    if worker.conn.poll():
+                        try:
+                            response = worker.conn.recv()
+                        except EOFError:
+                            response = None
+                        if response is not None:
+                            self._finish(worker, response)
+                            if response.get("recycle"):
+                                pool.remove(worker)
+                                worker.stop()
+                            continue
+                    if not worker.process.is_alive():
+                        # os._exit, 시그널, 인터프리터 오류 등으로 워커가 종료됨
+                        self._finish(worker, {
+                            "exit_code": worker.process.exitcode,
+                            "error": f"워커 프로세스가 종료되었습니다 (code: {worker.process.exitcode})",
+                        }, "crashed")
+                        pool.remove(worker)
+                        worker.stop(kill=True)
+                    elif worker.deadline is not None and time.monotonic() >= worker.deadline:
+                        # 실행 중인 스크립트는 중단할 수 없으므로 워커를 종료 (다음 작업은 새 워커에서)
+                        elapsed = float(worker.job.get("timeout", self.timeout))
+                        self._finish(worker, {
+                            "duration_ms": round(elapsed * 1000, 1),
+                            "error": f"스크립트 실행 시간 초과 ({elapsed:g}초)",
+                        }, "timeout")
+                        pool.remove(worker)
+                        worker.stop(kill=True)
+        finally:
+            for worker in pool:
+                worker.stop(kill=worker.job is not None)
+
+        summary = {"event": "summary", **self.stats, "workers": worker_count,
+                   "duration_ms": round((time.perf_counter() - start) * 1000, 1)}
+        self.emit(summary)
+        return summary
+
+
+def _read_jobs(path: str) -> List[Dict[str, Any]]:
+    stream = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    try:
+        return [json.loads(line) for line in stream if line.strip()]
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="레거시 스크립트 일괄 실행기")
+    parser.add_argument("scripts", nargs="*", help="실행할 스크립트 (인자 없이 실행)")
+    parser.add_argument("--jobs", help="작업 목록 JSONL 파일 (-이면 표준 입력)")
+    parser.add_argument("--workers", type=int, default=int(os.getenv("SCRIPT_BATCH_WORKERS", str(os.cpu_count() or 2))),
+                        help="워커 프로세스 수")
+    parser.add_argument("--timeout", type=float, default=float(os.getenv("SCRIPT_BATCH_TIMEOUT", "300")),
+                        help="스크립트 하나의 시간 제한(초, 0이면 제한 없음)")
+    parser.add_argument("--max-runs", type=int, default=int(os.getenv("SCRIPT_BATCH_MAX_RUNS", "100")),
+                        help="워커 하나가 실행할 최대 스크립트 수")
+    parser.add_argument("--preload", default=os.getenv("SCRIPT_BATCH_PRELOAD", ",".join(DEFAULT_PRELOAD)),
+                        help="워커 시작 시 미리 import할 모듈 (쉼표 구분)")
+    options = parser.parse_args()
+
+    jobs = [{"script": script} for script in options.scripts]
+    if options.jobs:
+        jobs.extend(_read_jobs(options.jobs))
+
+    def emit(event: Dict[str, Any]) -> None:
+        sys.stdout.write(json.dumps(event, ensure_ascii=False) + "\n")
+        sys.stdout.flush()
+
+    runner = BatchRunner(
+        workers=options.workers,
+        timeout=options.timeout,
+        max_runs=options.max_runs,
+        preload=[name.strip() for name in options.preload.split(",") if name.strip()],
+        emit=emit,
+    )
+    summary = runner.run(jobs)
+    return 0 if summary["scripts"] == summary["passed"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,313 @@
+"""
+Selenium WebDriver 풀
+드라이버 바이너리 경로를 디스크에 캐시하고, 살아있는 WebDriver 세션을 테스트 간에 재사용
+"""
+
+import os
+import json
+import time
+import tempfile
+from typing import Optional, Dict, Any, List, Tuple
+
+from context_pool import _origin_of
+
+
+# 드라이버 경로 캐시 파일 (워커/실행 간 공유)
+DRIVER_CACHE_FILE = os.getenv(
+    "TEST_DRIVER_CACHE",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "driver-cache.json")
+)
+# 캐시 유효 기간 (일) - 브라우저 업데이트 후 오래된 드라이버를 계속 쓰지 않도록 제한
+DRIVER_CACHE_TTL_DAYS = float(os.getenv("TEST_DRIVER_CACHE_TTL", "7"))
+
+# 프로세스 내 캐시 (세션당 한 번만 해석)
+_resolved_paths: Dict[str, Optional[str]] = {}
+
+resolution_stats = {
+    "memory_hits": 0,
+    "disk_hits": 0,
+    "resolved": 0,
+    "resolve_ms": 0.0,
+}
+
+
+def resolve_driver_path(browser_name: str, force: bool = False) -> Optional[str]:
+    """
+    WebDriver 바이너리 경로 해석 (메모리 → 디스크 캐시 → webdriver-manager 순)
+
+    Args:
+        browser_name: "Chrome", "Firefox", "Edge"
+        force: True면 캐시를 무시하고 다시 해석 (버전 불일치 등으로 세션 생성 실패 시)
+
+    Returns:
+        드라이버 경로 또는 None (webdriver-manager가 없으면 Selenium Manager에 위임)
+    """
+    if not force and browser_name in _resolved_paths:
+        resolution_stats["memory_hits"] += 1
+        return _resolved_paths[browser_name]
+
+    if not force:
+        cached = _read_disk_cache().get(browser_name)
+        if cached and _is_cache_entry_valid(cached):
+            resolution_stats["disk_hits"] += 1
+            _resolved_paths[browser_name] = cached["path"]
+            return cached["path"]
+
+    start = time.perf_counter()
+    path = _install_driver(browser_name)
+    resolution_stats["resolve_ms"] += (time.perf_counter() - start) * 1000
+    resolution_stats["resolved"] += 1
+
+    _resolved_paths[browser_name] = path
+    if path:
+        _write_disk_cache(browser_name, path)
+    return path
+
+
+def _install_driver(browser_name: str) -> Optional[str]:
+    """webdriver-manager로 드라이버 설치/경로 해석 (네트워크 사용 가능)"""
+    try:
+        from webdriver_manager.chrome import ChromeDriverManager
+        from webdriver_manager.firefox import GeckoDriverManager
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+    except ImportError:
+        import warnings
+        warnings.warn("webdriver-manager가 설치되지 않았습니다. WebDriver 경로를 수동으로 설정해야 할 수 있습니다.")
+        return None
+
+    managers = {
+        "Chrome": ChromeDriverManager,
+        "Firefox": GeckoDriverManager,
+        "Edge": EdgeChromiumDriverManager,
+    }
+    manager = managers.get(browser_name, ChromeDriverManager)
+    return manager().install()
+
+
+def _is_cache_entry_valid(entry: Dict[str, Any]) -> bool:
+    path = entry.get("path")
+    if not path or not os.path.exists(path):
+        return False
+    age_days = (time.time() - entry.get("resolved_at", 0)) / 86400
+    return age_days <= DRIVER_CACHE_TTL_DAYS
+
+
+def _read_disk_cache() -> Dict[str, Any]:
+    try:
+        with open(DRIVER_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_disk_cache(browser_name: str, path: str) -> None:
+    """원자적으로 캐시 기록 (여러 xdist 워커가 동시에 기록해도 파일이 깨지지 않도록)"""
+    try:
+        cache_dir = os.path.dirname(DRIVER_CACHE_FILE)
+        os.makedirs(cache_dir, exist_ok=True)
+        cache = _read_disk_cache()
+        cache[browser_name] = {"path": path, "resolved_at": time.time()}
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp_path, DRIVER_CACHE_FILE)
+    except OSError:
+        # 캐시 기록 실패는 무시 (다음 실행에서 다시 해석)
+        pass
+
+
+def create_driver(options, browser_name: str):
+    """
+    WebDriver 생성 (캐시된 드라이버 경로 사용)
+
+    캐시된 경로로 세션 생성에 실패하면 캐시를 무시하고 한 번 더 시도
+    """
+    resolved_before = resolution_stats["resolved"]
+    driver_path = resolve_driver_path(browser_name)
+    try:
+        return _start_driver(options, browser_name, driver_path)
+    except Exception:
+        # 방금 새로 해석한 경로였다면 다시 해석해도 결과가 같으므로 그대로 실패 처리
+        if driver_path is None or resolution_stats["resolved"] != resolved_before:
+            raise
+        return _start_driver(options, browser_name, resolve_driver_path(browser_name, force=True))
+
+
+def _start_driver(options, browser_name: str, driver_path: Optional[str]):
+    from selenium import webdriver
+    from selenium.webdriver.chrome.service import Service as ChromeService
+    from selenium.webdriver.firefox.service import Service as FirefoxService
+    from selenium.webdriver.edge.service import Service as EdgeService
+
+    if browser_name == "Firefox":
+        service = FirefoxService(driver_path) if driver_path else FirefoxService()
+        return webdriver.Firefox(service=service, options=options)
+    if browser_name == "Edge":
+        service = EdgeService(driver_path) if driver_path else EdgeService()
+        return webdriver.Edge(service=service, options=options)
+    # 기본값: Chrome
+    service = ChromeService(driver_path) if driver_path else ChromeService()
+    return webdriver.Chrome(service=service, options=options)
+
+
+class SeleniumDriverPool:
+    """
+    워커(프로세스) 단위 WebDriver 세션 풀
+
+    - 반납된 세션은 쿠키, 창, 스토리지를 초기화한 뒤 다음 테스트에 재사용
+    - max_uses 초과, 테스트 실패, 초기화 실패, 세션 종료 시 폐기 (quit)
+    - 방문한 origin 기록: driver.get()으로 이동한 URL + 반납 시점에 열려 있던 창의 URL
+      (CDP가 없는 브라우저는 현재 도메인 쿠키/스토리지만 지울 수 있으므로 여러 origin을 방문했다면 폐기)
+    """
+
+    def __init__(self, options, browser_name: str, max_size: int = 1, max_uses: int = 20):
+        self.options = options
+        self.browser_name = browser_name
+        self.max_size = max(1, int(max_size))
+        self.max_uses = max(1, int(max_uses))
+        # 유휴 세션: (driver, 사용 횟수)
+        self._idle: List[Tuple[Any, int]] = []
+        self._uses: Dict[int, int] = {}
+        # 사용 중인 세션이 방문한 origin
+        self._origins: Dict[int, set] = {}
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "recycled": 0,
+            "recycled_max_uses": 0,
+            "recycled_failed": 0,
+            "recycled_reset_error": 0,
+            "startup_ms": 0.0,
+            "acquire_hit_ms": 0.0,
+            "reset_ms": 0.0,
+        }
+
+    def acquire(self):
+        """WebDriver 대여 (유휴 세션 우선)"""
+        start = time.perf_counter()
+        while self._idle:
+            driver, uses = self._idle.pop()
+            if self._is_alive(driver):
+                self.stats["hits"] += 1
+                self.stats["acquire_hit_ms"] += (time.perf_counter() - start) * 1000
+                self._uses[id(driver)] = uses + 1
+                self._origins[id(driver)] = set()
+                return driver
+            self._quit(driver, "recycled_reset_error")
+
+        driver = create_driver(self.options, self.browser_name)
+        self.stats["misses"] += 1
+        self.stats["startup_ms"] += (time.perf_counter() - start) * 1000
+        self._uses[id(driver)] = 1
+        self._origins[id(driver)] = set()
+        self._track_origins(driver)
+        return driver
+
+    def release(self, driver, failed: bool = False) -> None:
+        """WebDriver 반납 (재사용 불가능하면 quit)"""
+        uses = self._uses.pop(id(driver), self.max_uses)
+        origins = self._origins.pop(id(driver), set())
+        if failed:
+            self._quit(driver, "recycled_failed")
+            return
+        if uses >= self.max_uses:
+            self._quit(driver, "recycled_max_uses")
+            return
+        if len(self._idle) >= self.max_size:
+            self._quit(driver, None)
+            return
+
+        start = time.perf_counter()
+        try:
+            reusable = self._reset(driver, origins)
+        except Exception:
+            reusable = False
+        self.stats["reset_ms"] += (time.perf_counter() - start) * 1000
+
+        if not reusable:
+            self._quit(driver, "recycled_reset_error")
+            return
+        self._idle.append((driver, uses))
+
+    def close(self) -> None:
+        """유휴 세션 모두 종료"""
+        while self._idle:
+            driver, _ = self._idle.pop()
+            self._quit(driver, None, count=False)
+
+    def summary(self) -> Dict[str, Any]:
+        """hit/miss 비율을 포함한 통계 반환"""
+        stats = dict(self.stats)
+        total = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / total, 3) if total else 0.0
+        return stats
+
+    def _quit(self, driver, reason: Optional[str], count: bool = True) -> None:
+        if count:
+            self.stats["recycled"] += 1
+            if reason:
+                self.stats[reason] += 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        try:
+            driver.window_handles
+            return True
+        except Exception:
+            return False
+
+    def _track_origins(self, driver) -> None:
+        """driver.get()으로 이동한 URL의 origin 기록 (세션 생성 시 한 번 감쌈)"""
+        navigate = driver.get
+
+        def get(url):
+            origin = _origin_of(url)
+            current = self._origins.get(id(driver))
+            if origin and current is not None:
+                current.add(origin)
+            return navigate(url)
+
+        driver.get = get
+
+    def _reset(self, driver, origins: set) -> bool:
+        """
+        다음 테스트를 위해 세션 상태 초기화
+
+        Returns:
+            재사용 가능 여부 (CDP 없이 여러 origin을 방문했으면 False)
+        """
+        handles = driver.window_handles
+        if not handles:
+            raise RuntimeError("열린 창이 없습니다")
+
+        # 테스트가 연 추가 창/탭 정리 (링크/팝업으로 이동한 origin도 기록)
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            origins.add(_origin_of(driver.current_url))
+            driver.close()
+        driver.switch_to.window(handles[0])
+        origins.add(_origin_of(driver.current_url))
+        origins.discard(None)
+
+        # 현재 origin의 스토리지 정리 (sessionStorage는 탭 단위라 CDP로 지워지지 않음)
+        driver.execute_script(
+            "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+        )
+
+        if hasattr(driver, "execute_cdp_cmd"):
+            # Chromium 계열: 모든 도메인의 쿠키와 방문한 모든 origin의 스토리지 정리
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            for origin in origins:
+                driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        elif len(origins) > 1:
+            # WebDriver 표준 API는 현재 도메인 쿠키/스토리지만 지울 수 있으므로 폐기
+            return False
+        else:
+            driver.delete_all_cookies()
+
+        driver.get("about:blank")
+        return True
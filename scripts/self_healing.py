@@ -0,0 +1,524 @@
+"""
+locator 자가 치유 재시도 (실패한 단계만 테스트 안에서 다시 실행)
+locator를 찾지 못하면 테스트 전체를 재실행(--reruns)하는 대신,
+마지막으로 찾았던 요소의 기록(id, class, 텍스트, 역할)과 현재 페이지 후보 요소 인덱스를 비교해
+가장 비슷한 요소로 그 단계만 다시 실행
+
+- 기록: locator가 요소를 찾으면 페이지 경로 + locator별로 요소 메타데이터를 저장 (세션당 locator 하나에 한 번)
+- 치유: 현재 페이지 후보 요소를 한 번의 evaluate/execute_script로 수집(element_metadata),
+  id/class/텍스트/역할 인덱스로 후보를 좁힌 뒤 점수가 가장 높은 요소 선택
+- 치유 결과는 JSONL로 기록 (코드 수정용: failed_locator -> healed_locator) 하고 리포트 user_properties에 추가 (conftest)
+
+사용 (test_utils를 통해):
+    heal_locator(page, "#login-btn").click()
+    heal_find_element(driver, By.ID, "login-btn").click()
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import tempfile
+import threading
+from urllib.parse import urlsplit
+from typing import Optional, Dict, Any, List, Tuple, Iterable
+
+import element_metadata
+
+# locator별 마지막으로 찾은 요소 기록 (실행 간 공유)
+FINGERPRINT_FILE = os.getenv(
+    "TEST_LOCATOR_FINGERPRINTS",
+    os.path.join(os.path.expanduser("~"), ".testarchitect", "locator-fingerprints.json")
+)
+
+# 치유 결과 기록 (JSONL, 코드 수정용)
+HEALED_FILE = os.getenv("TEST_HEALED_LOCATORS", ".pytest-reports/healed-locators.jsonl")
+
+# 점수 가중치 (요소 기록과 같은 값이면 더함)
+WEIGHTS = {
+    "id": 40,
+    "data-testid": 35,
+    "name": 25,
+    "aria-label": 20,
+    "text": 25,
+    "role": 10,
+    "tag": 5,
+    "class": 15,
+}
+
+# 태그 -> 암묵적 역할 (role 속성이 없을 때)
+_IMPLICIT_ROLES = {
+    "a": "link", "button": "button", "summary": "button", "select": "combobox", "textarea": "textbox",
+    "option": "option", "img": "img", "nav": "navigation", "form": "form", "table": "table",
+    "ul": "list", "ol": "list", "li": "listitem", "dialog": "dialog",
+    "h1": "heading", "h2": "heading", "h3": "heading", "h4": "heading", "h5": "heading", "h6": "heading",
+}
+_INPUT_ROLES = {"checkbox": "checkbox", "radio": "radio", "button": "button", "submit": "button",
+                "reset": "button", "image": "button", "range": "slider", "search": "searchbox"}
+
+# 요소를 찾지 못한 경우의 예외 (드라이버 패키지를 import하지 않도록 이름으로 판별)
+_NOT_FOUND_ERRORS = ("TimeoutError", "NoSuchElementException", "TimeoutException")
+
+_SPACE_RE = re.compile(r"\s+")
+
+
+def _norm_text(text: Optional[str]) -> str:
+    return _SPACE_RE.sub(" ", text or "").strip().lower()
+
+
+def element_role(element: Dict[str, Any]) -> Optional[str]:
+    """명시한 role 속성 또는 태그/type으로 정해지는 암묵적 역할"""
+    attrs = element.get("attrs") or {}
+    if attrs.get("role"):
+        return attrs["role"]
+    tag = element.get("tag")
+    if tag == "input":
+        return _INPUT_ROLES.get(attrs.get("type", "text"), "textbox")
+    return _IMPLICIT_ROLES.get(tag)
+
+
+def _attribute(element: Dict[str, Any], name: str) -> Optional[str]:
+    if name.startswith("data-"):
+        return (element.get("dataAttrs") or {}).get(name)
+    return (element.get("attrs") or {}).get(name)
+
+
+def score(fingerprint: Dict[str, Any], element: Dict[str, Any]) -> Tuple[int, str]:
+    """요소 기록과 후보 요소의 유사도 점수와 가장 크게 기여한 특징"""
+    parts: Dict[str, float] = {}
+    if fingerprint.get("id") and fingerprint["id"] == element.get("id"):
+        parts["id"] = WEIGHTS["id"]
+    for name in ("data-testid", "name", "aria-label"):
+        value = _attribute(fingerprint, name)
+        if value and value == _attribute(element, name):
+            parts[name] = WEIGHTS[name]
+    text, candidate_text = _norm_text(fingerprint.get("text")), _norm_text(element.get("text"))
+    if text and candidate_text:
+        if text == candidate_text:
+            parts["text"] = WEIGHTS["text"]
+        elif text in candidate_text or candidate_text in text:
+            parts["text"] = WEIGHTS["text"] * 0.4
+    role = element_role(fingerprint)
+    if role and role == element_role(element):
+        parts["role"] = WEIGHTS["role"]
+    if fingerprint.get("tag") and fingerprint["tag"] == element.get("tag"):
+        parts["tag"] = WEIGHTS["tag"]
+    classes, candidate_classes = set(fingerprint.get("classes") or ()), set(element.get("classes") or ())
+    if classes and candidate_classes:
+        parts["class"] = WEIGHTS["class"] * len(classes & candidate_classes) / len(classes | candidate_classes)
+    if not parts:
+        return 0, ""
+    return round(sum(parts.values())), max(parts, key=parts.get)
+
+
+class ElementIndex:
+    """
+    현재 페이지 후보 요소 인덱스 (id, class, 텍스트, 역할, 주요 속성별)
+
+    요소 기록과 같은 값을 가진 후보만 점수를 계산
+    """
+
+    def __init__(self, elements: Iterable[Dict[str, Any]]):
+        self.elements = [element for element in elements if element.get("css")]
+        self.by_id: Dict[str, List[int]] = {}
+        self.by_class: Dict[str, List[int]] = {}
+        self.by_text: Dict[str, List[int]] = {}
+        self.by_role: Dict[str, List[int]] = {}
+        self.by_attr: Dict[Tuple[str, str], List[int]] = {}
+        for position, element in enumerate(self.elements):
+            if element.get("id"):
+                self.by_id.setdefault(element["id"], []).append(position)
+            for class_name in element.get("classes") or ():
+                self.by_class.setdefault(class_name, []).append(position)
+            text = _norm_text(element.get("text"))
+            if text:
+                self.by_text.setdefault(text, []).append(position)
+            role = element_role(element)
+            if role:
+                self.by_role.setdefault(role, []).append(position)
+            for name in ("data-testid", "name", "aria-label"):
+                value = _attribute(element, name)
+                if value:
+                    self.by_attr.setdefault((name, value), []).append(position)
+
+    def candidates(self, fingerprint: Dict[str, Any]) -> List[int]:
+        found = set(self.by_id.get(fingerprint.get("id") or "", ()))
+        for class_name in fingerprint.get("classes") or ():
+            found.update(self.by_class.get(class_name, ()))
+        text = _norm_text(fingerprint.get("text"))
+        if text:
+            found.update(self.by_text.get(text, ()))
+            # 텍스트가 조금 바뀐 경우 (부분 일치)
+            found.update(position for key, positions in self.by_text.items()
+                         if text in key or key in text for position in positions)
+        for name in ("data-testid", "name", "aria-label"):
+            value = _attribute(fingerprint, name)
+            if value:
+                found.update(self.by_attr.get((name, value), ()))
+        # 역할만 같은 후보는 다른 특징이 하나도 맞지 않을 때만 사용
+        if not found:
+            found.update(self.by_role.get(element_role(fingerprint) or "", ()))
+        return sorted(found)
+
+    def best_match(self, fingerprint: Dict[str, Any], min_score: int) -> Optional[Tuple[Dict[str, Any], int, str]]:
+        """(요소, 점수, 특징) 또는 None (min_score 미만이거나 같은 점수의 후보가 여럿이면 None)"""
+        ranked = sorted(((score(fingerprint, self.elements[position]), position)
+                         for position in self.candidates(fingerprint)),
+                        key=lambda item: (-item[0][0], item[1]))
+        if not ranked or ranked[0][0][0] < min_score:
+            return None
+        if len(ranked) > 1 and ranked[1][0][0] == ranked[0][0][0]:
+            return None
+        (points, method), position = ranked[0]
+        return self.elements[position], points, method
+
+
+_CSS_ID_RE = re.compile(r"#([\w-]+)")
+_CSS_CLASS_RE = re.compile(r"\.([\w-]+)")
+_CSS_ATTR_RE = re.compile(r"""\[([\w-]+)=["']([^"']*)["']\]""")
+_CSS_TAG_RE = re.compile(r"^([a-zA-Z][\w-]*)")
+_TEXT_RE = re.compile(r"""(?:has-text|text\(\)\s*,|text\(\)\s*=|contains\(\s*text\(\)\s*,|normalize-space\(\)\s*=)\s*\(?\s*["']([^"']+)["']""")
+_XPATH_ATTR_RE = re.compile(r"""@([\w-]+)\s*=\s*["']([^"']*)["']""")
+_XPATH_TAG_RE = re.compile(r"/([a-zA-Z][\w-]*)\s*(?:\[[^\]]*\]\s*)*$")
+
+
+def fingerprint_from_locator(by: str, value: str) -> Dict[str, Any]:
+    """
+    기록이 없을 때 locator 자체에서 요소 특징 추정 (마지막 단계의 selector 기준)
+
+    by: "css", "xpath", "text" 또는 Selenium By 값 ("id", "class name", "name", "link text" 등)
+    """
+    fingerprint: Dict[str, Any] = {"attrs": {}, "dataAttrs": {}}
+    if by == "id":
+        fingerprint["id"] = value
+    elif by == "class name":
+        fingerprint["classes"] = value.split()
+    elif by == "name":
+        fingerprint["attrs"]["name"] = value
+    elif by in ("link text", "partial link text"):
+        fingerprint.update(tag="a", text=value)
+    elif by == "tag name":
+        fingerprint["tag"] = value
+    elif by == "text":
+        fingerprint["text"] = value
+    else:
+        last = re.split(r"\s*>>\s*|\s*>\s*|\s+(?![^\[]*\])", value.strip())[-1] if by == "css" else value
+        if by == "css" and last.startswith("text="):
+            fingerprint["text"] = last[len("text="):].strip("\"'")
+        id_match = _CSS_ID_RE.search(last) if by == "css" else None
+        if id_match:
+            fingerprint["id"] = id_match.group(1)
+        if by == "css":
+            classes = _CSS_CLASS_RE.findall(re.sub(r"\[[^\]]*\]", "", last))
+            if classes:
+                fingerprint["classes"] = classes
+        tag = _CSS_TAG_RE.match(last) if by == "css" else _XPATH_TAG_RE.search(last)
+        if tag:
+            fingerprint["tag"] = tag.group(1).lower()
+        for name, attr_value in (_CSS_ATTR_RE.findall(last) if by == "css" else _XPATH_ATTR_RE.findall(last)):
+            if name == "id":
+                fingerprint["id"] = attr_value
+            elif name == "class":
+                fingerprint["classes"] = attr_value.split()
+            elif name.startswith("data-"):
+                fingerprint["dataAttrs"][name] = attr_value
+            else:
+                fingerprint["attrs"][name] = attr_value
+        text = _TEXT_RE.search(last)
+        if text:
+            fingerprint["text"] = text.group(1)
+    return fingerprint
+
+
+def _fingerprint_values(fingerprint: Dict[str, Any]) -> List[str]:
+    """후보 수집 시 함께 찾을 값"""
+    values = [fingerprint.get("id"), fingerprint.get("text")]
+    values.extend(_attribute(fingerprint, name) for name in ("data-testid", "name", "aria-label"))
+    return [value for value in values if value and len(value) <= 80]
+
+
+class FingerprintStore:
+    """
+    페이지 경로 + locator별 마지막으로 찾은 요소 기록 (JSON 파일)
+
+    세션 종료 시 파일을 다시 읽어 합친 뒤 원자적으로 교체 (xdist 워커가 동시에 저장해도 다른 워커 기록 유지)
+    """
+
+    def __init__(self, path: str = FINGERPRINT_FILE):
+        self.path = path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty: Dict[str, Dict[str, Any]] = {}
+
+    @staticmethod
+    def key(page_url: str, locator: str) -> str:
+        parts = urlsplit(page_url or "")
+        return f"{parts.netloc}{parts.path}\u0000{locator}"
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                entries = json.load(f)
+            return entries if isinstance(entries, dict) else {}
+        except (OSError, ValueError):
+            return {}
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._load()
+        return self._dirty.get(key) or self._entries.get(key)
+
+    def put(self, key: str, fingerprint: Dict[str, Any]) -> None:
+        self._dirty[key] = fingerprint
+
+    def save(self) -> int:
+        """변경된 기록 저장, 저장한 항목 수 반환"""
+        if not self._dirty:
+            return 0
+        entries = self._load()
+        entries.update(self._dirty)
+        directory = os.path.dirname(self.path) or "."
+        try:
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"[SelfHealing] 요소 기록 저장 실패: {e}")
+            return 0
+        saved = len(self._dirty)
+        self._entries = entries
+        self._dirty = {}
+        return saved
+
+
+class SelfHealer:
+    """
+    locator 기록/치유 (프로세스 공용, get_healer()로 사용)
+
+    Args:
+        store: 요소 기록 저장소
+        healed_path: 치유 결과 JSONL 경로
+        min_score: 치유에 사용할 최소 점수 (id만 같으면 40, 텍스트+역할+태그가 같으면 40)
+        wait_ms: 원래 locator를 기다리는 시간 (이후 치유 시도)
+        enabled: False이면 기록/치유 없이 원래 locator만 사용
+    """
+
+    def __init__(self, store: FingerprintStore, healed_path: str = HEALED_FILE, min_score: int = 40,
+                 wait_ms: int = 5000, enabled: bool = True):
+        self.store = store
+        self.healed_path = healed_path
+        self.min_score = min_score
+        self.wait_ms = wait_ms
+        self.enabled = enabled
+        # 이번 세션에 이미 기록한 키 (요소 기록은 locator당 한 번만)
+        self._recorded = set()
+        # 리포트에 아직 추가하지 않은 치유 결과
+        self._pending: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        self.stats = {
+            "steps": 0,
+            "healed": 0,
+            "heal_failed": 0,
+            "fingerprints": 0,
+            "heal_ms": 0.0,
+            "max_heal_ms": 0.0,
+        }
+
+    def should_record(self, key: str) -> bool:
+        with self._lock:
+            if key in self._recorded:
+                return False
+            self._recorded.add(key)
+            return True
+
+    def record(self, key: str, fingerprint: Any) -> None:
+        if isinstance(fingerprint, dict):
+            fingerprint.pop("css", None)
+            self.store.put(key, fingerprint)
+            self.stats["fingerprints"] += 1
+
+    def heal(self, target, by: str, value: str, page_url: str) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """
+        현재 페이지에서 대체 요소의 CSS selector 찾기
+
+        target: Playwright 페이지 또는 Selenium 드라이버
+        Returns: (CSS selector, 치유 결과) 또는 None
+        """
+        start = time.perf_counter()
+        key = self.store.key(page_url, value)
+        fingerprint = self.store.get(key) or fingerprint_from_locator(by, value)
+        try:
+            metadata = element_metadata.evaluate(
+                target, element_metadata.COLLECT_SCRIPT,
+                element_metadata.arguments(value, extra_values=_fingerprint_values(fingerprint), selectors=True)
+            )
+            match = ElementIndex(metadata.get("elements") or ()).best_match(fingerprint, self.min_score)
+        except Exception as e:
+            print(f"[SelfHealing] 후보 요소 수집 실패: {e}")
+            match = None
+        elapsed = (time.perf_counter() - start) * 1000
+        self.stats["heal_ms"] = round(self.stats["heal_ms"] + elapsed, 1)
+        self.stats["max_heal_ms"] = max(self.stats["max_heal_ms"], round(elapsed, 1))
+        if match is None:
+            self.stats["heal_failed"] += 1
+            return None
+
+        element, points, method = match
+        healed = {
+            "nodeid": os.getenv("PYTEST_CURRENT_TEST", "").rsplit(" (", 1)[0] or None,
+            "failed_locator": value,
+            "locator_by": by,
+            "healed_locator": element["css"],
+            "healing_method": method,
+            "confidence": min(100, points),
+            "page_url": page_url,
+            "timestamp": round(time.time(), 3),
+        }
+        healed.update(_caller_location())
+        self.stats["healed"] += 1
+        with self._lock:
+            self._pending.append(healed)
+        self._write(healed)
+        print(f"[SelfHealing] locator 치유: {value} -> {element['css']} ({method}, 점수 {points})")
+        return element["css"], healed
+
+    def take_pending(self) -> List[Dict[str, Any]]:
+        """리포트에 추가할 치유 결과 (가져가면 비움)"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        return pending
+
+    def _write(self, healed: Dict[str, Any]) -> None:
+        try:
+            directory = os.path.dirname(self.healed_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # 한 줄 단위 append (xdist 워커가 같은 파일에 써도 줄이 섞이지 않음)
+            with open(self.healed_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(healed, ensure_ascii=False) + "\n")
+        except OSError as e:
+            print(f"[SelfHealing] 치유 결과 기록 실패: {e}")
+
+
+def _caller_location() -> Dict[str, Any]:
+    """이 모듈/test_utils 밖의 첫 호출 위치 (코드 수정 대상)"""
+    skipped = {os.path.abspath(__file__)}
+    test_utils = sys.modules.get("test_utils")
+    if test_utils is not None and getattr(test_utils, "__file__", None):
+        skipped.add(os.path.abspath(test_utils.__file__))
+    frame = sys._getframe(1)
+    while frame is not None and os.path.abspath(frame.f_code.co_filename) in skipped:
+        frame = frame.f_back
+    if frame is None:
+        return {}
+    return {"test_file": frame.f_code.co_filename, "test_function": frame.f_code.co_name,
+            "line_number": frame.f_lineno}
+
+
+def _is_not_found(error: BaseException) -> bool:
+    return type(error).__name__ in _NOT_FOUND_ERRORS
+
+
+class HealingLocator:
+    """
+    Playwright locator 대리 객체 (sync API)
+
+    액션 메서드를 호출하면 원래 locator를 wait_ms 동안 기다리고, 찾지 못하면 치유한 locator로 그 액션만 실행
+    """
+
+    def __init__(self, healer: SelfHealer, page, selector: str, wait_ms: Optional[int] = None):
+        self._healer = healer
+        self._page = page
+        self._selector = selector
+        self._wait_ms = healer.wait_ms if wait_ms is None else wait_ms
+        self._resolved = None
+
+    @property
+    def selector(self) -> str:
+        return self._selector
+
+    def _locator(self):
+        if self._resolved is not None:
+            return self._resolved
+        healer = self._healer
+        locator = self._page.locator(self._selector)
+        if not healer.enabled:
+            return locator
+        healer.stats["steps"] += 1
+        try:
+            # 여러 요소를 가리키는 locator도 그대로 쓸 수 있도록 첫 요소 기준 (wait_for는 strict)
+            locator.first.wait_for(state="attached", timeout=self._wait_ms)
+        except Exception as e:
+            if not _is_not_found(e):
+                raise
+            healed = healer.heal(self._page, "css", self._selector, self._page.url)
+            if healed is None:
+                raise
+            locator = self._page.locator(healed[0])
+        else:
+            key = healer.store.key(self._page.url, self._selector)
+            if healer.should_record(key):
+                try:
+                    healer.record(key, element_metadata.evaluate(locator.first, element_metadata.DESCRIBE_SCRIPT, None))
+                except Exception:
+                    # 기록 실패는 무시 (요소가 바로 사라진 경우 등)
+                    pass
+        self._resolved = locator
+        return locator
+
+    def __getattr__(self, name: str):
+        return getattr(self._locator(), name)
+
+
+def find_element(healer: SelfHealer, driver, by: str, value: str, wait_ms: Optional[int] = None):
+    """Selenium find_element + 치유 (wait_ms 동안 원래 locator를 다시 찾은 뒤 치유 시도)"""
+    if not healer.enabled:
+        return driver.find_element(by, value)
+    healer.stats["steps"] += 1
+    deadline = time.monotonic() + (healer.wait_ms if wait_ms is None else wait_ms) / 1000
+    while True:
+        try:
+            element = driver.find_element(by, value)
+            break
+        except Exception as e:
+            if not _is_not_found(e):
+                raise
+            if time.monotonic() < deadline:
+                time.sleep(0.1)
+                continue
+            healed = healer.heal(driver, by, value, driver.current_url)
+            if healed is None:
+                raise
+            return driver.find_element("css selector", healed[0])
+
+    key = healer.store.key(driver.current_url, value)
+    if healer.should_record(key):
+        try:
+            healer.record(key, element_metadata.evaluate(driver, element_metadata.DESCRIBE_SCRIPT, element))
+        except Exception:
+            pass
+    return element
+
+
+def create_from_env() -> SelfHealer:
+    """환경 변수 설정으로 생성"""
+    return SelfHealer(
+        FingerprintStore(FINGERPRINT_FILE),
+        healed_path=HEALED_FILE,
+        min_score=int(os.getenv("TEST_SELF_HEAL_MIN_SCORE", "40")),
+        wait_ms=int(os.getenv("TEST_SELF_HEAL_WAIT_MS", "5000")),
+        enabled=os.getenv("TEST_SELF_HEAL", "true").lower() == "true",
+    )
+
+
+_healer: Optional[SelfHealer] = None
+
+
+def get_healer() -> SelfHealer:
+    """프로세스 공용 치유기"""
+    global _healer
+    if _healer is None:
+        _healer = create_from_env()
+    return _healer
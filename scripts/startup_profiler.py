@@ -0,0 +1,219 @@
+"""
+시작 시간 프로파일러 (pytest 플러그인)
+플러그인 import/등록, 훅 구현, fixture setup에 걸린 시간을 측정해 실행 끝에 요약
+
+다른 플러그인보다 먼저 로드되어야 하므로 -p로 지정:
+    pytest -p startup_profiler --collect-only
+    pytest -p startup_profiler --profile-startup-json=.pytest-reports/startup.json test_example.py
+
+측정 방식:
+- 플러그인: 직전 플러그인 등록 이후 경과 시간 (setuptools 엔트리포인트 import + 등록 시간)
+  이 모듈보다 먼저 등록된 pytest 내장 플러그인은 측정하지 않음
+- 훅: 래퍼가 아닌 훅 구현 함수마다 실행 시간 (시작 단계 / 테스트 실행 단계 구분)
+- fixture: pytest_fixture_setup 실행 시간 (fixture 이름 + scope별)
+"""
+
+import functools
+import json
+import os
+import sys
+import time
+from typing import Dict, Any, List, Tuple
+
+import pytest
+
+# 모듈이 import된 시점 (측정 기준점)
+_LOADED_AT = time.perf_counter()
+
+# 터미널 요약에 표시할 항목 수
+TOP_N = int(os.getenv("PYTEST_STARTUP_PROFILE_TOP", "10"))
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 2)
+
+
+class StartupProfiler:
+    """플러그인/훅/fixture 시간 측정기"""
+
+    def __init__(self):
+        self.marks: Dict[str, float] = {"profiler_loaded": _LOADED_AT}
+        # [(플러그인 이름, 직전 등록 이후 경과 시간)]
+        self.plugins: List[Tuple[str, float]] = []
+        # (단계, 플러그인, 훅) -> [호출 수, 총 시간, 최대 시간]
+        self.hooks: Dict[Tuple[str, str, str], List[float]] = {}
+        # (fixture, scope) -> [호출 수, 총 시간, 최대 시간]
+        self.fixtures: Dict[Tuple[str, str], List[float]] = {}
+        self.phase = "startup"
+        self._last_registered = None
+        self._wrapped = set()
+        self._registered = False
+
+    # ------------------------------------------------------------------
+    # 측정
+    # ------------------------------------------------------------------
+
+    def mark(self, name: str) -> None:
+        self.marks.setdefault(name, time.perf_counter())
+
+    @staticmethod
+    def _add(table: Dict, key, elapsed: float) -> None:
+        entry = table.get(key)
+        if entry is None:
+            table[key] = [1, elapsed, elapsed]
+        else:
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[2] = max(entry[2], elapsed)
+
+    def plugin_registered(self, plugin, plugin_name: str, manager) -> None:
+        now = time.perf_counter()
+        if plugin is sys.modules[__name__] and not self._registered:
+            # 이 모듈이 등록된 시점부터 측정 (먼저 등록된 플러그인은 훅만 측정)
+            self._registered = True
+            manager.register(self, "startup_profiler_instance")
+        elif self._last_registered is not None:
+            self.plugins.append((self._short_name(plugin_name), now - self._last_registered))
+        self._wrap_hookimpls(plugin, plugin_name, manager)
+        if self._registered:
+            # 훅 래핑 시간은 다음 플러그인 시간에 포함하지 않음
+            self._last_registered = time.perf_counter()
+
+    def _wrap_hookimpls(self, plugin, plugin_name: str, manager) -> None:
+        """플러그인의 훅 구현 함수를 시간 측정 함수로 교체 (훅 래퍼는 제외)"""
+        if plugin is self or plugin is sys.modules[__name__] or id(plugin) in self._wrapped:
+            return
+        self._wrapped.add(id(plugin))
+        name = self._short_name(plugin_name)
+        for caller in manager.get_hookcallers(plugin) or ():
+            for impl in caller.get_hookimpls():
+                if impl.plugin is not plugin or impl.hookwrapper or getattr(impl, "wrapper", False):
+                    continue
+                impl.function = self._timed(impl.function, name, caller.name)
+
+    def _timed(self, function, plugin_name: str, hook_name: str):
+        @functools.wraps(function)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self._add(self.hooks, (self.phase, plugin_name, hook_name), time.perf_counter() - start)
+        return timed
+
+    @staticmethod
+    def _short_name(plugin_name: str) -> str:
+        # conftest는 전체 경로로 등록되므로 상위 디렉토리/파일명만 표시
+        if os.path.isabs(plugin_name):
+            return os.path.join(os.path.basename(os.path.dirname(plugin_name)), os.path.basename(plugin_name))
+        return plugin_name
+
+    # ------------------------------------------------------------------
+    # pytest 훅
+    # ------------------------------------------------------------------
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_configure(self, config):
+        self.mark("configure")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self, session):
+        self.mark("session_start")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_collection(self, session):
+        self.mark("collection_start")
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_finish(self, session):
+        self.mark("collection_finish")
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtestloop(self, session):
+        self.mark("runtestloop")
+        self.phase = "run"
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_logfinish(self, nodeid, location):
+        self.mark("first_test_finished")
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        start = time.perf_counter()
+        yield
+        self._add(self.fixtures, (fixturedef.argname, fixturedef.scope), time.perf_counter() - start)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.mark("session_finish")
+        path = session.config.getoption("profile_startup_json", None)
+        if path:
+            directory = os.path.dirname(os.path.abspath(path))
+            os.makedirs(directory, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.summary(), f, ensure_ascii=False, indent=2)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        summary = self.summary()
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("-", "시작 시간 프로파일 (프로파일러 로드 기준, ms)")
+        write("단계: " + ", ".join(f"{name}={value}" for name, value in summary["phases"].items()))
+
+        write(f"플러그인 import/등록 (상위 {TOP_N}):")
+        for entry in summary["plugins"][:TOP_N]:
+            write(f"  {entry['ms']:>9.2f}  {entry['plugin']}")
+
+        write(f"훅 구현 - 시작 단계 (상위 {TOP_N}):")
+        for entry in [e for e in summary["hooks"] if e["phase"] == "startup"][:TOP_N]:
+            write(f"  {entry['total_ms']:>9.2f}  {entry['plugin']}::{entry['hook']} (호출 {entry['calls']}회)")
+
+        write(f"fixture setup (상위 {TOP_N}):")
+        for entry in summary["fixtures"][:TOP_N]:
+            write(f"  {entry['total_ms']:>9.2f}  {entry['fixture']} [{entry['scope']}] "
+                  f"(호출 {entry['calls']}회, 최대 {entry['max_ms']})")
+
+    # ------------------------------------------------------------------
+    # 결과
+    # ------------------------------------------------------------------
+
+    def summary(self) -> Dict[str, Any]:
+        """측정 결과 (시간 순 단계 + 항목별 상위 정렬)"""
+        phases = {
+            name: _ms(at - _LOADED_AT)
+            for name, at in sorted(self.marks.items(), key=lambda item: item[1])
+            if name != "profiler_loaded"
+        }
+        plugins = sorted(
+            ({"plugin": name, "ms": _ms(elapsed)} for name, elapsed in self.plugins),
+            key=lambda entry: -entry["ms"]
+        )
+        hooks = sorted(
+            ({"phase": phase, "plugin": plugin, "hook": hook,
+              "calls": int(calls), "total_ms": _ms(total), "max_ms": _ms(peak)}
+             for (phase, plugin, hook), (calls, total, peak) in self.hooks.items()),
+            key=lambda entry: -entry["total_ms"]
+        )
+        fixtures = sorted(
+            ({"fixture": name, "scope": scope,
+              "calls": int(calls), "total_ms": _ms(total), "max_ms": _ms(peak)}
+             for (name, scope), (calls, total, peak) in self.fixtures.items()),
+            key=lambda entry: -entry["total_ms"]
+        )
+        return {"phases": phases, "plugins": plugins, "hooks": hooks, "fixtures": fixtures}
+
+
+_profiler = StartupProfiler()
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--profile-startup-json",
+        action="store",
+        default=os.getenv("PYTEST_STARTUP_PROFILE_JSON", ""),
+        help="시작 시간 프로파일 결과를 저장할 JSON 파일 경로 (-p startup_profiler와 함께 사용)"
+    )
+
+
+def pytest_plugin_registered(plugin, plugin_name, manager):
+    # historic 훅: 이 모듈 등록 시 이미 등록된 플러그인에 대해서도 호출됨
+    _profiler.plugin_registered(plugin, plugin_name, manager)
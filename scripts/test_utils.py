@@ -3,189 +3,397 @@
 공통으로 사용되는 헬퍼 함수들을 정의
 """
 
+import os
 import re
 import ast
-import inspect
+from functools import lru_cache
 from urllib.parse import urlparse
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple
 
 
 def normalize_url(url):
     """URL 정규화: 쿼리 파라미터를 제거하여 기본 경로만 반환"""
     if not url:
         return url
+    return _normalize_url_cached(url)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_url_cached(url: str) -> str:
+    # 폴링 중에는 같은 URL이 반복되므로 urlparse 결과를 캐시
     try:
         parsed = urlparse(url)
         return f"{parsed.scheme}://{parsed.netloc}{parsed.path}"
-    except:
+    except ValueError:
         # URL 파싱 실패 시 쿼리 스트링만 제거
-        query_index = url.find('?')
-        return url[:query_index] if query_index != -1 else url
+        return _strip_query(url)
+
+
+def _strip_query(url: str) -> str:
+    query_index = url.find('?')
+    return url[:query_index] if query_index != -1 else url
+
+
+def normalize_urls(urls: List[str]) -> List[str]:
+    """여러 URL을 한 번에 정규화 (중복 URL은 캐시된 결과 사용)"""
+    return [normalize_url(url) for url in urls]
+
+
+URL_MATCH_MODES = ('exact', 'prefix', 'contains', 'pattern')
+
+
+class UrlMatcher:
+    """
+    정규화된 URL 비교 조건
+
+    기대값은 생성 시 한 번만 정규화(pattern은 컴파일)하므로 폴링마다 비용이 거의 없음
+    - Playwright: page.wait_for_url(matcher) - URL 문자열을 받음
+    - Selenium: WebDriverWait(driver, 10).until(matcher) - driver를 받으면 current_url 사용
+    """
+
+    __slots__ = ('expected', 'mode', '_test')
+
+    def __init__(self, expected: str, mode: str = 'exact'):
+        if mode not in URL_MATCH_MODES:
+            raise ValueError(f"지원하지 않는 URL 비교 방식: {mode} (사용 가능: {', '.join(URL_MATCH_MODES)})")
+        self.mode = mode
+
+        if mode == 'pattern':
+            self.expected = expected
+            self._test = re.compile(expected).search
+            return
+
+        # 절대 URL은 실제 URL과 같은 방식으로 정규화, 경로 조각 등은 쿼리만 제거
+        self.expected = normalize_url(expected) if '://' in expected else _strip_query(expected)
+        if mode == 'exact':
+            self._test = self.expected.__eq__
+        elif mode == 'prefix':
+            self._test = lambda url: url.startswith(self.expected)
+        else:
+            self._test = lambda url: self.expected in url
+
+    def __call__(self, url_or_driver) -> bool:
+        url = url_or_driver if isinstance(url_or_driver, str) else url_or_driver.current_url
+        return bool(self._test(normalize_url(url) or ''))
+
+    def __repr__(self) -> str:
+        return f"UrlMatcher({self.expected!r}, mode={self.mode!r})"
+
+
+@lru_cache(maxsize=256)
+def make_url_matcher(expected: str, mode: str = 'exact') -> UrlMatcher:
+    """
+    URL 비교 조건 생성 (같은 인자로 다시 호출하면 같은 객체 반환)
+
+    Args:
+        expected: 기대 URL (pattern 모드에서는 정규식)
+        mode: 'exact' | 'prefix' | 'contains' | 'pattern'
+
+    Returns:
+        URL 문자열 또는 Selenium driver를 받아 bool을 반환하는 UrlMatcher
+    """
+    return UrlMatcher(expected, mode)
+
+
+# ============================================================================
+# 실패 분류기 (사전 컴파일된 결합 정규식으로 traceback을 한 번만 스캔)
+# ============================================================================
+
+# 분석할 텍스트 최대 길이 (예외 정보는 traceback 끝부분에 있으므로 뒤쪽을 남김)
+MAX_SCAN_CHARS = 16 * 1024
+
+# 프레임워크/locator/URL/프레임 신호를 한 번에 찾는 결합 정규식
+# 같은 위치에서는 먼저 나열된 대안이 우선하므로 구체적인 패턴을 앞에 둠
+# (실패가 있을 때만 필요하므로 컴파일은 첫 사용 시 한 번)
+_FAILURE_SIGNAL_PATTERN = r"""
+      (?P<pw_action>Locator\.(?:click|fill|press|wait_for|locator|check|uncheck|hover|dblclick|type|select_option|set_input_files))
+    | (?P<se_error>(?:NoSuchElementException|ElementNotFoundError)
+        (?:[^\n]*?(?P<se_attr>\w+)\s*=\s*['"](?P<se_attr_value>[^'"\n]+)['"])?)
+    | (?P<se_module>selenium\.common\.exceptions)
+    | (?P<pw_timeout>TimeoutError)
+    | locator\(\s*(?P<q1>['"])(?P<pw_locator>(?:(?!(?P=q1))[^\n])+)(?P=q1)\s*[,)]
+    | :has-text\((?P<q2>['"])(?P<pw_has_text>(?:(?!(?P=q2))[^\n])+)(?P=q2)\)
+    | text=(?P<q3>['"])(?P<pw_text>[^'"\n]+)(?P=q3)
+    | "selector"\s*:\s*"(?P<se_selector>[^"\n]+)"
+    | (?i:navigating\ to)\ ['"](?P<url_navigating>[^'"\n]+)['"]
+    | (?i:url):\s*['"](?P<url_field>[^'"\n]+)['"]
+    | (?i:page\.goto)\(['"](?P<url_goto>[^'"\n]+)['"]\)
+    | (?i:driver\.get)\(['"](?P<url_get>[^'"\n]+)['"]\)
+    | File\ "(?P<tb_file>[^"\n]+)",\ line\ (?P<tb_line>\d+)
+    | ^(?P<short_file>[^\s:][^\n:]*\.py):(?P<short_line>\d+):
+    """
+
+
+@lru_cache(maxsize=None)
+def _failure_signal_re():
+    return re.compile(_FAILURE_SIGNAL_PATTERN, re.VERBOSE | re.MULTILINE)
+
+
+# 같은 종류의 신호가 여러 개면 앞쪽 그룹이 우선
+_PLAYWRIGHT_LOCATOR_GROUPS = ('pw_locator', 'pw_has_text', 'pw_text')
+_URL_GROUPS = ('url_navigating', 'url_field', 'url_goto', 'url_get')
+
+
+def _relevant_failure_text(longrepr, source_file: Optional[str]) -> Tuple[str, List[Tuple[str, int]]]:
+    """
+    분석 대상 텍스트와 프레임 위치 추출
+
+    pytest의 구조화된 longrepr이 있으면 전체 traceback을 문자열로 만들지 않고
+    테스트 파일 프레임, 마지막(예외가 발생한) 프레임, 예외 메시지만 사용
+
+    Returns:
+        (분석할 텍스트, [(파일 경로, 라인 번호), ...])
+    """
+    reprtraceback = getattr(longrepr, 'reprtraceback', None)
+    entries = getattr(reprtraceback, 'reprentries', None)
+    if not entries:
+        text = longrepr if isinstance(longrepr, str) else str(longrepr)
+        return text[-MAX_SCAN_CHARS:], []
+
+    frames: List[Tuple[str, int]] = []
+    # 예외 메시지를 먼저 두어 소스 코드 라인보다 우선 매칭되도록 함
+    crash = getattr(longrepr, 'reprcrash', None)
+    parts: List[str] = [crash.message] if crash is not None else []
+    last_index = len(entries) - 1
+    for i, entry in enumerate(entries):
+        fileloc = getattr(entry, 'reprfileloc', None)
+        in_source = False
+        if fileloc is not None:
+            frames.append((fileloc.path, fileloc.lineno))
+            in_source = bool(source_file) and _same_file(fileloc.path, source_file)
+        if i == last_index or in_source:
+            parts.extend(entry.lines)
+
+    return '\n'.join(parts)[:MAX_SCAN_CHARS], frames
+
+
+def _same_file(frame_path: str, source_file: str) -> bool:
+    """traceback 경로(상대 경로일 수 있음)가 소스 파일을 가리키는지 확인"""
+    frame_path = frame_path.replace('\\', '/')
+    source_file = source_file.replace('\\', '/')
+    return source_file.endswith(frame_path) or frame_path.endswith(source_file)
+
+
+def classify_failure(longrepr, source_file: Optional[str] = None) -> Dict[str, Any]:
+    """
+    실패 traceback 분류
+
+    Args:
+        longrepr: pytest 리포트의 longrepr 또는 traceback 문자열
+        source_file: 테스트 소스 파일 경로 (해당 파일의 프레임 라인을 우선 사용)
+
+    Returns:
+        {'framework', 'locator', 'locator_failure', 'line_number', 'page_url', 'error_message'}
+        (찾지 못한 항목은 None, locator_failure는 프레임워크/timeout/요소 없음 신호가 있었는지 여부,
+        error_message는 분석한 텍스트)
+    """
+    text, frames = _relevant_failure_text(longrepr, source_file)
+
+    first: Dict[str, str] = {}
+    text_frames: List[Tuple[str, int]] = []
+    for match in _failure_signal_re().finditer(text):
+        kind = match.lastgroup
+        if kind == 'tb_line':
+            text_frames.append((match.group('tb_file'), int(match.group('tb_line'))))
+        elif kind == 'short_line':
+            text_frames.append((match.group('short_file'), int(match.group('short_line'))))
+        for name, value in match.groupdict().items():
+            if value is not None and name not in first:
+                first[name] = value
+
+    # 프레임 위치: 구조화된 traceback 우선, 없으면 텍스트에서 찾은 위치
+    frames = frames or text_frames
+    line_number = None
+    if frames:
+        line_number = frames[0][1]
+        if source_file:
+            for path, lineno in frames:
+                if _same_file(path, source_file):
+                    line_number = lineno
+                    break
+
+    framework = None
+    locator = None
+    playwright_locator = next((first[g] for g in _PLAYWRIGHT_LOCATOR_GROUPS if g in first), None)
+    if 'pw_action' in first or ('pw_timeout' in first and playwright_locator):
+        framework = 'playwright'
+        locator = playwright_locator
+    if locator is None and ('se_error' in first or 'se_module' in first):
+        framework = 'selenium'
+        locator = first.get('se_attr_value') or first.get('se_selector')
+
+    return {
+        'framework': framework,
+        'locator': locator,
+        'locator_failure': framework is not None or 'pw_timeout' in first,
+        'line_number': line_number,
+        'page_url': next((first[g] for g in _URL_GROUPS if g in first), None),
+        'error_message': text,
+    }
 
 
 def extract_locator_failure_info(rep, item) -> Optional[Dict[str, Any]]:
     """
     테스트 실패 리포트에서 locator 실패 정보 추출
-    
+
     Args:
         rep: pytest 리포트 객체
         item: pytest 테스트 아이템
-        
+
     Returns:
         locator 실패 정보 딕셔너리 또는 None
     """
     if not rep.failed or not rep.longrepr:
         return None
-    
-    error_message = str(rep.longrepr)
-    exc_info = getattr(rep, 'longrepr', None)
-    
-    # Playwright TimeoutError 감지
-    playwright_timeout_patterns = [
-        r"TimeoutError:.*?Locator\.(?:click|fill|press|wait_for|locator)",
-        r"TimeoutError.*?locator\(['\"]([^'\"]+)['\"]\)",
-        r"Locator\.(?:click|fill|press|wait_for).*?timeout",
-    ]
-    
-    # Selenium ElementNotFound 감지
-    selenium_patterns = [
-        r"NoSuchElementException.*?(\w+)\s*=\s*['\"]([^'\"]+)['\"]",
-        r"ElementNotFoundError.*?(\w+)\s*=\s*['\"]([^'\"]+)['\"]",
-        r"selenium\.common\.exceptions\.NoSuchElementException",
-    ]
-    
-    failed_locator = None
-    locator_type = None
-    
-    # Playwright locator 추출
-    for pattern in playwright_timeout_patterns:
-        match = re.search(pattern, error_message, re.IGNORECASE)
-        if match:
-            locator_type = 'playwright'
-            # 다양한 locator 패턴 추출
-            locator_patterns = [
-                r"locator\(['\"]([^'\"]+)['\"]\)",
-                r"\.locator\(['\"]([^'\"]+)['\"]\)",
-                r":has-text\(['\"]([^'\"]+)['\"]\)",
-                r"text=['\"]([^'\"]+)['\"]",
-            ]
-            for loc_pattern in locator_patterns:
-                locator_match = re.search(loc_pattern, error_message)
-                if locator_match:
-                    failed_locator = locator_match.group(1)
-                    break
-            if not failed_locator:
-                # 전체 locator 표현식 추출
-                full_locator_match = re.search(r"(?:page|self)\.locator\(['\"]([^'\"]+)['\"]\)", error_message)
-                if full_locator_match:
-                    failed_locator = full_locator_match.group(1)
-            break
-    
-    # Selenium locator 추출
-    if not failed_locator:
-        for pattern in selenium_patterns:
-            match = re.search(pattern, error_message, re.IGNORECASE)
-            if match:
-                locator_type = 'selenium'
-                if len(match.groups()) >= 2:
-                    failed_locator = match.group(2)
-                break
-    
-    # 소스 코드에서 locator 추출 시도 (AST 파싱 사용)
-    if not failed_locator and hasattr(item, 'func') and hasattr(item.func, '__code__'):
+
+    # 테스트 함수가 정의된 소스 파일 (pytest Function 아이템은 .function으로 접근)
+    code = getattr(getattr(item, 'function', None), '__code__', None)
+    source_file = code.co_filename if code is not None else None
+
+    result = classify_failure(rep.longrepr, source_file)
+    failed_locator = result['locator']
+    locator_type = result['framework']
+    line_number = result['line_number']
+
+    # 소스 코드에서 locator 추출 시도 (파일별 캐시된 locator 인덱스 사용)
+    # locator 실패 신호가 없는 실패(일반 assert 등)는 근처에 locator가 있어도 힐링 대상이 아님
+    if not failed_locator and result['locator_failure'] and source_file and line_number:
         try:
-            source_file = inspect.getfile(item.func)
-            with open(source_file, 'r', encoding='utf-8') as f:
-                source_code = f.read()
-                source_lines = source_code.splitlines()
-            
-            # 실패한 라인 번호 추정 (traceback에서)
-            line_number = _extract_line_number_from_error(error_message)
-            
-            if line_number:
-                # AST 파싱으로 정확한 locator 추출 시도
-                failed_locator = _extract_locator_with_ast(source_code, line_number, locator_type)
-                
-                # AST 파싱 실패 시 정규식으로 폴백
-                if not failed_locator:
-                    failed_locator = _extract_locator_from_source(source_lines, line_number, locator_type)
-        except Exception as e:
+            failed_locator = lookup_locator(source_file, line_number, locator_type)
+        except Exception:
             # 추출 실패는 무시
             pass
-    
+
     if not failed_locator:
         return None
-    
-    # 현재 페이지 URL 추출 시도
-    page_url = None
-    try:
-        # 에러 메시지에서 URL 추출 시도
-        url_patterns = [
-            r"navigating to ['\"]([^'\"]+)['\"]",
-            r"url:\s*['\"]([^'\"]+)['\"]",
-            r"page\.goto\(['\"]([^'\"]+)['\"]\)",
-            r"driver\.get\(['\"]([^'\"]+)['\"]\)",
-        ]
-        for pattern in url_patterns:
-            match = re.search(pattern, error_message, re.IGNORECASE)
-            if match:
-                page_url = match.group(1)
-                break
-    except Exception:
-        pass
-    
+
     return {
         'test_file': str(item.fspath) if hasattr(item, 'fspath') else None,
         'test_function': item.name,
         'failed_locator': failed_locator,
         'locator_type': locator_type or 'unknown',
-        'error_message': error_message[:500],  # 길이 제한
-        'line_number': _extract_line_number_from_error(error_message),
-        'page_url': page_url
+        'error_message': result['error_message'][:500],  # 길이 제한
+        'line_number': line_number,
+        'page_url': result['page_url']
     }
 
 
-def _extract_line_number_from_error(error_message: str) -> Optional[int]:
-    """에러 메시지에서 라인 번호 추출"""
-    # File "path/to/file.py", line X 패턴
-    line_match = re.search(r'File\s+["\']([^"\']+)["\'],\s+line\s+(\d+)', error_message)
-    if line_match:
-        return int(line_match.group(2))
+# ============================================================================
+# 파일별 locator 인덱스 (한 번 파싱한 파일은 mtime이 바뀔 때까지 재사용)
+# ============================================================================
+
+# Playwright locator 생성 메서드 (get_by_*는 접두사로 판별)
+_PLAYWRIGHT_LOCATOR_METHODS = {'locator', 'frame_locator'}
+# Selenium 요소 검색 메서드 (find_element_by_*는 접두사로 판별)
+_SELENIUM_LOCATOR_METHODS = {'find_element', 'find_elements'}
+
+# 라인 번호 → [(locator 종류, locator 값), ...] (바깥쪽 호출 우선)
+LocatorIndex = Dict[int, List[Tuple[str, str]]]
+
+# 경로 → (mtime, 파일 크기, locator 인덱스, 소스 라인(파싱 실패 시에만))
+_locator_index_cache: Dict[str, Tuple[float, int, Optional[LocatorIndex], Optional[List[str]]]] = {}
+
+
+def _classify_locator_call(node: ast.Call) -> Optional[Tuple[str, str]]:
+    """호출 노드가 locator 호출이면 (종류, 값) 반환"""
+    if not isinstance(node.func, ast.Attribute):
+        return None
+    attr = node.func.attr
+    
+    def constant_arg(index: int) -> Optional[str]:
+        if len(node.args) > index and isinstance(node.args[index], ast.Constant) \
+                and isinstance(node.args[index].value, str):
+            return node.args[index].value
+        return None
+    
+    # Playwright: page.locator('...'), page.get_by_text('...')
+    if attr in _PLAYWRIGHT_LOCATOR_METHODS or attr.startswith('get_by_'):
+        value = constant_arg(0)
+        return ('playwright', value) if value is not None else None
+    # Selenium: driver.find_element(By.ID, '...')
+    if attr in _SELENIUM_LOCATOR_METHODS:
+        value = constant_arg(1)
+        return ('selenium', value) if value is not None else None
+    # Selenium 3: driver.find_element_by_id('...')
+    if attr.startswith('find_element_by_') or attr.startswith('find_elements_by_'):
+        value = constant_arg(0)
+        return ('selenium', value) if value is not None else None
     return None
 
 
-def _extract_locator_with_ast(source_code: str, line_number: int, locator_type: Optional[str]) -> Optional[str]:
-    """AST 파싱을 사용하여 소스 코드에서 locator 추출"""
+def build_locator_index(source_code: str) -> LocatorIndex:
+    """
+    소스 코드 전체를 한 번 순회하여 라인별 locator 호출 인덱스 생성
+    
+    여러 줄에 걸친 호출은 걸친 모든 라인에 등록하고,
+    체이닝/중첩 호출은 바깥쪽 호출이 먼저 오도록 등록
+    """
+    tree = ast.parse(source_code)
+    index: LocatorIndex = {}
+    
+    # 전위 순회 (바깥쪽 호출 먼저)
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ast.Call):
+            entry = _classify_locator_call(node)
+            if entry:
+                end_line = getattr(node, 'end_lineno', None) or node.lineno
+                for line in range(node.lineno, end_line + 1):
+                    index.setdefault(line, []).append(entry)
+        stack.extend(reversed(list(ast.iter_child_nodes(node))))
+    return index
+
+
+def get_locator_index(source_file: str) -> Tuple[Optional[LocatorIndex], Optional[List[str]]]:
+    """
+    파일의 locator 인덱스 조회 (경로 + mtime 기준 캐시)
+    
+    Returns:
+        (locator 인덱스, 소스 라인) - 파싱에 성공하면 소스 라인은 None,
+        실패하면 인덱스는 None이고 정규식 폴백을 위한 소스 라인 반환
+    """
+    stat = os.stat(source_file)
+    cached = _locator_index_cache.get(source_file)
+    if cached and cached[0] == stat.st_mtime and cached[1] == stat.st_size:
+        return cached[2], cached[3]
+    
+    with open(source_file, 'r', encoding='utf-8') as f:
+        source_code = f.read()
+    
     try:
-        tree = ast.parse(source_code)
-        
-        class LocatorVisitor(ast.NodeVisitor):
-            def __init__(self, target_line: int):
-                self.target_line = target_line
-                self.found_locator = None
-                self.locator_type = locator_type
-            
-            def visit_Call(self, node):
-                # Playwright: page.locator('...')
-                if isinstance(node.func, ast.Attribute):
-                    if node.func.attr == 'locator' and node.lineno == self.target_line:
-                        if node.args and isinstance(node.args[0], ast.Constant):
-                            self.found_locator = node.args[0].value
-                            return
-                    # Selenium: driver.find_element(...)
-                    elif node.func.attr == 'find_element' and node.lineno == self.target_line:
-                        if len(node.args) >= 2 and isinstance(node.args[1], ast.Constant):
-                            self.found_locator = node.args[1].value
-                            return
-                
-                # 중첩된 호출 처리
-                self.generic_visit(node)
-        
-        visitor = LocatorVisitor(line_number)
-        visitor.visit(tree)
-        return visitor.found_locator
-    except Exception:
-        return None
+        index, lines = build_locator_index(source_code), None
+    except SyntaxError:
+        index, lines = None, source_code.splitlines()
+    
+    _locator_index_cache[source_file] = (stat.st_mtime, stat.st_size, index, lines)
+    return index, lines
+
+
+def lookup_locator(source_file: str, line_number: int, locator_type: Optional[str] = None,
+                   search_radius: int = 10) -> Optional[str]:
+    """
+    실패 라인의 locator 조회
+    
+    해당 라인에 locator가 없으면 위아래 search_radius 라인 내에서 가장 가까운 locator 반환
+    
+    Args:
+        source_file: 테스트 소스 파일 경로
+        line_number: 실패한 라인 번호
+        locator_type: 'playwright', 'selenium' 또는 None (None이면 종류 무관)
+        search_radius: 주변 라인 탐색 범위
+    """
+    index, lines = get_locator_index(source_file)
+    if index is None:
+        return _extract_locator_from_source(lines or [], line_number, locator_type)
+    
+    for distance in range(search_radius + 1):
+        candidates = [line_number] if distance == 0 else [line_number - distance, line_number + distance]
+        for line in candidates:
+            for kind, value in index.get(line, ()):
+                if locator_type in (None, kind):
+                    return value
+    return None
 
 
 def _extract_locator_from_source(source_lines: list, line_number: int, locator_type: Optional[str]) -> Optional[str]:
@@ -237,3 +445,20 @@ def _extract_locator_from_source(source_lines: list, line_number: int, locator_t
     
     return None
 
+
+
+def heal_locator(page, selector: str, wait_ms: Optional[int] = None):
+    """
+    자가 치유 Playwright locator (sync API)
+
+    원래 selector로 요소를 찾지 못하면 마지막으로 기록한 요소와 가장 비슷한 요소로 그 단계만 다시 실행
+    (테스트 전체 재실행 없음, 치유 결과는 .pytest-reports/healed-locators.jsonl과 리포트에 기록)
+    """
+    from self_healing import HealingLocator, get_healer
+    return HealingLocator(get_healer(), page, selector, wait_ms)
+
+
+def heal_find_element(driver, by: str, value: str, wait_ms: Optional[int] = None):
+    """자가 치유 Selenium find_element (heal_locator와 같은 방식)"""
+    from self_healing import find_element, get_healer
+    return find_element(get_healer(), driver, by, value, wait_ms)
@@ -0,0 +1,78 @@
+"""
+async_playwright_runner의 동시 실행 대상 판정 단위 테스트 (수집만 하고 실행하지 않음, 브라우저 불필요)
+"""
+
+import pytest
+
+from async_playwright_runner import _direct_params, static_funcargs
+
+pytest_plugins = ["pytester"]
+
+pytestmark = pytest.mark.unit
+
+SOURCE = '''
+import pytest
+
+@pytest.fixture
+def account(request):
+    return {"name": request.param}
+
+@pytest.fixture(scope="session")
+def base_url():
+    return "https://shop.example.com"
+
+@pytest.mark.parametrize("query", ["shoes"])
+async def test_direct(page, query):
+    pass
+
+@pytest.mark.parametrize("account", ["admin"], indirect=True)
+async def test_indirect(page, account):
+    pass
+
+@pytest.mark.parametrize("query, account", [("shoes", "admin")], indirect=["account"])
+async def test_mixed(page, query, account):
+    pass
+
+async def test_session_fixture(page, base_url):
+    pass
+
+@pytest.mark.skip
+async def test_skipped(page):
+    pass
+'''
+
+
+@pytest.fixture
+def items(pytester):
+    """테스트 이름 -> 수집된 아이템"""
+    return {item.originalname: item for item in pytester.getitems(SOURCE)}
+
+
+class TestDirectParams:
+    """parametrize 마커에서 직접 값을 받는 인자"""
+
+    def test_direct_and_indirect(self, items):
+        assert _direct_params(items["test_direct"]) == {"query"}
+        assert _direct_params(items["test_indirect"]) == set()
+        assert _direct_params(items["test_mixed"]) == {"query"}
+
+
+class TestStaticFuncargs:
+    """동시 실행 가능 여부와 fixture 값"""
+
+    def test_direct_param_value(self, items):
+        """직접 parametrize 값은 그대로 사용"""
+        assert static_funcargs(items["test_direct"]) == {"query": "shoes"}
+
+    def test_indirect_param_sequential(self, items):
+        """indirect 값은 fixture를 거쳐야 하므로 순차 실행"""
+        assert static_funcargs(items["test_indirect"]) is None
+        assert static_funcargs(items["test_mixed"]) is None
+
+    def test_session_fixture_not_ready(self, items):
+        """아직 생성되지 않은 session fixture를 쓰면 순차 실행"""
+        assert static_funcargs(items["test_session_fixture"]) is None
+
+    def test_skip_marker_sequential(self, items):
+        """setup 훅에서 판정되는 마커가 있으면 순차 실행"""
+        assert static_funcargs(items["test_skipped"]) is None
@@ -0,0 +1,122 @@
+"""
+auth_state의 잠금 파일과 로그인 상태 만료 단위 테스트 (브라우저 불필요)
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from auth_state import AuthError, AuthStateManager, FileLock
+
+pytestmark = pytest.mark.unit
+
+ROLES = {"admin": {"login_url": "/login", "session_cookies": ["sessionid"], "ttl_minutes": 30}}
+
+
+class TestFileLock:
+    """잠금 획득/대기, 오래된 잠금 제거, 잠금 갱신"""
+
+    def test_stale_lock_removed(self, tmp_path):
+        """갱신되지 않은 잠금 파일(종료된 워커)은 제거하고 잠금을 잡음"""
+        path = str(tmp_path / "admin.lock")
+        with open(path, "w") as f:
+            f.write("12345")
+        old = time.time() - 60
+        os.utime(path, (old, old))
+
+        with FileLock(path, timeout=1, stale_seconds=30):
+            assert os.path.exists(path)
+        assert not os.path.exists(path)
+
+    def test_timeout_while_held(self, tmp_path):
+        """잠금을 잡은 워커가 있으면 대기 시간 초과 시 AuthError"""
+        path = str(tmp_path / "admin.lock")
+        with FileLock(path, stale_seconds=30):
+            with pytest.raises(AuthError):
+                with FileLock(path, timeout=0.3, stale_seconds=30):
+                    pass
+
+    def test_long_login_not_treated_as_stale(self, tmp_path):
+        """로그인이 stale_seconds보다 오래 걸려도 잠금 파일이 갱신되어 다른 워커가 제거하지 않음"""
+        path = str(tmp_path / "admin.lock")
+        holding = threading.Event()
+        released_at = []
+
+        def hold():
+            with FileLock(path, stale_seconds=0.3):
+                holding.set()
+                time.sleep(1.0)
+                released_at.append(time.time())
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        holding.wait(2)
+        with FileLock(path, timeout=5, stale_seconds=0.3):
+            acquired_at = time.time()
+        holder.join()
+
+        assert released_at and acquired_at >= released_at[0]
+
+    def test_stale_threshold_shorter_than_wait(self):
+        """기본값: 종료된 워커의 잠금은 대기 시간 안에 회수"""
+        lock = FileLock("unused.lock")
+        assert lock.stale_seconds < lock.timeout
+
+
+class TestExpired:
+    """로그인 상태 만료 판정"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return AuthStateManager(ROLES, "https://app.example.com", str(tmp_path))
+
+    def test_ttl(self, manager):
+        """ttl_minutes가 지나면 만료"""
+        now = time.time()
+        assert not manager._expired("admin", {"expires": now + 60, "storage_state": {}})
+        assert manager._expired("admin", {"expires": now - 1, "storage_state": {}})
+
+    def test_session_cookie_expired(self, manager):
+        """지정한 세션 쿠키가 만료되면 ttl 이전이라도 만료"""
+        now = time.time()
+        state = {"cookies": [{"name": "sessionid", "expires": now - 1}, {"name": "theme", "expires": -1}]}
+        assert manager._expired("admin", {"expires": now + 60, "storage_state": state})
+
+    def test_other_and_session_cookies_ignored(self, manager):
+        """지정하지 않은 쿠키의 만료와 브라우저 세션 쿠키(expires -1)는 무시"""
+        now = time.time()
+        state = {"cookies": [{"name": "theme", "expires": now - 1}, {"name": "sessionid", "expires": -1}]}
+        assert not manager._expired("admin", {"expires": now + 60, "storage_state": state})
+
+
+class TestStateFor:
+    """역할별 로그인 한 번, 파일로 공유"""
+
+    def test_login_once_shared_through_file(self, tmp_path):
+        """다른 워커(관리자)는 파일에 저장된 상태를 읽고 다시 로그인하지 않음"""
+        logins = []
+
+        def login(config):
+            logins.append(config)
+            return {"cookies": [{"name": "sessionid", "value": "abc", "expires": -1}], "origins": []}
+
+        first = AuthStateManager(ROLES, "https://app.example.com", str(tmp_path))
+        second = AuthStateManager(ROLES, "https://app.example.com", str(tmp_path))
+
+        state = first.state_for("admin", login)
+        assert first.state_for("admin", login) == state
+        assert second.state_for("admin", login) == state
+        assert len(logins) == 1
+        assert first.stats["reused"] == 1
+        assert second.stats["loaded"] == 1
+
+    def test_invalidate_forces_login(self, tmp_path):
+        """폐기한 상태는 파일에서도 지워져 다시 로그인"""
+        logins = []
+        manager = AuthStateManager(ROLES, "https://app.example.com", str(tmp_path))
+        manager.state_for("admin", lambda config: logins.append(1) or {"cookies": [], "origins": []})
+        manager.invalidate("admin")
+        manager.state_for("admin", lambda config: logins.append(1) or {"cookies": [], "origins": []})
+        assert len(logins) == 2
@@ -0,0 +1,104 @@
+"""
+browser_matrix의 브라우저 목록/node ID 처리와 결과 집계 단위 테스트
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from browser_matrix import BROWSER_PROPERTY, MatrixReport, base_nodeid, browser_of, parse_browsers
+
+pytestmark = pytest.mark.unit
+
+BROWSERS = ["chromium", "firefox", "webkit"]
+
+
+class TestParseBrowsers:
+    """--browser-matrix / --browser 값"""
+
+    def test_matrix_option(self):
+        """공백/대소문자 정리, 순서 유지, 중복 제거"""
+        assert parse_browsers(" Firefox,chromium, firefox ") == ["firefox", "chromium"]
+
+    def test_playwright_browser_option(self):
+        """--browser를 두 개 이상 지정한 경우에만 매트릭스"""
+        assert parse_browsers("", ["chromium", "webkit"]) == ["chromium", "webkit"]
+        assert parse_browsers("", ["chromium"]) == []
+        assert parse_browsers("", None) == []
+
+    def test_unknown_browser(self):
+        """지원하지 않는 브라우저는 ValueError"""
+        with pytest.raises(ValueError):
+            parse_browsers("chromium,safari")
+
+
+class TestNodeIds:
+    """매개변수 id에서 브라우저 찾기/빼기"""
+
+    @pytest.mark.parametrize("nodeid, expected", [
+        ("test_a.py::test_login[firefox]", "firefox"),
+        ("test_a.py::test_login[firefox-2]", "firefox"),
+        ("test_a.py::test_login[admin-webkit]", "webkit"),
+        ("test_a.py::test_login[edge]", None),
+        ("test_a.py::test_login", None),
+        ("test_a.py::TestCart::test_add[chromium]", "chromium"),
+    ])
+    def test_browser_of(self, nodeid, expected):
+        """매트릭스 브라우저가 아닌 id(edge)나 매개변수가 없으면 None"""
+        assert browser_of(nodeid, BROWSERS) == expected
+
+    @pytest.mark.parametrize("nodeid, browser, expected", [
+        ("test_a.py::test_login[firefox]", "firefox", "test_a.py::test_login"),
+        ("test_a.py::test_login[firefox-2]", "firefox", "test_a.py::test_login[2]"),
+        ("test_a.py::test_login[admin-webkit]", "webkit", "test_a.py::test_login[admin]"),
+        ("test_a.py::test_login", "firefox", "test_a.py::test_login"),
+    ])
+    def test_base_nodeid(self, nodeid, browser, expected):
+        """다른 매개변수 id는 유지"""
+        assert base_nodeid(nodeid, browser) == expected
+
+    def test_same_base_across_browsers(self):
+        """브라우저만 다른 항목은 같은 테스트로 묶임"""
+        nodeids = [f"test_a.py::test_login[{browser}-2]" for browser in BROWSERS]
+        assert {base_nodeid(nodeid, browser_of(nodeid, BROWSERS)) for nodeid in nodeids} == {"test_a.py::test_login[2]"}
+
+
+def _report(browser, when, outcome, name="test_login", duration=0.5):
+    return SimpleNamespace(
+        nodeid=f"test_a.py::{name}[{browser}]", when=when, outcome=outcome, duration=duration,
+        passed=outcome == "passed", failed=outcome == "failed", skipped=outcome == "skipped",
+        user_properties=[(BROWSER_PROPERTY, browser)],
+    )
+
+
+class TestMatrixReport:
+    """브라우저별 결과와 브라우저마다 결과가 다른 테스트"""
+
+    def test_summary_and_divergent(self):
+        """브라우저별 call 결과 집계"""
+        report = MatrixReport(["chromium", "firefox"])
+        for browser, outcome in (("chromium", "passed"), ("firefox", "failed")):
+            report.pytest_runtest_logreport(_report(browser, "setup", "passed"))
+            report.pytest_runtest_logreport(_report(browser, "call", outcome))
+
+        assert report.summary["chromium"]["passed"] == 1
+        assert report.summary["firefox"]["failed"] == 1
+        assert report.divergent() == {"test_a.py::test_login": {"chromium": "passed", "firefox": "failed"}}
+
+    def test_teardown_error_replaces_call_result(self):
+        """통과 후 teardown 실패는 error 하나로 집계"""
+        report = MatrixReport(["chromium"])
+        report.pytest_runtest_logreport(_report("chromium", "call", "passed"))
+        report.pytest_runtest_logreport(_report("chromium", "teardown", "failed"))
+
+        assert report.summary["chromium"]["passed"] == 0
+        assert report.summary["chromium"]["error"] == 1
+
+    def test_skip_not_divergent(self):
+        """한 브라우저에서만 skip된 테스트는 결과가 다른 테스트로 보지 않음"""
+        report = MatrixReport(["chromium", "webkit"])
+        report.pytest_runtest_logreport(_report("chromium", "call", "passed"))
+        report.pytest_runtest_logreport(_report("webkit", "setup", "skipped"))
+
+        assert report.summary["webkit"]["skipped"] == 1
+        assert report.divergent() == {}
@@ -0,0 +1,313 @@
+"""
+context_pool.ContextPool 단위 테스트 (가짜 BrowserContext/Page 사용, 브라우저 불필요)
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from context_pool import ContextPool
+
+pytestmark = pytest.mark.unit
+
+
+class FakeFrame:
+    def __init__(self, url, parent_frame=None):
+        self.url = url
+        self.parent_frame = parent_frame
+
+
+class FakePage:
+    """URL 이동과 framenavigated 이벤트만 흉내 내는 Page"""
+
+    def __init__(self, context):
+        self.context = context
+        self.main_frame = FakeFrame("about:blank")
+        self.child_frames = []
+        self.handlers = []
+        self.closed = False
+        self.evaluated = []
+
+    @property
+    def url(self):
+        return self.main_frame.url
+
+    @property
+    def frames(self):
+        return [self.main_frame] + self.child_frames
+
+    def on(self, event, handler):
+        assert event == "framenavigated"
+        self.handlers.append(handler)
+
+    def goto(self, url):
+        self.main_frame.url = url
+        for handler in self.handlers:
+            handler(self.main_frame)
+
+    def open_iframe(self, url):
+        frame = FakeFrame(url, parent_frame=self.main_frame)
+        self.child_frames.append(frame)
+        for handler in self.handlers:
+            handler(frame)
+
+    def evaluate(self, script):
+        self.evaluated.append(script)
+        return self.context.storage_cleared
+
+    def is_closed(self):
+        return self.closed
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def close(self):
+        self.closed = True
+        self.context.pages.remove(self)
+
+
+class FakeCDPSession:
+    def __init__(self, context):
+        self.context = context
+
+    def send(self, method, params):
+        self.context.cdp_calls.append((method, params["origin"]))
+
+    def detach(self):
+        pass
+
+
+class FakeContext:
+    """페이지 목록, 초기화 호출, CDP 호출을 기록하는 BrowserContext"""
+
+    def __init__(self):
+        self.pages = []
+        self.page_handlers = []
+        self.cdp_calls = []
+        self.cookies_cleared = 0
+        self.storage_cleared = True
+        self.fail_reset = False
+        self.closed = False
+
+    def on(self, event, handler):
+        assert event == "page"
+        self.page_handlers.append(handler)
+
+    def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    def open_popup(self, url):
+        """테스트 코드가 연 팝업 (context.on("page") 이벤트 발생)"""
+        page = self.new_page()
+        for handler in self.page_handlers:
+            handler(page)
+        page.goto(url)
+        return page
+
+    def new_cdp_session(self, page):
+        return FakeCDPSession(self)
+
+    def clear_cookies(self):
+        if self.fail_reset:
+            raise RuntimeError("Target closed")
+        self.cookies_cleared += 1
+
+    def clear_permissions(self):
+        pass
+
+    def set_extra_http_headers(self, headers):
+        pass
+
+    def set_offline(self, offline):
+        pass
+
+    def unroute_all(self, behavior=None):
+        pass
+
+    def close(self):
+        self.closed = True
+
+
+class FakeBrowser:
+    def __init__(self, name="chromium"):
+        self.browser_type = SimpleNamespace(name=name)
+        self.contexts = []
+
+    def new_context(self, **options):
+        context = FakeContext()
+        self.contexts.append(context)
+        return context
+
+
+def _pool(name="chromium", **kwargs):
+    browser = FakeBrowser(name)
+    return browser, ContextPool(browser, **kwargs)
+
+
+class TestReuse:
+    """반납한 컨텍스트 재사용과 hit/miss 카운터"""
+
+    def test_hit_miss_counters(self):
+        """반납한 컨텍스트를 다시 빌리면 hit"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        pool.release(context, page)
+        reused, _ = pool.acquire()
+
+        assert reused is context
+        summary = pool.summary()
+        assert (summary["hits"], summary["misses"], summary["created"]) == (1, 1, 1)
+        assert summary["hit_rate"] == 0.5
+
+    def test_reset_on_release(self):
+        """반납 시 쿠키 정리, 추가 페이지 닫기, about:blank 이동"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/cart")
+        popup = context.open_popup("https://shop.example.com/help")
+        pool.release(context, page)
+
+        assert popup.closed
+        assert context.pages == [page]
+        assert page.url == "about:blank"
+        assert context.cookies_cleared == 1
+        assert pool.stats["discarded"] == 0
+
+    def test_prewarm(self):
+        """미리 만드는 컨텍스트는 max_size개까지"""
+        browser, pool = _pool(max_size=2)
+        pool.prewarm(3)
+        pool.acquire()
+        assert len(browser.contexts) == 2
+        assert pool.stats["hits"] == 1
+
+
+class TestDiscard:
+    """재사용하지 않고 폐기하는 경우"""
+
+    def test_failed_test(self):
+        """실패한 테스트의 컨텍스트는 초기화하지 않고 닫음"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        pool.release(context, page, failed=True)
+
+        assert context.closed
+        assert pool.stats["discarded_failed"] == 1
+        assert pool.acquire()[0] is not context
+
+    def test_max_uses(self):
+        """max_uses번 사용한 컨텍스트는 닫음"""
+        _browser, pool = _pool(max_uses=2)
+        context, page = pool.acquire()
+        pool.release(context, page)
+        context, page = pool.acquire()
+        pool.release(context, page)
+
+        assert context.closed
+        assert pool.stats["discarded_max_uses"] == 1
+
+    def test_reset_error(self):
+        """초기화 중 예외가 나면 폐기"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        context.fail_reset = True
+        pool.release(context, page)
+
+        assert context.closed
+        assert pool.stats["discarded_reset_error"] == 1
+
+    def test_pool_full(self):
+        """유휴 컨텍스트가 max_size개면 닫음"""
+        _browser, pool = _pool(max_size=1)
+        first, second = pool.acquire(), pool.acquire()
+        pool.release(*first)
+        pool.release(*second)
+
+        assert second[0].closed
+        assert not first[0].closed
+
+
+class TestChromiumOrigins:
+    """Chromium: 모든 페이지/프레임이 방문한 origin을 CDP로 정리"""
+
+    def test_popup_and_iframe_origins_cleared(self):
+        """팝업과 iframe이 방문한 origin까지 정리"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        page.open_iframe("https://pay.example.net/widget")
+        context.open_popup("https://sso.example.org/login")
+        pool.release(context, page)
+
+        assert {origin for _method, origin in context.cdp_calls} == {
+            "https://shop.example.com", "https://pay.example.net", "https://sso.example.org"}
+
+    def test_origins_reset_per_test(self):
+        """이전 테스트가 방문한 origin은 다음 반납 때 다시 정리하지 않음"""
+        _browser, pool = _pool()
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        pool.release(context, page)
+        context.cdp_calls.clear()
+
+        context, page = pool.acquire()
+        pool.release(context, page)
+        assert context.cdp_calls == []
+
+
+class TestOtherBrowserOrigins:
+    """Firefox/WebKit: 한 origin만 페이지 안에서 정리하고, 그 밖에는 폐기"""
+
+    def test_single_origin_cleared_in_page(self):
+        """IndexedDB/Cache Storage/Service Worker까지 정리하는 스크립트 실행 후 재사용"""
+        _browser, pool = _pool("firefox")
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        pool.release(context, page)
+
+        assert not context.closed
+        assert len(page.evaluated) == 1
+        script = page.evaluated[0]
+        assert "indexedDB" in script and "caches" in script and "serviceWorker" in script
+
+    def test_storage_not_clearable(self):
+        """IndexedDB 목록을 얻을 수 없으면(스크립트가 false) 폐기"""
+        _browser, pool = _pool("webkit")
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        context.storage_cleared = False
+        pool.release(context, page)
+
+        assert context.closed
+        assert pool.stats["discarded_reset_error"] == 1
+
+    def test_popup_other_origin(self):
+        """팝업이 다른 origin을 방문하면 폐기"""
+        _browser, pool = _pool("firefox")
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        context.open_popup("https://sso.example.org/login")
+        pool.release(context, page)
+
+        assert context.closed
+
+    def test_page_left_origin(self):
+        """페이지가 방문한 origin을 떠나 있으면 그 origin을 정리할 수 없으므로 폐기"""
+        _browser, pool = _pool("firefox")
+        context, page = pool.acquire()
+        page.goto("https://shop.example.com/")
+        page.goto("data:text/html,done")
+        pool.release(context, page)
+
+        assert context.closed
+
+    def test_no_origin_visited(self):
+        """origin을 방문하지 않았으면 스토리지 정리 없이 재사용"""
+        _browser, pool = _pool("firefox")
+        context, page = pool.acquire()
+        pool.release(context, page)
+
+        assert not context.closed
+        assert page.evaluated == []
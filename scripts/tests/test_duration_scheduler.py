@@ -0,0 +1,113 @@
+"""
+duration_scheduler의 작업 단위 구성/배정 순서 단위 테스트 (pytest-xdist 필요, 워커 없이 실행)
+"""
+
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("xdist")
+
+from duration_history import DurationHistory, estimate  # noqa: E402
+from duration_scheduler import DurationScheduling, plan_units  # noqa: E402
+
+pytestmark = pytest.mark.unit
+
+
+class TestPlanUnits:
+    """설정 그룹별 묶음, 큰 단위 나누기, 예상 시간 순서"""
+
+    def test_grouped_by_setup_group_then_file(self):
+        """기록된 그룹끼리 묶고, 그룹이 없으면 테스트 파일로 묶음"""
+        nodeids = ["a.py::t1", "a.py::t2", "b.py::t1", "c.py::t1"]
+        estimates = dict.fromkeys(nodeids, 1.0)
+        groups = {"a.py::t1": "chromium|shop", "c.py::t1": "chromium|shop"}
+
+        units = plan_units(nodeids, estimates, groups, workers=1)
+
+        members = sorted(sorted(unit[1]) for unit in units)
+        assert members == [["a.py::t1", "c.py::t1"], ["a.py::t2"], ["b.py::t1"]]
+
+    def test_longest_first(self):
+        """단위는 예상 시간이 긴 순, 단위 안의 테스트도 긴 순"""
+        nodeids = ["a.py::fast", "a.py::slow", "b.py::t"]
+        estimates = {"a.py::fast": 1.0, "a.py::slow": 3.0, "b.py::t": 5.0}
+
+        units = plan_units(nodeids, estimates, {}, workers=1)
+
+        assert [unit[2] for unit in units] == [5.0, 4.0]
+        assert units[1][1] == ["a.py::slow", "a.py::fast"]
+
+    def test_large_group_split(self):
+        """워커당 평균 부하의 절반을 넘는 그룹은 여러 단위로 나눔"""
+        nodeids = [f"a.py::t{index}" for index in range(8)]
+        estimates = dict.fromkeys(nodeids, 1.0)
+
+        units = plan_units(nodeids, estimates, {}, workers=2)
+
+        # 전체 8초, 워커 2개 -> 단위당 최대 2초
+        assert len(units) == 4
+        assert all(total <= 2.0 for _name, _members, total in units)
+        assert sorted(nodeid for unit in units for nodeid in unit[1]) == sorted(nodeids)
+        assert len({name for name, _members, _total in units}) == 4
+
+    def test_single_test_longer_than_limit_kept(self):
+        """한 테스트가 제한보다 길어도 빈 단위를 만들지 않음"""
+        nodeids = ["a.py::huge", "a.py::small"]
+        estimates = {"a.py::huge": 10.0, "a.py::small": 1.0}
+
+        units = plan_units(nodeids, estimates, {}, workers=4)
+
+        assert [unit[1] for unit in units] == [["a.py::huge"], ["a.py::small"]]
+
+
+class TestEstimate:
+    """기록 없는 테스트의 예상 시간"""
+
+    def test_unknown_uses_median(self, tmp_path):
+        """기록이 없는 테스트는 기록된 테스트의 중앙값"""
+        history = DurationHistory(str(tmp_path / "history.json"))
+        history.tests = {"a": {"duration": 1.0}, "b": {"duration": 3.0}, "c": {"duration": 9.0}}
+
+        assert estimate(history, ["a", "b", "c", "new"])["new"] == 3.0
+
+    def test_no_history_defaults_to_one_second(self, tmp_path):
+        """기록이 전혀 없으면 1초"""
+        history = DurationHistory(str(tmp_path / "missing.json"))
+        assert estimate(history, ["a"]) == {"a": 1.0}
+
+
+def _scheduler(units):
+    """워커 없이 대기열만 채운 스케줄러 (units: [(단위 이름, 브라우저)])"""
+    scheduler = DurationScheduling.__new__(DurationScheduling)
+    scheduler.workqueue = OrderedDict((name, {}) for name, _browser in units)
+    scheduler._unit_browser = {name: browser for name, browser in units if browser is not None}
+    scheduler._node_browser = {}
+    return scheduler
+
+
+class TestNextUnit:
+    """워커에 배정할 다음 단위"""
+
+    def test_queue_order_without_matrix(self):
+        """매트릭스가 아니면 대기열 맨 앞 (가장 긴 단위)"""
+        scheduler = _scheduler([("long", None), ("short", None)])
+        assert scheduler._next_unit("gw0") == "long"
+
+    def test_keeps_current_browser(self):
+        """워커가 실행 중인 브라우저의 단위를 이어서 배정"""
+        scheduler = _scheduler([("c#0", "chromium"), ("f#1", "firefox"), ("c#2", "chromium")])
+        scheduler._node_browser = {"gw0": "firefox"}
+        assert scheduler._next_unit("gw0") == "f#1"
+
+    def test_new_worker_takes_least_held_browser(self):
+        """처음 배정받는 워커는 맡은 워커가 가장 적은 브라우저의 단위"""
+        scheduler = _scheduler([("c#0", "chromium"), ("c#1", "chromium"), ("f#2", "firefox")])
+        scheduler._node_browser = {"gw0": "chromium"}
+        assert scheduler._next_unit("gw1") == "f#2"
+
+    def test_falls_back_when_current_browser_done(self):
+        """실행 중인 브라우저의 단위가 남지 않았으면 다른 브라우저로 전환"""
+        scheduler = _scheduler([("f#0", "firefox")])
+        scheduler._node_browser = {"gw0": "chromium"}
+        assert scheduler._next_unit("gw0") == "f#0"
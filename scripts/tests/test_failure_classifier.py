@@ -0,0 +1,97 @@
+"""
+test_utils.classify_failure / extract_locator_failure_info 단위 테스트 (benchmarks/corpus 샘플 사용)
+"""
+
+import json
+import os
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+from test_utils import classify_failure, extract_locator_failure_info
+
+pytestmark = pytest.mark.unit
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks", "corpus")
+
+
+def _load_corpus():
+    with open(os.path.join(CORPUS_DIR, "manifest.json"), "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    return [pytest.param(entry, id=entry["file"]) for entry in manifest]
+
+
+def _longrepr(entry):
+    """.txt는 traceback 문자열, .json은 직렬화된 TestReport의 구조화된 longrepr"""
+    with open(os.path.join(CORPUS_DIR, entry["file"]), "r", encoding="utf-8") as f:
+        if entry["file"].endswith(".json"):
+            return pytest.TestReport._from_json(json.load(f)).longrepr
+        return f.read()
+
+
+# 실패 라인 근처에 locator가 있는 테스트 소스
+NEAR_LOCATOR_TEST = textwrap.dedent('''\
+    def test_total(page):
+        total = page.locator("#from-source")
+        summary = total.inner_text()
+        assert False
+''')
+
+
+@pytest.fixture
+def near_locator_test(tmp_path):
+    """생성된 테스트 파일과 그 파일에서 정의된 테스트 함수"""
+    path = tmp_path / "test_near_locator.py"
+    path.write_text(NEAR_LOCATOR_TEST, encoding="utf-8")
+    namespace = {}
+    exec(compile(NEAR_LOCATOR_TEST, str(path), "exec"), namespace)
+    return str(path), namespace["test_total"]
+
+
+def _failure(source_file: str, line: int, message: str):
+    """pytest 짧은 traceback 형식의 실패 리포트"""
+    longrepr = f"{source_file}:{line}: in test_total\n    ...\nE   {message}"
+    return SimpleNamespace(failed=True, longrepr=longrepr)
+
+
+class TestClassifyFailure:
+    """corpus 샘플 분류 (문자열과 구조화된 longrepr 모두)"""
+
+    @pytest.mark.parametrize("entry", _load_corpus())
+    def test_corpus_sample(self, entry):
+        """manifest의 기대값과 일치"""
+        result = classify_failure(_longrepr(entry), entry.get("source_file"))
+        for field, expected in entry["expected"].items():
+            assert result[field] == expected, field
+
+    def test_corpus_has_structured_samples(self):
+        """구조화된 longrepr 샘플이 corpus에 포함"""
+        entries = [param.values[0] for param in _load_corpus()]
+        structured = [entry for entry in entries if entry["file"].endswith(".json")]
+        assert structured
+        assert not isinstance(_longrepr(structured[0]), str)
+
+
+class TestExtractLocatorFailure:
+    """소스 인덱스 조회는 locator 실패 신호가 있을 때만"""
+
+    def test_assertion_near_locator_ignored(self, near_locator_test):
+        """locator 두 줄 아래의 일반 assert 실패는 locator 실패가 아님"""
+        source_file, function = near_locator_test
+        item = SimpleNamespace(function=function, name="test_total", fspath=source_file)
+        rep = _failure(source_file, 4, "AssertionError: assert False")
+
+        assert classify_failure(rep.longrepr, source_file)["locator_failure"] is False
+        assert extract_locator_failure_info(rep, item) is None
+
+    def test_timeout_without_locator_uses_source(self, near_locator_test):
+        """locator 없는 timeout은 소스 인덱스에서 근처 locator를 찾음"""
+        source_file, function = near_locator_test
+        item = SimpleNamespace(function=function, name="test_total", fspath=source_file)
+        rep = _failure(source_file, 3, "playwright._impl._errors.TimeoutError: Locator.inner_text: Timeout 30000ms exceeded.")
+
+        info = extract_locator_failure_info(rep, item)
+        assert info is not None
+        assert info["failed_locator"] == "#from-source"
+        assert info["line_number"] == 3
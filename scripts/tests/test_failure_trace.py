@@ -0,0 +1,87 @@
+"""
+failure_trace.FailureTracer 단위 테스트 (가짜 tracing 사용, 브라우저 불필요)
+"""
+
+import os
+
+import pytest
+
+from failure_trace import FailureTracer
+
+pytestmark = pytest.mark.unit
+
+
+class FakeTracing:
+    """stop_chunk(path=...) 호출 시 파일만 쓰는 context.tracing"""
+
+    def __init__(self):
+        self.starts = 0
+        self.chunks = 0
+
+    def start(self, **kwargs):
+        self.starts += 1
+
+    def start_chunk(self, **kwargs):
+        self.chunks += 1
+
+    def stop_chunk(self, path=None):
+        if path:
+            with open(path, "wb") as f:
+                f.write(b"PK trace")
+
+
+class FakeContext:
+    def __init__(self):
+        self.tracing = FakeTracing()
+
+
+def _run(tracer, context, name, failed):
+    start_ms = tracer.begin(context, name)
+    return tracer.end(context, name, failed, start_ms)
+
+
+class TestFailureTracer:
+    """실패한 테스트만 저장, 이번 실행에서 저장한 trace만 상한 적용"""
+
+    def test_passed_not_saved(self, tmp_path):
+        """통과한 테스트는 파일 없이 버리고, 재사용 컨텍스트는 chunk만 시작"""
+        tracer = FailureTracer(str(tmp_path))
+        context = FakeContext()
+        assert _run(tracer, context, "test_a", failed=False)[0] is None
+        assert _run(tracer, context, "test_b", failed=False)[0] is None
+
+        assert list(tmp_path.iterdir()) == []
+        assert (context.tracing.starts, context.tracing.chunks) == (1, 1)
+        assert tracer.stats["discarded"] == 2
+
+    def test_oldest_evicted(self, tmp_path):
+        """max_traces개를 넘으면 먼저 저장한 trace부터 삭제"""
+        tracer = FailureTracer(str(tmp_path), max_traces=2)
+        context = FakeContext()
+        paths = [_run(tracer, context, f"test_{index}", failed=True)[0] for index in range(4)]
+
+        assert [os.path.exists(path) for path in paths] == [False, False, True, True]
+        assert tracer.stats["saved"] == 4
+        assert tracer.stats["evicted"] == 2
+
+    def test_previous_run_untouched(self, tmp_path):
+        """이전 실행(다른 워커)이 저장한 trace는 상한을 넘어도 삭제하지 않음"""
+        previous = [tmp_path / f"test_old_{index}.zip" for index in range(3)]
+        for path in previous:
+            path.write_bytes(b"PK old")
+        tracer = FailureTracer(str(tmp_path), max_traces=1)
+        context = FakeContext()
+        first = _run(tracer, context, "test_new_1", failed=True)[0]
+        second = _run(tracer, context, "test_new_2", failed=True)[0]
+
+        assert all(path.exists() for path in previous)
+        assert not os.path.exists(first)
+        assert os.path.exists(second)
+
+    def test_no_limit(self, tmp_path):
+        """max_traces 0이면 삭제하지 않음"""
+        tracer = FailureTracer(str(tmp_path), max_traces=0)
+        context = FakeContext()
+        for index in range(3):
+            _run(tracer, context, f"test_{index}", failed=True)
+        assert len(list(tmp_path.iterdir())) == 3
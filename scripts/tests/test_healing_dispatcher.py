@@ -0,0 +1,178 @@
+"""
+healing_dispatcher.HealingDispatcher 단위 테스트 (로컬 HTTP 서버 사용)
+"""
+
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from dom_cache import DomCache
+from healing_dispatcher import HealingDispatcher
+
+pytestmark = pytest.mark.unit
+
+
+class FakeHealingServer:
+    """
+    받은 요청을 기록하고 statuses 순서대로 응답 (다 쓰면 200)
+    받은 DOM은 해시로 기억하고, 모르는 해시만 온 항목은 unknown_dom_hashes로 응답 (locatorHealing.js와 같은 방식)
+    """
+
+    def __init__(self):
+        self.statuses = []
+        self.requests = []
+        self.known_doms = set()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers["Content-Length"]))
+                if self.headers.get("Content-Encoding") == "gzip":
+                    body = gzip.decompress(body)
+                request = json.loads(body)
+                server.requests.append(request)
+                status = server.statuses.pop(0) if server.statuses else 200
+                unknown = []
+                for item in request.get("batch", [request]):
+                    info = item["failure_info"]
+                    if info.get("current_dom"):
+                        server.known_doms.add(info["current_dom_hash"])
+                    elif info.get("current_dom_hash") and info["current_dom_hash"] not in server.known_doms:
+                        unknown.append(info["current_dom_hash"])
+                payload = b'{"error": "too large"}' if status >= 400 else json.dumps(
+                    {"unknown_dom_hashes": unknown}).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/locator-healing/trigger"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = FakeHealingServer()
+    yield server
+    server.close()
+
+
+def _payload(locator="#submit", dom=None):
+    info = {"failed_locator": locator, "locator_type": "playwright", "page_url": "https://app.example.com/"}
+    if dom is not None:
+        info["current_dom"] = dom
+    return {"failure_info": info}
+
+
+def _send(dispatcher, *payloads):
+    """요청 하나씩 넣고 전송이 끝날 때까지 대기 (flush 없이 같은 전송기로 여러 번 호출)"""
+    for payload in payloads:
+        before = dispatcher.stats()
+        dispatcher.submit(payload)
+        for _ in range(200):
+            stats = dispatcher.stats()
+            done = sum(stats[key] - before[key] for key in ("sent", "failed", "merged"))
+            if done and stats["queue_depth"] == 0:
+                break
+            threading.Event().wait(0.01)
+
+
+class TestHealingDispatcher:
+    """전송 실패와 중복 병합"""
+
+    def test_duplicate_merged_after_successful_send(self, server):
+        """전송에 성공한 요청과 같은 요청은 병합"""
+        dispatcher = HealingDispatcher(server.url, batch_wait=0, backoff=0.01, compress=False)
+        _send(dispatcher, _payload(), _payload())
+        dispatcher.flush(2)
+
+        stats = dispatcher.stats()
+        assert stats["sent"] == 1
+        assert stats["merged"] == 1
+        assert len(server.requests) == 1
+
+    def test_client_error_not_retried_and_not_remembered(self, server, capsys):
+        """4xx 응답은 재시도 없이 실패로 집계하고, 같은 요청이 다시 오면 다시 전송"""
+        server.statuses = [413]
+        dispatcher = HealingDispatcher(server.url, batch_wait=0, backoff=0.01, max_retries=3)
+        _send(dispatcher, _payload())
+        _send(dispatcher, _payload())
+        dispatcher.flush(2)
+
+        stats = dispatcher.stats()
+        assert stats["failed"] == 1
+        assert stats["retries"] == 0
+        assert stats["sent"] == 1
+        assert stats["merged"] == 0
+        assert len(server.requests) == 2
+        assert "HTTP 413" in capsys.readouterr().out
+
+    def test_server_error_retried(self, server):
+        """5xx 응답은 백오프 후 재시도"""
+        server.statuses = [503, 500]
+        dispatcher = HealingDispatcher(server.url, batch_wait=0, backoff=0.01, max_retries=3)
+        _send(dispatcher, _payload())
+        dispatcher.flush(2)
+
+        stats = dispatcher.stats()
+        assert stats["retries"] == 2
+        assert stats["sent"] == 1
+        assert stats["failed"] == 0
+
+    def test_duplicates_in_one_batch_sent_once(self, server):
+        """같은 배치 안의 중복 요청은 하나만 전송"""
+        dispatcher = HealingDispatcher(server.url, batch_wait=0.5, backoff=0.01, compress=False)
+        dispatcher.submit(_payload())
+        dispatcher.submit(_payload())
+        dispatcher.submit(_payload("#cancel"))
+        dispatcher.flush(3)
+
+        assert dispatcher.stats()["merged"] == 1
+        assert dispatcher.stats()["sent"] == 2
+        assert [len(request["batch"]) for request in server.requests] == [2]
+
+
+class TestDomHashOnly:
+    """이미 전송한 DOM은 해시만 전송, 서버가 모르면 DOM 전체 재전송"""
+
+    DOM = "<html><body><button id='save'>저장</button></body></html>"
+
+    def test_hash_only_after_first_send(self, server, tmp_path):
+        """같은 DOM의 두 번째 요청은 본문 없이 해시만 전송"""
+        dispatcher = HealingDispatcher(server.url, batch_wait=0, dom_cache=DomCache(str(tmp_path)))
+        _send(dispatcher, _payload("#submit", self.DOM), _payload("#cancel", self.DOM))
+        dispatcher.flush(2)
+
+        assert "current_dom" in server.requests[0]["failure_info"]
+        assert "current_dom" not in server.requests[1]["failure_info"]
+        assert dispatcher.stats()["dom_hash_only"] == 1
+        assert dispatcher.stats()["dom_resent"] == 0
+
+    def test_unknown_hash_resent_with_dom(self, server, tmp_path):
+        """서버가 재시작해 해시를 모르면 DOM 전체와 함께 다시 전송"""
+        cache = DomCache(str(tmp_path))
+        dispatcher = HealingDispatcher(server.url, batch_wait=0, dom_cache=cache)
+        _send(dispatcher, _payload("#submit", self.DOM))
+        server.known_doms.clear()
+        _send(dispatcher, _payload("#cancel", self.DOM))
+        dispatcher.flush(2)
+
+        assert len(server.requests) == 3
+        hash_only, resent = server.requests[1]["failure_info"], server.requests[2]["failure_info"]
+        assert "current_dom" not in hash_only
+        assert resent["current_dom"] == self.DOM
+        assert resent["current_dom_hash"] == hash_only["current_dom_hash"]
+        assert dispatcher.stats()["dom_resent"] == 1
+        # 다시 전송한 DOM은 전송 기록이 갱신되어 다음 요청부터 다시 해시만 전송
+        assert cache.was_sent(resent["current_dom_hash"])
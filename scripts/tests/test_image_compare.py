@@ -0,0 +1,170 @@
+"""
+image_compare의 빠른 종료 경로, 마스크, 비교 방식별 허용치, 실패 시 차이 이미지 저장 단위 테스트 (작은 NumPy 배열 사용)
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("PIL")
+
+from image_compare import TILE_ROWS, DecodedImage, ImageComparator, encode_png, mask_array  # noqa: E402
+
+pytestmark = pytest.mark.unit
+
+HEIGHT, WIDTH = TILE_ROWS * 4, 32
+
+
+@pytest.fixture
+def pixels():
+    """세로 그라데이션 회색 이미지 (띠 4개)"""
+    column = np.linspace(40, 200, HEIGHT, dtype=np.uint8)
+    return np.ascontiguousarray(np.repeat(column[:, None, None], WIDTH, axis=1).repeat(3, axis=2))
+
+
+def _image(array, digest=None):
+    return DecodedImage(np.ascontiguousarray(array), digest or str(id(array)))
+
+
+def _changed(array, rows, columns, delta=(60, 60, 60)):
+    changed = array.astype(np.int16)
+    changed[rows, columns] += delta
+    return np.clip(changed, 0, 255).astype(np.uint8)
+
+
+class TestFastPaths:
+    """디코딩 없는 바이트 일치, 띠 해시 일치, 달라진 띠만 픽셀 비교"""
+
+    def test_exact_bytes(self, pixels):
+        """PNG 바이트가 기준 이미지 파일과 같으면 디코딩 없이 일치"""
+        data = encode_png(pixels)
+        expected = DecodedImage.from_bytes(data)
+        result = ImageComparator("unused").compare(data, expected)
+        assert (result.matched, result.reason) == (True, "exact")
+
+    def test_tiles_match(self, pixels):
+        """인코딩이 달라도(다른 digest) 픽셀이 같으면 띠 해시만으로 일치"""
+        result = ImageComparator("unused").compare(_image(pixels.copy()), _image(pixels))
+        assert (result.matched, result.reason, result.tiles_total) == (True, "tiles", 4)
+
+    def test_only_changed_tile_compared(self, pixels):
+        """달라진 띠 하나만 픽셀 비교"""
+        actual = _changed(pixels, slice(TILE_ROWS + 10, TILE_ROWS + 12), slice(0, 5))
+        result = ImageComparator("unused").compare(_image(actual), _image(pixels))
+
+        assert (result.matched, result.reason) == (False, "diff")
+        assert (result.tiles_diffed, result.tiles_total) == (1, 4)
+        assert result.diff_count == 10
+        assert result.compared == HEIGHT * WIDTH
+
+    def test_size_mismatch(self, pixels):
+        """크기가 다르면 픽셀 비교 없이 실패"""
+        result = ImageComparator("unused").compare(_image(pixels[:-1]), _image(pixels))
+        assert (result.matched, result.reason) == (False, "size")
+
+
+class TestMask:
+    """제외 영역"""
+
+    def test_mask_array(self):
+        """(x, y, width, height)와 bounding_box 딕셔너리, 이미지 밖은 잘라냄"""
+        mask = mask_array((10, 10), [(8, 8, 5, 5), {"x": 0, "y": 0, "width": 2.5, "height": 1}, None])
+        assert not mask[9, 9] and not mask[0, 2] and mask[1, 0]
+        assert int((~mask).sum()) == 4 + 3
+        assert mask_array((10, 10), [(20, 20, 5, 5)]) is None
+
+    def test_masked_change_matches(self, pixels):
+        """바뀐 픽셀이 제외 영역 안에만 있으면 일치, 비교한 픽셀 수에서도 제외"""
+        actual = _changed(pixels, slice(0, 4), slice(0, 4))
+        result = ImageComparator("unused").compare(_image(actual), _image(pixels), mask=[(0, 0, 8, 8)])
+
+        assert (result.matched, result.reason) == (True, "pixels")
+        assert result.diff_count == 0
+        assert result.compared == HEIGHT * WIDTH - 64
+
+
+class TestThresholds:
+    """perceptual(YIQ 색 거리)과 pixel(채널 차이)의 허용치"""
+
+    def test_blue_shift_perceptual_vs_pixel(self, pixels):
+        """파란 채널만 바뀐 경우 사람 눈에 덜 띄므로 perceptual은 허용, pixel은 차이"""
+        actual = _changed(pixels, slice(0, 2), slice(0, 2), delta=(0, 0, 40))
+        comparator = ImageComparator("unused", threshold=0.1)
+
+        assert comparator.compare(_image(actual), _image(pixels), method="perceptual").matched
+        assert comparator.compare(_image(actual), _image(pixels), method="pixel").diff_count == 4
+
+    def test_threshold_per_pixel(self, pixels):
+        """채널 차이 10: pixel 허용치 0.05면 통과, 0.03이면 차이"""
+        actual = _changed(pixels, slice(0, 2), slice(0, 2), delta=(10, 10, 10))
+        comparator = ImageComparator("unused", method="pixel")
+
+        assert comparator.compare(_image(actual), _image(pixels), threshold=0.05).matched
+        assert not comparator.compare(_image(actual), _image(pixels), threshold=0.03).matched
+
+    def test_max_diff_pixels_and_ratio(self, pixels):
+        """허용치를 넘는 픽셀이 max_diff_pixels/max_diff_ratio 이하이면 일치"""
+        actual = _changed(pixels, slice(0, 2), slice(0, 5))
+        comparator = ImageComparator("unused")
+
+        assert comparator.compare(_image(actual), _image(pixels), max_diff_pixels=10).matched
+        assert not comparator.compare(_image(actual), _image(pixels), max_diff_pixels=9).matched
+        assert comparator.compare(_image(actual), _image(pixels), max_diff_ratio=10 / (HEIGHT * WIDTH)).matched
+
+    def test_unknown_method(self):
+        """지원하지 않는 비교 방식은 ValueError"""
+        with pytest.raises(ValueError):
+            ImageComparator("unused", method="ssim")
+
+
+class TestCheck:
+    """기준 이미지 파일 비교와 실패 시에만 현재/차이 이미지 저장"""
+
+    @pytest.fixture
+    def baseline(self, tmp_path, pixels):
+        path = tmp_path / "baseline" / "login.png"
+        path.parent.mkdir()
+        path.write_bytes(encode_png(pixels))
+        return path
+
+    def test_match_writes_nothing(self, tmp_path, baseline, pixels):
+        """일치하면 차이 디렉토리에 아무것도 쓰지 않음, 기준 이미지는 캐시에서 재사용"""
+        comparator = ImageComparator(str(tmp_path / "diff"))
+        for _ in range(2):
+            assert comparator.check(baseline.read_bytes(), str(baseline), "login").matched
+        assert comparator.check(encode_png(pixels.copy()), str(baseline), "login").matched
+
+        assert not (tmp_path / "diff").exists()
+        stats = comparator.stats()
+        assert (stats["misses"], stats["hits"]) == (1, 2)
+        assert stats["exact_matches"] + stats["tile_matches"] == 3
+
+    def test_failure_writes_actual_and_diff(self, tmp_path, baseline, pixels):
+        """실패하면 현재 이미지와 다른 픽셀을 빨강으로 표시한 차이 이미지 저장"""
+        comparator = ImageComparator(str(tmp_path / "diff"))
+        result = comparator.check(encode_png(_changed(pixels, slice(0, 3), slice(0, 3))), str(baseline), "login")
+
+        assert not result.matched
+        assert result.actual_path.endswith("login-actual.png")
+        assert result.diff_path.endswith("login-diff.png")
+        with open(result.diff_path, "rb") as f:
+            diff = DecodedImage.from_bytes(f.read()).pixels
+        assert tuple(diff[0, 0]) == (255, 0, 0)
+        assert comparator.stats()["diff_images"] == 1
+
+    def test_missing_baseline_created(self, tmp_path, pixels):
+        """기준 이미지가 없으면 현재 이미지를 기준으로 저장하고 실패"""
+        comparator = ImageComparator(str(tmp_path / "diff"))
+        path = tmp_path / "new.png"
+        result = comparator.check(encode_png(pixels), str(path), "new")
+
+        assert (result.matched, result.reason) == (False, "missing")
+        assert path.exists()
+        assert not (tmp_path / "diff").exists()
+
+    def test_update_replaces_baseline(self, tmp_path, baseline, pixels):
+        """update면 기준 이미지를 교체하고 차이 이미지는 쓰지 않음"""
+        comparator = ImageComparator(str(tmp_path / "diff"))
+        changed = encode_png(_changed(pixels, slice(0, 3), slice(0, 3)))
+        assert comparator.check(changed, str(baseline), "login", update=True).matched
+        assert baseline.read_bytes() == changed
+        assert not (tmp_path / "diff").exists()
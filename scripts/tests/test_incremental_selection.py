@@ -0,0 +1,143 @@
+"""
+incremental_selection의 테스트 지문과 선택 실행 기록 단위 테스트
+"""
+
+import textwrap
+
+import pytest
+
+from incremental_selection import Fingerprinter, IncrementalState
+
+pytestmark = pytest.mark.unit
+
+TEST_SOURCE = textwrap.dedent('''\
+    from pages.login_page import LoginPage
+
+    BASE_URL = "https://app.example.com"
+
+    def test_login(page):
+        LoginPage(page).login("admin")
+
+    def test_logout(page):
+        page.click("#logout")
+
+    class TestCart:
+        def setup_method(self):
+            self.items = []
+
+        def test_add(self, page):
+            page.click("#add")
+''')
+
+
+@pytest.fixture
+def project(tmp_path):
+    """테스트 파일, Page Object 패키지, conftest.py가 있는 프로젝트"""
+    (tmp_path / "pages").mkdir()
+    (tmp_path / "pages" / "__init__.py").write_text("", encoding="utf-8")
+    (tmp_path / "pages" / "login_page.py").write_text("class LoginPage:\n    pass\n", encoding="utf-8")
+    (tmp_path / "conftest.py").write_text("", encoding="utf-8")
+    (tmp_path / "test_app.py").write_text(TEST_SOURCE, encoding="utf-8")
+    return tmp_path
+
+
+def _fingerprints(root, context=""):
+    fingerprinter = Fingerprinter(root, context)
+    return {name: fingerprinter.fingerprint(f"test_app.py::{name}")
+            for name in ("test_login", "test_logout", "TestCart::test_add")}
+
+
+def _edit(path, old, new):
+    path.write_text(path.read_text(encoding="utf-8").replace(old, new), encoding="utf-8")
+
+
+class TestFingerprinter:
+    """바뀐 코드에 영향받는 테스트만 지문이 바뀜"""
+
+    def test_stable(self, project):
+        """같은 코드면 같은 지문"""
+        assert _fingerprints(project) == _fingerprints(project)
+
+    def test_function_change_only_affects_that_test(self, project):
+        """테스트 함수가 바뀌면 그 테스트만 (힐링으로 로케이터가 바뀐 경우)"""
+        before = _fingerprints(project)
+        _edit(project / "test_app.py", '"#logout"', '"#sign-out"')
+        after = _fingerprints(project)
+
+        assert after["test_logout"] != before["test_logout"]
+        assert after["test_login"] == before["test_login"]
+        assert after["TestCart::test_add"] == before["TestCart::test_add"]
+
+    def test_shared_code_change_affects_all(self, project):
+        """테스트 외 코드(모듈 상수 등)가 바뀌면 파일의 모든 테스트"""
+        before = _fingerprints(project)
+        _edit(project / "test_app.py", "app.example.com", "staging.example.com")
+        after = _fingerprints(project)
+        assert all(after[name] != before[name] for name in before)
+
+    def test_class_setup_change_affects_class_tests(self, project):
+        """클래스의 테스트 외 코드가 바뀌면 그 클래스의 테스트만"""
+        before = _fingerprints(project)
+        _edit(project / "test_app.py", "self.items = []", "self.items = [1]")
+        after = _fingerprints(project)
+
+        assert after["TestCart::test_add"] != before["TestCart::test_add"]
+        assert after["test_login"] == before["test_login"]
+
+    def test_imported_module_and_conftest(self, project):
+        """import한 로컬 모듈이나 conftest.py가 바뀌면 다시 실행"""
+        before = _fingerprints(project)
+        (project / "pages" / "login_page.py").write_text("class LoginPage:\n    url = '/login'\n", encoding="utf-8")
+        after_page = _fingerprints(project)
+        (project / "conftest.py").write_text("import pytest\n", encoding="utf-8")
+        after_conftest = _fingerprints(project)
+
+        assert after_page["test_login"] != before["test_login"]
+        assert after_conftest["test_login"] != after_page["test_login"]
+
+    def test_params_share_function_fingerprint_and_context(self, project):
+        """매개변수가 달라도 같은 함수 지문, 실행 설정이 다르면 다른 지문"""
+        fingerprinter = Fingerprinter(project, "chromium")
+        assert fingerprinter.fingerprint("test_app.py::test_login[a]") == fingerprinter.fingerprint("test_app.py::test_login[b]")
+        assert _fingerprints(project, "chromium") != _fingerprints(project, "firefox")
+
+    def test_unreadable_file_always_runs(self, project):
+        """읽거나 분석할 수 없는 파일의 테스트는 지문 없음 (항상 실행)"""
+        (project / "test_broken.py").write_text("def test_x(:\n", encoding="utf-8")
+        fingerprinter = Fingerprinter(project)
+        assert fingerprinter.fingerprint("test_broken.py::test_x") is None
+        assert fingerprinter.fingerprint("missing.py::test_x") is None
+
+
+class TestIncrementalState:
+    """지난 실행에서 같은 지문으로 통과한 테스트만 캐시"""
+
+    def test_cached_only_when_passed_with_same_fingerprint(self, tmp_path):
+        """지문이 바뀌었거나 통과하지 못한 테스트는 다시 실행"""
+        state = IncrementalState(str(tmp_path / "state.json"))
+        state.save({"a": {"fingerprint": "f1", "outcome": "passed"}, "b": {"fingerprint": "f1", "outcome": "failed"}})
+
+        reloaded = IncrementalState(str(tmp_path / "state.json"))
+        assert reloaded.is_cached("a", "f1")
+        assert not reloaded.is_cached("a", "f2")
+        assert not reloaded.is_cached("b", "f1")
+        assert not reloaded.is_cached("unknown", "f1")
+
+    def test_save_merges_concurrent_runs(self, tmp_path):
+        """다른 실행이 그사이 저장한 기록을 덮어쓰지 않음"""
+        path = str(tmp_path / "state.json")
+        first, second = IncrementalState(path), IncrementalState(path)
+        first.save({"a": {"fingerprint": "f1", "outcome": "passed"}})
+        second.save({"b": {"fingerprint": "f2", "outcome": "passed"}})
+
+        assert set(IncrementalState(path).tests) == {"a", "b"}
+
+    def test_expired_entries_removed(self, tmp_path):
+        """오래 실행되지 않은 테스트는 기록에서 제거, 캐시된 통과는 기록 시각만 갱신"""
+        path = tmp_path / "state.json"
+        path.write_text('{"version": 1, "tests": {"old": {"fingerprint": "f", "outcome": "passed", "seen": 0}, '
+                        '"kept": {"fingerprint": "f", "outcome": "passed", "seen": 0}}}', encoding="utf-8")
+
+        IncrementalState(str(path)).save({}, cached=["kept"])
+
+        assert set(IncrementalState(str(path)).tests) == {"kept"}
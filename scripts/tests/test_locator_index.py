@@ -0,0 +1,90 @@
+"""
+test_utils의 파일별 locator 인덱스 단위 테스트
+"""
+
+import textwrap
+from types import SimpleNamespace
+
+import pytest
+
+import test_utils
+from test_utils import build_locator_index, extract_locator_failure_info, lookup_locator
+
+pytestmark = pytest.mark.unit
+
+# 실패한 테스트 소스 (라인 번호가 테스트의 기대값과 맞도록 들여쓰기 제거 후 그대로 저장)
+GENERATED_TEST = textwrap.dedent('''\
+    def test_checkout(page):
+        page.goto("https://shop.example.com/cart")
+        page.locator(
+            "button#pay"
+        ).click()
+        page.get_by_role("link").click()
+        assert page.url.endswith("/done")
+''')
+
+
+@pytest.fixture
+def generated_test(tmp_path):
+    """생성된 테스트 파일과 그 파일에서 정의된 테스트 함수"""
+    path = tmp_path / "test_generated.py"
+    path.write_text(GENERATED_TEST, encoding="utf-8")
+    namespace = {}
+    exec(compile(GENERATED_TEST, str(path), "exec"), namespace)
+    return str(path), namespace["test_checkout"]
+
+
+def _failure(source_file: str, line: int, message: str):
+    """pytest 짧은 traceback 형식의 실패 리포트"""
+    longrepr = f"{source_file}:{line}: in test_checkout\n    ...\nE   {message}"
+    return SimpleNamespace(failed=True, longrepr=longrepr)
+
+
+class TestLocatorIndex:
+    """라인 → locator 인덱스"""
+
+    def test_multiline_call_registered_on_every_line(self):
+        """여러 줄에 걸친 호출은 걸친 모든 라인에서 조회"""
+        index = build_locator_index(GENERATED_TEST)
+        for line in (3, 4, 5):
+            assert index[line] == [("playwright", "button#pay")]
+        assert index[6] == [("playwright", "link")]
+
+    def test_nearest_line_within_radius(self, generated_test):
+        """실패 라인에 locator가 없으면 가장 가까운 라인의 locator"""
+        source_file, _ = generated_test
+        assert lookup_locator(source_file, 7) == "link"
+        assert lookup_locator(source_file, 7, "selenium") is None
+        assert lookup_locator(source_file, 7, search_radius=0) is None
+
+
+class TestExtractUsesIndex:
+    """extract_locator_failure_info가 테스트 함수의 소스 파일 인덱스를 사용하는지"""
+
+    def test_locator_from_source_index(self, generated_test, monkeypatch):
+        """traceback에 locator가 없는 실패는 item.function의 소스에서 찾고, 파일은 한 번만 파싱"""
+        source_file, function = generated_test
+        test_utils._locator_index_cache.pop(source_file, None)
+        builds = []
+        original = test_utils.build_locator_index
+        monkeypatch.setattr(test_utils, "build_locator_index", lambda code: builds.append(1) or original(code))
+
+        item = SimpleNamespace(function=function, name="test_checkout", fspath=source_file)
+        rep = _failure(source_file, 5, "playwright._impl._errors.TimeoutError: Locator.click: Timeout 30000ms exceeded.")
+        first = extract_locator_failure_info(rep, item)
+        second = extract_locator_failure_info(rep, item)
+
+        assert first is not None
+        assert first["failed_locator"] == "button#pay"
+        assert first["locator_type"] == "playwright"
+        assert first["line_number"] == 5
+        assert second["failed_locator"] == "button#pay"
+        assert len(builds) == 1
+
+    def test_index_rebuilt_after_file_change(self, generated_test):
+        """파일이 바뀌면(mtime/크기) 인덱스를 다시 생성"""
+        source_file, _ = generated_test
+        assert lookup_locator(source_file, 6, search_radius=0) == "link"
+        with open(source_file, "w", encoding="utf-8") as f:
+            f.write(GENERATED_TEST.replace('"link"', '"button"'))
+        assert lookup_locator(source_file, 6, search_radius=0) == "button"
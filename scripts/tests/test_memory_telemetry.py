@@ -0,0 +1,184 @@
+"""
+memory_telemetry의 브라우저 재실행 기준, 증가량 귀속, 브라우저 프로세스 RSS 단위 테스트 (가짜 psutil 사용)
+"""
+
+import json
+import warnings
+from types import SimpleNamespace
+
+import pytest
+
+import memory_telemetry
+from memory_telemetry import MB, RECYCLE_PROPERTY, SAMPLE_PROPERTY, MemoryTelemetry, RecyclableBrowser
+
+pytestmark = pytest.mark.unit
+
+
+class FakeProcess:
+    """이름, RSS, 하위 프로세스만 흉내 내는 psutil.Process"""
+
+    def __init__(self, pid, name, rss_mb, children=()):
+        self.pid = pid
+        self._name = name
+        self.rss = int(rss_mb * MB)
+        self._children = list(children)
+
+    def name(self):
+        return self._name
+
+    def memory_info(self):
+        return SimpleNamespace(rss=self.rss)
+
+    def children(self, recursive=False):
+        if not recursive:
+            return list(self._children)
+        result = []
+        for child in self._children:
+            result.append(child)
+            result.extend(child.children(recursive=True))
+        return result
+
+
+def _fake_psutil(root):
+    return SimpleNamespace(Process=lambda: root, NoSuchProcess=ProcessLookupError, AccessDenied=PermissionError)
+
+
+def _telemetry(monkeypatch, samples=(), **kwargs):
+    """process_memory가 samples를 차례로 반환하는 MemoryTelemetry (브라우저 RSS는 MB)"""
+    values = iter([(100 * MB, int(browser_mb * MB), 3) for browser_mb in samples])
+    monkeypatch.setattr(memory_telemetry, "process_memory", lambda: next(values))
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        telemetry = MemoryTelemetry(**kwargs)
+    telemetry.has_psutil = True
+    return telemetry
+
+
+class FakeBrowser:
+    def __init__(self, number):
+        self.number = number
+        self.version = f"v{number}"
+
+
+class TestProcessMemory:
+    """브라우저 프로세스 트리만 브라우저 RSS로 합산"""
+
+    def test_driver_and_helper_processes_excluded(self, monkeypatch):
+        """Playwright 드라이버(node), chromedriver, 그 밖의 하위 프로세스는 제외"""
+        renderer = FakeProcess(4, "chrome", 300)
+        chrome = FakeProcess(3, "chrome", 200, [renderer])
+        node = FakeProcess(2, "node", 80, [chrome])
+        chromedriver = FakeProcess(5, "chromedriver", 20, [FakeProcess(6, "chrome", 150)])
+        helper = FakeProcess(7, "python", 40)
+        root = FakeProcess(1, "python", 100, [node, chromedriver, helper])
+        monkeypatch.setattr(memory_telemetry, "_psutil", lambda: _fake_psutil(root))
+
+        python_rss, browser_rss, count = memory_telemetry.process_memory()
+
+        assert python_rss == 100 * MB
+        assert browser_rss == (200 + 300 + 150) * MB
+        assert count == 3
+
+    def test_firefox_content_processes(self, monkeypatch):
+        """브라우저 하위 프로세스는 이름과 관계없이 포함"""
+        firefox = FakeProcess(3, "firefox", 250, [FakeProcess(4, "Isolated Web Co", 120)])
+        root = FakeProcess(1, "python", 100, [FakeProcess(2, "node", 80, [firefox])])
+        monkeypatch.setattr(memory_telemetry, "_psutil", lambda: _fake_psutil(root))
+
+        assert memory_telemetry.process_memory()[1:] == (370 * MB, 2)
+
+    def test_without_psutil(self, monkeypatch):
+        """psutil이 없으면 브라우저 RSS는 None"""
+        monkeypatch.setattr(memory_telemetry, "_psutil", lambda: None)
+        assert memory_telemetry.process_memory()[1:] == (None, 0)
+
+
+class TestRecycleReason:
+    """테스트 수/RSS 기준"""
+
+    def test_max_tests(self, monkeypatch):
+        telemetry = _telemetry(monkeypatch, max_tests=2)
+        browser = SimpleNamespace(tests=0)
+        assert telemetry.recycle_reason(browser) is None
+        assert telemetry.recycle_reason(browser) == "tests"
+
+    def test_rss_threshold(self, monkeypatch):
+        """브라우저 RSS가 max_browser_mb를 넘을 때만"""
+        telemetry = _telemetry(monkeypatch, samples=[1000, 1600], max_browser_mb=1500)
+        browser = SimpleNamespace(tests=0)
+        assert telemetry.recycle_reason(browser) is None
+        assert telemetry.recycle_reason(browser) == "rss"
+
+    def test_rss_needs_psutil(self, monkeypatch):
+        """psutil이 없으면 RSS 기준은 사용하지 않음"""
+        telemetry = _telemetry(monkeypatch, samples=[5000], max_browser_mb=1500)
+        telemetry.has_psutil = False
+        assert not telemetry.recycles
+        assert telemetry.recycle_reason(SimpleNamespace(tests=0)) is None
+
+
+def _run_teardown(telemetry, item):
+    hook = telemetry.pytest_runtest_teardown(item, None)
+    next(hook)
+    with pytest.raises(StopIteration):
+        next(hook)
+    return json.loads(dict(item.user_properties)[SAMPLE_PROPERTY])
+
+
+class TestGrowthAttribution:
+    """setup 직전 ~ teardown 직후 증가량을 그 테스트에 귀속"""
+
+    def test_growth_charged_to_test(self, monkeypatch):
+        telemetry = _telemetry(monkeypatch, samples=[500, 700, 700, 710])
+        first = SimpleNamespace(nodeid="test_a.py::test_heavy", user_properties=[])
+        second = SimpleNamespace(nodeid="test_a.py::test_light", user_properties=[])
+
+        telemetry.pytest_runtest_setup(first)
+        heavy = _run_teardown(telemetry, first)
+        telemetry.pytest_runtest_setup(second)
+        light = _run_teardown(telemetry, second)
+
+        assert heavy["browser_rss_delta_mb"] == 200.0
+        assert light["browser_rss_delta_mb"] == 10.0
+        assert telemetry.stats["max_browser_rss_mb"] == 710.0
+
+    def test_recycled_test_not_charged(self, monkeypatch):
+        """브라우저를 다시 실행한 테스트에는 브라우저 증가량을 기록하지 않음"""
+        telemetry = _telemetry(monkeypatch, samples=[1600, 300])
+        item = SimpleNamespace(nodeid="test_a.py::test_x", user_properties=[(RECYCLE_PROPERTY, "rss")])
+
+        telemetry.pytest_runtest_setup(item)
+        record = _run_teardown(telemetry, item)
+
+        assert "browser_rss_delta_mb" not in record
+        assert record["browser_rss_mb"] == 300.0
+
+
+class TestRecyclableBrowser:
+    """재실행 가능한 세션 브라우저 대리 객체"""
+
+    def test_recycle(self):
+        """콜백(풀 정리)을 먼저 호출하고 이전 브라우저를 닫은 뒤 새로 실행"""
+        launched, events = [], []
+
+        def launch():
+            launched.append(FakeBrowser(len(launched) + 1))
+            return launched[-1]
+
+        browser = RecyclableBrowser(launch, lambda old: events.append(f"close {old.number}"))
+        browser.on_recycle(lambda: events.append("pools"))
+        browser.tests = 5
+        browser.recycle()
+
+        assert events == ["pools", "close 1"]
+        assert browser.version == "v2"
+        assert (browser.tests, browser.launches) == (0, 2)
+
+    def test_close_failure_ignored(self):
+        """이전 브라우저를 닫지 못해도(크래시) 새로 실행"""
+        def close(old):
+            raise RuntimeError("Browser has been closed")
+
+        browser = RecyclableBrowser(lambda: FakeBrowser(1), close)
+        browser.recycle()
+        assert browser.launches == 2
@@ -0,0 +1,194 @@
+"""
+network_cache의 요청 키 규칙, 저장소 구조, 기록/재생 라우터 단위 테스트 (가짜 route/request 사용, 브라우저 불필요)
+"""
+
+import hashlib
+import json
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from network_cache import MatchRules, NetworkCache, NetworkStore, resolve_mode
+
+pytestmark = pytest.mark.unit
+
+
+class FakeResponse:
+    def __init__(self, status=200, headers=None, body=b"{}"):
+        self.status = status
+        self.headers = headers or {"content-type": "application/json"}
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class FakeRoute:
+    """route.fetch/fulfill/continue_/abort 호출을 기록하는 Route"""
+
+    def __init__(self, url, method="GET", post_data=None, response=None):
+        self.request = SimpleNamespace(url=url, method=method, post_data_buffer=post_data)
+        self.response = response or FakeResponse()
+        self.fetched = 0
+        self.fulfilled = None
+        self.continued = False
+        self.aborted = None
+
+    def fetch(self, max_redirects=None):
+        self.fetched += 1
+        return self.response
+
+    def fulfill(self, status, headers, body):
+        self.fulfilled = {"status": status, "headers": headers, "body": body}
+
+    def continue_(self):
+        self.continued = True
+
+    def abort(self, error_code="failed"):
+        self.aborted = error_code
+
+
+def _cache(tmp_path, mode, **rules):
+    return NetworkCache(NetworkStore(str(tmp_path)), MatchRules(**rules), mode)
+
+
+class TestMatchRules:
+    """기록/재생 대상과 요청 키"""
+
+    def test_include_exclude(self):
+        """exclude가 include보다 우선, http(s)가 아닌 요청은 대상 아님"""
+        rules = MatchRules(include=["*/api/*"], exclude=["*/api/session*"])
+        assert rules.applies("https://shop.example.com/api/products")
+        assert not rules.applies("https://shop.example.com/api/session")
+        assert not rules.applies("https://shop.example.com/static/app.js")
+        assert not rules.applies("data:text/plain,hello")
+        assert MatchRules().applies("http://localhost:8000/")
+
+    def test_ignored_params_keep_key(self):
+        """캐시 무효화 파라미터와 파라미터 순서, fragment가 달라도 같은 키"""
+        rules = MatchRules(ignore_params=["ts", "cb"])
+        key = rules.key("GET", "https://Shop.example.com/api/items?page=2&sort=price&ts=1700000000")
+        assert rules.key("get", "https://shop.example.com/api/items?sort=price&page=2&cb=abc#top") == key
+        assert rules.key("GET", "https://shop.example.com/api/items?page=3&sort=price") != key
+
+    def test_body_hash(self):
+        """요청 본문이 다르면 다른 키 (match_body=False면 본문 무시)"""
+        rules = MatchRules()
+        url = "https://shop.example.com/api/search"
+        assert rules.key("POST", url, b'{"q":"shoes"}') != rules.key("POST", url, b'{"q":"hats"}')
+        assert rules.key("POST", url, b'{"q":"shoes"}') != rules.key("GET", url)
+
+        ignore_body = MatchRules(match_body=False)
+        assert ignore_body.key("POST", url, b'{"q":"shoes"}') == ignore_body.key("POST", url, b'{"q":"hats"}')
+
+    def test_marker_overrides_mode(self):
+        """network 마커의 모드와 제외 패턴이 기본 설정보다 우선"""
+        marker = SimpleNamespace(args=("replay",), kwargs={"exclude": ["*/api/session*"], "ignore_params": ["nonce"]})
+        mode, rules = resolve_mode("auto", marker)
+        assert mode == "replay"
+        assert "*/api/session*" in rules.exclude
+        assert "nonce" in rules.ignore_params
+
+
+class TestNetworkStore:
+    """본문은 sha256 주소로 한 번만, 응답 정보는 키별 파일"""
+
+    def test_layout(self, tmp_path):
+        """같은 본문을 가진 두 응답은 본문 파일 하나를 공유"""
+        store = NetworkStore(str(tmp_path))
+        body = b"console.log(1)"
+        digest = hashlib.sha256(body).hexdigest()
+        assert store.put("ab" + "0" * 62, "GET", "https://a/app.js", 200, {"content-type": "text/javascript"}, body)
+        assert store.put("cd" + "0" * 62, "GET", "https://b/app.js", 200, {}, body)
+
+        assert (tmp_path / "blobs" / digest[:2] / digest).read_bytes() == body
+        assert len(list((tmp_path / "blobs").rglob("*"))) == 2  # 디렉토리 하나 + 본문 하나
+        entry = json.loads((tmp_path / "entries" / "ab" / ("ab" + "0" * 62 + ".json")).read_text(encoding="utf-8"))
+        assert entry["body"] == digest
+        assert entry["status"] == 200
+        entry, stored = store.get("cd" + "0" * 62)
+        assert (entry["url"], stored) == ("https://b/app.js", body)
+
+    def test_no_temp_files_left(self, tmp_path):
+        """원자적 교체 후 임시 파일이 남지 않음"""
+        store = NetworkStore(str(tmp_path))
+        store.put("ab" + "0" * 62, "GET", "https://a/", 200, {}, b"x")
+        store.put("ab" + "0" * 62, "GET", "https://a/", 200, {}, b"y")
+        assert not list(tmp_path.rglob("*.tmp"))
+
+    def test_missing_blob(self, tmp_path):
+        """본문이 없는 기록은 없는 것으로 처리"""
+        store = NetworkStore(str(tmp_path))
+        store.put("ab" + "0" * 62, "GET", "https://a/", 200, {}, b"x")
+        for blob in (tmp_path / "blobs").rglob("*"):
+            if blob.is_file():
+                os.remove(blob)
+        assert store.get("ab" + "0" * 62) is None
+
+
+class TestNetworkCache:
+    """기록 후 재생, 재생 실패 시 차단"""
+
+    def test_record_then_replay(self, tmp_path):
+        """기록한 응답을 실제 서버 없이 재생"""
+        url = "https://shop.example.com/api/items?page=1&ts=1"
+        recorder = _cache(tmp_path, "record", ignore_params=["ts"])
+        route = FakeRoute(url, response=FakeResponse(body=b'[{"id": 1}]'))
+        recorder._handle(route)
+        assert route.fetched == 1
+        assert recorder.stats["recorded"] == 1
+
+        player = _cache(tmp_path, "replay", ignore_params=["ts"])
+        replayed = FakeRoute("https://shop.example.com/api/items?ts=2&page=1")
+        player._handle(replayed)
+        assert replayed.fetched == 0
+        assert replayed.fulfilled["body"] == b'[{"id": 1}]'
+        assert player.stats["hits"] == 1
+
+    def test_encoding_headers_dropped_on_record(self, tmp_path):
+        """압축을 푼 본문과 맞지 않는 길이/인코딩 헤더는 기록하지 않음"""
+        headers = {"content-type": "text/css", "Content-Encoding": "gzip", "content-length": "120",
+                   "transfer-encoding": "chunked"}
+        cache = _cache(tmp_path, "record")
+        route = FakeRoute("https://shop.example.com/app.css", response=FakeResponse(headers=headers, body=b"body{}"))
+        cache._handle(route)
+
+        assert route.fulfilled["headers"] == {"content-type": "text/css"}
+        entry_file = next(path for path in (tmp_path / "entries").rglob("*.json"))
+        assert json.loads(entry_file.read_text(encoding="utf-8"))["headers"] == {"content-type": "text/css"}
+
+    def test_replay_miss_aborts(self, tmp_path):
+        """replay 모드에서 기록이 없으면 실제 서버로 보내지 않고 차단"""
+        cache = _cache(tmp_path, "replay")
+        route = FakeRoute("https://shop.example.com/api/new")
+        cache._handle(route)
+
+        assert route.aborted == "internetdisconnected"
+        assert route.fetched == 0
+        assert cache.missed == ["GET https://shop.example.com/api/new"]
+
+    def test_auto_miss_records(self, tmp_path):
+        """auto 모드는 기록이 없으면 받아서 기록하고 다음부터 재생"""
+        cache = _cache(tmp_path, "auto")
+        first, second = FakeRoute("https://shop.example.com/"), FakeRoute("https://shop.example.com/")
+        cache._handle(first)
+        cache._handle(second)
+
+        assert (first.fetched, second.fetched) == (1, 0)
+        assert (cache.stats["misses"], cache.stats["hits"]) == (1, 1)
+
+    def test_excluded_passthrough(self, tmp_path):
+        """제외한 URL은 기록하지 않고 그대로 진행"""
+        cache = _cache(tmp_path, "auto", exclude=["*/api/session*"])
+        route = FakeRoute("https://shop.example.com/api/session")
+        cache._handle(route)
+
+        assert route.continued
+        assert cache.stats["passthrough"] == 1
+        assert not (tmp_path / "entries").exists()
+
+    def test_unknown_mode(self, tmp_path):
+        """지원하지 않는 모드는 ValueError"""
+        with pytest.raises(ValueError):
+            _cache(tmp_path, "offline")
@@ -0,0 +1,164 @@
+"""
+resource_blocking의 프로필 선택과 요청 차단 단위 테스트 (가짜 route/드라이버 사용, 브라우저 불필요)
+"""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+from resource_blocking import ESTIMATED_BYTES, TRACKER_PATTERNS, PlaywrightBlocker, SeleniumBlocker, resolve_profile
+
+pytestmark = pytest.mark.unit
+
+TRACKER_URL = "https://www.googletagmanager.com/gtm.js?id=GTM-1"
+
+
+@pytest.fixture(autouse=True)
+def no_env_rules(monkeypatch):
+    """환경 변수로 추가한 차단 규칙 제외"""
+    monkeypatch.delenv("TEST_BLOCK_RESOURCE_TYPES", raising=False)
+    monkeypatch.delenv("TEST_BLOCK_URL_PATTERNS", raising=False)
+
+
+def _marker(*args, **kwargs):
+    return SimpleNamespace(args=args, kwargs=kwargs)
+
+
+class FakeRoute:
+    def __init__(self, url, resource_type, navigation=False, main_frame=True):
+        frame = SimpleNamespace(parent_frame=None if main_frame else object())
+        self.request = SimpleNamespace(url=url, resource_type=resource_type, frame=frame,
+                                       is_navigation_request=lambda: navigation)
+        self.result = None
+
+    def abort(self, error_code="failed"):
+        self.result = ("abort", error_code)
+
+    def fallback(self):
+        self.result = ("fallback", None)
+
+
+class TestResolveProfile:
+    """block_resources 마커가 명령줄/환경 변수 설정보다 우선"""
+
+    def test_option_profile(self):
+        """마커가 없으면 명령줄 프로필"""
+        profile = resolve_profile("media")
+        assert profile.resource_types == {"image", "font", "media"}
+        assert profile.url_patterns == ()
+
+    def test_marker_overrides_option(self):
+        """마커의 프로필과 추가 타입/패턴 적용"""
+        profile = resolve_profile("media", _marker("trackers", types=["stylesheet"], patterns=["*/chat-widget/*"]))
+        assert profile.name == "trackers"
+        assert profile.resource_types == {"stylesheet"}
+        assert profile.url_patterns == TRACKER_PATTERNS + ("*/chat-widget/*",)
+
+    def test_marker_off(self):
+        """마커로 차단을 끄면 추가 옵션도 무시"""
+        profile = resolve_profile("fast", _marker("off", types=["image"]))
+        assert not profile.enabled
+
+    def test_marker_without_args_keeps_option(self):
+        """프로필 이름 없이 옵션만 준 마커는 명령줄 프로필에 추가"""
+        profile = resolve_profile("trackers", _marker(types=["font"]))
+        assert profile.name == "trackers"
+        assert profile.resource_types == {"font"}
+
+    def test_unknown_profile(self):
+        """지원하지 않는 프로필은 ValueError"""
+        with pytest.raises(ValueError):
+            resolve_profile("everything")
+
+
+class TestPlaywrightBlocker:
+    """리소스 타입/URL 패턴 차단, 메인 프레임 페이지 이동은 항상 허용"""
+
+    def test_blocks_matching_requests(self):
+        """차단하지 않는 요청은 다음 라우터(네트워크 캐시 등)로 넘김"""
+        blocker = PlaywrightBlocker(resolve_profile("fast"))
+        image, tracker, api = (FakeRoute("https://shop.example.com/logo.png", "image"),
+                               FakeRoute(TRACKER_URL, "script"),
+                               FakeRoute("https://shop.example.com/api/cart", "fetch"))
+        for route in (image, tracker, api):
+            blocker._handle(route)
+
+        assert image.result == tracker.result == ("abort", "blockedbyclient")
+        assert api.result == ("fallback", None)
+        assert blocker.stats["requests_blocked"] == 2
+        assert (blocker.stats["blocked_image"], blocker.stats["blocked_url"]) == (1, 1)
+
+    def test_main_frame_navigation_never_blocked(self):
+        """패턴에 맞아도 테스트가 직접 연 메인 프레임 페이지는 허용, iframe 이동은 차단"""
+        blocker = PlaywrightBlocker(resolve_profile("fast", _marker(patterns=["*/landing/*"])))
+        main = FakeRoute("https://shop.example.com/landing/promo", "document", navigation=True)
+        iframe = FakeRoute("https://shop.example.com/landing/ad", "document", navigation=True, main_frame=False)
+        blocker._handle(main)
+        blocker._handle(iframe)
+
+        assert main.result == ("fallback", None)
+        assert iframe.result == ("abort", "blockedbyclient")
+        assert blocker.stats["requests_blocked"] == 1
+
+    def test_estimated_bytes_recorded(self):
+        """절약한 바이트는 리소스 타입별 추정치로 기록"""
+        blocker = PlaywrightBlocker(resolve_profile("media"))
+        blocker._handle(FakeRoute("https://shop.example.com/hero.jpg", "image"))
+        blocker._handle(FakeRoute("https://shop.example.com/font.woff2", "font"))
+        node = SimpleNamespace(user_properties=[])
+        blocker.record(node)
+
+        expected = ESTIMATED_BYTES["image"] + ESTIMATED_BYTES["font"]
+        assert blocker.stats["estimated_bytes_saved"] == expected
+        assert dict(node.user_properties) == {"resources_blocked": 2, "resource_estimated_bytes_saved": expected}
+
+
+class FakeChromeDriver:
+    """CDP 명령과 성능 로그만 흉내 내는 Chrome 드라이버"""
+
+    def __init__(self, log=()):
+        self.commands = []
+        self.log = list(log)
+
+    def execute_cdp_cmd(self, command, params):
+        self.commands.append((command, params))
+        return {}
+
+    def get_log(self, name):
+        log, self.log = self.log, []
+        return log
+
+
+def _loading_failed(resource_type, blocked_reason="inspector"):
+    message = {"method": "Network.loadingFailed", "params": {"type": resource_type, "blockedReason": blocked_reason}}
+    return {"message": json.dumps({"message": message})}
+
+
+class TestSeleniumBlocker:
+    """CDP 차단 설정/해제와 성능 로그 집계"""
+
+    def test_attach_and_detach(self):
+        """반납 전에 차단 목록을 비우고, 차단된 요청만 집계"""
+        driver = FakeChromeDriver()
+        blocker = SeleniumBlocker(resolve_profile("fast"))
+        assert blocker.attach(driver)
+        driver.log = [_loading_failed("Image"), _loading_failed("Script"), _loading_failed("XHR", blocked_reason=None)]
+        blocker.detach()
+
+        assert driver.commands[1][0] == "Network.setBlockedURLs"
+        assert "*.png*" in driver.commands[1][1]["urls"]
+        assert driver.commands[-1] == ("Network.setBlockedURLs", {"urls": []})
+        assert (blocker.stats["blocked_image"], blocker.stats["blocked_url"]) == (1, 1)
+
+    def test_previous_log_discarded(self):
+        """세션 풀에서 재사용한 드라이버의 이전 테스트 로그는 집계하지 않음"""
+        driver = FakeChromeDriver(log=[_loading_failed("Image")])
+        blocker = SeleniumBlocker(resolve_profile("media"))
+        blocker.attach(driver)
+        blocker.detach()
+        assert blocker.stats["requests_blocked"] == 0
+
+    def test_without_cdp(self):
+        """CDP를 지원하지 않는 드라이버(Firefox)는 False"""
+        assert not SeleniumBlocker(resolve_profile("fast")).attach(object())
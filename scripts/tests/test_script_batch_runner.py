@@ -0,0 +1,142 @@
+"""
+script_batch_runner.BatchRunner 단위 테스트 (실제 워커 프로세스로 작은 스크립트 실행, 브라우저 불필요)
+"""
+
+import textwrap
+
+import pytest
+
+from script_batch_runner import MAX_ASSIGN_ATTEMPTS, BatchRunner, parse_result
+
+pytestmark = pytest.mark.unit
+
+SCRIPTS = {
+    "passed.py": """
+        import json
+        import sys
+        print(json.dumps({"test_name": sys.argv[1] if len(sys.argv) > 1 else "passed", "status": "PASSED"}))
+    """,
+    "failed.py": """
+        import sys
+        print("plain output")
+        sys.exit(2)
+    """,
+    "error.py": """
+        raise ValueError("broken")
+    """,
+    "crash.py": """
+        import os
+        os._exit(3)
+    """,
+    "slow.py": """
+        import time
+        time.sleep(30)
+    """,
+}
+
+
+@pytest.fixture
+def scripts(tmp_path):
+    """이름 -> 스크립트 경로"""
+    paths = {}
+    for name, source in SCRIPTS.items():
+        path = tmp_path / name
+        path.write_text(textwrap.dedent(source), encoding="utf-8")
+        paths[name] = str(path)
+    return paths
+
+
+def _run(jobs, runner_class=BatchRunner, **options):
+    """(작업 순서대로 결과 이벤트, 요약)"""
+    events = []
+    options.setdefault("timeout", 10)
+    runner = runner_class(preload=(), emit=events.append, **options)
+    summary = runner.run(jobs)
+    results = {event["index"]: event for event in events if event["event"] == "result"}
+    return [results[index] for index in range(len(jobs))], summary
+
+
+class TestBatchRunner:
+    """종료 상태별 결과와 워커 교체"""
+
+    def test_passed_and_failed(self, scripts):
+        """종료 코드 0은 passed (stdout JSON 파싱), 그 외 종료 코드와 예외는 failed"""
+        results, summary = _run([
+            {"script": scripts["passed.py"], "args": ["로그인"]},
+            {"script": scripts["failed.py"]},
+            {"script": scripts["error.py"]},
+        ], workers=2)
+
+        assert [result["status"] for result in results] == ["passed", "failed", "failed"]
+        assert results[0]["data"] == {"test_name": "로그인", "status": "PASSED"}
+        assert results[1]["exit_code"] == 2
+        assert results[1]["data"]["output"].strip() == "plain output"
+        assert "ValueError: broken" in results[2]["error"]
+        assert (summary["passed"], summary["failed"]) == (1, 2)
+
+    def test_crash_replaced(self, scripts):
+        """워커가 비정상 종료되면 crashed로 보고하고 다음 스크립트는 새 워커에서 실행"""
+        results, summary = _run([{"script": scripts["crash.py"]}, {"script": scripts["passed.py"]}], workers=1)
+
+        assert [result["status"] for result in results] == ["crashed", "passed"]
+        assert results[0]["exit_code"] == 3
+        assert results[0]["worker"] != results[1]["worker"]
+        assert summary["workers_started"] == 2
+
+    def test_timeout(self, scripts):
+        """시간 제한을 넘은 스크립트만 timeout, 나머지는 계속 실행"""
+        results, summary = _run([
+            {"script": scripts["slow.py"], "timeout": 0.5},
+            {"script": scripts["passed.py"]},
+        ], workers=1)
+
+        assert [result["status"] for result in results] == ["timeout", "passed"]
+        assert results[0]["duration_ms"] == 500.0
+        assert summary["timeout"] == 1
+
+    def test_recycle_after_max_runs(self, scripts):
+        """max_runs번 실행한 워커는 새 워커로 교체"""
+        results, summary = _run([{"script": scripts["passed.py"]}] * 3, workers=1, max_runs=2)
+
+        assert all(result["status"] == "passed" for result in results)
+        assert results[0]["worker"] == results[1]["worker"] != results[2]["worker"]
+        assert summary["workers_started"] == 2
+
+    def test_dead_idle_worker_replaced(self, scripts):
+        """작업을 기다리던 워커가 종료되어 있으면 배치를 중단하지 않고 새 워커에 다시 배정"""
+        class FirstWorkerDies(BatchRunner):
+            def _start_worker(self):
+                worker = super()._start_worker()
+                if self.stats["workers_started"] == 1:
+                    worker.process.kill()
+                    worker.process.join()
+                return worker
+
+        results, summary = _run([{"script": scripts["passed.py"]}], FirstWorkerDies, workers=1)
+
+        assert results[0]["status"] == "passed"
+        assert summary["workers_started"] == 2
+
+    def test_workers_keep_dying(self, scripts):
+        """새 워커도 계속 종료되면 무한히 교체하지 않고 crashed로 보고"""
+        class AlwaysDies(BatchRunner):
+            def _start_worker(self):
+                worker = super()._start_worker()
+                worker.process.kill()
+                worker.process.join()
+                return worker
+
+        results, summary = _run([{"script": scripts["passed.py"]}], AlwaysDies, workers=1)
+
+        assert results[0]["status"] == "crashed"
+        assert summary["workers_started"] == MAX_ASSIGN_ATTEMPTS
+
+
+class TestParseResult:
+    """PythonService._parseResult와 같은 규칙"""
+
+    def test_rules(self):
+        """빈 출력, JSON, 일반 출력"""
+        assert parse_result("") == {"output": ""}
+        assert parse_result('{"status": "PASSED"}') == {"status": "PASSED"}
+        assert parse_result("hello")["output"] == "hello"
@@ -0,0 +1,139 @@
+"""
+selenium_pool.SeleniumDriverPool 단위 테스트 (가짜 WebDriver 사용, 브라우저 불필요)
+"""
+
+import pytest
+
+import selenium_pool
+from selenium_pool import SeleniumDriverPool
+
+pytestmark = pytest.mark.unit
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """창 목록과 창별 URL만 흉내 내는 WebDriver"""
+
+    def __init__(self):
+        self.windows = {"main": "about:blank"}
+        self.current = "main"
+        self.switch_to = FakeSwitchTo(self)
+        self.cookies_deleted = 0
+        self.quit_called = False
+
+    @property
+    def window_handles(self):
+        return list(self.windows)
+
+    @property
+    def current_url(self):
+        return self.windows[self.current]
+
+    def get(self, url):
+        self.windows[self.current] = url
+
+    def open_window(self, url):
+        self.windows[f"w{len(self.windows)}"] = url
+
+    def close(self):
+        del self.windows[self.current]
+
+    def execute_script(self, script):
+        return None
+
+    def delete_all_cookies(self):
+        self.cookies_deleted += 1
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeChromeDriver(FakeDriver):
+    def __init__(self):
+        super().__init__()
+        self.cdp_calls = []
+
+    def execute_cdp_cmd(self, cmd, params):
+        self.cdp_calls.append((cmd, params))
+
+
+@pytest.fixture
+def make_pool(monkeypatch):
+    def make(driver_class):
+        monkeypatch.setattr(selenium_pool, "create_driver", lambda options, browser_name: driver_class())
+        return SeleniumDriverPool(options=None, browser_name="Firefox", max_size=1, max_uses=5)
+    return make
+
+
+class TestSeleniumDriverPool:
+    """반납 시 초기화와 재사용 여부"""
+
+    def test_single_origin_reused_without_cdp(self, make_pool):
+        """CDP가 없어도 origin 하나만 방문했으면 쿠키 삭제 후 재사용"""
+        pool = make_pool(FakeDriver)
+        driver = pool.acquire()
+        driver.get("https://app.example.com/login")
+        driver.get("https://app.example.com/home")
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert driver.cookies_deleted == 1
+        assert pool.stats["hits"] == 1
+
+    def test_multiple_origins_discarded_without_cdp(self, make_pool):
+        """CDP 없이 여러 origin을 방문한 세션은 재사용하지 않음"""
+        pool = make_pool(FakeDriver)
+        driver = pool.acquire()
+        driver.get("https://app.example.com/")
+        driver.get("https://sso.example.net/authorize")
+        driver.get("https://app.example.com/home")
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert pool.stats["recycled_reset_error"] == 1
+        assert pool.acquire() is not driver
+
+    def test_origin_of_popup_window_counted(self, make_pool):
+        """get()을 거치지 않고 열린 창(팝업)의 origin도 기록"""
+        pool = make_pool(FakeDriver)
+        driver = pool.acquire()
+        driver.get("https://app.example.com/")
+        driver.open_window("https://payments.example.org/checkout")
+        pool.release(driver)
+
+        assert driver.quit_called
+        assert driver.window_handles == ["main"]
+
+    def test_cdp_clears_every_visited_origin(self, make_pool):
+        """Chromium 계열은 방문한 origin마다 스토리지를 정리하고 재사용"""
+        pool = make_pool(FakeChromeDriver)
+        driver = pool.acquire()
+        driver.get("https://app.example.com/")
+        driver.get("https://sso.example.net/authorize")
+        pool.release(driver)
+
+        cleared = {params["origin"] for cmd, params in driver.cdp_calls if cmd == "Storage.clearDataForOrigin"}
+        assert cleared == {"https://app.example.com", "https://sso.example.net"}
+        assert ("Network.clearBrowserCookies", {}) in driver.cdp_calls
+        assert pool.acquire() is driver
+
+    def test_origins_reset_between_tests(self, make_pool):
+        """이전 테스트에서 방문한 origin은 다음 반납에 영향을 주지 않음"""
+        pool = make_pool(FakeDriver)
+        driver = pool.acquire()
+        driver.get("https://app.example.com/")
+        pool.release(driver)
+
+        driver = pool.acquire()
+        driver.get("https://other.example.com/")
+        pool.release(driver)
+
+        assert not driver.quit_called
+        assert pool.stats["hits"] == 1
@@ -0,0 +1,96 @@
+"""
+self_healing의 요소 후보 인덱스와 점수 단위 테스트 (수집한 요소 메타데이터만 사용, 브라우저 불필요)
+"""
+
+import pytest
+
+from self_healing import ElementIndex, fingerprint_from_locator, score
+
+pytestmark = pytest.mark.unit
+
+
+def _element(css, tag="button", id=None, classes=(), text="", attrs=None, data_attrs=None):
+    return {"css": css, "tag": tag, "id": id, "classes": list(classes), "text": text,
+            "attrs": attrs or {}, "dataAttrs": data_attrs or {}}
+
+
+# 버튼 id가 바뀐 결제 페이지
+ELEMENTS = [
+    _element("#pay-now-v2", id="pay-now-v2", classes=["btn", "btn-primary"], text="결제하기"),
+    _element("#cancel", id="cancel", classes=["btn"], text="취소"),
+    _element("a.help", tag="a", classes=["help"], text="도움말"),
+    _element("input[name='email']", tag="input", attrs={"name": "email", "type": "email"}),
+    _element("", tag="div", text="css 없는 요소"),
+]
+
+
+class TestBestMatch:
+    """기록과 가장 비슷한 후보 요소"""
+
+    def test_renamed_id_matched_by_text_and_class(self):
+        """id가 바뀌어도 텍스트/class가 같은 요소"""
+        fingerprint = {"id": "pay-now", "tag": "button", "classes": ["btn", "btn-primary"], "text": "결제하기"}
+        match = ElementIndex(ELEMENTS).best_match(fingerprint, min_score=30)
+
+        assert match is not None
+        element, points, method = match
+        assert element["css"] == "#pay-now-v2"
+        assert method == "text"
+        assert points >= 30
+
+    def test_attribute_match(self):
+        """name 속성으로 후보 찾기"""
+        fingerprint = {"tag": "input", "attrs": {"name": "email"}}
+        element, _points, method = ElementIndex(ELEMENTS).best_match(fingerprint, min_score=20)
+        assert element["css"] == "input[name='email']"
+        assert method == "name"
+
+    def test_below_min_score(self):
+        """점수가 기준 미만이면 None"""
+        fingerprint = {"tag": "button", "classes": ["btn"]}
+        assert ElementIndex(ELEMENTS).best_match(fingerprint, min_score=50) is None
+
+    def test_ambiguous_tie(self):
+        """같은 점수의 후보가 여럿이면 잘못 고르지 않도록 None"""
+        elements = [_element("#a", classes=["item"], text="추가"), _element("#b", classes=["item"], text="추가")]
+        assert ElementIndex(elements).best_match({"tag": "button", "text": "추가"}, min_score=10) is None
+
+    def test_role_only_candidates(self):
+        """다른 특징이 하나도 맞지 않으면 역할이 같은 후보만 사용"""
+        index = ElementIndex(ELEMENTS)
+        assert [index.elements[position]["css"] for position in index.candidates({"tag": "a"})] == ["a.help"]
+
+    def test_elements_without_css_ignored(self):
+        """다시 찾을 수 없는(css 없는) 요소는 후보에서 제외"""
+        index = ElementIndex(ELEMENTS)
+        assert len(index.elements) == 4
+        assert index.best_match({"tag": "div", "text": "css 없는 요소"}, min_score=1) is None
+
+
+class TestScore:
+    """요소 기록과 후보의 유사도"""
+
+    def test_partial_text(self):
+        """텍스트가 일부만 같으면 낮은 점수"""
+        exact, _ = score({"text": "결제하기"}, _element("#x", text="결제하기"))
+        partial, method = score({"text": "결제"}, _element("#x", text="결제하기"))
+        assert 0 < partial < exact
+        assert method == "text"
+
+
+class TestFingerprintFromLocator:
+    """기록이 없을 때 locator에서 특징 추정"""
+
+    @pytest.mark.parametrize("by, value, expected", [
+        ("css", "form > button#pay.btn.primary", {"id": "pay", "tag": "button", "classes": ["btn", "primary"]}),
+        ("css", "[data-testid='pay']", {"dataAttrs": {"data-testid": "pay"}}),
+        ("css", "button:has-text('결제하기')", {"tag": "button", "text": "결제하기"}),
+        ("xpath", "//form//button[@name='pay']", {"tag": "button", "attrs": {"name": "pay"}}),
+        ("id", "pay", {"id": "pay"}),
+        ("link text", "도움말", {"tag": "a", "text": "도움말"}),
+    ])
+    def test_locator(self, by, value, expected):
+        """마지막 단계 selector의 id/class/태그/속성/텍스트"""
+        fingerprint = fingerprint_from_locator(by, value)
+        for key, expected_value in expected.items():
+            assert fingerprint[key] == expected_value, key
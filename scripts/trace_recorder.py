@@ -0,0 +1,407 @@
+"""
+실행 구간 기록기 (Chrome trace-event JSON)
+테스트 단계, fixture setup/teardown, 페이지 이동, Playwright/Selenium 호출, 실패 스크린샷, 힐링 트리거 시간을
+chrome://tracing / Perfetto(https://ui.perfetto.dev)에서 열 수 있는 trace-event 파일로 기록하고 구간별로 집계
+
+- 이벤트는 완료 이벤트("ph": "X") 한 줄로 바로 파일에 기록 (메모리에 누적하지 않음)
+- 파일은 JSON 배열 형식이라 실행이 중간에 끊겨도 열 수 있음
+- xdist 워커마다 별도 파일 (trace-gw0.json ...), 집계(trace-summary.json)는 컨트롤러에서 합침
+- Playwright(sync API)는 모든 호출이 지나가는 SyncBase._sync, Selenium은 WebDriver.execute 한 곳만 감싸서 측정
+  (page/driver 객체를 감싸지 않으므로 isinstance 검사, expect() 등에 영향 없음)
+"""
+
+import functools
+import glob
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, Any, List, Callable
+
+import pytest
+
+# xdist 워커 -> 컨트롤러로 집계를 전달하는 workeroutput 키
+TRACE_KEY = "testarchitect_trace"
+
+# 집계 파일 이름
+SUMMARY_FILE = "trace-summary.json"
+
+# 터미널에 출력할 구간 수
+TOP_N = int(os.getenv("TEST_TRACE_TOP", "10"))
+
+# 페이지 이동으로 분류하는 호출 (Playwright 메서드 이름 / Selenium 명령 이름)
+PLAYWRIGHT_NAVIGATION = frozenset(("goto", "reload", "go_back", "go_forward", "wait_for_url", "wait_for_load_state"))
+SELENIUM_NAVIGATION = frozenset(("get", "refresh", "goBack", "goForward"))
+SCREENSHOT_COMMANDS = frozenset(("screenshot", "elementScreenshot", "fullPageScreenshot"))
+
+# 완료 이벤트 한 줄 형식 (name, cat, ts, dur, pid, tid, args)
+_EVENT_FORMAT = '{"name":%s,"cat":"%s","ph":"X","ts":%.1f,"dur":%.1f,"pid":%d,"tid":%d%s}'
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str).encode
+
+# 기록 중인 기록기 (없으면 감싼 호출은 그대로 통과)
+_active: Optional["TraceRecorder"] = None
+
+
+class TraceRecorder:
+    """
+    trace-event 파일 기록 + 구간별 집계
+
+    - record(): 끝난 구간 하나를 기록 (시간은 time.perf_counter() 값)
+    - 집계 키는 (카테고리, 이름) -> [호출 수, 총 시간, 최대 시간, 최대 시간이 나온 테스트]
+    """
+
+    def __init__(self, path: str, process_name: str = "pytest"):
+        self.path = path
+        self.process_name = process_name
+        self.current_test: Optional[str] = None
+        self.events = 0
+        self.aggregate: Dict[tuple, list] = {}
+        self._pid = os.getpid()
+        # 워커 파일끼리 시간축을 맞추도록 벽시계 기준(µs)으로 변환
+        self._origin = time.perf_counter()
+        self._wall_origin_us = time.time() * 1e6
+        self._file = None
+        self._lock = threading.Lock()
+        self._threads = set()
+
+    def record(self, name: str, cat: str, start: float, end: float,
+               args: Optional[Dict[str, Any]] = None, key: Optional[str] = None) -> None:
+        """
+        구간 기록
+
+        Args:
+            name: trace 이벤트 이름
+            cat: 카테고리 (phase, fixture_setup, navigation, playwright ...)
+            start/end: time.perf_counter() 값
+            args: trace 이벤트에 함께 표시할 값
+            key: 집계 이름 (기본값은 name, 테스트처럼 이름이 매번 다른 구간은 공통 이름 사용)
+        """
+        duration = end - start
+        tid = threading.get_native_id()
+        # 이벤트마다 dict -> json.dumps 하지 않고 고정 형식으로 조립 (이름/값만 인코딩)
+        line = _EVENT_FORMAT % (
+            _encode(name), cat, self._wall_origin_us + (start - self._origin) * 1e6, duration * 1e6,
+            self._pid, tid, (',"args":' + _encode(args)) if args else ""
+        )
+
+        with self._lock:
+            if self._file is None:
+                if not self._open():
+                    return
+            if tid not in self._threads:
+                self._threads.add(tid)
+                self._write_metadata("thread_name", tid, threading.current_thread().name)
+            self._file.write(",\n" + line)
+            self.events += 1
+
+            entry = self.aggregate.get((cat, key or name))
+            if entry is None:
+                self.aggregate[(cat, key or name)] = [1, duration, duration, self.current_test]
+            else:
+                entry[0] += 1
+                entry[1] += duration
+                if duration > entry[2]:
+                    entry[2] = duration
+                    entry[3] = self.current_test
+
+    @contextmanager
+    def span(self, name: str, cat: str, args: Optional[Dict[str, Any]] = None):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, cat, start, time.perf_counter(), args)
+
+    def _open(self) -> bool:
+        try:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            self._file = open(self.path, "w", encoding="utf-8", buffering=1024 * 1024)
+        except OSError as e:
+            print(f"[Trace] trace 파일을 열 수 없습니다 ({self.path}): {e}")
+            self.record = lambda *args, **kwargs: None
+            return False
+        # 첫 항목은 프로세스 이름 (이후 이벤트는 ",\n"으로 이어 붙임)
+        self._file.write("[\n" + json.dumps({
+            "name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": self.process_name}
+        }, ensure_ascii=False))
+        return True
+
+    def _write_metadata(self, name: str, tid: int, value: str) -> None:
+        self._file.write(",\n" + json.dumps({
+            "name": name, "ph": "M", "pid": self._pid, "tid": tid, "args": {"name": value}
+        }, ensure_ascii=False))
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file is not None:
+                try:
+                    self._file.write("\n]\n")
+                    self._file.close()
+                except OSError:
+                    pass
+                self._file = None
+
+    def rows(self) -> List[list]:
+        """집계를 xdist로 전달할 수 있는 목록으로 변환 ([카테고리, 이름, 호출 수, 총 시간, 최대 시간, 테스트])"""
+        return [[cat, name, *values] for (cat, name), values in self.aggregate.items()]
+
+    def stats(self) -> Dict[str, Any]:
+        """실행 통계에 넣을 카테고리별 총 시간(ms)"""
+        stats: Dict[str, Any] = {"events": self.events}
+        for (cat, _name), (_calls, total, _peak, _test) in self.aggregate.items():
+            stats[f"{cat}_ms"] = stats.get(f"{cat}_ms", 0.0) + total * 1000
+        return {key: round(value, 1) if isinstance(value, float) else value for key, value in stats.items()}
+
+
+def merge_rows(aggregate: Dict[tuple, list], rows: List[list]) -> None:
+    """rows()로 받은 집계를 합침"""
+    for cat, name, calls, total, peak, test in rows:
+        entry = aggregate.get((cat, name))
+        if entry is None:
+            aggregate[(cat, name)] = [calls, total, peak, test]
+        else:
+            entry[0] += calls
+            entry[1] += total
+            if peak > entry[2]:
+                entry[2] = peak
+                entry[3] = test
+
+
+def summarize(aggregate: Dict[tuple, list]) -> Dict[str, Any]:
+    """카테고리별 합계 + 구간별 집계 (총 시간 순)"""
+    phases: Dict[str, Dict[str, Any]] = {}
+    steps = []
+    for (cat, name), (calls, total, peak, test) in aggregate.items():
+        phase = phases.setdefault(cat, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+        phase["calls"] += calls
+        phase["total_ms"] += total * 1000
+        phase["max_ms"] = max(phase["max_ms"], peak * 1000)
+        steps.append({
+            "cat": cat, "name": name, "calls": calls,
+            "total_ms": round(total * 1000, 2), "max_ms": round(peak * 1000, 2), "max_test": test,
+        })
+    for phase in phases.values():
+        phase["total_ms"] = round(phase["total_ms"], 2)
+        phase["max_ms"] = round(phase["max_ms"], 2)
+    steps.sort(key=lambda step: -step["total_ms"])
+    return {"phases": dict(sorted(phases.items(), key=lambda item: -item[1]["total_ms"])), "steps": steps}
+
+
+def span(name: str, cat: str, args: Optional[Dict[str, Any]] = None):
+    """기록 중이면 구간을 기록하는 컨텍스트 (기록 중이 아니면 아무것도 하지 않음)"""
+    recorder = _active
+    if recorder is None:
+        return nullcontext()
+    return recorder.span(name, cat, args)
+
+
+# ----------------------------------------------------------------------
+# Playwright / Selenium 호출 측정
+# ----------------------------------------------------------------------
+
+def _wrap_playwright_sync(original):
+    @functools.wraps(original)
+    def _sync(self, coro):
+        recorder = _active
+        if recorder is None:
+            return original(self, coro)
+        name = getattr(coro, "__qualname__", "playwright")
+        method = name.rpartition(".")[2]
+        args = None
+        if method in PLAYWRIGHT_NAVIGATION:
+            cat = "navigation"
+            # 시작 전 코루틴의 인자 (goto(url=...))
+            frame = getattr(coro, "cr_frame", None)
+            url = frame.f_locals.get("url") if frame is not None else None
+            if isinstance(url, str):
+                args = {"url": url}
+        elif method == "screenshot":
+            cat = "screenshot"
+        else:
+            cat = "playwright"
+        start = time.perf_counter()
+        try:
+            return original(self, coro)
+        finally:
+            recorder.record(name, cat, start, time.perf_counter(), args)
+    _sync.__testarchitect_original__ = original
+    return _sync
+
+
+def _wrap_selenium_execute(original):
+    @functools.wraps(original)
+    def execute(self, driver_command, params=None):
+        recorder = _active
+        if recorder is None:
+            return original(self, driver_command, params)
+        args = None
+        if driver_command in SELENIUM_NAVIGATION:
+            cat = "navigation"
+            if params and "url" in params:
+                args = {"url": params["url"]}
+        elif driver_command in SCREENSHOT_COMMANDS:
+            cat = "screenshot"
+        else:
+            cat = "selenium"
+        start = time.perf_counter()
+        try:
+            return original(self, driver_command, params)
+        finally:
+            recorder.record(f"selenium.{driver_command}", cat, start, time.perf_counter(), args)
+    execute.__testarchitect_original__ = original
+    return execute
+
+
+def _patch(cls, attribute: str, wrap: Callable) -> None:
+    """cls.attribute를 이 모듈의 래퍼로 교체 (상주 실행기에서 모듈을 다시 import해도 원본 기준으로 한 번만 감쌈)"""
+    current = cls.__dict__.get(attribute)
+    if current is None or getattr(current, "__globals__", None) is globals():
+        # 없거나 이미 이 모듈이 감쌈
+        return
+    original = getattr(current, "__testarchitect_original__", current)
+    setattr(cls, attribute, wrap(original))
+
+
+def instrument_loaded_drivers() -> None:
+    """이미 import된 Playwright/Selenium 모듈만 측정 대상으로 설정 (여기서 import하지 않음)"""
+    sync_base = sys.modules.get("playwright._impl._sync_base")
+    if sync_base is not None and hasattr(sync_base, "SyncBase"):
+        _patch(sync_base.SyncBase, "_sync", _wrap_playwright_sync)
+    webdriver = sys.modules.get("selenium.webdriver.remote.webdriver")
+    if webdriver is not None and hasattr(webdriver, "WebDriver"):
+        _patch(webdriver.WebDriver, "execute", _wrap_selenium_execute)
+
+
+# ----------------------------------------------------------------------
+# pytest 플러그인
+# ----------------------------------------------------------------------
+
+class TracePlugin:
+    """
+    실행 구간 기록 플러그인 (conftest.py가 --trace-events 지정 시 등록)
+
+    - 테스트(runtest_protocol)와 setup/call/teardown 단계, fixture setup/teardown을 기록
+    - fixture setup 뒤마다 새로 import된 Playwright/Selenium 모듈을 측정 대상으로 설정
+    """
+
+    def __init__(self, config, trace_dir: str, publish_stats: Optional[Callable[[str, Dict[str, Any]], None]] = None):
+        global _active
+        self.config = config
+        self.trace_dir = trace_dir
+        self.publish_stats = publish_stats
+        workerinput = getattr(config, "workerinput", None)
+        self.worker_id = workerinput["workerid"] if workerinput else "main"
+        if workerinput is None:
+            # 이전 실행의 워커 파일 정리 (워커가 시작되기 전)
+            for stale in glob.glob(os.path.join(trace_dir, "trace-*.json")):
+                try:
+                    os.remove(stale)
+                except OSError:
+                    pass
+        self.recorder = TraceRecorder(
+            os.path.join(trace_dir, f"trace-{self.worker_id}.json"),
+            process_name=f"pytest {self.worker_id}"
+        )
+        # 워커에서 받은 집계 (컨트롤러)
+        self.aggregate: Dict[tuple, list] = {}
+        # id(fixturedef) -> teardown 시작 시간
+        self._teardown_started: Dict[int, float] = {}
+        _active = self.recorder
+        instrument_loaded_drivers()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        recorder = self.recorder
+        recorder.current_test = item.nodeid
+        start = time.perf_counter()
+        yield
+        recorder.record(item.nodeid, "test", start, time.perf_counter(), key="test")
+        recorder.current_test = None
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_setup(self, item):
+        start = time.perf_counter()
+        yield
+        self.recorder.record("setup", "phase", start, time.perf_counter())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        start = time.perf_counter()
+        yield
+        self.recorder.record("call", "phase", start, time.perf_counter())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item, nextitem):
+        start = time.perf_counter()
+        yield
+        self.recorder.record("teardown", "phase", start, time.perf_counter())
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef, request):
+        instrument_loaded_drivers()
+        start = time.perf_counter()
+        outcome = yield
+        self.recorder.record(fixturedef.argname, "fixture_setup", start, time.perf_counter(),
+                             {"scope": fixturedef.scope})
+        # fixture가 import한 Playwright/Selenium은 다음 호출부터 측정 (예: playwright_instance 다음 브라우저 실행)
+        instrument_loaded_drivers()
+        if outcome.excinfo is None:
+            # 마지막에 등록한 finalizer가 가장 먼저 실행됨 -> teardown 시작 시점
+            key = id(fixturedef)
+            fixturedef.addfinalizer(lambda: self._teardown_started.__setitem__(key, time.perf_counter()))
+
+    def pytest_fixture_post_finalizer(self, fixturedef, request):
+        start = self._teardown_started.pop(id(fixturedef), None)
+        if start is not None:
+            self.recorder.record(fixturedef.argname, "fixture_teardown", start, time.perf_counter(),
+                                 {"scope": fixturedef.scope})
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_testnodedown(self, node, error):
+        rows = getattr(node, "workeroutput", {}).get(TRACE_KEY)
+        if rows:
+            merge_rows(self.aggregate, rows)
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        # conftest.py의 pytest_sessionfinish(통계 전달)보다 먼저 실행
+        global _active
+        recorder = self.recorder
+        recorder.close()
+        if _active is recorder:
+            _active = None
+        if recorder.events and self.publish_stats is not None:
+            self.publish_stats("trace", recorder.stats())
+
+        workeroutput = getattr(self.config, "workeroutput", None)
+        if workeroutput is not None:
+            workeroutput[TRACE_KEY] = recorder.rows()
+            return
+        merge_rows(self.aggregate, recorder.rows())
+        if not self.aggregate:
+            return
+        summary = summarize(self.aggregate)
+        summary["trace_files"] = sorted(glob.glob(os.path.join(self.trace_dir, "trace-*.json")))
+        try:
+            with open(os.path.join(self.trace_dir, SUMMARY_FILE), "w", encoding="utf-8") as f:
+                json.dump(summary, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"[Trace] 집계 파일 저장 실패: {e}")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.aggregate:
+            return
+        summary = summarize(self.aggregate)
+        write = terminalreporter.write_line
+        terminalreporter.write_sep("-", f"실행 구간 요약 (trace: {self.trace_dir})")
+        write("구간별 총 시간(ms): " + ", ".join(
+            f"{cat}={phase['total_ms']}" for cat, phase in summary["phases"].items()
+        ))
+        write(f"총 시간 상위 {TOP_N}개:")
+        for step in [s for s in summary["steps"] if s["cat"] not in ("test", "phase")][:TOP_N]:
+            write(f"  {step['total_ms']:>10.1f}  {step['cat']}:{step['name']} "
+                  f"(호출 {step['calls']}회, 최대 {step['max_ms']}ms @ {step['max_test']})")
+
@@ -28,6 +28,8 @@ const wss = new WebSocket.Server({ server });
 
 // 미들웨어
 app.use(cors());
+// 힐링 트리거는 DOM을 포함한 여러 실패를 배치로 전송하므로 본문 크기 제한을 늘림
+app.use('/api/locator-healing', bodyParser.json({ limit: '50mb' }));
 app.use(bodyParser.json());
 app.use(bodyParser.urlencoded({ extended: true }));
 
@@ -10,45 +10,151 @@ const healingService = require('../services/locatorHealingService');
 const codeModifier = require('../services/codeModifier');
 
 /**
- * 힐링 트리거 (테스트 실패 시 자동 호출)
- * POST /api/locator-healing/trigger
+ * 진행 중인 힐링 (locator + URL + DOM 해시 → Promise)
+ * 여러 워커가 같은 실패를 동시에 보내면 힐링을 한 번만 수행
  */
-router.post('/trigger', async (req, res) => {
-  try {
-    const { failure_info, test_file, test_function, timestamp } = req.body;
+const inflightHeals = new Map();
 
-    if (!failure_info || !failure_info.failed_locator) {
-      return res.status(400).json({
+/**
+ * 힐링 트리거 단건 처리
+ * @param {Object} payload - { failure_info, test_file, test_function, timestamp }
+ * @returns {Promise<{status: number, body: Object}>} HTTP 상태 코드와 응답 본문
+ */
+async function processTrigger(payload) {
+  const { failure_info } = payload || {};
+
+  if (!failure_info || !failure_info.failed_locator) {
+    return {
+      status: 400,
+      body: {
         success: false,
         error: 'failure_info와 failed_locator는 필수입니다.'
-      });
-    }
+      }
+    };
+  }
 
-    const { failed_locator, locator_type, page_url, line_number, current_dom } = failure_info;
+  const { failed_locator, locator_type, page_url, current_dom_hash, current_dom_type } = failure_info;
+  let { current_dom } = failure_info;
 
-    // 힐링 수행
-    const healingResult = await healingService.healLocator({
+  // 콘텐츠 주소 DOM: 본문이 있으면 해시로 캐시, 해시만 있으면 캐시에서 조회
+  if (current_dom_hash) {
+    if (current_dom) {
+      await healingService.rememberCurrentDom(current_dom_hash, current_dom);
+    } else {
+      current_dom = await healingService.resolveCurrentDom(current_dom_hash);
+      if (!current_dom) {
+        // 서버 재시작/캐시 교체로 모르는 해시: DOM 없이 힐링하지 않고 전송기가 DOM 전체를 다시 보내도록 응답
+        return {
+          status: 200,
+          body: {
+            success: false,
+            error: `DOM 해시를 찾을 수 없습니다: ${current_dom_hash}`,
+            unknown_dom_hashes: [current_dom_hash]
+          }
+        };
+      }
+    }
+  }
+
+  // 힐링 수행 (동일한 요청이 진행 중이면 결과 공유)
+  const healKey = [failed_locator, locator_type, page_url, current_dom_hash || ''].join('\u0000');
+  let healingPromise = inflightHeals.get(healKey);
+  if (!healingPromise) {
+    healingPromise = healingService.healLocator({
       failedLocator: failed_locator,
       locatorType: locator_type || 'playwright',
       pageUrl: page_url,
       snapshotId: null,
-      currentDom: current_dom || null
-    });
+      currentDom: current_dom || null,
+      currentDomType: current_dom_type || 'html'
+    }).finally(() => inflightHeals.delete(healKey));
+    inflightHeals.set(healKey, healingPromise);
+  }
+  const healingResult = await healingPromise;
 
-    if (!healingResult.success) {
-      return res.json({
+  if (!healingResult.success) {
+    return {
+      status: 200,
+      body: {
         success: false,
         error: healingResult.error,
         healing_attempted: true
-      });
-    }
+      }
+    };
+  }
 
-    // 힐링 결과 반환 (자동 적용은 나중에)
-    res.json({
+  // 힐링 결과 반환 (자동 적용은 나중에)
+  return {
+    status: 200,
+    body: {
       success: true,
       healing_result: healingResult,
       message: '힐링 완료. 수동으로 코드에 적용해주세요.'
-    });
+    }
+  };
+}
+
+/**
+ * 배치 항목 중 해시만 있는 DOM을 미리 찾아 본문으로 채움 (접수 응답 전에 모르는 해시를 알려주기 위해)
+ * @param {Object[]} batch - 배치 항목
+ * @returns {Promise<{accepted: Object[], unknownHashes: string[]}>} 처리할 항목과 찾지 못한 DOM 해시
+ */
+async function resolveBatchDoms(batch) {
+  const accepted = [];
+  const unknownHashes = new Set();
+  for (const payload of batch) {
+    const info = payload && payload.failure_info;
+    if (!info || !info.current_dom_hash || info.current_dom) {
+      accepted.push(payload);
+      continue;
+    }
+    const currentDom = await healingService.resolveCurrentDom(info.current_dom_hash);
+    if (currentDom) {
+      accepted.push({ ...payload, failure_info: { ...info, current_dom: currentDom } });
+    } else {
+      unknownHashes.add(info.current_dom_hash);
+    }
+  }
+  return { accepted, unknownHashes: [...unknownHashes] };
+}
+
+/**
+ * 힐링 트리거 (테스트 실패 시 자동 호출)
+ * POST /api/locator-healing/trigger
+ *
+ * 단건: { failure_info, test_file, test_function, timestamp }
+ * 배치: { batch: [단건, ...] } (conftest.py의 백그라운드 전송기가 여러 실패를 묶어 전송)
+ *
+ * 해시만 보낸 DOM을 찾을 수 없으면 해당 항목은 처리하지 않고 unknown_dom_hashes로 응답
+ * (전송기가 DOM 전체를 포함해 다시 전송)
+ */
+router.post('/trigger', async (req, res) => {
+  try {
+    if (Array.isArray(req.body.batch)) {
+      const { accepted: batch, unknownHashes } = await resolveBatchDoms(req.body.batch);
+
+      // 배치는 접수 즉시 응답하고 힐링은 순차적으로 처리 (전송기의 요청 타임아웃 방지)
+      res.status(202).json({
+        success: true,
+        accepted: batch.length,
+        unknown_dom_hashes: unknownHashes
+      });
+
+      for (const payload of batch) {
+        try {
+          const { body } = await processTrigger(payload);
+          if (!body.success) {
+            console.warn('[Locator Healing API] 배치 힐링 실패:', body.error);
+          }
+        } catch (error) {
+          console.error('[Locator Healing API] 배치 힐링 트리거 항목 오류:', error);
+        }
+      }
+      return;
+    }
+
+    const { status, body } = await processTrigger(req.body);
+    res.status(status).json(body);
   } catch (error) {
     console.error('[Locator Healing API] 힐링 트리거 오류:', error);
     res.status(500).json({
@@ -71,7 +177,8 @@ router.post('/heal', async (req, res) => {
       page_url,
       line_number,
       healing_method = 'auto',
-      current_dom
+      current_dom,
+      current_dom_type
     } = req.body;
 
     if (!test_script_id || !failed_locator || !page_url) {
@@ -96,7 +203,8 @@ router.post('/heal', async (req, res) => {
       locatorType: locator_type || 'playwright',
       pageUrl: page_url,
       snapshotId: null,
-      currentDom: current_dom || null
+      currentDom: current_dom || null,
+      currentDomType: current_dom_type || 'html'
     });
 
     if (!healingResult.success) {
@@ -541,6 +541,43 @@ async function getLatestSnapshot(normalizedUrl, decompress = true) {
   }
 }
 
+/**
+ * 해시로 스냅샷 조회 (압축 해제 포함)
+ * @param {string} snapshotHash - DOM SHA256 해시 (압축 전 원본 기준)
+ * @returns {Promise<Object|null>} 스냅샷 또는 null
+ */
+async function getSnapshotByHash(snapshotHash) {
+  try {
+    const query = `
+      SELECT *
+      FROM dom_snapshots
+      WHERE snapshot_hash = ?
+        AND expires_at > NOW()
+      ORDER BY captured_at DESC
+      LIMIT 1
+    `;
+    
+    const snapshot = await db.get(query, [snapshotHash]);
+    
+    if (!snapshot) {
+      return null;
+    }
+    
+    if (snapshot.snapshot_data) {
+      try {
+        snapshot.decompressed_data = await decompressDomData(snapshot.snapshot_data);
+      } catch (error) {
+        snapshot.decompressed_data = snapshot.snapshot_data;
+      }
+    }
+    
+    return snapshot;
+  } catch (error) {
+    console.error('[Snapshot Scheduler] 해시로 스냅샷 조회 실패:', error);
+    return null;
+  }
+}
+
 /**
  * 특정 URL의 최근 N개 스냅샷 조회 (히스토리)
  * @param {string} normalizedUrl - 정규화된 URL
@@ -636,10 +673,13 @@ module.exports = {
   analyzeURLPattern,
   matchURLPattern,
   generateHash,
+  compressDomData,
+  decompressDomData,
   saveSnapshot,
   cleanupExpiredSnapshots,
   getLatestSnapshot,
   getRecentSnapshots,
+  getSnapshotByHash,
   getSnapshotHistory,
   shouldSaveSnapshot,
   isDuplicateSnapshot,
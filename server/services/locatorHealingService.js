@@ -205,6 +205,43 @@ async function findElementInSnapshot(snapshotData, failedLocator, locatorType, i
   return null;
 }
 
+/**
+ * 요소 메타데이터를 HTML 조각으로 변환
+ * 테스트 실행기가 보낸 후보 요소 목록(element_metadata.py)을 HTML 기반 매칭 로직에 그대로 사용하기 위함
+ * @param {string|Object} metadata - { elements: [{ tag, id, classes, text, attrs, dataAttrs }] }
+ * @returns {string|null} 요소마다 한 줄인 HTML 또는 null
+ */
+function metadataToHtml(metadata) {
+  let parsed;
+  try {
+    parsed = typeof metadata === 'string' ? JSON.parse(metadata) : metadata;
+  } catch (error) {
+    console.error('[Healing Service] 현재 DOM 메타데이터 파싱 실패:', error);
+    return null;
+  }
+  if (!parsed || !Array.isArray(parsed.elements)) {
+    return null;
+  }
+  
+  const escapeHtml = (value) => String(value)
+    .replace(/&/g, '&amp;')
+    .replace(/</g, '&lt;')
+    .replace(/>/g, '&gt;')
+    .replace(/"/g, '&quot;');
+  
+  return parsed.elements.map((elem) => {
+    const tag = /^[a-z][\w-]*$/i.test(elem.tag || '') ? elem.tag : 'div';
+    const attrs = [];
+    if (elem.id) attrs.push(`id="${escapeHtml(elem.id)}"`);
+    if (Array.isArray(elem.classes) && elem.classes.length) attrs.push(`class="${escapeHtml(elem.classes.join(' '))}"`);
+    for (const [name, value] of Object.entries({ ...(elem.attrs || {}), ...(elem.dataAttrs || {}) })) {
+      attrs.push(`${name}="${escapeHtml(value)}"`);
+    }
+    const openTag = attrs.length ? `<${tag} ${attrs.join(' ')}>` : `<${tag}>`;
+    return `${openTag}${escapeHtml(elem.text || '')}</${tag}>`;
+  }).join('\n');
+}
+
 /**
  * 정규식 이스케이프
  */
@@ -553,10 +590,17 @@ function generateOptimalLocators(elementInCurrentDom, currentDom, locatorType) {
  * @param {string} options.pageUrl - 현재 페이지 URL
  * @param {string} options.snapshotId - 사용할 스냅샷 ID
  * @param {string} options.currentDom - 현재 DOM HTML (필수: 현재 DOM에서 요소를 찾기 위해 필요)
+ * @param {string} options.currentDomType - currentDom 형식 ('html' 또는 'metadata', 기본값: 'html')
  * @returns {Promise<Object>} 힐링 결과
  */
 async function healLocator(options) {
-  const { failedLocator, locatorType, pageUrl, snapshotId, currentDom } = options;
+  const { failedLocator, locatorType, pageUrl, snapshotId, currentDomType } = options;
+  let { currentDom } = options;
+  
+  // 후보 요소 메타데이터로 받은 현재 DOM은 HTML 조각으로 바꿔 같은 매칭 로직 사용
+  if (currentDom && currentDomType === 'metadata') {
+    currentDom = metadataToHtml(currentDom);
+  }
   
   if (!failedLocator || !pageUrl) {
     return {
@@ -802,6 +846,55 @@ async function healLocator(options) {
   };
 }
 
+/**
+ * 힐링 트리거로 전달받은 현재 DOM 캐시 (해시 → gzip 압축 데이터)
+ * 같은 DOM으로 반복되는 실패는 해시만 전송되므로 여기서 찾아 사용
+ * Map의 삽입 순서를 이용한 LRU
+ */
+const CURRENT_DOM_CACHE_LIMIT = 200;
+const currentDomCache = new Map();
+
+/**
+ * 현재 DOM을 해시로 캐시
+ * @param {string} domHash - DOM SHA256 해시
+ * @param {string} currentDom - DOM HTML
+ */
+async function rememberCurrentDom(domHash, currentDom) {
+  if (!domHash || !currentDom || currentDomCache.has(domHash)) {
+    return;
+  }
+  
+  const compressed = await snapshotScheduler.compressDomData(currentDom);
+  currentDomCache.set(domHash, compressed);
+  
+  if (currentDomCache.size > CURRENT_DOM_CACHE_LIMIT) {
+    const oldestKey = currentDomCache.keys().next().value;
+    currentDomCache.delete(oldestKey);
+  }
+}
+
+/**
+ * 해시로 현재 DOM 조회 (메모리 캐시 → 저장된 DOM 스냅샷 순)
+ * @param {string} domHash - DOM SHA256 해시
+ * @returns {Promise<string|null>} DOM HTML 또는 null
+ */
+async function resolveCurrentDom(domHash) {
+  if (!domHash) {
+    return null;
+  }
+  
+  const compressed = currentDomCache.get(domHash);
+  if (compressed) {
+    // 최근 사용 항목으로 갱신
+    currentDomCache.delete(domHash);
+    currentDomCache.set(domHash, compressed);
+    return snapshotScheduler.decompressDomData(compressed);
+  }
+  
+  const snapshot = await snapshotScheduler.getSnapshotByHash(domHash);
+  return snapshot ? snapshot.decompressed_data : null;
+}
+
 /**
  * 힐링 히스토리 저장
  * @param {Object} healingData - 힐링 데이터
@@ -905,9 +998,12 @@ async function getHealingHistory(filters = {}) {
 
 module.exports = {
   healLocator,
+  rememberCurrentDom,
+  resolveCurrentDom,
   saveHealingHistory,
   getHealingHistory,
   findElementInSnapshot,
+  metadataToHtml,
   generateTextLocator,
   generateAttributeLocator
 };
@@ -117,7 +117,11 @@ const config = {
       maxFailures: null,          // 최대 실패 허용 수 (null = 무제한)
       timeout: 300,               // 테스트 타임아웃(초)
       captureScreenshots: true,    // 스크린샷 자동 캡처 여부
-      htmlReport: true            // HTML 리포트 생성 여부
+      htmlReport: true,           // HTML 리포트 생성 여부
+      streamReport: true,         // 테스트 단계별 NDJSON 이벤트 스트리밍 여부
+      jsonReport: true,           // 실행 종료 시 전체 JSON 리포트 생성 여부 (false면 NDJSON 이벤트로 결과 구성)
+      warmRunner: true,           // 상주 pytest 실행기 사용 여부 (실패 시 새 프로세스로 실행)
+      traceEvents: true           // 실행 구간 trace-event 기록 여부 (.pytest-reports/trace)
     }
   },
 
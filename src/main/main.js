@@ -49,6 +49,7 @@ const net = require('net');
 const WebSocket = require('ws');
 const config = require('./config/config');
 const PytestService = require('./services/pytestService');
+const PytestDaemonService = require('./services/pytestDaemonService');
 const ScriptManager = require('./services/scriptManager');
 const EnvironmentChecker = require('./services/environmentChecker');
 const DbService = require('./services/dbService');
@@ -5525,6 +5526,9 @@ app.on('before-quit', () => {
   // 전역 단축키 해제
   globalShortcut.unregisterAll();
   
+  // 상주 pytest 실행기 종료 (유지 중인 브라우저 포함)
+  PytestDaemonService.stop();
+  
   // 녹화 서버 종료
     if (recordingServer) {
       // WebSocket 서버 종료
@@ -5807,6 +5811,20 @@ ipcMain.handle('cleanup-old-snapshots', async (event) => {
   }
 });
 
+/**
+ * pytest NDJSON 이벤트를 렌더러로 전달하는 콜백 생성
+ * 렌더러에서는 window.electronAPI.onIpcMessage('test-progress', callback)으로 수신
+ * @param {Electron.WebContents} sender - 실행을 요청한 렌더러
+ * @returns {Function} PytestService.runTests의 onEvent 콜백
+ */
+function createTestProgressForwarder(sender) {
+  return (testEvent) => {
+    if (!sender.isDestroyed()) {
+      sender.send('test-progress', testEvent);
+    }
+  };
+}
+
 /**
  * Pytest 테스트 실행 IPC 핸들러
  * 렌더러 프로세스에서 pytest 테스트 실행 요청 처리
@@ -5823,7 +5841,10 @@ ipcMain.handle('cleanup-old-snapshots', async (event) => {
  */
 ipcMain.handle('run-python-script', async (event, testFile, args = [], options = {}) => {
   try {
-    const result = await PytestService.runTests(testFile, args, options);
+    const result = await PytestService.runTests(testFile, args, {
+      ...options,
+      onEvent: createTestProgressForwarder(event.sender)
+    });
     return result;
   } catch (error) {
     // 에러를 일관된 형식으로 반환
@@ -5981,6 +6002,33 @@ async function cleanupTempDir(tempDir, maxRetries = 5, retryDelay = 500) {
   }
 }
 
+/**
+ * conftest.py가 import하는 보조 모듈 (임시 실행 디렉토리로 함께 복사)
+ */
+const CONFTEST_SUPPORT_MODULES = [
+  'context_pool.py',
+  'selenium_pool.py',
+  'healing_dispatcher.py',
+  'dom_cache.py',
+  'screenshot_pipeline.py',
+  'async_playwright_runner.py',
+  'ndjson_reporter.py',
+  'startup_profiler.py',
+  'trace_recorder.py',
+  'duration_history.py',
+  'duration_scheduler.py',
+  'incremental_selection.py',
+  'network_cache.py',
+  'resource_blocking.py',
+  'auth_state.py',
+  'image_compare.py',
+  'element_metadata.py',
+  'self_healing.py',
+  'browser_matrix.py',
+  'memory_telemetry.py',
+  'failure_trace.py'
+];
+
 /**
  * 여러 스크립트를 임시 파일로 생성하여 실행
  * DB에서 코드를 가져와 임시 파일 생성 → 실행 → 삭제
@@ -6203,7 +6251,7 @@ ipcMain.handle('run-python-scripts', async (event, scripts, args = [], options =
         
         if (!found) {
           console.warn(`[WARN] test_utils.py not found. Tried: ${altPaths.map(p => path.resolve(p)).join(', ')}`);
-          console.warn('[WARN] Continuing without test_utils.py (normalize_url may not work)');
+          console.warn('[WARN] Continuing without test_utils.py (URL matchers may not work)');
         }
       } else {
         console.warn(`[WARN] Failed to copy test_utils.py: ${error.code || error.message}`);
@@ -6211,6 +6259,18 @@ ipcMain.handle('run-python-scripts', async (event, scripts, args = [], options =
       // test_utils.py가 없어도 계속 진행
     }
     
+    // 3-2-1. conftest.py 보조 모듈 복사 (컨텍스트 풀, 힐링 전송기 등)
+    for (const moduleName of CONFTEST_SUPPORT_MODULES) {
+      try {
+        const moduleContent = await fs.readFile(path.join(scriptsDir, moduleName), 'utf-8');
+        await fs.writeFile(path.join(tempDir, moduleName), moduleContent, 'utf-8');
+        console.log(`[INFO] ${moduleName} copied successfully`);
+      } catch (error) {
+        // 보조 모듈이 없으면 해당 기능만 비활성화되므로 계속 진행
+        console.warn(`[WARN] Failed to copy ${moduleName}: ${error.code || error.message}`);
+      }
+    }
+    
     // 3-3. snapshots 폴더 생성 및 DB에서 이미지 불러오기
     const snapshotsDir = path.join(tempDir, 'snapshots');
     await fs.mkdir(snapshotsDir, { recursive: true });
@@ -6383,7 +6443,8 @@ ipcMain.handle('run-python-scripts', async (event, scripts, args = [], options =
     // 절대 경로로 전달 (한글 경로 문제 해결)
     const result = await PytestService.runTests(testFiles, args, {
       ...options,
-      cwd: tempDir  // 임시 디렉토리에서 실행 (conftest.py를 찾기 위해)
+      cwd: tempDir,  // 임시 디렉토리에서 실행 (conftest.py를 찾기 위해)
+      onEvent: createTestProgressForwarder(event.sender)
     });
     
     // 6. 임시 파일 삭제 (안전한 cleanup 사용)
@@ -0,0 +1,178 @@
+/**
+ * NDJSON 리포트 리더
+ * scripts/ndjson_reporter.py가 기록하는 이벤트 파일을 실행 중에 따라 읽음 (tail)
+ * 파일 전체를 메모리에 올리지 않고 새로 추가된 바이트만 고정 크기 버퍼로 읽어 줄 단위로 처리
+ */
+
+const fs = require('fs');
+const { StringDecoder } = require('string_decoder');
+
+/** 한 번에 읽는 바이트 수 */
+const READ_CHUNK_SIZE = 64 * 1024;
+
+/** 파일 확인 주기(ms) */
+const POLL_INTERVAL_MS = 200;
+
+class NdjsonReportReader {
+  /**
+   * @param {string} filePath - NDJSON 리포트 파일 경로
+   * @param {Function|null} onEvent - 이벤트마다 호출될 콜백 (event 객체 전달)
+   */
+  constructor(filePath, onEvent = null) {
+    this.filePath = filePath;
+    this.onEvent = onEvent;
+    this._fd = null;
+    this._offset = 0;
+    this._buffer = Buffer.alloc(READ_CHUNK_SIZE);
+    this._decoder = new StringDecoder('utf8');
+    this._pending = '';
+    this._timer = null;
+
+    // pytest-json-report와 같은 구조로 모은 결과
+    this._tests = [];
+    this._summary = null;
+    this._stats = null;
+    this._collectErrors = [];
+    this._exitStatus = null;
+  }
+
+  /**
+   * 파일 따라 읽기 시작
+   * @returns {NdjsonReportReader} this
+   */
+  start() {
+    this._timer = setInterval(() => this._poll(), POLL_INTERVAL_MS);
+    return this;
+  }
+
+  /**
+   * 따라 읽기 중지 (남은 내용을 모두 읽은 뒤 파일 닫기)
+   * @returns {Object|null} 모은 결과 (session_finish 이벤트를 받지 못했으면 summary는 테스트 이벤트로 계산)
+   */
+  stop() {
+    if (this._timer) {
+      clearInterval(this._timer);
+      this._timer = null;
+    }
+    this._poll();
+    const rest = this._pending + this._decoder.end();
+    this._pending = '';
+    if (rest.trim()) {
+      this._handleLine(rest);
+    }
+    if (this._fd !== null) {
+      try {
+        fs.closeSync(this._fd);
+      } catch (error) {
+        // 이미 닫힌 경우 무시
+      }
+      this._fd = null;
+    }
+    return this.toReport();
+  }
+
+  /**
+   * 모은 결과를 pytest-json-report와 같은 구조로 반환
+   * @returns {Object|null} { summary, tests, exitcode, testarchitect_stats } 또는 이벤트가 없으면 null
+   */
+  toReport() {
+    if (!this._summary && this._tests.length === 0 && this._collectErrors.length === 0) {
+      return null;
+    }
+    let summary = this._summary;
+    if (!summary) {
+      // 실행이 중간에 끝난 경우: 받은 테스트 이벤트로 계산
+      summary = { total: this._tests.length };
+      for (const test of this._tests) {
+        summary[test.outcome] = (summary[test.outcome] || 0) + 1;
+      }
+    }
+    const report = {
+      summary,
+      tests: this._tests,
+      exitcode: this._exitStatus,
+      source: 'ndjson'
+    };
+    if (this._collectErrors.length > 0) {
+      report.collectors = this._collectErrors;
+    }
+    if (this._stats) {
+      report.testarchitect_stats = this._stats;
+    }
+    return report;
+  }
+
+  /**
+   * @private
+   */
+  _poll() {
+    if (this._fd === null) {
+      try {
+        this._fd = fs.openSync(this.filePath, 'r');
+      } catch (error) {
+        // pytest가 아직 파일을 만들지 않음
+        return;
+      }
+    }
+    try {
+      let bytesRead;
+      do {
+        bytesRead = fs.readSync(this._fd, this._buffer, 0, READ_CHUNK_SIZE, this._offset);
+        if (bytesRead > 0) {
+          this._offset += bytesRead;
+          this._consume(this._decoder.write(this._buffer.subarray(0, bytesRead)));
+        }
+      } while (bytesRead === READ_CHUNK_SIZE);
+    } catch (error) {
+      console.warn('[NDJSON] 리포트 읽기 실패:', error.message);
+    }
+  }
+
+  /**
+   * @private
+   */
+  _consume(text) {
+    const lines = (this._pending + text).split('\n');
+    // 마지막 조각은 아직 줄이 끝나지 않았을 수 있음
+    this._pending = lines.pop();
+    for (const line of lines) {
+      if (line.trim()) {
+        this._handleLine(line);
+      }
+    }
+  }
+
+  /**
+   * @private
+   */
+  _handleLine(line) {
+    let event;
+    try {
+      event = JSON.parse(line);
+    } catch (error) {
+      console.warn('[NDJSON] 잘못된 이벤트 무시:', line.slice(0, 200));
+      return;
+    }
+
+    if (event.event === 'test' && event.outcome !== 'rerun') {
+      const { event: _type, ...test } = event;
+      this._tests.push(test);
+    } else if (event.event === 'collect_error') {
+      this._collectErrors.push({ nodeid: event.nodeid, outcome: 'failed', longrepr: event.longrepr });
+    } else if (event.event === 'session_finish') {
+      this._summary = event.summary;
+      this._stats = event.stats || null;
+      this._exitStatus = event.exitstatus;
+    }
+
+    if (this.onEvent) {
+      try {
+        this.onEvent(event);
+      } catch (error) {
+        console.warn('[NDJSON] 이벤트 콜백 오류:', error.message);
+      }
+    }
+  }
+}
+
+module.exports = NdjsonReportReader;
@@ -0,0 +1,273 @@
+/**
+ * 상주 pytest 실행기 서비스
+ * scripts/pytest_daemon.py 프로세스를 유지하면서 pytest 실행 요청을 전달
+ * (Python 인터프리터 시작, pytest/플러그인/Playwright import, 브라우저 실행 비용을 실행마다 반복하지 않음)
+ *
+ * - 요청/응답은 표준 입출력의 한 줄 JSON으로 주고받음
+ * - 실행은 한 번에 하나씩 순서대로 처리
+ * - 프로세스가 비정상 종료되면 진행 중인 요청을 실패 처리하고 다음 요청에서 다시 시작
+ * - 준비 완료 전에 종료/시작 실패한 경우만 'SPAWN_FAILED' (호출 측은 이때만 새 프로세스로 대체 실행)
+ */
+
+const { spawn } = require('child_process');
+const fs = require('fs');
+const path = require('path');
+const readline = require('readline');
+const config = require('../config/config');
+
+/**
+ * 상주 실행기 실행 결과 타입 정의
+ * @typedef {Object} PytestDaemonResult
+ * @property {number} exitCode - pytest 종료 코드
+ * @property {string} stdout - pytest 표준 출력
+ * @property {string} stderr - pytest 표준 에러 출력
+ * @property {number} durationMs - 실행 시간(ms)
+ * @property {number} runs - 현재 프로세스에서 실행한 횟수 (1이면 새로 시작한 프로세스)
+ */
+
+class PytestDaemonService {
+  /** @type {Object|null} 실행 중인 실행기 ({ process, pending, ready, started, pythonPath }) */
+  static _daemon = null;
+
+  /** @type {number} 요청 ID */
+  static _nextId = 1;
+
+  /** @type {Promise} 실행 요청 순서 보장용 체인 */
+  static _queue = Promise.resolve();
+
+  /**
+   * 상주 실행기로 pytest 실행
+   * @param {PythonRuntimeInfo} runtime - Python 런타임 정보
+   * @param {string[]} args - pytest 인자 배열 (따옴표 없이)
+   * @param {Object} options - 실행 옵션
+   * @param {string} options.cwd - 실행 디렉토리
+   * @param {Object} options.env - 환경 변수 (실행 동안만 적용)
+   * @param {number} options.timeout - 제한 시간(ms, 초과 시 실행기 종료)
+   * @returns {Promise<PytestDaemonResult>} 실행 결과
+   * @throws {Error} code가 'TIMEOUT'(시간 초과), 'CRASHED'(요청 전송 후 비정상 종료/내부 오류),
+   *   'SPAWN_FAILED'(시작 실패 또는 준비 완료 전 종료, 요청은 전송되지 않음)인 에러
+   */
+  static run(runtime, args, options = {}) {
+    const task = this._queue.then(() => this._run(runtime, args, options));
+    // 실패한 요청이 다음 요청을 막지 않도록 체인에는 결과를 남기지 않음
+    this._queue = task.catch(() => {});
+    return task;
+  }
+
+  /**
+   * 실행기 종료 (앱 종료 시 호출)
+   */
+  static stop() {
+    const daemon = this._daemon;
+    if (!daemon) {
+      return;
+    }
+    this._daemon = null;
+    try {
+      daemon.process.stdin.write(JSON.stringify({ id: this._nextId++, cmd: 'shutdown' }) + '\n');
+      daemon.process.stdin.end();
+    } catch (error) {
+      // 이미 종료된 경우 무시
+    }
+    // 브라우저 정리 시간을 준 뒤 남아 있으면 강제 종료
+    setTimeout(() => {
+      if (daemon.process.exitCode === null) {
+        daemon.process.kill();
+      }
+    }, 3000).unref();
+  }
+
+  /**
+   * @private
+   */
+  static async _run(runtime, args, { cwd, env, timeout } = {}) {
+    const daemon = await this._ensureDaemon(runtime, env);
+    const response = await this._request(daemon, { cmd: 'run', args, cwd, env }, timeout);
+
+    if (!response.ok) {
+      const error = new Error(`pytest 실행기 내부 오류: ${response.error}`);
+      error.code = 'CRASHED';
+      throw error;
+    }
+
+    console.log(`[DEBUG] 상주 pytest 실행기: ${response.duration_ms}ms, 실행 ${response.runs}회째` +
+      (response.browsers ? `, 브라우저 ${JSON.stringify(response.browsers)}` : ''));
+
+    return {
+      exitCode: response.exit_code,
+      stdout: response.stdout || '',
+      stderr: response.stderr || '',
+      durationMs: response.duration_ms,
+      runs: response.runs
+    };
+  }
+
+  /**
+   * 실행기 프로세스 가져오기 (없거나 Python 경로가 바뀌었으면 새로 시작)
+   * @private
+   */
+  static async _ensureDaemon(runtime, env) {
+    if (this._daemon && this._daemon.pythonPath !== runtime.pythonPath) {
+      this.stop();
+    }
+    if (!this._daemon) {
+      this._daemon = this._spawn(runtime, env);
+    }
+    const daemon = this._daemon;
+    try {
+      await daemon.ready;
+    } catch (error) {
+      if (this._daemon === daemon) {
+        this._daemon = null;
+      }
+      throw error;
+    }
+    return daemon;
+  }
+
+  /**
+   * @private
+   */
+  static _spawn(runtime, env) {
+    const scriptPath = this._getScriptPath();
+    console.log('[DEBUG] 상주 pytest 실행기 시작:', scriptPath);
+
+    const child = spawn(runtime.pythonPath, ['-u', scriptPath], {
+      cwd: path.dirname(scriptPath),
+      env: { ...env, PYTHONIOENCODING: 'utf-8' },
+      stdio: ['pipe', 'pipe', 'pipe'],
+      windowsHide: true
+    });
+
+    const daemon = {
+      process: child,
+      pythonPath: runtime.pythonPath,
+      pending: new Map(),
+      ready: null,
+      started: false
+    };
+
+    let onReady;
+    let onReadyFailed;
+    daemon.ready = new Promise((resolve, reject) => {
+      onReady = resolve;
+      onReadyFailed = reject;
+    });
+
+    const lines = readline.createInterface({ input: child.stdout });
+    lines.on('line', (line) => {
+      let message;
+      try {
+        message = JSON.parse(line);
+      } catch (error) {
+        console.log('[pytest_daemon]', line);
+        return;
+      }
+      if (message.event === 'ready') {
+        daemon.started = true;
+        onReady();
+        return;
+      }
+      const pending = daemon.pending.get(message.id);
+      if (pending) {
+        daemon.pending.delete(message.id);
+        pending.resolve(message);
+      }
+      // 실행기가 재시작을 요청하면 (최대 실행 횟수 도달, 내부 오류) 다음 요청에서 새로 시작
+      if (message.recycle && this._daemon === daemon) {
+        this._daemon = null;
+      }
+    });
+
+    // 종료된 프로세스에 쓰면 EPIPE가 발생하므로 무시 (exit 이벤트에서 처리)
+    child.stdin.on('error', () => {});
+
+    child.stderr.setEncoding('utf8');
+    child.stderr.on('data', (data) => {
+      console.warn('[pytest_daemon]', data.trimEnd());
+    });
+
+    const fail = (code, message) => {
+      if (this._daemon === daemon) {
+        this._daemon = null;
+      }
+      const error = new Error(message);
+      // 준비 완료 전에 실패했으면 요청을 보낸 적이 없으므로 시작 실패로 처리
+      error.code = daemon.started ? code : 'SPAWN_FAILED';
+      onReadyFailed(error);
+      for (const pending of daemon.pending.values()) {
+        pending.reject(error);
+      }
+      daemon.pending.clear();
+    };
+
+    child.on('error', (error) => {
+      fail('SPAWN_FAILED', `pytest 실행기를 시작할 수 없습니다: ${error.message}`);
+    });
+    child.on('exit', (code, signal) => {
+      fail('CRASHED', `pytest 실행기가 종료되었습니다 (code: ${code}, signal: ${signal})`);
+    });
+
+    return daemon;
+  }
+
+  /**
+   * pytest_daemon.py 경로 찾기 (개발 모드에서는 config.paths.scripts가 실제 scripts 폴더와 다를 수 있음)
+   * @private
+   * @returns {string} 스크립트 경로
+   */
+  static _getScriptPath() {
+    const candidates = [
+      path.join(config.paths.scripts, 'pytest_daemon.py'),
+      path.join(process.cwd(), 'scripts', 'pytest_daemon.py'),
+      path.join(__dirname, '..', '..', '..', 'scripts', 'pytest_daemon.py')
+    ];
+    return candidates.find(candidate => fs.existsSync(candidate)) || candidates[0];
+  }
+
+  /**
+   * 요청 전송 후 응답 대기
+   * @private
+   */
+  static _request(daemon, message, timeout) {
+    const id = this._nextId++;
+    return new Promise((resolve, reject) => {
+      let timer = null;
+      if (timeout > 0) {
+        timer = setTimeout(() => {
+          daemon.pending.delete(id);
+          // 멈춘 실행기는 재사용할 수 없으므로 종료 (다음 요청에서 다시 시작)
+          if (this._daemon === daemon) {
+            this._daemon = null;
+          }
+          daemon.process.kill();
+          const error = new Error(`pytest 실행 시간 초과 (${timeout}ms)`);
+          error.code = 'TIMEOUT';
+          reject(error);
+        }, timeout);
+      }
+
+      daemon.pending.set(id, {
+        resolve: (response) => {
+          clearTimeout(timer);
+          resolve(response);
+        },
+        reject: (error) => {
+          clearTimeout(timer);
+          reject(error);
+        }
+      });
+
+      daemon.process.stdin.write(JSON.stringify({ id, ...message }) + '\n', 'utf8', (error) => {
+        if (error && daemon.pending.has(id)) {
+          daemon.pending.delete(id);
+          clearTimeout(timer);
+          error.code = 'CRASHED';
+          reject(error);
+        }
+      });
+    });
+  }
+}
+
+module.exports = PytestDaemonService;
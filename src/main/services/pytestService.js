@@ -8,6 +8,8 @@ const fs = require('fs');
 const path = require('path');
 const config = require('../config/config');
 const PythonRuntime = require('./pythonRuntime');
+const PytestDaemonService = require('./pytestDaemonService');
+const NdjsonReportReader = require('./ndjsonReportReader');
 
 /**
  * Pytest 실행 결과 타입 정의
@@ -42,13 +44,36 @@ class PytestService {
    * @param {Object} options - 실행 옵션
    * @param {boolean} options.parallel - 병렬 실행 여부
    * @param {string|number} options.workers - 병렬 워커 수 ('auto' 또는 숫자)
+   * @param {boolean} options.historySchedule - 병렬 실행 시 실행 시간 기록 기반 배정 사용 여부 (기본값: true, scripts/duration_scheduler.py)
+   * @param {boolean} options.incremental - 코드 지문이 바뀌었거나 지난 실행에서 통과하지 못한 테스트만 실행할지 여부 (scripts/incremental_selection.py)
    * @param {number} options.reruns - 실패 시 재시도 횟수
    * @param {number} options.rerunsDelay - 재시도 전 대기 시간(초)
    * @param {number|null} options.maxFailures - 최대 실패 허용 수
    * @param {number} options.timeout - 테스트 타임아웃(초)
    * @param {boolean} options.captureScreenshots - 스크린샷 자동 캡처 여부
+   * @param {string} options.screenshotFormat - 실패 스크린샷 형식 ('png', 'jpeg', 'webp')
+   * @param {number} options.screenshotBudgetMb - 스크린샷 디렉토리 최대 용량(MB, 초과 시 오래된 파일부터 삭제)
    * @param {boolean} options.htmlReport - HTML 리포트 생성 여부
    * @param {boolean} options.headless - 헤드리스 모드 여부 (기본값: false, 브라우저 표시)
+   * @param {boolean} options.contextPool - Playwright BrowserContext 풀 사용 여부
+   * @param {number} options.contextPoolSize - 워커당 유휴 BrowserContext 최대 개수
+   * @param {number} options.contextPoolMaxUses - BrowserContext 하나를 재사용할 최대 테스트 수
+   * @param {string} options.driver - 웹드라이버 ('playwright', 'playwright-async', 'selenium')
+   * @param {number} options.asyncConcurrency - playwright-async 모드에서 워커당 동시에 실행할 async 테스트 수
+   * @param {number} options.asyncTestTimeout - playwright-async 모드의 async 테스트 제한 시간(초)
+   * @param {string} options.networkCache - Playwright 네트워크 기록/재생 모드 ('live', 'record', 'replay', 'auto', scripts/network_cache.py)
+   * @param {string} options.blockResources - 리소스 차단 프로필 ('off', 'media', 'trackers', 'fast', scripts/resource_blocking.py)
+   * @param {string} options.authRole - 모든 테스트에 적용할 로그인 역할 (역할별 로그인 상태 재사용, scripts/auth_state.py)
+   * @param {string} options.authRoles - 역할별 로그인 설정 파일 경로 (기본값: 실행 디렉토리의 auth_roles.json)
+   * @param {boolean} options.seleniumPool - Selenium WebDriver 세션 풀 사용 여부
+   * @param {number} options.seleniumPoolMaxUses - WebDriver 세션 하나를 재사용할 최대 테스트 수
+   * @param {boolean} options.streamReport - 테스트 단계별 NDJSON 이벤트 스트리밍 여부 (scripts/ndjson_reporter.py)
+   * @param {boolean} options.jsonReport - 실행 종료 시 pytest-json-report 전체 리포트 생성 여부 (false면 NDJSON 이벤트로 결과 구성)
+   * @param {Function} options.onEvent - NDJSON 이벤트 콜백 (테스트 단계가 끝날 때마다 호출)
+   * @param {boolean} options.warmRunner - 상주 pytest 실행기(scripts/pytest_daemon.py) 사용 여부 (병렬 실행 시 무시)
+   * @param {boolean} options.profileStartup - 플러그인/훅/fixture별 시작 시간 프로파일 출력 여부 (scripts/startup_profiler.py)
+   * @param {boolean} options.traceEvents - fixture/단계/페이지 이동/드라이버 호출 시간을 trace-event JSON으로 기록할지 여부 (scripts/trace_recorder.py)
+   * @param {string} options.traceDir - trace 파일 저장 디렉토리 (기본값: 리포트 디렉토리의 trace)
    * @returns {Promise<PytestExecutionResult>} 실행 결과
    */
   static async runTests(testFiles, args = [], options = {}) {
@@ -87,6 +112,10 @@ class PytestService {
         const htmlReportFile = execOptions.htmlReport 
           ? this._getHtmlReportFilePath(execCwd) 
           : null;
+        if (!execOptions.streamReport && execOptions.jsonReport === false) {
+          // 결과를 받을 리포트가 하나는 있어야 함
+          execOptions.streamReport = true;
+        }
 
         // 디버깅: pytest 실행 전 상태 확인
         console.log('[DEBUG] ========== pytest 실행 전 상태 확인 ==========');
@@ -133,8 +162,21 @@ class PytestService {
         const driver = execOptions.driver || 'playwright';
         playwrightEnv.TEST_DRIVER = driver;
         
+        // 실패 스크린샷 저장 위치/형식/용량 (conftest.py의 스크린샷 파이프라인이 환경 변수로 읽음)
+        playwrightEnv.PYTEST_SCREENSHOT_DIR = playwrightEnv.PYTEST_SCREENSHOT_DIR || config.pytest.screenshotDir;
+        if (execOptions.screenshotFormat) {
+          playwrightEnv.PYTEST_SCREENSHOT_FORMAT = execOptions.screenshotFormat;
+        }
+        if (execOptions.screenshotBudgetMb > 0) {
+          playwrightEnv.PYTEST_SCREENSHOT_BUDGET_MB = String(execOptions.screenshotBudgetMb);
+        }
+        
+        // 상주 pytest 실행기 사용 여부 (xdist 워커는 어차피 새 프로세스이므로 병렬 실행은 제외)
+        const useWarmRunner = execOptions.warmRunner && !execOptions.parallel;
+        
         // 경로 확인: Python에서 실제 작업 디렉토리와 conftest.py 경로 확인
-        if (execCwd) {
+        // (상주 실행기를 사용하면 확인용 인터프리터를 따로 띄우지 않음)
+        if (execCwd && !useWarmRunner) {
           // 테스트 파일의 절대 경로 사용
           const testFileAbsPath = testPaths.length > 0 ? testPaths[0] : '';
           
@@ -209,6 +251,51 @@ print('===================')`;
           }
         }
         
+        // NDJSON 이벤트 따라 읽기 (실행이 끝나기 전에도 진행 상황 전달)
+        const startStreamReader = () => execOptions.streamReport
+          ? new NdjsonReportReader(this._getNdjsonReportFilePath(reportFile), execOptions.onEvent || null).start()
+          : null;
+        let streamReader = startStreamReader();
+        
+        // 상주 실행기로 실행 (import/브라우저가 이미 로드된 프로세스 재사용)
+        if (useWarmRunner) {
+          // 인자 배열로 전달하므로 호출 측에서 감싼 따옴표 제거
+          const rawArgs = args.map(arg => String(arg).replace(/^"(.*)"$/, '$1'));
+          const warmArgs = this._buildArgs(testPaths, reportFile, htmlReportFile, rawArgs, execOptions, execCwd);
+          try {
+            const result = await PytestDaemonService.run(runtime, warmArgs, {
+              cwd: execCwd,
+              env: playwrightEnv,
+              timeout: config.python.timeout
+            });
+            const error = result.exitCode === 0
+              ? null
+              : { code: result.exitCode, message: `pytest 종료 코드 ${result.exitCode}` };
+            this._settleRun(reportFile, error, result.stdout, result.stderr, resolve, reject, streamReader);
+            return;
+          } catch (warmError) {
+            if (streamReader) {
+              // 중단된 실행의 이벤트는 버리고 다시 읽기
+              streamReader.stop();
+              this._cleanupReportFile(this._getNdjsonReportFilePath(reportFile));
+            }
+            // 실행 도중 실패(시간 초과, 비정상 종료)는 테스트가 이미 실행됐을 수 있으므로 다시 실행하지 않음
+            if (warmError.code !== 'SPAWN_FAILED') {
+              this._cleanupReportFile(reportFile);
+              reject({
+                success: false,
+                error: warmError.message,
+                stderr: '',
+                stdout: ''
+              });
+              return;
+            }
+            // 실행기 시작 실패: 요청을 보내지 않았으므로 새 프로세스로 실행
+            console.warn('[DEBUG] 상주 pytest 실행기 시작 실패, 새 프로세스로 실행:', warmError.message);
+            streamReader = startStreamReader();
+          }
+        }
+        
         // 테스트 실행
         // ✅ shell: false로 변경하여 cwd가 제대로 적용되도록 함
         // Windows에서 shell: true일 때 cwd가 제대로 적용되지 않을 수 있음
@@ -222,81 +309,7 @@ print('===================')`;
             shell: false, // ✅ shell: false로 변경 (cwd가 제대로 적용되도록)
             env: playwrightEnv // Playwright 브라우저 경로 포함
           },
-          async (error, stdout, stderr) => {
-            try {
-              // 디버깅: pytest 실행 결과 로깅
-              console.log('[DEBUG] ========== pytest exec 콜백 호출됨 ==========');
-              console.log('[DEBUG] PYTEST EXEC CALLBACK CALLED AT:', new Date().toISOString());
-              console.log('[DEBUG] pytest 실행 완료');
-              console.log('[DEBUG] exit code:', error ? error.code : 0);
-              console.log('[DEBUG] stdout 길이:', stdout?.length || 0);
-              console.log('[DEBUG] stderr 길이:', stderr?.length || 0);
-              if (stdout && stdout.length > 0) {
-                // 전체 stdout 출력 (에러 메시지 확인을 위해)
-                console.log('[DEBUG] stdout 전체:\n', stdout);
-              }
-              if (stderr && stderr.length > 0) {
-                console.log('[DEBUG] stderr 전체:\n', stderr);
-              }
-              
-              // 리포트 파일 읽기
-              const reportData = this._readReportFile(reportFile);
-              
-              if (reportData) {
-                console.log('[DEBUG] 리포트 데이터 summary:', reportData.summary);
-                console.log('[DEBUG] 리포트 데이터 tests 개수:', reportData.tests?.length || 0);
-              } else {
-                console.warn('[DEBUG] 리포트 파일이 없거나 읽을 수 없음:', reportFile);
-              }
-
-              // 리포트 파일 정리
-              this._cleanupReportFile(reportFile);
-
-              // pytest는 테스트 실패 시에도 exit code 1을 반환하므로
-              // error가 있어도 리포트가 있으면 성공으로 처리
-              if (reportData) {
-                resolve({
-                  success: true,
-                  data: reportData,
-                  stdout: stdout,
-                  stderr: stderr || ''
-                });
-              } else if (error) {
-                // 리포트가 없고 에러가 있는 경우
-                reject({
-                  success: false,
-                  error: error.message || '테스트 실행 실패',
-                  stderr: stderr || '',
-                  stdout: stdout || ''
-                });
-              } else {
-                // 리포트가 없지만 에러도 없는 경우 (이상한 상황)
-                resolve({
-                  success: true,
-                  data: {
-                    summary: {
-                      total: 0,
-                      passed: 0,
-                      failed: 0,
-                      skipped: 0,
-                      error: 0
-                    },
-                    note: '테스트 결과 리포트를 생성할 수 없었습니다.'
-                  },
-                  stdout: stdout,
-                  stderr: stderr || ''
-                });
-              }
-            } catch (parseError) {
-              this._cleanupReportFile(reportFile);
-              reject({
-                success: false,
-                error: `결과 파싱 실패: ${parseError.message}`,
-                stderr: stderr || '',
-                stdout: stdout || ''
-              });
-            }
-          }
+          (error, stdout, stderr) => this._settleRun(reportFile, error, stdout, stderr, resolve, reject, streamReader)
         );
       } catch (error) {
         // 런타임 가져오기 실패 등 초기화 오류 처리
@@ -310,6 +323,97 @@ print('===================')`;
     });
   }
 
+  /**
+   * pytest 실행 결과 처리 (리포트 파일 읽기 후 resolve/reject)
+   * @private
+   * @param {string} reportFile - JSON 리포트 파일 경로
+   * @param {Object|null} error - 실행 오류 (종료 코드가 0이 아니면 설정됨)
+   * @param {string} stdout - 표준 출력
+   * @param {string} stderr - 표준 에러 출력
+   * @param {Function} resolve - Promise resolve
+   * @param {Function} reject - Promise reject
+   * @param {NdjsonReportReader|null} streamReader - NDJSON 리포트 리더 (JSON 리포트가 없으면 이 결과 사용)
+   */
+  static _settleRun(reportFile, error, stdout, stderr, resolve, reject, streamReader = null) {
+    try {
+      // 디버깅: pytest 실행 결과 로깅
+      console.log('[DEBUG] ========== pytest exec 콜백 호출됨 ==========');
+      console.log('[DEBUG] PYTEST EXEC CALLBACK CALLED AT:', new Date().toISOString());
+      console.log('[DEBUG] pytest 실행 완료');
+      console.log('[DEBUG] exit code:', error ? error.code : 0);
+      console.log('[DEBUG] stdout 길이:', stdout?.length || 0);
+      console.log('[DEBUG] stderr 길이:', stderr?.length || 0);
+      if (stdout && stdout.length > 0) {
+        // 전체 stdout 출력 (에러 메시지 확인을 위해)
+        console.log('[DEBUG] stdout 전체:\n', stdout);
+      }
+      if (stderr && stderr.length > 0) {
+        console.log('[DEBUG] stderr 전체:\n', stderr);
+      }
+      
+      // 리포트 파일 읽기 (JSON 리포트가 없으면 NDJSON 이벤트로 모은 결과 사용)
+      const streamedReport = streamReader ? streamReader.stop() : null;
+      const reportData = this._readReportFile(reportFile) || streamedReport;
+      
+      if (reportData) {
+        console.log('[DEBUG] 리포트 데이터 summary:', reportData.summary);
+        console.log('[DEBUG] 리포트 데이터 tests 개수:', reportData.tests?.length || 0);
+      } else {
+        console.warn('[DEBUG] 리포트 파일이 없거나 읽을 수 없음:', reportFile);
+      }
+
+      // 리포트 파일 정리
+      this._cleanupReportFile(reportFile);
+      if (streamReader) {
+        this._cleanupReportFile(streamReader.filePath);
+      }
+
+      // pytest는 테스트 실패 시에도 exit code 1을 반환하므로
+      // error가 있어도 리포트가 있으면 성공으로 처리
+      if (reportData) {
+        resolve({
+          success: true,
+          data: reportData,
+          stdout: stdout,
+          stderr: stderr || ''
+        });
+      } else if (error) {
+        // 리포트가 없고 에러가 있는 경우
+        reject({
+          success: false,
+          error: error.message || '테스트 실행 실패',
+          stderr: stderr || '',
+          stdout: stdout || ''
+        });
+      } else {
+        // 리포트가 없지만 에러도 없는 경우 (이상한 상황)
+        resolve({
+          success: true,
+          data: {
+            summary: {
+              total: 0,
+              passed: 0,
+              failed: 0,
+              skipped: 0,
+              error: 0
+            },
+            note: '테스트 결과 리포트를 생성할 수 없었습니다.'
+          },
+          stdout: stdout,
+          stderr: stderr || ''
+        });
+      }
+    } catch (parseError) {
+      this._cleanupReportFile(reportFile);
+      reject({
+        success: false,
+        error: `결과 파싱 실패: ${parseError.message}`,
+        stderr: stderr || '',
+        stdout: stdout || ''
+      });
+    }
+  }
+
   /**
    * 테스트 파일 경로 생성
    * @private
@@ -362,6 +466,16 @@ print('===================')`;
     return path.join(reportDir, `pytest-report-${timestamp}.json`);
   }
 
+  /**
+   * NDJSON 리포트 파일 경로 (JSON 리포트 파일과 같은 위치)
+   * @private
+   * @param {string} reportFile - JSON 리포트 파일 경로
+   * @returns {string} NDJSON 리포트 파일 경로
+   */
+  static _getNdjsonReportFilePath(reportFile) {
+    return reportFile.replace(/\.json$/, '.ndjson');
+  }
+
   /**
    * Pytest 실행 명령어 구성
    * @private
@@ -375,6 +489,28 @@ print('===================')`;
    * @returns {string} 실행 명령어
    */
   static _buildCommand(testPaths, reportFile, htmlReportFile, args = [], options = {}, runtime, execCwd = null) {
+    // pytest 실행 경로 (항상 python -m pytest 사용하여 번들/시스템 모두 지원)
+    // 번들된 Python에도 pytest가 Scripts/에 없을 수 있으므로 python -m pytest 사용
+    const pytestCmd = `"${runtime.pythonPath}" -m pytest`;
+    // Windows에서 한글 경로를 안전하게 처리하기 위해 경로는 따옴표로 감싸기
+    const allArgs = this._buildArgs(testPaths, reportFile, htmlReportFile, args, options, execCwd, value => `"${value}"`);
+    
+    return `${pytestCmd} ${allArgs.join(' ')}`;
+  }
+
+  /**
+   * Pytest 인자 목록 구성 (명령어 문자열 또는 상주 실행기 요청에 사용)
+   * @private
+   * @param {string|string[]} testPaths - 테스트 파일 경로(들)
+   * @param {string} reportFile - JSON 리포트 파일 경로
+   * @param {string|null} htmlReportFile - HTML 리포트 파일 경로
+   * @param {string[]} args - 추가 인자 배열
+   * @param {Object} options - 실행 옵션
+   * @param {string} execCwd - 실행 디렉토리
+   * @param {Function} quotePath - 경로 인자 변환 함수 (명령어 문자열이면 따옴표 추가, 인자 배열이면 그대로)
+   * @returns {string[]} pytest 인자 목록
+   */
+  static _buildArgs(testPaths, reportFile, htmlReportFile, args = [], options = {}, execCwd = null, quotePath = value => value) {
     // 여러 파일을 배열로 처리
     const paths = Array.isArray(testPaths) ? testPaths : [testPaths];
     
@@ -389,16 +525,13 @@ print('===================')`;
         const base = execCwd || process.cwd();
         absolutePath = path.normalize(path.resolve(base, p));
       }
-      // Windows에서 한글 경로를 안전하게 처리하기 위해 따옴표로 감싸기
-      return `"${absolutePath}"`;
+      return quotePath(absolutePath);
     });
     
     console.log('[DEBUG] 테스트 타겟 (파일명/절대 경로):', testTargets);
     
-    // 경로를 그대로 사용 (이미 따옴표로 감싸져 있음)
-    const escapedPaths = testTargets;
     // 리포트 파일 경로도 정규화
-    const escapedReportFile = `"${path.normalize(reportFile)}"`;
+    const escapedReportFile = quotePath(path.normalize(reportFile));
     
     // 디버깅: 실행 디렉토리 상태 확인
     console.log('[DEBUG] _buildCommand 호출됨');
@@ -444,24 +577,39 @@ print('===================')`;
       console.log(`[DEBUG] 테스트 타겟 ${index + 1} 존재 여부:`, exists);
     });
     
-    // pytest 실행 경로 (항상 python -m pytest 사용하여 번들/시스템 모두 지원)
-    // 번들된 Python에도 pytest가 Scripts/에 없을 수 있으므로 python -m pytest 사용
-    const pytestCmd = `"${runtime.pythonPath}" -m pytest`;
-    
     // 기본 pytest 옵션
     // pytest는 자동으로 conftest.py를 찾아서 로드하므로 -p conftest 옵션이 필요 없음
     const baseOptions = [
-      '--json-report',
-      `--json-report-file=${escapedReportFile}`,
       '-v',
       '--tb=short',
       '-p', 'no:cacheprovider' // ✅ 4️⃣ pytest 캐시 비활성화 (Windows 락 제거)
     ];
     
+    // 실행 종료 시 전체 JSON 리포트 (NDJSON 스트리밍을 쓰면 생략 가능)
+    if (options.jsonReport !== false) {
+      baseOptions.unshift('--json-report', `--json-report-file=${escapedReportFile}`);
+    }
+    
+    // 테스트 단계별 NDJSON 이벤트 스트리밍 (conftest.py의 --ndjson-report 옵션)
+    if (options.streamReport) {
+      baseOptions.push(`--ndjson-report=${quotePath(this._getNdjsonReportFilePath(path.normalize(reportFile)))}`);
+    }
+    
+    // 시작 시간 프로파일 (플러그인/conftest 로드 전에 등록되도록 -p로 지정)
+    if (options.profileStartup) {
+      baseOptions.push('-p', 'startup_profiler');
+    }
+    
+    // 실행 구간 trace-event 기록 (임시 실행 디렉토리가 정리되어도 남도록 리포트 디렉토리에 저장)
+    if (options.traceEvents) {
+      const traceDir = options.traceDir || path.join(config.pytest.reportDir, 'trace');
+      baseOptions.push(`--trace-events=${quotePath(path.normalize(traceDir))}`);
+    }
+    
     // ✅ rootdir 옵션 추가 (Windows 한글 경로 문제 해결)
     // execCwd가 있으면 명시적으로 rootdir 지정
     if (execCwd) {
-      baseOptions.push('--rootdir', `"${path.normalize(execCwd)}"`);
+      baseOptions.push('--rootdir', quotePath(path.normalize(execCwd)));
     }
     
     // headless 옵션 추가 (pytest-playwright는 --headed 옵션 사용)
@@ -478,6 +626,11 @@ print('===================')`;
     const browser = options.browser || 'chromium';
     baseOptions.push('--browser', browser);
 
+    // 브라우저 매트릭스 (세션 하나에서 여러 브라우저 실행, 결과는 브라우저별로 합쳐 보고)
+    if (Array.isArray(options.browsers) && options.browsers.length > 1) {
+      baseOptions.push('--browser-matrix', options.browsers.join(','));
+    }
+
     // 드라이버 옵션은 환경 변수로 전달 (--driver 옵션 제거)
     // conftest.py에서 환경 변수 TEST_DRIVER를 읽어서 사용
 
@@ -486,15 +639,87 @@ print('===================')`;
       baseOptions.push('--mobile', 'true');
     }
 
+    // BrowserContext 풀 옵션 추가 (테스트마다 컨텍스트를 새로 만들지 않고 재사용)
+    if (options.contextPool) {
+      baseOptions.push('--context-pool', 'true');
+      if (options.contextPoolSize > 0) {
+        baseOptions.push('--context-pool-size', String(options.contextPoolSize));
+      }
+      if (options.contextPoolMaxUses > 0) {
+        baseOptions.push('--context-pool-max-uses', String(options.contextPoolMaxUses));
+      }
+    }
+
+    // playwright-async 모드 동시 실행 수 (워커 하나의 이벤트 루프에서 동시에 구동할 테스트 수)
+    if (options.driver === 'playwright-async') {
+      if (options.asyncConcurrency > 0) {
+        baseOptions.push('--async-concurrency', String(options.asyncConcurrency));
+      }
+      if (options.asyncTestTimeout > 0) {
+        baseOptions.push('--async-test-timeout', String(options.asyncTestTimeout));
+      }
+    }
+
+    // 네트워크 기록/재생 (기록된 응답으로 실제 서버 호출 대체)
+    if (options.networkCache && options.networkCache !== 'live') {
+      baseOptions.push('--network-cache', options.networkCache);
+    }
+
+    // 리소스 차단 (이미지/폰트/미디어/외부 분석 스크립트 요청 차단)
+    if (options.blockResources && options.blockResources !== 'off') {
+      baseOptions.push('--block-resources', options.blockResources);
+    }
+
+    // 역할별 로그인 상태 재사용 (역할마다 한 번만 로그인)
+    if (options.authRole) {
+      baseOptions.push('--auth-role', options.authRole);
+    }
+    if (options.authRoles) {
+      baseOptions.push(`--auth-roles=${quotePath(path.normalize(options.authRoles))}`);
+    }
+
+    // 실패한 테스트만 Playwright trace 저장 (snapshots, screenshots)
+    if (options.failureTrace && options.failureTrace !== 'off') {
+      baseOptions.push('--failure-trace', options.failureTrace);
+    }
+
+    // 테스트별 메모리 측정 및 Playwright 브라우저 재실행 기준
+    if (options.memoryTelemetry) {
+      baseOptions.push('--memory-telemetry', 'true');
+    }
+    if (options.browserRecycleMb > 0) {
+      baseOptions.push('--browser-recycle-mb', String(options.browserRecycleMb));
+    }
+    if (options.browserRecycleTests > 0) {
+      baseOptions.push('--browser-recycle-tests', String(options.browserRecycleTests));
+    }
+
+    // Selenium 세션 풀 옵션 추가 (테스트마다 WebDriver를 새로 띄우지 않고 재사용)
+    if (options.seleniumPool) {
+      baseOptions.push('--selenium-pool', 'true');
+      if (options.seleniumPoolMaxUses > 0) {
+        baseOptions.push('--selenium-pool-max-uses', String(options.seleniumPoolMaxUses));
+      }
+    }
+
     // HTML 리포트 옵션 추가
     if (options.htmlReport && htmlReportFile) {
-      baseOptions.push('--html', `"${path.normalize(htmlReportFile)}"`, '--self-contained-html');
+      baseOptions.push('--html', quotePath(path.normalize(htmlReportFile)), '--self-contained-html');
     }
 
     // 병렬 실행 옵션 추가 (pytest-xdist)
     if (options.parallel) {
       const workers = options.workers === 'auto' ? 'auto' : String(options.workers || 'auto');
       baseOptions.push('-n', workers);
+      // 실행 시간 기록 기반 배정 끄기 (기본: 오래 걸리는 테스트부터, 같은 브라우저/호스트는 같은 워커로)
+      if (options.historySchedule === false) {
+        baseOptions.push('--history-schedule', 'false');
+      }
+    }
+
+    // 선택 실행 (변경되지 않고 지난번에 통과한 테스트는 캐시된 통과로 보고)
+    if (options.incremental) {
+      baseOptions.push('--incremental', 'true');
     }
 
     // 재시도 옵션 추가 (pytest-rerunfailures)
@@ -516,9 +741,7 @@ print('===================')`;
     }
 
     // 추가 인자와 합치기 (여러 파일 경로 포함)
-    const allArgs = [...baseOptions, ...args, ...escapedPaths];
-    
-    return `${pytestCmd} ${allArgs.join(' ')}`;
+    return [...baseOptions, ...args, ...testTargets];
   }
 
   /**
@@ -6,9 +6,10 @@
  * 이 서비스는 pytest를 사용하지 않는 레거시 스크립트용으로 유지됩니다.
  */
 
-const { exec } = require('child_process');
+const { exec, spawn } = require('child_process');
 const fs = require('fs');
 const path = require('path');
+const readline = require('readline');
 const config = require('../config/config');
 
 /**
@@ -21,6 +22,16 @@ const config = require('../config/config');
  * @property {string} error - 에러 메시지 (실패 시)
  */
 
+/**
+ * 일괄 실행의 스크립트별 결과 타입 정의
+ * @typedef {PythonExecutionResult} PythonBatchResult
+ * @property {string} scriptName - 스크립트 파일명
+ * @property {number} index - 요청 목록에서의 순서
+ * @property {string} status - passed | failed | timeout | crashed | invalid
+ * @property {number|null} exitCode - 종료 코드
+ * @property {number|null} durationMs - 실행 시간(ms)
+ */
+
 class PythonService {
   /**
    * Python 스크립트 실행
@@ -77,6 +88,134 @@ class PythonService {
     });
   }
 
+  /**
+   * 여러 스크립트를 한 번에 실행 (scripts/script_batch_runner.py)
+   * 스크립트마다 인터프리터를 새로 띄우지 않고 미리 시작한 워커 프로세스에서 runpy로 실행하며,
+   * 결과는 끝나는 순서대로 onResult로 전달
+   * @param {Array<string|{scriptName: string, args?: string[], timeout?: number}>} scripts - 실행할 스크립트 목록
+   * @param {Object} options - 실행 옵션
+   * @param {number} options.workers - 워커 프로세스 수 (기본: CPU 수)
+   * @param {number} options.timeout - 스크립트 하나의 시간 제한(ms, 기본 config.python.timeout)
+   * @param {Function} options.onResult - 스크립트 하나가 끝날 때마다 호출 (PythonBatchResult)
+   * @returns {Promise<{results: PythonBatchResult[], summary: Object}>} 요청 순서대로 정렬한 결과와 실행 통계
+   */
+  static async executeBatch(scripts, options = {}) {
+    const jobs = scripts.map(script => (typeof script === 'string' ? { scriptName: script } : script));
+    const timeout = options.timeout || config.python.timeout;
+    const onResult = options.onResult || (() => {});
+    const results = [];
+
+    // 존재하지 않는 스크립트는 실행하지 않고 결과만 남김
+    const runnable = [];
+    jobs.forEach((job, index) => {
+      const scriptPath = this._getScriptPath(job.scriptName);
+      if (!this._validateScript(scriptPath)) {
+        const result = {
+          success: false,
+          scriptName: job.scriptName,
+          index,
+          status: 'invalid',
+          exitCode: null,
+          durationMs: null,
+          data: null,
+          stdout: '',
+          stderr: '',
+          error: `스크립트 파일을 찾을 수 없습니다: ${job.scriptName}`
+        };
+        results.push(result);
+        onResult(result);
+        return;
+      }
+      runnable.push({
+        index,
+        line: JSON.stringify({
+          script: scriptPath,
+          args: (job.args || []).map(String),
+          timeout: (job.timeout || timeout) / 1000
+        })
+      });
+    });
+
+    if (runnable.length === 0) {
+      return { results, summary: null };
+    }
+
+    return new Promise((resolve, reject) => {
+      const runnerArgs = ['-u', this._getBatchRunnerPath(), '--jobs', '-'];
+      if (options.workers) {
+        runnerArgs.push('--workers', String(options.workers));
+      }
+      const child = spawn(config.python.command, runnerArgs, {
+        cwd: config.paths.scripts,
+        env: { ...process.env, PYTHONIOENCODING: 'utf-8' },
+        stdio: ['pipe', 'pipe', 'pipe'],
+        windowsHide: true
+      });
+
+      let summary = null;
+      let stderr = '';
+      const lines = readline.createInterface({ input: child.stdout });
+      lines.on('line', (line) => {
+        let event;
+        try {
+          event = JSON.parse(line);
+        } catch (error) {
+          console.log('[script_batch_runner]', line);
+          return;
+        }
+        if (event.event === 'summary') {
+          summary = event;
+          return;
+        }
+        if (event.event !== 'result') {
+          return;
+        }
+        const result = {
+          success: event.status === 'passed',
+          scriptName: jobs[runnable[event.index].index].scriptName,
+          index: runnable[event.index].index,
+          status: event.status,
+          exitCode: event.exit_code,
+          durationMs: event.duration_ms,
+          data: event.data,
+          stdout: event.stdout || '',
+          stderr: event.stderr || ''
+        };
+        if (!result.success) {
+          result.error = event.error || `종료 코드 ${event.exit_code}`;
+        }
+        results.push(result);
+        onResult(result);
+      });
+
+      child.stderr.setEncoding('utf8');
+      child.stderr.on('data', (data) => {
+        stderr += data;
+      });
+      // 종료된 프로세스에 쓰면 EPIPE가 발생하므로 무시 (close 이벤트에서 처리)
+      child.stdin.on('error', () => {});
+
+      child.on('error', (error) => {
+        reject({ success: false, error: error.message, stderr, stdout: '' });
+      });
+      child.on('close', (code) => {
+        if (!summary) {
+          reject({
+            success: false,
+            error: `일괄 실행기가 비정상 종료되었습니다 (code: ${code})`,
+            stderr,
+            stdout: ''
+          });
+          return;
+        }
+        results.sort((a, b) => a.index - b.index);
+        resolve({ results, summary });
+      });
+
+      child.stdin.end(runnable.map(job => job.line).join('\n') + '\n', 'utf8');
+    });
+  }
+
   /**
    * 스크립트 파일 경로 생성
    * @private
@@ -87,6 +226,20 @@ class PythonService {
     return path.join(config.paths.scripts, scriptName);
   }
 
+  /**
+   * script_batch_runner.py 경로 찾기 (개발 모드에서는 config.paths.scripts가 실제 scripts 폴더와 다를 수 있음)
+   * @private
+   * @returns {string} 스크립트 경로
+   */
+  static _getBatchRunnerPath() {
+    const candidates = [
+      path.join(config.paths.scripts, 'script_batch_runner.py'),
+      path.join(process.cwd(), 'scripts', 'script_batch_runner.py'),
+      path.join(__dirname, '..', '..', '..', 'scripts', 'script_batch_runner.py')
+    ];
+    return candidates.find(candidate => fs.existsSync(candidate)) || candidates[0];
+  }
+
   /**
    * 스크립트 파일 유효성 검증
    * @private
@@ -370,12 +370,12 @@ function buildPlaywrightPythonAction(ev, selectorInfo, base = 'page') {
       
       if (matchMode === 'contains') {
         // 포함 검증
-        return `assert "${value}" in normalize_url(${base}.url)`;
+        return `assert make_url_matcher("${value}", mode="contains")(${base}.url)`;
       } else {
         // 완전일치 검증 (기존 동작)
         return [
-          `${base}.wait_for_url(lambda url: normalize_url(url) == "${value}", timeout=10000)`,
-          `assert normalize_url(${base}.url) == "${value}"`
+          `${base}.wait_for_url(make_url_matcher("${value}"), timeout=10000)`,
+          `assert make_url_matcher("${value}")(${base}.url)`
         ];
       }
     }
@@ -460,25 +460,25 @@ function buildPlaywrightPythonAction(ev, selectorInfo, base = 'page') {
     
     if (matchMode === 'contains') {
       // 포함 검증
-      return `assert "${expectedUrl}" in normalize_url(${base}.url)`;
+      return `assert make_url_matcher("${expectedUrl}", mode="contains")(${base}.url)`;
     } else {
       // 완전일치 검증 (기존 동작)
       return [
-        `${base}.wait_for_url(lambda url: normalize_url(url) == "${expectedUrl}", timeout=10000)`,
-        `assert normalize_url(${base}.url) == "${expectedUrl}"`
+        `${base}.wait_for_url(make_url_matcher("${expectedUrl}"), timeout=10000)`,
+        `assert make_url_matcher("${expectedUrl}")(${base}.url)`
       ];
     }
   }
   if (ev.action === 'verifyImage') {
-    // 이미지 비교 (pytest-playwright-visual-snapshot 사용)
-    // locator.screenshot()으로 이미지를 캡처하고 assert_snapshot에 전달
+    // 이미지 비교 (conftest의 compare_snapshot, 기준 이미지 경로는 pytest-playwright-visual-snapshot과 같음)
+    // locator.screenshot()으로 이미지를 캡처하고 compare_snapshot에 전달
     const locatorVar = getLocator();
     const imageVar = `image_${Math.random().toString(36).substr(2, 9)}`;
     const snapshotName = ev.snapshotName || ev.value || 'snapshot';
     
     return [
       `${imageVar} = ${locatorVar}.screenshot()`,
-      `assert_snapshot(${imageVar}, name="${snapshotName}.jpeg")`
+      `compare_snapshot(${imageVar}, name="${snapshotName}.jpeg")`
     ];
   }
   return null;
@@ -619,12 +619,12 @@ function buildSeleniumPythonAction(ev, selectorInfo, driverVar = 'driver') {
       
       if (matchMode === 'contains') {
         // 포함 검증
-        return `assert "${normalizedValue}" in normalize_url(${driverVar}.current_url)`;
+        return `assert make_url_matcher("${normalizedValue}", mode="contains")(${driverVar}.current_url)`;
       } else {
         // 완전일치 검증 (기존 동작)
         return [
-          `WebDriverWait(${driverVar}, 10).until(lambda d: normalize_url(d.current_url) == "${normalizedValue}")`,
-          `assert normalize_url(${driverVar}.current_url) == "${normalizedValue}"`
+          `WebDriverWait(${driverVar}, 10).until(make_url_matcher("${normalizedValue}"))`,
+          `assert make_url_matcher("${normalizedValue}")(${driverVar}.current_url)`
         ];
       }
     }
@@ -725,18 +725,22 @@ function buildSeleniumPythonAction(ev, selectorInfo, driverVar = 'driver') {
     
     if (matchMode === 'contains') {
       // 포함 검증
-      return `assert "${expectedUrl}" in normalize_url(${driverVar}.current_url)`;
+      return `assert make_url_matcher("${expectedUrl}", mode="contains")(${driverVar}.current_url)`;
     } else {
       // 완전일치 검증 (기존 동작)
       return [
-        `WebDriverWait(${driverVar}, 10).until(lambda d: normalize_url(d.current_url) == "${expectedUrl}")`,
-        `assert normalize_url(${driverVar}.current_url) == "${expectedUrl}"`
+        `WebDriverWait(${driverVar}, 10).until(make_url_matcher("${expectedUrl}"))`,
+        `assert make_url_matcher("${expectedUrl}")(${driverVar}.current_url)`
       ];
     }
   }
   if (ev.action === 'verifyImage') {
-    // 이미지 비교 (PIL/Pillow 사용)
-    return `# 이미지 비교를 위해 PIL/Pillow 라이브러리 필요\nfrom PIL import Image\nimport io\ncurrent_screenshot = ${element}.screenshot_as_png\n# 기준 이미지와 비교하는 로직 구현 필요`;
+    // 이미지 비교 (image_compare 모듈 사용, numpy/Pillow 필요)
+    const snapshotName = ev.snapshotName || ev.value || 'snapshot';
+    return [
+      `current_screenshot = ${element}.screenshot_as_png`,
+      `assert_image_matches(current_screenshot, "snapshots/${snapshotName}.jpeg")`
+    ];
   }
   return null;
 }
@@ -1377,12 +1381,12 @@ export function generateCode(events, manualList, framework, language) {
       
       // 필요한 import 추가
       if (hasVerifyUrl) {
-        lines.push("from test_utils import normalize_url");
+        lines.push("from test_utils import make_url_matcher");
       }
       lines.push("");
       
-      // fixture 설정: page는 항상 필요, verifyImage가 있으면 assert_snapshot도 추가
-      const fixtureParams = hasVerifyImage ? "page, assert_snapshot" : "page";
+      // fixture 설정: page는 항상 필요, verifyImage가 있으면 compare_snapshot도 추가
+      const fixtureParams = hasVerifyImage ? "page, compare_snapshot" : "page";
       lines.push(`def test_generated(${fixtureParams}):`);
       lines.push("    \"\"\"Generated test case\"\"\"");
       
@@ -1676,8 +1680,16 @@ export function generateCode(events, manualList, framework, language) {
         entry.kind === 'event' && entry.event && entry.event.action === 'verifyUrl'
       );
       
+      // verifyImage 액션이 있는지 확인
+      const hasVerifyImage = timeline.some(entry => 
+        entry.kind === 'event' && entry.event && entry.event.action === 'verifyImage'
+      );
+      
       if (hasVerifyUrl) {
-        lines.push("from test_utils import normalize_url");
+        lines.push("from test_utils import make_url_matcher");
+      }
+      if (hasVerifyImage) {
+        lines.push("from image_compare import assert_image_matches");
       }
       lines.push("");
       lines.push("");
@@ -227,14 +227,15 @@ export const KEYWORDS = {
     codeGenerators: {
       playwright: (params) => {
         const snapshotName = params.value || 'snapshot';
-        return `image = page.locator("${params.target}").screenshot()\nassert_snapshot(image, name="${snapshotName}.jpeg")`;
+        return `image = page.locator("${params.target}").screenshot()\ncompare_snapshot(image, name="${snapshotName}.jpeg")`;
       },
       selenium: (params) => {
-        return `# 이미지 비교를 위해 PIL/Pillow 라이브러리 필요\nfrom PIL import Image\nimport io\ncurrent_screenshot = driver.find_element(By.CSS_SELECTOR, "${params.target}").screenshot_as_png\n# 기준 이미지와 비교하는 로직 구현 필요`;
+        const snapshotName = params.value || 'snapshot';
+        return `from image_compare import assert_image_matches\ncurrent_screenshot = driver.find_element(By.CSS_SELECTOR, "${params.target}").screenshot_as_png\nassert_image_matches(current_screenshot, "snapshots/${snapshotName}.jpeg")`;
       },
       pytest: (params) => {
         const snapshotName = params.value || 'snapshot';
-        return `image = page.locator("${params.target}").screenshot()\nassert_snapshot(image, name="${snapshotName}.jpeg")`;
+        return `image = page.locator("${params.target}").screenshot()\ncompare_snapshot(image, name="${snapshotName}.jpeg")`;
       }
     }
   },